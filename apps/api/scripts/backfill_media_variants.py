@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from groundedart_api.db.models import Capture, MediaBlob, Node
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.media_variants import MediaVariantPipeline, VariantJob
+from groundedart_api.settings import get_settings
+
+
+async def _pending_jobs(
+    sessionmaker: async_sessionmaker[AsyncSession], *, force: bool
+) -> list[VariantJob]:
+    capture_query = (
+        select(Capture.image_path, Capture.image_sha256)
+        .outerjoin(MediaBlob, MediaBlob.sha256 == Capture.image_sha256)
+        .where(Capture.image_path.is_not(None))
+        .distinct()
+    )
+    node_query = select(Node.image_path).where(Node.image_path.is_not(None)).distinct()
+    if not force:
+        # Blobs stored before perceptual hashing existed are re-run for their hash.
+        capture_query = capture_query.where(
+            or_(
+                Capture.image_variants.is_(None),
+                and_(Capture.image_sha256.is_not(None), MediaBlob.phash.is_(None)),
+            )
+        )
+        node_query = node_query.where(Node.image_variants.is_(None))
+    async with sessionmaker() as db:
+        captures = (await db.execute(capture_query)).all()
+        nodes = (await db.scalars(node_query)).all()
+    return [
+        VariantJob(kind="capture", source_path=row.image_path, sha256=row.image_sha256)
+        for row in captures
+    ] + [VariantJob(kind="node", source_path=image_path) for image_path in nodes]
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description=(
+            "Render thumbnail/WebP variants for capture and node images missing them, and "
+            "perceptual-hash capture blobs that have no hash yet."
+        )
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every image, overwriting existing variant files.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.media_variant_workers,
+        help="Worker processes used for rendering.",
+    )
+    args = parser.parse_args()
+
+    settings = settings.model_copy(update={"media_variant_workers": args.workers})
+    sessionmaker = create_sessionmaker(settings.database_url)
+    pipeline = MediaVariantPipeline(settings, sessionmaker=sessionmaker)
+    started = time.perf_counter()
+    jobs = await _pending_jobs(sessionmaker, force=args.force)
+    semaphore = asyncio.Semaphore(args.workers)
+    failures: list[str] = []
+
+    async def _run(job: VariantJob) -> None:
+        async with semaphore:
+            try:
+                await pipeline.process(job, force=args.force)
+            except Exception as exc:  # noqa: BLE001
+                failures.append(f"{job.source_path} ({exc})")
+
+    try:
+        await asyncio.gather(*(_run(job) for job in jobs))
+    finally:
+        await pipeline.stop()
+
+    captures = sum(1 for job in jobs if job.kind == "capture")
+    print(
+        f"backfill_media_variants: captures={captures} nodes={len(jobs) - captures} "
+        f"failed={len(failures)} duration_ms={(time.perf_counter() - started) * 1000.0:.1f}"
+    )
+    for failure in failures:
+        print(f"backfill_media_variants: failed {failure}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
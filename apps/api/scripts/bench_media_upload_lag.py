@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from groundedart_api.settings import get_settings
+from groundedart_api.storage.local import LocalMediaStorage
+
+DURABILITY_MODES = ("fsync", "batched", "none")
+
+
+def _upload(payload: bytes) -> UploadFile:
+    return UploadFile(
+        io.BytesIO(payload),
+        size=len(payload),
+        filename="bench.jpg",
+        headers=Headers({"content-type": "image/jpeg"}),
+    )
+
+
+async def _save_inline(root: str, capture_id: uuid.UUID, upload: UploadFile) -> None:
+    """The previous behaviour: blocking write + fsync on the event loop, for comparison."""
+    path = os.path.join(root, f"capture_{capture_id}.jpg")
+    with open(path, "wb") as handle:
+        while chunk := await upload.read(1024 * 1024):
+            handle.write(chunk)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+async def _probe_lag(stop: asyncio.Event, interval: float, samples: list[float]) -> None:
+    """Sleep `interval` repeatedly and record how late each wake-up was."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(time.perf_counter() - start - interval, 0.0))
+
+
+async def _run_mode(
+    mode: str,
+    *,
+    uploads: int,
+    concurrency: int,
+    size_bytes: int,
+    interval: float,
+) -> None:
+    base_payload = os.urandom(size_bytes)
+    with tempfile.TemporaryDirectory(prefix="bench-media-") as root:
+        settings = get_settings().model_copy(
+            update={
+                "media_dir": root,
+                "media_durability": mode if mode != "inline" else "fsync",
+                "upload_max_bytes": size_bytes,
+            }
+        )
+        storage = LocalMediaStorage(settings)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one() -> None:
+            async with semaphore:
+                capture_id = uuid.uuid4()
+                # Unique content per upload, otherwise the blob store deduplicates it.
+                payload = capture_id.bytes + base_payload[16:]
+                if mode == "inline":
+                    await _save_inline(root, capture_id, _upload(payload))
+                else:
+                    await storage.save_capture_image(capture_id, _upload(payload))
+
+        samples: list[float] = []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe_lag(stop, interval, samples))
+        start = time.perf_counter()
+        await asyncio.gather(*(_one() for _ in range(uploads)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await probe
+        await storage.aclose()
+
+    samples_ms = sorted(sample * 1000.0 for sample in samples) or [0.0]
+    p99 = samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.99))]
+    print(
+        "bench_media_upload_lag: "
+        f"mode={mode} uploads={uploads} concurrency={concurrency} size_bytes={size_bytes} "
+        f"elapsed_s={elapsed:.2f} mb_per_s={uploads * size_bytes / elapsed / 1e6:.1f} "
+        f"lag_p50_ms={statistics.median(samples_ms):.2f} lag_p99_ms={p99:.2f} "
+        f"lag_max_ms={samples_ms[-1]:.2f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure event-loop lag while saving capture images in parallel through "
+            "LocalMediaStorage, per durability mode."
+        )
+    )
+    parser.add_argument("--uploads", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--size-bytes", type=int, default=1_500_000)
+    parser.add_argument(
+        "--interval-ms",
+        type=float,
+        default=5.0,
+        help="Lag probe sleep interval; lag is how late each wake-up is.",
+    )
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=("inline", *DURABILITY_MODES),
+        help="Mode to run (repeatable). Defaults to inline plus every durability mode; "
+        "inline is the old blocking write path, for comparison.",
+    )
+    args = parser.parse_args()
+
+    for mode in args.mode or ("inline", *DURABILITY_MODES):
+        await _run_mode(
+            mode,
+            uploads=args.uploads,
+            concurrency=args.concurrency,
+            size_bytes=args.size_bytes,
+            interval=args.interval_ms / 1000.0,
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from groundedart_api.db.models import utcnow
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.event_outbox import OutboxBatchResult, requeue_dead_events
+from groundedart_api.domain.verification_events import (
+    get_verification_event_dispatcher,
+    shutdown_verification_event_dispatcher,
+)
+from groundedart_api.resources import close_app_resources
+from groundedart_api.settings import get_settings
+
+
+def _report(result: OutboxBatchResult) -> None:
+    print(
+        "dispatch_event_outbox: "
+        f"claimed={result.claimed} delivered={result.delivered} retried={result.retried} "
+        f"dead={result.dead} duration_ms={result.duration_seconds * 1000.0:.1f}"
+    )
+
+
+async def _drain() -> int:
+    dispatcher = get_verification_event_dispatcher()
+    delivered = 0
+    while True:
+        result = await dispatcher.dispatch_once()
+        if result.claimed == 0:
+            return delivered
+        _report(result)
+        delivered += result.delivered
+        if result.claimed < dispatcher.batch_size:
+            return delivered
+
+
+async def _requeue_dead() -> None:
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    async with sessionmaker() as db:
+        requeued = await requeue_dead_events(db=db, now=utcnow())
+        await db.commit()
+    print(f"dispatch_event_outbox: requeued_dead={requeued}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Deliver pending verification events from the event_outbox to the webhook."
+    )
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Run continuously, polling the outbox after it has been drained.",
+    )
+    parser.add_argument(
+        "--requeue-dead",
+        action="store_true",
+        help="Move dead-lettered events back to pending before dispatching.",
+    )
+    args = parser.parse_args()
+    settings = get_settings()
+    if settings.verification_events_mode != "webhook":
+        raise ValueError("VERIFICATION_EVENTS_MODE must be webhook to dispatch the event outbox.")
+
+    if args.requeue_dead:
+        await _requeue_dead()
+    try:
+        if args.loop:
+            while True:
+                await _drain()
+                await asyncio.sleep(settings.verification_events_outbox_poll_seconds)
+        else:
+            delivered = await _drain()
+            print(f"dispatch_event_outbox: delivered={delivered}")
+    finally:
+        await shutdown_verification_event_dispatcher()
+        await close_app_resources()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete, select
+
+from groundedart_api.db.models import CaptureUploadSession, utcnow
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.resources import close_app_resources, get_app_resources
+from groundedart_api.settings import get_settings
+
+
+async def _expire_once(*, batch_size: int) -> int:
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    staging = get_app_resources(settings).upload_staging
+    started = time.perf_counter()
+    expired = 0
+    while True:
+        async with sessionmaker() as db:
+            expired_ids = list(
+                await db.scalars(
+                    delete(CaptureUploadSession)
+                    .where(
+                        CaptureUploadSession.id.in_(
+                            select(CaptureUploadSession.id)
+                            .where(CaptureUploadSession.expires_at <= utcnow())
+                            .limit(batch_size)
+                            .scalar_subquery()
+                        )
+                    )
+                    .returning(CaptureUploadSession.id)
+                )
+            )
+            await db.commit()
+        # Rows go first: a PATCH racing the delete fails its lookup instead of writing to
+        # a file that is about to vanish.
+        for upload_id in expired_ids:
+            await staging.delete(upload_id)
+        expired += len(expired_ids)
+        if len(expired_ids) < batch_size:
+            break
+    # Files whose row is already gone (e.g. a crash between commit and unlink).
+    orphaned = await asyncio.to_thread(
+        staging.sweep, older_than_seconds=settings.upload_session_ttl_seconds
+    )
+    print(
+        f"expire_upload_sessions: expired={expired} orphaned_files={orphaned} "
+        f"duration_ms={(time.perf_counter() - started) * 1000.0:.1f}"
+    )
+    return expired
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Delete expired resumable upload sessions and their staged bytes."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Run continuously.",
+    )
+    parser.add_argument("--interval-seconds", type=int, default=15 * 60)
+    args = parser.parse_args()
+
+    try:
+        while True:
+            await _expire_once(batch_size=args.batch_size)
+            if not args.loop:
+                break
+            await asyncio.sleep(args.interval_seconds)
+    finally:
+        await close_app_resources()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
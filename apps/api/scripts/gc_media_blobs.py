@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import time
+
+from groundedart_api.db.models import utcnow
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.media_blobs import collect_unreferenced_blobs
+from groundedart_api.resources import close_app_resources, get_app_resources
+from groundedart_api.settings import get_settings
+
+
+async def _collect_once(*, grace_seconds: int, batch_size: int) -> int:
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    storage = get_app_resources(settings).media_storage
+    started = time.perf_counter()
+    deleted = freed_bytes = 0
+    while True:
+        async with sessionmaker() as db:
+            blobs = await collect_unreferenced_blobs(
+                db=db,
+                unreferenced_before=utcnow() - dt.timedelta(seconds=grace_seconds),
+                limit=batch_size,
+            )
+            # Files go while the rows are still locked, so an upload that just found one
+            # waits for this commit and then re-stores it. A crash before the commit
+            # leaves unreferenced rows for missing files, which the next run deletes.
+            for blob in blobs:
+                await storage.delete_blob(blob.path)
+            await db.commit()
+        deleted += len(blobs)
+        freed_bytes += sum(blob.size_bytes for blob in blobs)
+        if len(blobs) < batch_size:
+            break
+    print(
+        f"gc_media_blobs: deleted={deleted} freed_bytes={freed_bytes} "
+        f"duration_ms={(time.perf_counter() - started) * 1000.0:.1f}"
+    )
+    return deleted
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Delete content-addressed media blobs no capture references any more."
+    )
+    parser.add_argument(
+        "--grace-seconds",
+        type=int,
+        default=settings.media_blob_gc_grace_seconds,
+        help="Only delete blobs unreferenced for at least this long.",
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Run continuously, once per grace period.",
+    )
+    args = parser.parse_args()
+
+    try:
+        while True:
+            await _collect_once(grace_seconds=args.grace_seconds, batch_size=args.batch_size)
+            if not args.loop:
+                break
+            await asyncio.sleep(max(args.grace_seconds, 60))
+    finally:
+        await close_app_resources()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
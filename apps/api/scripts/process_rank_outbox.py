@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.rank_outbox import RankOutboxBatchResult, process_rank_refresh_batch
+from groundedart_api.settings import get_settings
+
+
+def _report(result: RankOutboxBatchResult) -> None:
+    rate = result.claimed / result.duration_seconds if result.duration_seconds > 0 else 0.0
+    print(
+        "process_rank_outbox: "
+        f"claimed={result.claimed} refreshed_days={result.refreshed_days} "
+        f"users={result.users} duration_ms={result.duration_seconds * 1000.0:.1f} "
+        f"entries_per_s={rate:.0f}"
+    )
+
+
+async def _drain(batch_size: int) -> int:
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    processed = 0
+    while True:
+        async with sessionmaker() as db:
+            result = await process_rank_refresh_batch(db=db, batch_size=batch_size)
+        if result.claimed == 0:
+            return processed
+        _report(result)
+        processed += result.claimed
+
+
+async def _run_loop(batch_size: int) -> None:
+    settings = get_settings()
+    while True:
+        await _drain(batch_size)
+        await asyncio.sleep(settings.rank_outbox_poll_interval_seconds)
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Apply pending curator rank refreshes from the rank_refresh_outbox."
+    )
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Run continuously, polling the outbox after it has been drained.",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.rank_outbox_batch_size)
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        raise ValueError("--batch-size must be at least 1.")
+
+    if args.loop:
+        await _run_loop(args.batch_size)
+    else:
+        processed = await _drain(args.batch_size)
+        print(f"process_rank_outbox: drained={processed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
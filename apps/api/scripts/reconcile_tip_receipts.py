@@ -7,6 +7,7 @@ import datetime as dt
 from groundedart_api.db.models import utcnow
 from groundedart_api.db.session import create_sessionmaker
 from groundedart_api.domain.tip_receipts_reconciliation import reconcile_tip_receipts
+from groundedart_api.resources import close_app_resources
 from groundedart_api.settings import get_settings
 
 
@@ -48,11 +49,14 @@ async def main() -> None:
     )
     args = parser.parse_args()
 
-    if args.loop:
-        await _run_loop()
-    else:
-        processed = await _run_once()
-        print(f"reconcile_tip_receipts: processed={processed}")
+    try:
+        if args.loop:
+            await _run_loop()
+        else:
+            processed = await _run_once()
+            print(f"reconcile_tip_receipts: processed={processed}")
+    finally:
+        await close_app_resources()
 
 
 if __name__ == "__main__":
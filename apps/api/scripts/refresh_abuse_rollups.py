@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import time
+
+from groundedart_api.db.models import utcnow
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.abuse_stats import refresh_abuse_event_rollups
+from groundedart_api.settings import get_settings
+
+
+async def _refresh_once(lookback_minutes: int) -> None:
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    started = time.perf_counter()
+    async with sessionmaker() as db:
+        rows = await refresh_abuse_event_rollups(
+            db=db,
+            now=utcnow(),
+            lookback=dt.timedelta(minutes=lookback_minutes),
+        )
+        await db.commit()
+    print(
+        f"refresh_abuse_rollups: lookback_minutes={lookback_minutes} rows={rows} "
+        f"duration_ms={(time.perf_counter() - started) * 1000.0:.1f}"
+    )
+
+
+async def _run_loop(lookback_minutes: int) -> None:
+    settings = get_settings()
+    while True:
+        await _refresh_once(lookback_minutes)
+        await asyncio.sleep(settings.abuse_rollup_refresh_seconds)
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Rebuild the rolling tail of the 5-minute abuse_event_rollups table."
+    )
+    parser.add_argument(
+        "--lookback-minutes",
+        type=int,
+        default=settings.abuse_rollup_lookback_minutes,
+        help="Recompute buckets this far back (use a large value once to backfill).",
+    )
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Run continuously, every ABUSE_ROLLUP_REFRESH_SECONDS.",
+    )
+    args = parser.parse_args()
+
+    if args.loop:
+        await _run_loop(args.lookback_minutes)
+    else:
+        await _refresh_once(args.lookback_minutes)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from groundedart_api.db.models import utcnow
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.leaderboard import LEADERBOARD_PERIOD_DAYS, refresh_rank_window
+from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
+from groundedart_api.settings import get_settings
+
+
+async def _refresh_all(rank_version: str) -> None:
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    today = utcnow().date()
+    for period, window_days in LEADERBOARD_PERIOD_DAYS.items():
+        started = time.perf_counter()
+        async with sessionmaker() as db:
+            users = await refresh_rank_window(
+                db=db,
+                rank_version=rank_version,
+                window_days=window_days,
+                today=today,
+            )
+            await db.commit()
+        print(
+            f"refresh_rank_windows: period={period} rank_version={rank_version} "
+            f"users={users} duration_ms={(time.perf_counter() - started) * 1000.0:.1f}"
+        )
+
+
+async def _run_loop(rank_version: str) -> None:
+    settings = get_settings()
+    while True:
+        await _refresh_all(rank_version)
+        await asyncio.sleep(settings.leaderboard_window_refresh_seconds)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the rolling-window leaderboard snapshots (curator_rank_window)."
+    )
+    parser.add_argument("--rank-version", default=DEFAULT_RANK_VERSION)
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Run continuously, every LEADERBOARD_WINDOW_REFRESH_SECONDS.",
+    )
+    args = parser.parse_args()
+
+    if args.loop:
+        await _run_loop(args.rank_version)
+    else:
+        await _refresh_all(args.rank_version)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
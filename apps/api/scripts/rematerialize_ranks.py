@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from pathlib import Path
+
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
+from groundedart_api.domain.rank_materialization import RankRangeResult, rematerialize_rank_range
+from groundedart_api.settings import get_settings
+
+_UUID_SPACE = 1 << 128
+
+
+def _chunk_bounds(index: int, chunks: int) -> tuple[uuid.UUID | None, uuid.UUID | None]:
+    step = _UUID_SPACE // chunks
+    start = uuid.UUID(int=index * step) if index > 0 else None
+    end = uuid.UUID(int=(index + 1) * step) if index < chunks - 1 else None
+    return start, end
+
+
+class Checkpoint:
+    def __init__(self, path: Path | None, *, rank_version: str, chunks: int) -> None:
+        self._path = path
+        self._rank_version = rank_version
+        self._chunks = chunks
+        self.completed: set[int] = set()
+        if path is not None and path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("rank_version") != rank_version or data.get("chunks") != chunks:
+                raise SystemExit(
+                    f"Checkpoint {path} was written for rank_version={data.get('rank_version')} "
+                    f"chunks={data.get('chunks')}; delete it or pass matching arguments."
+                )
+            self.completed = {int(index) for index in data.get("completed", [])}
+
+    def mark_done(self, index: int) -> None:
+        self.completed.add(index)
+        if self._path is None:
+            return
+        payload = {
+            "rank_version": self._rank_version,
+            "chunks": self._chunks,
+            "completed": sorted(self.completed),
+        }
+        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self._path)
+
+
+async def _run_chunk(
+    index: int,
+    chunks: int,
+    *,
+    rank_version: str,
+    dry_run: bool,
+) -> RankRangeResult:
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    start, end = _chunk_bounds(index, chunks)
+    async with sessionmaker() as db:
+        result = await rematerialize_rank_range(
+            db=db,
+            rank_version=rank_version,
+            user_id_start=start,
+            user_id_end=end,
+            dry_run=dry_run,
+        )
+        if dry_run:
+            await db.rollback()
+        else:
+            await db.commit()
+    return result
+
+
+def _format(result: RankRangeResult, *, dry_run: bool) -> str:
+    if not dry_run:
+        return f"users={result.users} daily_rows={result.daily_rows}"
+    return (
+        f"users={result.users} users_changed={result.users_changed} "
+        f"daily_rows={result.daily_rows} added={result.daily_added} "
+        f"removed={result.daily_removed} changed={result.daily_changed}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute curator_rank_daily and curator_rank_cache for all users."
+    )
+    parser.add_argument("--rank-version", default=DEFAULT_RANK_VERSION)
+    parser.add_argument(
+        "--chunks",
+        type=int,
+        default=64,
+        help="Number of disjoint user_id ranges; each range is rebuilt in one transaction.",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Ranges processed concurrently.")
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="JSON file recording completed ranges so an interrupted run can resume.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report how stored rows differ from a rebuild without writing anything.",
+    )
+    args = parser.parse_args()
+    if args.chunks < 1 or args.workers < 1:
+        raise SystemExit("--chunks and --workers must be at least 1.")
+
+    checkpoint = Checkpoint(
+        None if args.dry_run else args.checkpoint,
+        rank_version=args.rank_version,
+        chunks=args.chunks,
+    )
+    pending = [index for index in range(args.chunks) if index not in checkpoint.completed]
+    semaphore = asyncio.Semaphore(args.workers)
+    totals: list[RankRangeResult] = []
+    started = time.perf_counter()
+
+    async def _worker(index: int) -> None:
+        async with semaphore:
+            chunk_started = time.perf_counter()
+            result = await _run_chunk(
+                index,
+                args.chunks,
+                rank_version=args.rank_version,
+                dry_run=args.dry_run,
+            )
+            if not args.dry_run:
+                checkpoint.mark_done(index)
+            totals.append(result)
+            print(
+                f"rematerialize_ranks: chunk={index + 1}/{args.chunks} "
+                f"{_format(result, dry_run=args.dry_run)} "
+                f"duration_ms={(time.perf_counter() - chunk_started) * 1000.0:.0f}"
+            )
+
+    await asyncio.gather(*(_worker(index) for index in pending))
+
+    summary = RankRangeResult(
+        users=sum(result.users for result in totals),
+        daily_rows=sum(result.daily_rows for result in totals),
+        daily_added=sum(result.daily_added for result in totals),
+        daily_removed=sum(result.daily_removed for result in totals),
+        daily_changed=sum(result.daily_changed for result in totals),
+        users_changed=sum(result.users_changed for result in totals),
+    )
+    print(
+        f"rematerialize_ranks: rank_version={args.rank_version} chunks_run={len(pending)} "
+        f"skipped={args.chunks - len(pending)} {_format(summary, dry_run=args.dry_run)} "
+        f"duration_s={time.perf_counter() - started:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
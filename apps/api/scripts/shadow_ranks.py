@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import time
+
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
+from groundedart_api.domain.rank_policies import (
+    RankPolicy,
+    register_rank_policy,
+    registered_rank_policies,
+)
+from groundedart_api.domain.rank_shadow import ShadowRankReport, run_shadow_rank_pass
+from groundedart_api.settings import get_settings
+
+
+def _parse_policy(spec: str) -> RankPolicy:
+    """`VERSION:DAY_CAP[:NODE_CAP]`, e.g. `v2_cap5:5` or `v2_node2:6:2`."""
+    parts = spec.split(":")
+    if len(parts) not in (2, 3) or not parts[0]:
+        raise argparse.ArgumentTypeError(
+            f"Invalid policy spec {spec!r}; use VERSION:DAY_CAP[:NODE_CAP]."
+        )
+    try:
+        day_cap = int(parts[1])
+        node_cap = int(parts[2]) if len(parts) == 3 else 1
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid caps in policy spec {spec!r}.") from exc
+    return RankPolicy(version=parts[0], per_day_points_cap=day_cap, per_node_per_day_cap=node_cap)
+
+
+def _print_report(report: ShadowRankReport, *, duration_seconds: float) -> None:
+    print(
+        f"shadow_ranks: source_version={report.source_version} source_rows={report.source_rows} "
+        f"users={report.users_scanned} daily_rows_written={report.daily_rows_written} "
+        f"duration_s={duration_seconds:.1f}"
+    )
+    for policy in report.policies:
+        print(
+            f"shadow_ranks: version={policy.version} vs={report.baseline_version} "
+            f"users_changed={policy.users_changed}/{policy.users_scored} "
+            f"gained={policy.users_gained} lost={policy.users_lost} "
+            f"points_total={policy.points_total} points_delta={policy.points_delta:+d}"
+        )
+        for mover in policy.top_movers:
+            print(
+                f"  user={mover.user_id} {mover.baseline_points} -> {mover.candidate_points}"
+            )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Score candidate rank policies against rank_events in one pass, write their "
+            "curator_rank_daily/curator_rank_cache rows and report divergence."
+        )
+    )
+    parser.add_argument("--source-version", default=DEFAULT_RANK_VERSION)
+    parser.add_argument(
+        "--policy",
+        action="append",
+        type=_parse_policy,
+        default=[],
+        help="Extra candidate VERSION:DAY_CAP[:NODE_CAP] (repeatable); adds to registered ones.",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report divergence without writing rows."
+    )
+    parser.add_argument("--top", type=int, default=10, help="Largest movers listed per policy.")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    args = parser.parse_args()
+
+    for policy in args.policy:
+        register_rank_policy(policy)
+    candidates = [
+        policy for policy in registered_rank_policies() if policy.version != args.source_version
+    ]
+    if not candidates:
+        raise SystemExit("No candidate policies; pass --policy VERSION:DAY_CAP[:NODE_CAP].")
+
+    settings = get_settings()
+    sessionmaker = create_sessionmaker(settings.database_url)
+    started = time.perf_counter()
+    async with sessionmaker() as db:
+        report = await run_shadow_rank_pass(
+            db=db,
+            policies=candidates,
+            source_version=args.source_version,
+            write=not args.dry_run,
+            top_movers=args.top,
+        )
+        if args.dry_run:
+            await db.rollback()
+        else:
+            await db.commit()
+
+    if args.json:
+        print(json.dumps(dataclasses.asdict(report), default=str, indent=2))
+    else:
+        _print_report(report, duration_seconds=time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,30 +2,87 @@ from __future__ import annotations
 
 import datetime as dt
 import uuid
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from groundedart_api.api.schemas import (
     AdminAbuseEvent,
     AdminAbuseEventsResponse,
+    AdminAbuseStatsGroup,
+    AdminAbuseStatsPoint,
+    AdminAbuseStatsResponse,
     AdminCapture,
+    AdminCaptureBatchTransitionRequest,
+    AdminCaptureBatchTransitionResponse,
+    AdminCaptureClaimResponse,
+    AdminCaptureLease,
+    AdminCaptureLeaseReleaseResponse,
+    AdminCaptureLeasesRequest,
+    AdminCaptureLeasesResponse,
+    AdminCaptureQueueResponse,
+    AdminCaptureReportsResolveResponse,
+    AdminCapturesResponse,
     AdminCaptureTransitionRequest,
     AdminCaptureTransitionResponse,
-    AdminCapturesResponse,
+    AdminQueueDepth,
     AdminReport,
+    AdminReportGroup,
+    AdminReportGroupsResponse,
     AdminReportResolveRequest,
     AdminReportResolveResponse,
     AdminReportsResponse,
+    AdminSimilarCapture,
+    AdminSimilarCapturesResponse,
 )
 from groundedart_api.auth.deps import require_admin
 from groundedart_api.db.models import AbuseEvent, Capture, ContentReport
-from groundedart_api.db.session import DbSessionDep
-from groundedart_api.domain.capture_moderation import transition_capture_state
+from groundedart_api.db.session import DbSessionDep, create_sessionmaker
+from groundedart_api.domain.abuse_stats import (
+    ABUSE_STATS_DEFAULT_RANGE,
+    AbuseStatsSource,
+    compute_abuse_event_stats,
+    parse_group_by,
+)
+from groundedart_api.domain.admin_exports import (
+    EXPORT_MEDIA_TYPES,
+    ExportFilters,
+    ExportFormat,
+    build_export_query,
+    get_export_table,
+    stream_export,
+)
+from groundedart_api.domain.capture_moderation import (
+    CaptureTransitionItem,
+    batch_transition_capture_states,
+    transition_capture_state,
+)
 from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.content_reports import (
+    decrement_report_counters,
+    list_report_groups,
+    resolve_capture_reports,
+)
 from groundedart_api.domain.errors import AppError
+from groundedart_api.domain.moderation_queue import (
+    QueueDepth,
+    ReviewLease,
+    claim_pending_captures,
+    decode_queue_cursor,
+    list_queue_page,
+    measure_queue_depth,
+    release_capture_leases,
+    renew_capture_leases,
+)
+from groundedart_api.domain.near_duplicates import find_similar_captures, get_capture_phash
 from groundedart_api.domain.report_resolution_code import ReportResolutionCode
-from groundedart_api.domain.verification_events import VerificationEventEmitterDep
+from groundedart_api.domain.verification_events import (
+    VerificationEventEmitter,
+    VerificationEventEmitterDep,
+)
 from groundedart_api.settings import Settings, get_settings
 from groundedart_api.time import UtcNow, get_utcnow
 
@@ -59,6 +116,7 @@ def capture_to_admin(capture: Capture, *, base_media_url: str) -> AdminCapture:
         attribution_source_url=capture.attribution_source_url,
         rights_basis=capture.rights_basis,
         rights_attested_at=capture.rights_attested_at,
+        image_metadata_check=capture.image_metadata_check,
     )
 
 
@@ -114,16 +172,129 @@ async def list_pending_captures(
     )
 
 
-@router.post("/captures/{capture_id}/transition", response_model=AdminCaptureTransitionResponse)
-async def transition_capture(
-    capture_id: uuid.UUID,
-    body: AdminCaptureTransitionRequest,
+async def require_moderator_id(
+    moderator_id: Annotated[str | None, Header(alias="X-Moderator-Id")] = None,
+) -> str:
+    value = (moderator_id or "").strip()
+    if not value or len(value) > 64:
+        raise AppError(
+            code="moderator_id_required",
+            message="X-Moderator-Id header (1-64 characters) is required",
+            status_code=400,
+        )
+    return value
+
+
+ModeratorId = Annotated[str, Depends(require_moderator_id)]
+
+
+def lease_to_admin(lease: ReviewLease, *, base_media_url: str) -> AdminCaptureLease:
+    return AdminCaptureLease(
+        capture=capture_to_admin(lease.capture, base_media_url=base_media_url),
+        moderator_id=lease.moderator_id,
+        expires_at=lease.expires_at,
+    )
+
+
+def queue_depth_to_admin(depth: QueueDepth) -> AdminQueueDepth:
+    return AdminQueueDepth(unclaimed=depth.unclaimed, leased=depth.leased)
+
+
+@router.post("/captures/claim", response_model=AdminCaptureClaimResponse)
+async def claim_captures(
     db: DbSessionDep,
-    verification_events: VerificationEventEmitterDep,
+    moderator_id: ModeratorId,
+    n: int = Query(default=10, ge=1),
     settings: Settings = Depends(get_settings),
-) -> AdminCaptureTransitionResponse:
+    now: UtcNow = Depends(get_utcnow),
+) -> AdminCaptureClaimResponse:
+    now_time = now()
+    leases = await claim_pending_captures(
+        db=db,
+        moderator_id=moderator_id,
+        limit=min(n, settings.moderation_claim_max),
+        lease_seconds=settings.moderation_lease_seconds,
+        now=now_time,
+    )
+    await db.commit()
+    depth = await measure_queue_depth(db=db, now=now_time)
+    return AdminCaptureClaimResponse(
+        leases=[
+            lease_to_admin(lease, base_media_url=settings.media_public_base_url)
+            for lease in leases
+        ],
+        queue_depth=queue_depth_to_admin(depth),
+    )
+
+
+@router.post("/captures/leases:renew", response_model=AdminCaptureLeasesResponse)
+async def renew_capture_leases_route(
+    body: AdminCaptureLeasesRequest,
+    db: DbSessionDep,
+    moderator_id: ModeratorId,
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+) -> AdminCaptureLeasesResponse:
+    leases = await renew_capture_leases(
+        db=db,
+        moderator_id=moderator_id,
+        capture_ids=body.capture_ids,
+        lease_seconds=settings.moderation_lease_seconds,
+        now=now(),
+    )
+    await db.commit()
+    return AdminCaptureLeasesResponse(
+        leases=[
+            lease_to_admin(lease, base_media_url=settings.media_public_base_url)
+            for lease in leases
+        ]
+    )
+
+
+@router.post("/captures/leases:release", response_model=AdminCaptureLeaseReleaseResponse)
+async def release_capture_leases_route(
+    body: AdminCaptureLeasesRequest,
+    db: DbSessionDep,
+    moderator_id: ModeratorId,
+) -> AdminCaptureLeaseReleaseResponse:
+    released = await release_capture_leases(
+        db=db,
+        moderator_id=moderator_id,
+        capture_ids=body.capture_ids,
+    )
+    await db.commit()
+    return AdminCaptureLeaseReleaseResponse(released=released)
+
+
+@router.get("/captures/queue", response_model=AdminCaptureQueueResponse)
+async def list_capture_queue(
+    db: DbSessionDep,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=500),
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+) -> AdminCaptureQueueResponse:
+    now_time = now()
+    page = await list_queue_page(
+        db=db,
+        now=now_time,
+        cursor=decode_queue_cursor(cursor) if cursor else None,
+        limit=limit,
+    )
+    depth = await measure_queue_depth(db=db, now=now_time)
+    return AdminCaptureQueueResponse(
+        captures=[
+            capture_to_admin(capture, base_media_url=settings.media_public_base_url)
+            for capture in page.captures
+        ],
+        next_cursor=page.next_cursor,
+        queue_depth=queue_depth_to_admin(depth),
+    )
+
+
+def _admin_target_state(value: str) -> CaptureState:
     try:
-        target_state = CaptureState(body.target_state)
+        target_state = CaptureState(value)
     except ValueError as exc:
         raise AppError(
             code="invalid_capture_state_transition",
@@ -136,7 +307,18 @@ async def transition_capture(
             message="Invalid admin target state",
             status_code=400,
         )
+    return target_state
+
 
+@router.post("/captures/{capture_id}/transition", response_model=AdminCaptureTransitionResponse)
+async def transition_capture(
+    capture_id: uuid.UUID,
+    body: AdminCaptureTransitionRequest,
+    db: DbSessionDep,
+    verification_events: VerificationEventEmitterDep,
+    settings: Settings = Depends(get_settings),
+) -> AdminCaptureTransitionResponse:
+    target_state = _admin_target_state(body.target_state)
     capture = await transition_capture_state(
         db=db,
         capture_id=capture_id,
@@ -146,12 +328,82 @@ async def transition_capture(
         actor_user_id=None,
         verification_events=verification_events,
         details=body.details,
+        rank_refresh_mode=settings.rank_refresh_mode,
     )
     return AdminCaptureTransitionResponse(
         capture=capture_to_admin(capture, base_media_url=settings.media_public_base_url)
     )
 
 
+@router.post(
+    "/captures:batchTransition",
+    response_model=AdminCaptureBatchTransitionResponse,
+)
+async def batch_transition_captures(
+    body: AdminCaptureBatchTransitionRequest,
+    db: DbSessionDep,
+    verification_events: VerificationEventEmitterDep,
+    settings: Settings = Depends(get_settings),
+) -> AdminCaptureBatchTransitionResponse:
+    items = [
+        CaptureTransitionItem(
+            capture_id=item.capture_id,
+            target_state=_admin_target_state(item.target_state),
+            reason_code=item.reason_code,
+            details=item.details,
+        )
+        for item in body.items
+    ]
+    captures = await batch_transition_capture_states(
+        db=db,
+        items=items,
+        actor_type="admin",
+        actor_user_id=None,
+        verification_events=verification_events,
+        rank_refresh_mode=settings.rank_refresh_mode,
+    )
+    return AdminCaptureBatchTransitionResponse(
+        captures=[
+            capture_to_admin(capture, base_media_url=settings.media_public_base_url)
+            for capture in captures
+        ]
+    )
+
+
+@router.get("/captures/{capture_id}/similar", response_model=AdminSimilarCapturesResponse)
+async def list_similar_captures(
+    capture_id: uuid.UUID,
+    db: DbSessionDep,
+    max_distance: int = Query(default=10, ge=0, le=16),
+    limit: int = Query(default=50, ge=1, le=200),
+    settings: Settings = Depends(get_settings),
+) -> AdminSimilarCapturesResponse:
+    capture = await db.get(Capture, capture_id)
+    if capture is None:
+        raise AppError(code="capture_not_found", message="Capture not found", status_code=404)
+    phash = await get_capture_phash(db, capture)
+    matches = (
+        await find_similar_captures(
+            db, capture_id=capture.id, phash=phash, max_distance=max_distance, limit=limit
+        )
+        if phash is not None
+        else []
+    )
+    return AdminSimilarCapturesResponse(
+        capture_id=capture.id,
+        phash=None if phash is None else f"{phash:016x}",
+        matches=[
+            AdminSimilarCapture(
+                capture=capture_to_admin(
+                    match.capture, base_media_url=settings.media_public_base_url
+                ),
+                distance=match.distance,
+            )
+            for match in matches
+        ],
+    )
+
+
 @router.get("/abuse-events", response_model=AdminAbuseEventsResponse)
 async def list_abuse_events(
     db: DbSessionDep,
@@ -178,6 +430,56 @@ async def list_abuse_events(
     return AdminAbuseEventsResponse(events=[abuse_event_to_admin(event) for event in events])
 
 
+@router.get("/abuse-events/stats", response_model=AdminAbuseStatsResponse)
+async def abuse_event_stats(
+    db: DbSessionDep,
+    bucket: str = Query(default="5m", description="Bucket width, e.g. 1m, 5m, 1h, 1d."),
+    group_by: str | None = Query(
+        default="event_type",
+        description="Comma-separated subset of event_type,user_id,node_id (empty for totals).",
+    ),
+    from_time: dt.datetime | None = Query(default=None, alias="from"),
+    to_time: dt.datetime | None = Query(default=None, alias="to"),
+    top: int = Query(default=10, ge=1, le=100, description="Busiest groups to return."),
+    source: AbuseStatsSource = Query(
+        default="raw",
+        description="raw scans abuse_events; rollup reads the 5-minute abuse_event_rollups.",
+    ),
+    now: UtcNow = Depends(get_utcnow),
+) -> AdminAbuseStatsResponse:
+    end = to_time or now()
+    start = from_time or end - ABUSE_STATS_DEFAULT_RANGE
+    stats = await compute_abuse_event_stats(
+        db=db,
+        bucket=bucket,
+        group_by=parse_group_by(group_by),
+        start=start,
+        end=end,
+        top_n=top,
+        source=source,
+    )
+    return AdminAbuseStatsResponse(
+        bucket=stats.bucket,
+        group_by=list(stats.group_by),
+        source=stats.source,
+        from_time=stats.start,
+        to_time=stats.end,
+        groups=[
+            AdminAbuseStatsGroup(
+                event_type=group.event_type,
+                user_id=group.user_id,
+                node_id=group.node_id,
+                total=group.total,
+                buckets=[
+                    AdminAbuseStatsPoint(bucket_start=point.bucket_start, events=point.events)
+                    for point in group.points
+                ],
+            )
+            for group in stats.groups
+        ],
+    )
+
+
 @router.get("/reports", response_model=AdminReportsResponse)
 async def list_reports(
     db: DbSessionDep,
@@ -206,12 +508,56 @@ async def list_reports(
     return AdminReportsResponse(reports=[report_to_admin(report) for report in reports])
 
 
+def _report_resolution(value: str) -> ReportResolutionCode:
+    try:
+        return ReportResolutionCode(value)
+    except ValueError as exc:
+        raise AppError(
+            code="invalid_report_resolution",
+            message="Invalid report resolution",
+            status_code=400,
+        ) from exc
+
+
+async def _hide_reported_capture(
+    *,
+    db: AsyncSession,
+    capture_id: uuid.UUID,
+    resolution: ReportResolutionCode,
+    details: dict[str, object],
+    verification_events: VerificationEventEmitter,
+    settings: Settings,
+) -> None:
+    if resolution not in {ReportResolutionCode.hide_capture, ReportResolutionCode.rights_takedown}:
+        return
+    capture = await db.get(Capture, capture_id)
+    if capture is None:
+        raise AppError(code="capture_not_found", message="Capture not found", status_code=404)
+    if capture.state == CaptureState.hidden.value:
+        return
+    reason_code = (
+        "rights_takedown" if resolution == ReportResolutionCode.rights_takedown else "report_hide"
+    )
+    await transition_capture_state(
+        db=db,
+        capture_id=capture_id,
+        target_state=CaptureState.hidden,
+        reason_code=reason_code,
+        actor_type="admin",
+        actor_user_id=None,
+        verification_events=verification_events,
+        details=details,
+        rank_refresh_mode=settings.rank_refresh_mode,
+    )
+
+
 @router.post("/reports/{report_id}/resolve", response_model=AdminReportResolveResponse)
 async def resolve_report(
     report_id: uuid.UUID,
     body: AdminReportResolveRequest,
     db: DbSessionDep,
     verification_events: VerificationEventEmitterDep,
+    settings: Settings = Depends(get_settings),
     now: UtcNow = Depends(get_utcnow),
 ) -> AdminReportResolveResponse:
     report = await db.get(ContentReport, report_id)
@@ -224,41 +570,132 @@ async def resolve_report(
             status_code=400,
         )
 
-    try:
-        resolution = ReportResolutionCode(body.resolution)
-    except ValueError as exc:
-        raise AppError(
-            code="invalid_report_resolution",
-            message="Invalid report resolution",
-            status_code=400,
-        ) from exc
-
-    if resolution in {ReportResolutionCode.hide_capture, ReportResolutionCode.rights_takedown}:
-        capture = await db.get(Capture, report.capture_id)
-        if capture is None:
-            raise AppError(code="capture_not_found", message="Capture not found", status_code=404)
-        if capture.state != CaptureState.hidden.value:
-            reason_code = (
-                "rights_takedown"
-                if resolution == ReportResolutionCode.rights_takedown
-                else "report_hide"
-            )
-            await transition_capture_state(
-                db=db,
-                capture_id=report.capture_id,
-                target_state=CaptureState.hidden,
-                reason_code=reason_code,
-                actor_type="admin",
-                actor_user_id=None,
-                verification_events=verification_events,
-                details={
-                    "report_id": str(report.id),
-                    "report_reason": report.reason,
-                },
-            )
+    resolution = _report_resolution(body.resolution)
+    await _hide_reported_capture(
+        db=db,
+        capture_id=report.capture_id,
+        resolution=resolution,
+        details={
+            "report_id": str(report.id),
+            "report_reason": report.reason,
+        },
+        verification_events=verification_events,
+        settings=settings,
+    )
 
     report.resolution = resolution.value
     report.resolved_at = now()
+    await decrement_report_counters(db=db, capture_id=report.capture_id, reason=report.reason)
     await db.commit()
     await db.refresh(report)
     return AdminReportResolveResponse(report=report_to_admin(report))
+
+
+@router.get("/reports/by-capture", response_model=AdminReportGroupsResponse)
+async def list_report_groups_route(
+    db: DbSessionDep,
+    include_resolved: bool = Query(
+        default=False, description="Include captures whose reports are all resolved."
+    ),
+    limit: int = Query(default=100, ge=1, le=500),
+) -> AdminReportGroupsResponse:
+    groups = await list_report_groups(db=db, include_resolved=include_resolved, limit=limit)
+    return AdminReportGroupsResponse(
+        groups=[
+            AdminReportGroup(
+                capture_id=group.capture.id,
+                node_id=group.capture.node_id,
+                capture_state=group.capture.state,
+                open_reports=group.counter.open_reports,
+                total_reports=group.counter.total_reports,
+                open_reason_counts=group.counter.open_reason_counts,
+                first_reported_at=group.counter.first_reported_at,
+                last_reported_at=group.counter.last_reported_at,
+                auto_hidden_at=group.counter.auto_hidden_at,
+            )
+            for group in groups
+        ]
+    )
+
+
+@router.post(
+    "/captures/{capture_id}/reports:resolve",
+    response_model=AdminCaptureReportsResolveResponse,
+)
+async def resolve_capture_reports_route(
+    capture_id: uuid.UUID,
+    body: AdminReportResolveRequest,
+    db: DbSessionDep,
+    verification_events: VerificationEventEmitterDep,
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+) -> AdminCaptureReportsResolveResponse:
+    resolution = _report_resolution(body.resolution)
+    resolved = await resolve_capture_reports(
+        db=db, capture_id=capture_id, resolution=resolution.value, now=now()
+    )
+    if resolved == 0:
+        raise AppError(
+            code="no_open_reports",
+            message="Capture has no open reports",
+            status_code=404,
+        )
+    # The hide transition commits the bulk resolve along with it.
+    await _hide_reported_capture(
+        db=db,
+        capture_id=capture_id,
+        resolution=resolution,
+        details={"bulk_resolved_reports": resolved},
+        verification_events=verification_events,
+        settings=settings,
+    )
+    await db.commit()
+    return AdminCaptureReportsResolveResponse(
+        capture_id=capture_id, resolution=resolution.value, resolved=resolved
+    )
+
+
+@router.get("/export/{table}", response_class=StreamingResponse)
+async def export_table(
+    table: str,
+    format: ExportFormat = Query(default="ndjson"),
+    gzip: bool = Query(default=False, description="Gzip-compress the response body."),
+    user_id: uuid.UUID | None = Query(default=None),
+    node_id: uuid.UUID | None = Query(default=None),
+    capture_id: uuid.UUID | None = Query(default=None),
+    event_type: str | None = Query(default=None),
+    created_after: dt.datetime | None = Query(default=None),
+    created_before: dt.datetime | None = Query(default=None),
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+) -> StreamingResponse:
+    export = get_export_table(table)
+    # Build (and validate) the query up front so bad filters fail before streaming starts.
+    query = build_export_query(
+        export,
+        ExportFilters(
+            created_after=created_after,
+            created_before=created_before,
+            user_id=user_id,
+            node_id=node_id,
+            capture_id=capture_id,
+            event_type=event_type,
+        ),
+    )
+    filename = f"{export.name}-{now().strftime('%Y%m%dT%H%M%SZ')}.{format}"
+    media_type = EXPORT_MEDIA_TYPES[format]
+    if gzip:
+        # A .gz file download rather than Content-Encoding, so clients keep it compressed.
+        filename = f"{filename}.gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        stream_export(
+            sessionmaker=create_sessionmaker(settings.database_url),
+            table=export,
+            query=query,
+            fmt=format,
+            gzip=gzip,
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import datetime as dt
+import re
 import uuid
+from collections.abc import Awaitable, Callable
+from email.utils import format_datetime
+from typing import BinaryIO
 
-from fastapi import APIRouter, Depends, UploadFile
+from fastapi import APIRouter, Depends, Header, Request, Response, UploadFile
 from sqlalchemy import func, select
+from starlette.datastructures import Headers
+from starlette.requests import ClientDisconnect
 
 from groundedart_api.api.schemas import (
+    CaptureImageCompleteRequest,
+    CaptureImagePresignRequest,
+    CaptureImagePresignResponse,
     CapturePublic,
+    CaptureUploadSessionPublic,
     CreateCaptureRequest,
     CreateCaptureResponse,
+    CreateCaptureUploadRequest,
     CreateReportRequest,
     CreateReportResponse,
     ReportPublic,
@@ -17,7 +30,13 @@ from groundedart_api.api.schemas import (
 )
 from groundedart_api.auth.deps import CurrentUser
 from groundedart_api.auth.tokens import hash_opaque_token
-from groundedart_api.db.models import Capture, CheckinToken, ContentReport, Node
+from groundedart_api.db.models import (
+    Capture,
+    CaptureUploadSession,
+    CheckinToken,
+    ContentReport,
+    Node,
+)
 from groundedart_api.db.session import DbSessionDep
 from groundedart_api.domain.abuse_events import record_abuse_event
 from groundedart_api.domain.attribution_rights import (
@@ -30,17 +49,46 @@ from groundedart_api.domain.capture_events import (
     record_capture_created_event,
     record_capture_published_event,
 )
+from groundedart_api.domain.capture_metadata import check_capture_metadata
 from groundedart_api.domain.capture_state import CaptureState
 from groundedart_api.domain.capture_transitions import validate_capture_state_reason
+from groundedart_api.domain.content_reports import (
+    auto_hide_reported_capture,
+    increment_report_counters,
+)
 from groundedart_api.domain.errors import AppError
 from groundedart_api.domain.gating import assert_can_create_capture
+from groundedart_api.domain.media_blobs import (
+    acquire_media_blob,
+    release_media_blob,
+    repoint_media_blob,
+)
+from groundedart_api.domain.media_variants import (
+    MediaVariantPipeline,
+    VariantJob,
+    get_media_variant_pipeline,
+)
 from groundedart_api.domain.rank_projection import get_rank_for_user
 from groundedart_api.domain.report_reason_code import ReportReasonCode
-from groundedart_api.domain.verification_events import VerificationEventEmitterDep
+from groundedart_api.domain.verification_events import (
+    VerificationEventEmitter,
+    VerificationEventEmitterDep,
+)
 from groundedart_api.observability import metrics
 from groundedart_api.observability.ops import observe_operation
 from groundedart_api.settings import Settings, get_settings
-from groundedart_api.storage.deps import MediaStorageDep
+from groundedart_api.storage.base import (
+    StoredMedia,
+    blob_relative_path,
+    check_sha256,
+    check_upload_content_type,
+    check_upload_size,
+    safe_extension,
+)
+from groundedart_api.storage.deps import MediaStorageDep, UploadStagingDep
+from groundedart_api.storage.exif import ExifMetadata, read_exif_metadata
+from groundedart_api.storage.staging import StagedUpload
+from groundedart_api.storage.variants import build_srcset, build_thumbnail_url
 from groundedart_api.time import UtcNow, get_utcnow
 
 router = APIRouter(prefix="/v1", tags=["captures"])
@@ -73,6 +121,8 @@ def capture_to_public(capture: Capture, *, base_media_url: str) -> CapturePublic
         visibility=capture.visibility,
         created_at=capture.created_at,
         image_url=image_url,
+        image_srcset=build_srcset(capture.image_variants, base_media_url=base_media_url),
+        thumbnail_url=build_thumbnail_url(capture.image_variants, base_media_url=base_media_url),
         attribution_artist_name=capture.attribution_artist_name,
         attribution_artwork_title=capture.attribution_artwork_title,
         attribution_source=capture.attribution_source,
@@ -197,6 +247,7 @@ async def create_capture(
         attribution_source_url=body.attribution_source_url,
         rights_basis=body.rights_basis,
         rights_attested_at=now_time if body.rights_attestation else None,
+        checkin_issued_at=token.created_at,
         publish_requested=bool(body.publish_requested),
         visibility="private",
         state=CaptureState.draft.value,
@@ -273,6 +324,7 @@ async def create_report(
     body: CreateReportRequest,
     db: DbSessionDep,
     user: CurrentUser,
+    verification_events: VerificationEventEmitterDep,
     settings: Settings = Depends(get_settings),
     now: UtcNow = Depends(get_utcnow),
 ) -> CreateReportResponse:
@@ -332,6 +384,18 @@ async def create_report(
         created_at=now(),
     )
     db.add(report)
+    counter = await increment_report_counters(
+        db=db, capture_id=capture.id, reason=reason.value, now=report.created_at
+    )
+    await auto_hide_reported_capture(
+        db=db,
+        capture=capture,
+        counter=counter,
+        threshold=settings.report_auto_hide_threshold,
+        verification_events=verification_events,
+        rank_refresh_mode=settings.rank_refresh_mode,
+        now=report.created_at,
+    )
     await db.commit()
     await db.refresh(report)
     return CreateReportResponse(report=report_to_public(report))
@@ -389,6 +453,131 @@ async def publish_capture(
     return capture_to_public(capture, base_media_url=settings.media_public_base_url)
 
 
+async def _get_capture_for_upload(
+    db: DbSessionDep, capture_id: uuid.UUID, user: CurrentUser, settings: Settings
+) -> Capture:
+    capture = await db.get(Capture, capture_id)
+    if capture is None:
+        raise AppError(code="capture_not_found", message="Capture not found", status_code=404)
+    if capture.user_id != user.id:
+        raise AppError(code="forbidden", message="Forbidden", status_code=403)
+
+    if capture.state == CaptureState.draft.value:
+        pending_count = await db.scalar(
+            select(func.count())
+            .select_from(Capture)
+            .where(
+                Capture.node_id == capture.node_id,
+                Capture.state == CaptureState.pending_verification.value,
+            )
+        )
+        if (pending_count or 0) >= settings.max_pending_verification_captures_per_node:
+            await record_abuse_event(
+                db=db,
+                event_type="pending_verification_cap_reached",
+                user_id=user.id,
+                node_id=capture.node_id,
+                capture_id=capture.id,
+                details={
+                    "max_pending_per_node": settings.max_pending_verification_captures_per_node,
+                    "pending_count": int(pending_count or 0),
+                },
+            )
+            raise AppError(
+                code="pending_verification_cap_reached",
+                message="Pending verification cap reached",
+                status_code=429,
+                details={
+                    "max_pending_per_node": settings.max_pending_verification_captures_per_node,
+                },
+            )
+    return capture
+
+
+async def _attach_capture_image(
+    *,
+    db: DbSessionDep,
+    capture: Capture,
+    stored: StoredMedia,
+    restore: Callable[[], Awaitable[StoredMedia]],
+    user: CurrentUser,
+    storage: MediaStorageDep,
+    verification_events: VerificationEventEmitter,
+    variant_pipeline: MediaVariantPipeline,
+    settings: Settings,
+    now: dt.datetime,
+    metadata_check: dict[str, object] | None,
+) -> CapturePublic:
+    """Point `capture` at a stored blob and promote drafts to pending verification.
+
+    `restore` stores the upload again when blob GC removed the file after the storage
+    found it. `metadata_check` is the EXIF cross-check of the new image, None when its
+    bytes were never seen here (direct uploads).
+    """
+    # Lock the row so concurrent re-uploads of one capture keep the refcounts exact.
+    await db.refresh(capture, with_for_update=True)
+    capture.image_metadata_check = metadata_check
+    uploaded_path = stored.path
+    if capture.image_sha256 == stored.sha256:
+        stored = dataclasses.replace(stored, path=capture.image_path, mime=capture.image_mime)
+    else:
+        stored = await acquire_media_blob(db=db, stored=stored, now=now)
+        # The blob row is locked now, so GC cannot remove the file after this check.
+        if await storage.stat_blob(stored.path) is None:
+            stored = await restore()
+            uploaded_path = stored.path
+            await repoint_media_blob(db=db, stored=stored, now=now)
+        if capture.image_sha256 is not None:
+            await release_media_blob(db=db, sha256=capture.image_sha256, now=now)
+    if capture.image_path != stored.path:
+        capture.image_variants = None
+    capture.image_path = stored.path
+    capture.image_mime = stored.mime
+    capture.image_sha256 = stored.sha256
+    if capture.state == CaptureState.draft.value:
+        apply_capture_transition_with_audit(
+            db=db,
+            capture=capture,
+            target_state=CaptureState.pending_verification,
+            reason_code="image_uploaded",
+            actor_type="user",
+            actor_user_id=user.id,
+        )
+        await verification_events.capture_uploaded(
+            capture_id=capture.id,
+            node_id=capture.node_id,
+            user_id=capture.user_id,
+        )
+    await db.commit()
+    await db.refresh(capture)
+    if uploaded_path != stored.path:
+        # Same bytes under another MIME type: the blob row tracks the first file only.
+        await storage.delete_blob(uploaded_path)
+    # The pipeline renders from local files; S3 deployments resize at the CDN instead.
+    if (
+        capture.image_variants is None
+        and settings.media_variants_enabled
+        and settings.media_storage_backend == "local"
+    ):
+        variant_pipeline.submit(
+            VariantJob(
+                kind="capture",
+                source_path=stored.path,
+                sha256=stored.sha256,
+                capture_id=capture.id,
+            )
+        )
+    return capture_to_public(capture, base_media_url=settings.media_public_base_url)
+
+
+def _read_exif_and_rewind(file: BinaryIO) -> ExifMetadata | None:
+    # Header reads only, so this costs the same for a 50 KB and a 20 MB upload.
+    try:
+        return read_exif_metadata(file)
+    finally:
+        file.seek(0)
+
+
 @router.post("/captures/{capture_id}/image", response_model=CapturePublic)
 async def upload_capture_image(
     capture_id: uuid.UUID,
@@ -398,6 +587,8 @@ async def upload_capture_image(
     storage: MediaStorageDep,
     verification_events: VerificationEventEmitterDep,
     settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+    variant_pipeline: MediaVariantPipeline = Depends(get_media_variant_pipeline),
 ) -> CapturePublic:
     async with observe_operation(
         "upload_capture_image",
@@ -405,65 +596,382 @@ async def upload_capture_image(
             "capture.id": str(capture_id),
         },
     ):
-        capture = await db.get(Capture, capture_id)
-        if capture is None:
-            raise AppError(code="capture_not_found", message="Capture not found", status_code=404)
-        if capture.user_id != user.id:
-            raise AppError(code="forbidden", message="Forbidden", status_code=403)
-
-        if capture.state == CaptureState.draft.value:
-            pending_count = await db.scalar(
-                select(func.count())
-                .select_from(Capture)
-                .where(
-                    Capture.node_id == capture.node_id,
-                    Capture.state == CaptureState.pending_verification.value,
+        capture = await _get_capture_for_upload(db, capture_id, user, settings)
+        exif = await asyncio.to_thread(_read_exif_and_rewind, file.file)
+        stored = await storage.save_capture_image(capture_id=capture.id, upload=file)
+        metrics.upload_bytes_total.labels(mime=stored.mime or "", outcome="success").inc(
+            float(stored.bytes_written)
+        )
+        metrics.media_blob_uploads_total.labels(
+            outcome="deduplicated" if stored.deduplicated else "stored"
+        ).inc()
+        now_time = now()
+        metadata_check = await check_capture_metadata(
+            db, capture=capture, metadata=exif, settings=settings, now=now_time
+        )
+
+        async def restore() -> StoredMedia:
+            await file.seek(0)
+            return await storage.save_capture_image(capture_id=capture.id, upload=file)
+
+        return await _attach_capture_image(
+            db=db,
+            capture=capture,
+            stored=stored,
+            restore=restore,
+            user=user,
+            storage=storage,
+            verification_events=verification_events,
+            variant_pipeline=variant_pipeline,
+            settings=settings,
+            now=now_time,
+            metadata_check=metadata_check,
+        )
+
+
+@router.post("/captures/{capture_id}/image:presign", response_model=CaptureImagePresignResponse)
+async def presign_capture_image(
+    capture_id: uuid.UUID,
+    body: CaptureImagePresignRequest,
+    db: DbSessionDep,
+    user: CurrentUser,
+    storage: MediaStorageDep,
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+) -> CaptureImagePresignResponse:
+    """Hand out a presigned PUT so the client uploads straight to the media store.
+
+    The client then calls `image:complete`; when the content is already stored
+    (`upload_required` false) it skips the PUT entirely.
+    """
+    capture = await _get_capture_for_upload(db, capture_id, user, settings)
+    presigned = await storage.presign_capture_upload(
+        capture.id,
+        sha256=body.sha256,
+        size_bytes=body.size_bytes,
+        content_type=body.content_type,
+        now=now(),
+    )
+    return CaptureImagePresignResponse(
+        upload_required=presigned.upload_required,
+        method=presigned.method,
+        url=presigned.url,
+        headers=presigned.headers,
+        expires_at=presigned.expires_at,
+    )
+
+
+@router.post("/captures/{capture_id}/image:complete", response_model=CapturePublic)
+async def complete_capture_image(
+    capture_id: uuid.UUID,
+    body: CaptureImageCompleteRequest,
+    db: DbSessionDep,
+    user: CurrentUser,
+    storage: MediaStorageDep,
+    verification_events: VerificationEventEmitterDep,
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+    variant_pipeline: MediaVariantPipeline = Depends(get_media_variant_pipeline),
+) -> CapturePublic:
+    """Attach a directly uploaded image and run the same promotion as a multipart upload."""
+    async with observe_operation(
+        "complete_capture_image",
+        attributes={
+            "capture.id": str(capture_id),
+        },
+    ):
+        capture = await _get_capture_for_upload(db, capture_id, user, settings)
+        content_type = check_upload_content_type(
+            body.content_type, {mime.lower() for mime in settings.upload_allowed_mime_types}
+        )
+        check_upload_size(body.size_bytes, settings.upload_max_bytes)
+        sha256 = check_sha256(body.sha256)
+        path = blob_relative_path(sha256, safe_extension(content_type))
+
+        async def find_upload() -> StoredMedia:
+            # The presigned PUT signed the checksum, so an object at this key holds these
+            # bytes. If GC removed it meanwhile, the client has to PUT it again.
+            blob = await storage.stat_blob(path)
+            if blob is None or blob.size_bytes != body.size_bytes:
+                raise AppError(
+                    code="upload_not_found",
+                    message="No uploaded image matches; PUT it to the presigned URL first.",
+                    status_code=409,
                 )
+            return StoredMedia(
+                path=path, mime=content_type, bytes_written=blob.size_bytes, sha256=sha256
             )
-            if (pending_count or 0) >= settings.max_pending_verification_captures_per_node:
-                await record_abuse_event(
-                    db=db,
-                    event_type="pending_verification_cap_reached",
-                    user_id=user.id,
-                    node_id=capture.node_id,
-                    capture_id=capture.id,
-                    details={
-                        "max_pending_per_node": settings.max_pending_verification_captures_per_node,
-                        "pending_count": int(pending_count or 0),
-                    },
+
+        stored = await find_upload()
+        metrics.media_blob_uploads_total.labels(outcome="direct").inc()
+        return await _attach_capture_image(
+            db=db,
+            capture=capture,
+            stored=stored,
+            restore=find_upload,
+            user=user,
+            storage=storage,
+            verification_events=verification_events,
+            variant_pipeline=variant_pipeline,
+            settings=settings,
+            now=now(),
+            metadata_check=None,
+        )
+
+
+def _upload_session_headers(
+    upload_session: CaptureUploadSession, *, offset: int
+) -> dict[str, str]:
+    return {
+        "Upload-Offset": str(offset),
+        "Upload-Length": str(upload_session.length),
+        "Upload-Expires": format_datetime(upload_session.expires_at, usegmt=True),
+        "Cache-Control": "no-store",
+    }
+
+
+async def _get_upload_session(
+    db: DbSessionDep,
+    capture_id: uuid.UUID,
+    upload_id: uuid.UUID,
+    user: CurrentUser,
+    now_time: dt.datetime,
+) -> CaptureUploadSession:
+    row = (
+        await db.execute(
+            select(CaptureUploadSession, Capture.user_id)
+            .join(Capture, Capture.id == CaptureUploadSession.capture_id)
+            .where(
+                CaptureUploadSession.id == upload_id,
+                CaptureUploadSession.capture_id == capture_id,
+            )
+        )
+    ).one_or_none()
+    if row is None:
+        raise AppError(
+            code="upload_session_not_found", message="Upload session not found", status_code=404
+        )
+    upload_session, owner_id = row
+    if owner_id != user.id:
+        raise AppError(code="forbidden", message="Forbidden", status_code=403)
+    if upload_session.expires_at <= now_time:
+        raise AppError(
+            code="upload_expired",
+            message="Upload session expired; start a new one.",
+            status_code=410,
+            details={"expires_at": upload_session.expires_at.isoformat()},
+        )
+    return upload_session
+
+
+async def _finalize_capture_upload(
+    *,
+    db: DbSessionDep,
+    upload_session: CaptureUploadSession,
+    staged: StagedUpload,
+    user: CurrentUser,
+    storage: MediaStorageDep,
+    verification_events: VerificationEventEmitter,
+    variant_pipeline: MediaVariantPipeline,
+    settings: Settings,
+    now: dt.datetime,
+) -> CapturePublic:
+    capture = await _get_capture_for_upload(db, upload_session.capture_id, user, settings)
+
+    async def save_staged() -> StoredMedia:
+        handle = await asyncio.to_thread(staged.open_reader)
+        try:
+            upload = UploadFile(
+                file=handle,
+                size=upload_session.length,
+                headers=Headers({"content-type": upload_session.content_type}),
+            )
+            # Same type, size-cap and hashing path as a multipart upload.
+            return await storage.save_capture_image(capture_id=capture.id, upload=upload)
+        finally:
+            await asyncio.to_thread(handle.close)
+
+    handle = await asyncio.to_thread(staged.open_reader)
+    try:
+        exif = await asyncio.to_thread(read_exif_metadata, handle)
+    finally:
+        await asyncio.to_thread(handle.close)
+    stored = await save_staged()
+    metrics.upload_bytes_total.labels(mime=stored.mime or "", outcome="success").inc(
+        float(stored.bytes_written)
+    )
+    metrics.media_blob_uploads_total.labels(
+        outcome="deduplicated" if stored.deduplicated else "stored"
+    ).inc()
+    # Committed together with the image by _attach_capture_image.
+    await db.delete(upload_session)
+    metadata_check = await check_capture_metadata(
+        db, capture=capture, metadata=exif, settings=settings, now=now
+    )
+    return await _attach_capture_image(
+        db=db,
+        capture=capture,
+        stored=stored,
+        restore=save_staged,
+        user=user,
+        storage=storage,
+        verification_events=verification_events,
+        variant_pipeline=variant_pipeline,
+        settings=settings,
+        now=now,
+        metadata_check=metadata_check,
+    )
+
+
+@router.post(
+    "/captures/{capture_id}/uploads",
+    response_model=CaptureUploadSessionPublic,
+    status_code=201,
+)
+async def create_capture_upload(
+    capture_id: uuid.UUID,
+    body: CreateCaptureUploadRequest,
+    response: Response,
+    db: DbSessionDep,
+    user: CurrentUser,
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+) -> CaptureUploadSessionPublic:
+    """Open a resumable upload: the client PATCHes chunks and HEADs to find where to resume.
+
+    Type and declared size are checked here so a doomed upload is refused before any
+    bytes move; the finished file goes through `save_capture_image` like a multipart one.
+    """
+    capture = await _get_capture_for_upload(db, capture_id, user, settings)
+    content_type = check_upload_content_type(
+        body.content_type, {mime.lower() for mime in settings.upload_allowed_mime_types}
+    )
+    check_upload_size(body.size_bytes, settings.upload_max_bytes)
+    now_time = now()
+    upload_session = CaptureUploadSession(
+        capture_id=capture.id,
+        content_type=content_type,
+        length=body.size_bytes,
+        created_at=now_time,
+        expires_at=now_time + dt.timedelta(seconds=settings.upload_session_ttl_seconds),
+    )
+    db.add(upload_session)
+    await db.commit()
+    response.headers["Location"] = f"/v1/captures/{capture.id}/uploads/{upload_session.id}"
+    response.headers.update(_upload_session_headers(upload_session, offset=0))
+    return CaptureUploadSessionPublic(
+        upload_id=upload_session.id,
+        capture_id=capture.id,
+        offset=0,
+        size_bytes=upload_session.length,
+        content_type=upload_session.content_type,
+        expires_at=upload_session.expires_at,
+    )
+
+
+@router.head("/captures/{capture_id}/uploads/{upload_id}", status_code=200)
+async def get_capture_upload_offset(
+    capture_id: uuid.UUID,
+    upload_id: uuid.UUID,
+    db: DbSessionDep,
+    user: CurrentUser,
+    staging: UploadStagingDep,
+    now: UtcNow = Depends(get_utcnow),
+) -> Response:
+    """Report how many bytes of the upload are stored (`Upload-Offset`)."""
+    upload_session = await _get_upload_session(db, capture_id, upload_id, user, now())
+    offset = await staging.offset(upload_session.id)
+    return Response(
+        status_code=200, headers=_upload_session_headers(upload_session, offset=offset)
+    )
+
+
+@router.patch(
+    "/captures/{capture_id}/uploads/{upload_id}",
+    response_model=CapturePublic,
+    responses={204: {"description": "Chunk stored; more bytes expected."}},
+)
+async def append_capture_upload(
+    capture_id: uuid.UUID,
+    upload_id: uuid.UUID,
+    request: Request,
+    db: DbSessionDep,
+    user: CurrentUser,
+    storage: MediaStorageDep,
+    staging: UploadStagingDep,
+    verification_events: VerificationEventEmitterDep,
+    upload_offset: str | None = Header(default=None),
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+    variant_pipeline: MediaVariantPipeline = Depends(get_media_variant_pipeline),
+) -> Response | CapturePublic:
+    """Append the request body at `Upload-Offset`.
+
+    Returns 204 with the new offset while bytes are missing. The request that supplies
+    the last byte finalizes the upload and returns the capture, exactly as
+    `POST /captures/{id}/image` would.
+    """
+    # str.isdigit() also accepts digits such as "²" that int() rejects.
+    if upload_offset is None or re.fullmatch(r"[0-9]+", upload_offset) is None:
+        raise AppError(
+            code="invalid_upload_offset",
+            message="Upload-Offset header must be a non-negative integer.",
+            status_code=400,
+        )
+    async with observe_operation(
+        "append_capture_upload",
+        attributes={
+            "capture.id": str(capture_id),
+            "upload.id": str(upload_id),
+        },
+    ):
+        upload_session = await _get_upload_session(db, capture_id, upload_id, user, now())
+        async with staging.locked(upload_session.id) as staged:
+            # A retry that overlapped the finalizing request was read before its commit;
+            # the session row is gone now, and finalizing again would double-attach.
+            still_open = await db.scalar(
+                select(CaptureUploadSession.id).where(
+                    CaptureUploadSession.id == upload_session.id
                 )
+            )
+            if still_open is None:
+                await staging.delete(upload_session.id)
                 raise AppError(
-                    code="pending_verification_cap_reached",
-                    message="Pending verification cap reached",
-                    status_code=429,
-                    details={
-                        "max_pending_per_node": settings.max_pending_verification_captures_per_node,
-                    },
+                    code="upload_session_not_found",
+                    message="Upload session not found",
+                    status_code=404,
                 )
-
-        stored = await storage.save_capture_image(capture_id=capture.id, upload=file)
-        metrics.upload_bytes_total.labels(mime=stored.mime or "", outcome="success").inc(
-            float(stored.bytes_written)
-        )
-        capture.image_path = stored.path
-        capture.image_mime = stored.mime
-        promoted = False
-        if capture.state == CaptureState.draft.value:
-            apply_capture_transition_with_audit(
+            if int(upload_offset) != staged.offset:
+                raise AppError(
+                    code="upload_offset_mismatch",
+                    message="Upload-Offset does not match the stored offset.",
+                    status_code=409,
+                    details={"offset": staged.offset},
+                )
+            try:
+                offset = await staged.append(request.stream(), length=upload_session.length)
+            except ClientDisconnect as exc:
+                raise AppError(
+                    code="upload_incomplete",
+                    message="Upload interrupted before completion.",
+                    status_code=400,
+                ) from exc
+            if offset < upload_session.length:
+                return Response(
+                    status_code=204,
+                    headers=_upload_session_headers(upload_session, offset=offset),
+                )
+            public = await _finalize_capture_upload(
                 db=db,
-                capture=capture,
-                target_state=CaptureState.pending_verification,
-                reason_code="image_uploaded",
-                actor_type="user",
-                actor_user_id=user.id,
-            )
-            promoted = True
-        await db.commit()
-        await db.refresh(capture)
-        if promoted:
-            await verification_events.capture_uploaded(
-                capture_id=capture.id,
-                node_id=capture.node_id,
-                user_id=capture.user_id,
+                upload_session=upload_session,
+                staged=staged,
+                user=user,
+                storage=storage,
+                verification_events=verification_events,
+                variant_pipeline=variant_pipeline,
+                settings=settings,
+                now=now(),
             )
-        return capture_to_public(capture, base_media_url=settings.media_public_base_url)
+            # Still under the lock, so no later request sees the completed file.
+            await staging.delete(upload_session.id)
+        return public
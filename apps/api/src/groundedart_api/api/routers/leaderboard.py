@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import uuid
+
+from fastapi import APIRouter, Depends, Query, Request
+
+from groundedart_api.api.routers.nodes import parse_bbox
+from groundedart_api.api.schemas import LeaderboardEntry, LeaderboardResponse
+from groundedart_api.db.session import DbSessionDep
+from groundedart_api.domain.errors import AppError
+from groundedart_api.domain.leaderboard import (
+    LeaderboardCache,
+    LeaderboardPeriod,
+    LeaderboardScope,
+    decode_leaderboard_cursor,
+    global_leaderboard,
+    scoped_leaderboard,
+)
+from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
+from groundedart_api.settings import Settings, get_settings
+from groundedart_api.time import UtcNow, get_utcnow
+
+router = APIRouter(prefix="/v1", tags=["leaderboard"])
+
+
+def get_leaderboard_cache(request: Request) -> LeaderboardCache:
+    return request.app.state.leaderboard_cache
+
+
+@router.get("/leaderboard", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    db: DbSessionDep,
+    scope: LeaderboardScope = Query(default="global"),
+    period: LeaderboardPeriod = Query(default="all"),
+    node_id: uuid.UUID | None = Query(default=None),
+    bbox: str | None = Query(default=None, description="minLng,minLat,maxLng,maxLat"),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=25, ge=1, le=100),
+    cache: LeaderboardCache = Depends(get_leaderboard_cache),
+    settings: Settings = Depends(get_settings),
+    now: UtcNow = Depends(get_utcnow),
+) -> LeaderboardResponse:
+    if scope == "node" and node_id is None:
+        raise AppError(
+            code="invalid_leaderboard_scope",
+            message="node_id is required for scope=node",
+            status_code=400,
+        )
+    if scope == "area" and not bbox:
+        raise AppError(
+            code="invalid_leaderboard_scope",
+            message="bbox is required for scope=area",
+            status_code=400,
+        )
+    parsed_bbox = parse_bbox(bbox) if scope == "area" and bbox else None
+    decoded_cursor = decode_leaderboard_cursor(cursor) if cursor else None
+
+    cache_key = (
+        DEFAULT_RANK_VERSION,
+        scope,
+        period,
+        node_id if scope == "node" else None,
+        parsed_bbox,
+        cursor,
+        limit,
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if scope == "global":
+        page = await global_leaderboard(
+            db=db,
+            rank_version=DEFAULT_RANK_VERSION,
+            period=period,
+            cursor=decoded_cursor,
+            limit=limit,
+        )
+    else:
+        page = await scoped_leaderboard(
+            db=db,
+            rank_version=DEFAULT_RANK_VERSION,
+            period=period,
+            node_id=node_id if scope == "node" else None,
+            bbox=parsed_bbox,
+            today=now().date(),
+            cursor=decoded_cursor,
+            limit=limit,
+        )
+
+    response = LeaderboardResponse(
+        scope=scope,
+        period=period,
+        rank_version=DEFAULT_RANK_VERSION,
+        entries=[
+            LeaderboardEntry(position=row.position, user_id=row.user_id, points=row.points)
+            for row in page.rows
+        ],
+        next_cursor=page.next_cursor,
+    )
+    cache.set(cache_key, response, ttl_seconds=settings.leaderboard_cache_ttl_seconds)
+    return response
@@ -1,23 +1,47 @@
 from __future__ import annotations
 
+import datetime as dt
 import uuid
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
 
 from groundedart_api.api.schemas import (
     MeResponse,
     NextUnlock,
     NotificationPublic,
+    NotificationsMarkReadRequest,
+    NotificationsMarkReadResponse,
     NotificationsResponse,
+    NotificationsUnreadCountResponse,
     RankBreakdown,
     RankBreakdownCaps,
+    RankHistoryPoint,
+    RankHistoryResponse,
 )
 from groundedart_api.auth.deps import CurrentUser
 from groundedart_api.db.models import UserNotification
-from groundedart_api.db.session import DbSessionDep
+from groundedart_api.db.session import DbSessionDep, create_sessionmaker
 from groundedart_api.domain.errors import AppError
+from groundedart_api.domain.notifications import (
+    decode_notification_cursor,
+    get_unread_count,
+    list_notification_page,
+    mark_notifications_read,
+)
+from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
+from groundedart_api.domain.rank_history import (
+    RANK_HISTORY_DEFAULT_DAYS,
+    RankHistoryBucket,
+    compute_rank_history,
+)
 from groundedart_api.domain.rank_projection import compute_rank_projection
+from groundedart_api.domain.user_events import (
+    decode_user_event_cursor,
+    get_user_event_broker,
+    stream_user_events,
+)
+from groundedart_api.settings import Settings, get_settings
 from groundedart_api.time import UtcNow, get_utcnow
 
 router = APIRouter(prefix="/v1", tags=["me"])
@@ -51,6 +75,51 @@ async def me(db: DbSessionDep, user: CurrentUser) -> MeResponse:
     )
 
 
+@router.get("/me/rank/history", response_model=RankHistoryResponse)
+async def rank_history(
+    db: DbSessionDep,
+    user: CurrentUser,
+    from_date: dt.date | None = Query(default=None, alias="from"),
+    to_date: dt.date | None = Query(default=None, alias="to"),
+    bucket: RankHistoryBucket | None = Query(
+        default=None,
+        description="Omit to pick the finest bucket that keeps the series short.",
+    ),
+    now: UtcNow = Depends(get_utcnow),
+) -> RankHistoryResponse:
+    end = to_date or now().date()
+    start = from_date or dt.date.fromordinal(
+        max(end.toordinal() - (RANK_HISTORY_DEFAULT_DAYS - 1), 1)
+    )
+    history = await compute_rank_history(
+        db=db,
+        user_id=user.id,
+        rank_version=DEFAULT_RANK_VERSION,
+        start=start,
+        end=end,
+        bucket=bucket,
+    )
+    return RankHistoryResponse(
+        rank_version=DEFAULT_RANK_VERSION,
+        bucket=history.bucket,
+        from_date=history.start,
+        to_date=history.end,
+        points=[
+            RankHistoryPoint(
+                bucket_start=point.bucket_start,
+                points=point.points,
+                points_cumulative=point.points_cumulative,
+                verified_captures=point.verified_captures,
+                caps_applied=RankBreakdownCaps(
+                    per_node_per_day=point.per_node_per_day_removed,
+                    per_day_total=point.per_day_removed,
+                ),
+            )
+            for point in history.points
+        ],
+    )
+
+
 def notification_to_public(notification: UserNotification) -> NotificationPublic:
     return NotificationPublic(
         id=notification.id,
@@ -69,15 +138,57 @@ async def list_notifications(
     user: CurrentUser,
     limit: int = Query(default=50, ge=1, le=200),
     unread_only: bool = Query(default=False),
+    cursor: str | None = Query(default=None),
 ) -> NotificationsResponse:
-    query = select(UserNotification).where(UserNotification.user_id == user.id)
-    if unread_only:
-        query = query.where(UserNotification.read_at.is_(None))
-    notifications = (
-        await db.scalars(query.order_by(UserNotification.created_at.desc()).limit(limit))
-    ).all()
+    page = await list_notification_page(
+        db=db,
+        user_id=user.id,
+        cursor=decode_notification_cursor(cursor) if cursor else None,
+        limit=limit,
+        unread_only=unread_only,
+    )
     return NotificationsResponse(
-        notifications=[notification_to_public(notification) for notification in notifications]
+        notifications=[
+            notification_to_public(notification) for notification in page.notifications
+        ],
+        next_cursor=page.next_cursor,
+        latest_cursor=page.latest_cursor,
+        unread_count=await get_unread_count(db=db, user_id=user.id),
+    )
+
+
+@router.get("/me/notifications/unread_count", response_model=NotificationsUnreadCountResponse)
+async def notifications_unread_count(
+    db: DbSessionDep, user: CurrentUser
+) -> NotificationsUnreadCountResponse:
+    return NotificationsUnreadCountResponse(
+        unread_count=await get_unread_count(db=db, user_id=user.id)
+    )
+
+
+@router.post("/me/notifications:markRead", response_model=NotificationsMarkReadResponse)
+async def mark_notifications_read_bulk(
+    body: NotificationsMarkReadRequest,
+    db: DbSessionDep,
+    user: CurrentUser,
+    now: UtcNow = Depends(get_utcnow),
+) -> NotificationsMarkReadResponse:
+    if (body.ids is None) == (body.up_to_cursor is None):
+        raise AppError(
+            code="invalid_mark_read_request",
+            message="Provide exactly one of ids or up_to_cursor",
+            status_code=400,
+        )
+    result = await mark_notifications_read(
+        db=db,
+        user_id=user.id,
+        now=now(),
+        ids=body.ids,
+        up_to=decode_notification_cursor(body.up_to_cursor) if body.up_to_cursor else None,
+    )
+    await db.commit()
+    return NotificationsMarkReadResponse(
+        marked_read=result.marked_read, unread_count=result.unread_count
     )
 
 
@@ -96,7 +207,38 @@ async def mark_notification_read(
             status_code=404,
         )
     if notification.read_at is None:
-        notification.read_at = now()
+        await mark_notifications_read(db=db, user_id=user.id, now=now(), ids=[notification.id])
         await db.commit()
         await db.refresh(notification)
     return notification_to_public(notification)
+
+
+@router.get("/me/stream", response_class=StreamingResponse)
+async def stream_events(
+    db: DbSessionDep,
+    user: CurrentUser,
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+    last_event_id: str | None = Query(
+        default=None,
+        description="Resume point for clients that cannot set the Last-Event-ID header.",
+    ),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Server-Sent Events: `notification` and `capture_state` events for the current user."""
+    resume_from = last_event_id_header or last_event_id
+    after = decode_user_event_cursor(resume_from) if resume_from else None
+    # The stream outlives the handler; release the request's pooled connection now.
+    await db.close()
+    return StreamingResponse(
+        stream_user_events(
+            broker=get_user_event_broker(),
+            sessionmaker=create_sessionmaker(settings.database_url),
+            user_id=user.id,
+            after=after,
+            heartbeat_seconds=settings.user_events_heartbeat_seconds,
+            poll_seconds=settings.user_events_poll_seconds,
+            replay_limit=settings.user_events_replay_limit,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -36,6 +36,7 @@ from groundedart_api.domain.gating import (
 from groundedart_api.domain.rank_projection import get_rank_for_user
 from groundedart_api.observability.ops import observe_operation
 from groundedart_api.settings import Settings, get_settings
+from groundedart_api.storage.variants import build_srcset, build_thumbnail_url
 from groundedart_api.time import UtcNow, get_utcnow
 
 router = APIRouter(prefix="/v1", tags=["nodes"])
@@ -65,6 +66,7 @@ def _node_select_with_coords():
         Node.radius_m,
         Node.min_rank,
         Node.image_path,
+        Node.image_variants,
         Node.image_attribution,
         Node.image_source_url,
         Node.image_license,
@@ -96,12 +98,27 @@ def _row_to_node_public(row: Any, *, base_media_url: str) -> NodePublic:
         radius_m=row.radius_m,
         min_rank=row.min_rank,
         image_url=image_url,
+        image_srcset=build_srcset(row.image_variants, base_media_url=base_media_url),
+        thumbnail_url=build_thumbnail_url(row.image_variants, base_media_url=base_media_url),
         image_attribution=row.image_attribution,
         image_source_url=row.image_source_url,
         image_license=row.image_license,
     )
 
 
+def parse_bbox(bbox: str) -> tuple[float, float, float, float]:
+    """`minLng,minLat,maxLng,maxLat` query value; raises `invalid_bbox`."""
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(x) for x in bbox.split(","))
+    except Exception as exc:  # noqa: BLE001
+        raise AppError(
+            code="invalid_bbox",
+            message="Invalid bbox format",
+            details={"bbox": bbox},
+        ) from exc
+    return min_lng, min_lat, max_lng, max_lat
+
+
 @router.get("/nodes", response_model=NodesResponse)
 async def list_nodes(
     db: DbSessionDep,
@@ -119,15 +136,7 @@ async def list_nodes(
 
         query = _node_select_with_coords().where(Node.min_rank <= rank)
         if bbox:
-            try:
-                min_lng, min_lat, max_lng, max_lat = (float(x) for x in bbox.split(","))
-            except Exception as exc:  # noqa: BLE001
-                raise AppError(
-                    code="invalid_bbox",
-                    message="Invalid bbox format",
-                    details={"bbox": bbox},
-                ) from exc
-            envelope = func.ST_MakeEnvelope(min_lng, min_lat, max_lng, max_lat, 4326)
+            envelope = func.ST_MakeEnvelope(*parse_bbox(bbox), 4326)
             query = query.where(func.ST_Intersects(Node.location, envelope))
 
         rows = (await db.execute(query.limit(500))).all()
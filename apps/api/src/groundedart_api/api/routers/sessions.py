@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import datetime as dt
+import uuid
 
 from fastapi import APIRouter, Depends, Response
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from groundedart_api.api.schemas import AnonymousSessionRequest, AnonymousSessionResponse
-from groundedart_api.auth.tokens import generate_opaque_token, hash_opaque_token
+from groundedart_api.auth.tokens import (
+    generate_opaque_token,
+    generate_signed_session_token,
+    hash_opaque_token,
+)
 from groundedart_api.db.models import CuratorRankCache, Device, Session, User
 from groundedart_api.db.session import DbSessionDep
 from groundedart_api.settings import Settings, get_settings
@@ -57,10 +62,19 @@ async def create_anonymous_session(
     if user is None:
         raise RuntimeError("Device references missing user")
 
-    token = generate_opaque_token()
-    token_hash = hash_opaque_token(token, settings)
+    session_id = uuid.uuid4()
     expires_at = now() + dt.timedelta(seconds=settings.session_ttl_seconds)
-    db.add(Session(user_id=user.id, token_hash=token_hash, expires_at=expires_at))
+    if settings.session_token_format == "signed":
+        token = generate_signed_session_token(
+            session_id=session_id,
+            user_id=user.id,
+            expires_at=expires_at,
+            settings=settings,
+        )
+    else:
+        token = generate_opaque_token()
+    token_hash = hash_opaque_token(token, settings)
+    db.add(Session(id=session_id, user_id=user.id, token_hash=token_hash, expires_at=expires_at))
     await db.commit()
 
     response.set_cookie(
@@ -32,6 +32,22 @@ class RankBreakdown(BaseModel):
     caps_applied: RankBreakdownCaps
 
 
+class RankHistoryPoint(BaseModel):
+    bucket_start: dt.date
+    points: int = 0
+    points_cumulative: int = 0
+    verified_captures: int = 0
+    caps_applied: RankBreakdownCaps
+
+
+class RankHistoryResponse(BaseModel):
+    rank_version: str
+    bucket: Literal["day", "week", "month"]
+    from_date: dt.date = Field(serialization_alias="from")
+    to_date: dt.date = Field(serialization_alias="to")
+    points: list[RankHistoryPoint]
+
+
 class NextUnlock(BaseModel):
     min_rank: int
     summary: str
@@ -62,6 +78,20 @@ class RankEventsResponse(BaseModel):
     events: list[RankEvent]
 
 
+class LeaderboardEntry(BaseModel):
+    position: int = Field(ge=1)
+    user_id: uuid.UUID
+    points: int
+
+
+class LeaderboardResponse(BaseModel):
+    scope: Literal["global", "node", "area"]
+    period: Literal["all", "30d"]
+    rank_version: str
+    entries: list[LeaderboardEntry]
+    next_cursor: str | None = None
+
+
 class NodePublic(BaseModel):
     id: uuid.UUID
     visibility: Literal["visible"] = "visible"
@@ -73,6 +103,9 @@ class NodePublic(BaseModel):
     radius_m: int = Field(ge=25)
     min_rank: int
     image_url: str | None = None
+    # WebP width variants ("<url> 320w, ...") and a small JPEG, once rendered.
+    image_srcset: str | None = None
+    thumbnail_url: str | None = None
     image_attribution: str | None = None
     image_source_url: str | None = None
     image_license: str | None = None
@@ -184,6 +217,8 @@ class CapturePublic(BaseModel):
     visibility: str
     created_at: dt.datetime
     image_url: str | None = None
+    image_srcset: str | None = None
+    thumbnail_url: str | None = None
     attribution_artist_name: str | None = None
     attribution_artwork_title: str | None = None
     attribution_source: str | None = None
@@ -192,6 +227,40 @@ class CapturePublic(BaseModel):
     rights_attested_at: dt.datetime | None = None
 
 
+class CaptureImagePresignRequest(BaseModel):
+    sha256: str = Field(min_length=64, max_length=64)
+    size_bytes: int = Field(gt=0)
+    content_type: str
+
+
+class CaptureImagePresignResponse(BaseModel):
+    upload_required: bool
+    method: str = "PUT"
+    url: str | None = None
+    headers: dict[str, str] = Field(default_factory=dict)
+    expires_at: dt.datetime | None = None
+
+
+class CaptureImageCompleteRequest(BaseModel):
+    sha256: str = Field(min_length=64, max_length=64)
+    size_bytes: int = Field(gt=0)
+    content_type: str
+
+
+class CreateCaptureUploadRequest(BaseModel):
+    size_bytes: int = Field(gt=0)
+    content_type: str
+
+
+class CaptureUploadSessionPublic(BaseModel):
+    upload_id: uuid.UUID
+    capture_id: uuid.UUID
+    offset: int
+    size_bytes: int
+    content_type: str
+    expires_at: dt.datetime
+
+
 class CreateCaptureResponse(BaseModel):
     capture: CapturePublic
 
@@ -217,6 +286,23 @@ class NotificationPublic(BaseModel):
 
 class NotificationsResponse(BaseModel):
     notifications: list[NotificationPublic]
+    next_cursor: str | None = None
+    latest_cursor: str | None = None
+    unread_count: int = 0
+
+
+class NotificationsUnreadCountResponse(BaseModel):
+    unread_count: int
+
+
+class NotificationsMarkReadRequest(BaseModel):
+    ids: list[uuid.UUID] | None = Field(default=None, min_length=1, max_length=500)
+    up_to_cursor: str | None = None
+
+
+class NotificationsMarkReadResponse(BaseModel):
+    marked_read: int
+    unread_count: int
 
 
 class ReportPublic(BaseModel):
@@ -239,6 +325,24 @@ class CreateReportResponse(BaseModel):
     report: ReportPublic
 
 
+CaptureMetadataCheckOutcome = Literal["consistent", "inconsistent", "missing"]
+
+
+class CaptureMetadataGps(BaseModel):
+    lat: float
+    lng: float
+    distance_m: float
+
+
+class CaptureMetadataCheck(BaseModel):
+    exif: bool
+    gps_check: CaptureMetadataCheckOutcome
+    gps: CaptureMetadataGps | None = None
+    time_check: CaptureMetadataCheckOutcome
+    captured_at: dt.datetime | None = None
+    time_source: Literal["gps", "exif_offset", "exif_local"] | None = None
+
+
 class AdminCapture(BaseModel):
     id: uuid.UUID
     node_id: uuid.UUID
@@ -254,12 +358,24 @@ class AdminCapture(BaseModel):
     attribution_source_url: str | None = None
     rights_basis: CaptureRightsBasis | None = None
     rights_attested_at: dt.datetime | None = None
+    image_metadata_check: CaptureMetadataCheck | None = None
 
 
 class AdminCapturesResponse(BaseModel):
     captures: list[AdminCapture]
 
 
+class AdminSimilarCapture(BaseModel):
+    capture: AdminCapture
+    distance: int
+
+
+class AdminSimilarCapturesResponse(BaseModel):
+    capture_id: uuid.UUID
+    phash: str | None = None
+    matches: list[AdminSimilarCapture]
+
+
 class AdminCaptureTransitionRequest(BaseModel):
     target_state: str
     reason_code: str | None = None
@@ -270,6 +386,52 @@ class AdminCaptureTransitionResponse(BaseModel):
     capture: AdminCapture
 
 
+class AdminCaptureBatchTransitionItem(AdminCaptureTransitionRequest):
+    capture_id: uuid.UUID
+
+
+class AdminCaptureBatchTransitionRequest(BaseModel):
+    items: list[AdminCaptureBatchTransitionItem] = Field(min_length=1, max_length=500)
+
+
+class AdminCaptureBatchTransitionResponse(BaseModel):
+    captures: list[AdminCapture]
+
+
+class AdminQueueDepth(BaseModel):
+    unclaimed: int
+    leased: int
+
+
+class AdminCaptureLease(BaseModel):
+    capture: AdminCapture
+    moderator_id: str
+    expires_at: dt.datetime
+
+
+class AdminCaptureClaimResponse(BaseModel):
+    leases: list[AdminCaptureLease]
+    queue_depth: AdminQueueDepth
+
+
+class AdminCaptureLeasesRequest(BaseModel):
+    capture_ids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+
+
+class AdminCaptureLeasesResponse(BaseModel):
+    leases: list[AdminCaptureLease]
+
+
+class AdminCaptureLeaseReleaseResponse(BaseModel):
+    released: list[uuid.UUID]
+
+
+class AdminCaptureQueueResponse(BaseModel):
+    captures: list[AdminCapture]
+    next_cursor: str | None = None
+    queue_depth: AdminQueueDepth
+
+
 class AdminAbuseEvent(BaseModel):
     id: uuid.UUID
     event_type: str
@@ -284,6 +446,28 @@ class AdminAbuseEventsResponse(BaseModel):
     events: list[AdminAbuseEvent]
 
 
+class AdminAbuseStatsPoint(BaseModel):
+    bucket_start: dt.datetime
+    events: int
+
+
+class AdminAbuseStatsGroup(BaseModel):
+    event_type: str | None = None
+    user_id: uuid.UUID | None = None
+    node_id: uuid.UUID | None = None
+    total: int
+    buckets: list[AdminAbuseStatsPoint]
+
+
+class AdminAbuseStatsResponse(BaseModel):
+    bucket: str
+    group_by: list[Literal["event_type", "user_id", "node_id"]]
+    source: Literal["raw", "rollup"]
+    from_time: dt.datetime = Field(serialization_alias="from")
+    to_time: dt.datetime = Field(serialization_alias="to")
+    groups: list[AdminAbuseStatsGroup]
+
+
 class AdminReport(BaseModel):
     id: uuid.UUID
     capture_id: uuid.UUID
@@ -306,3 +490,25 @@ class AdminReportResolveRequest(BaseModel):
 
 class AdminReportResolveResponse(BaseModel):
     report: AdminReport
+
+
+class AdminReportGroup(BaseModel):
+    capture_id: uuid.UUID
+    node_id: uuid.UUID
+    capture_state: str
+    open_reports: int
+    total_reports: int
+    open_reason_counts: dict[str, int]
+    first_reported_at: dt.datetime
+    last_reported_at: dt.datetime
+    auto_hidden_at: dt.datetime | None = None
+
+
+class AdminReportGroupsResponse(BaseModel):
+    groups: list[AdminReportGroup]
+
+
+class AdminCaptureReportsResolveResponse(BaseModel):
+    capture_id: uuid.UUID
+    resolution: str
+    resolved: int
@@ -5,7 +5,12 @@ from typing import Annotated
 from fastapi import Depends, Header, Request
 from sqlalchemy import select
 
-from groundedart_api.auth.tokens import hash_opaque_token
+from groundedart_api.auth.revocation import SessionRevocationList, get_session_revocation_list
+from groundedart_api.auth.tokens import (
+    hash_opaque_token,
+    is_signed_session_token,
+    verify_signed_session_token,
+)
 from groundedart_api.db.models import Session, User
 from groundedart_api.db.session import DbSessionDep
 from groundedart_api.domain.errors import AppError
@@ -18,11 +23,29 @@ async def get_optional_user(
     settings: Annotated[Settings, Depends(get_settings)],
     now: Annotated[UtcNow, Depends(get_utcnow)],
     request: Request,
+    revocations: Annotated[SessionRevocationList, Depends(get_session_revocation_list)],
 ) -> User | None:
     session_cookie = request.cookies.get(settings.session_cookie_name)
     if not session_cookie:
         return None
 
+    if is_signed_session_token(session_cookie):
+        claims = verify_signed_session_token(session_cookie, settings)
+        if claims is None:
+            return None
+        now_time = now()
+        if now_time >= claims.expires_at:
+            return None
+        await revocations.ensure_fresh(
+            db,
+            now=now_time,
+            refresh_seconds=settings.session_revocation_refresh_seconds,
+        )
+        if revocations.is_revoked(claims.session_id):
+            return None
+        # Transient identity: handlers only need `user.id`, so skip the users lookup.
+        return User(id=claims.user_id)
+
     token_hash = hash_opaque_token(session_cookie, settings)
     session = await db.scalar(
         select(Session).where(
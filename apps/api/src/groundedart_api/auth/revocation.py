@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import time
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import Session
+
+
+class SessionRevocationList:
+    """Per-worker snapshot of revoked, not-yet-expired session ids.
+
+    Signed session tokens are validated without a DB lookup, so revocation is enforced
+    against this snapshot, reloaded from `sessions.revoked_at` at most once per
+    `refresh_seconds`. Only unexpired sessions are kept, which bounds its size.
+    """
+
+    def __init__(self) -> None:
+        self._revoked: frozenset[uuid.UUID] = frozenset()
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def is_stale(self, refresh_seconds: int) -> bool:
+        if self._loaded_at is None:
+            return True
+        return time.monotonic() - self._loaded_at >= refresh_seconds
+
+    def is_revoked(self, session_id: uuid.UUID) -> bool:
+        return session_id in self._revoked
+
+    async def refresh(self, db: AsyncSession, *, now: dt.datetime) -> None:
+        rows = await db.scalars(
+            select(Session.id).where(
+                Session.revoked_at.is_not(None),
+                Session.expires_at > now,
+            )
+        )
+        self._revoked = frozenset(rows.all())
+        self._loaded_at = time.monotonic()
+
+    async def ensure_fresh(
+        self,
+        db: AsyncSession,
+        *,
+        now: dt.datetime,
+        refresh_seconds: int,
+    ) -> None:
+        if not self.is_stale(refresh_seconds):
+            return
+        async with self._lock:
+            if self.is_stale(refresh_seconds):
+                await self.refresh(db, now=now)
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+
+_revocation_list = SessionRevocationList()
+
+
+def get_session_revocation_list() -> SessionRevocationList:
+    return _revocation_list
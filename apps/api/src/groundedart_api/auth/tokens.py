@@ -1,10 +1,30 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import datetime as dt
 import hashlib
+import hmac
 import secrets
+import struct
+import uuid
+from dataclasses import dataclass
 
 from groundedart_api.settings import Settings
 
+SIGNED_SESSION_TOKEN_PREFIX = "v1."
+
+# session_id (16 bytes) + user_id (16 bytes) + expires_at as unix seconds (8 bytes).
+_SIGNED_SESSION_PAYLOAD = struct.Struct(">16s16sQ")
+_SIGNED_SESSION_MAC_CONTEXT = b"groundedart.session."
+
+
+@dataclass(frozen=True)
+class SignedSessionClaims:
+    session_id: uuid.UUID
+    user_id: uuid.UUID
+    expires_at: dt.datetime
+
 
 def generate_opaque_token() -> str:
     return secrets.token_urlsafe(32)
@@ -14,3 +34,64 @@ def hash_opaque_token(token: str, settings: Settings) -> str:
     payload = (token + settings.token_hash_secret).encode("utf-8")
     return hashlib.sha256(payload).hexdigest()
 
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    padded = value + "=" * (-len(value) % 4)
+    return base64.urlsafe_b64decode(padded.encode("ascii"))
+
+
+def _session_mac(message: str, settings: Settings) -> bytes:
+    return hmac.new(
+        settings.token_hash_secret.encode("utf-8"),
+        _SIGNED_SESSION_MAC_CONTEXT + message.encode("ascii"),
+        hashlib.sha256,
+    ).digest()
+
+
+def is_signed_session_token(token: str) -> bool:
+    # Opaque tokens are urlsafe base64 and never contain a dot.
+    return token.startswith(SIGNED_SESSION_TOKEN_PREFIX)
+
+
+def generate_signed_session_token(
+    *,
+    session_id: uuid.UUID,
+    user_id: uuid.UUID,
+    expires_at: dt.datetime,
+    settings: Settings,
+) -> str:
+    payload = _SIGNED_SESSION_PAYLOAD.pack(
+        session_id.bytes,
+        user_id.bytes,
+        int(expires_at.timestamp()),
+    )
+    message = SIGNED_SESSION_TOKEN_PREFIX + _b64encode(payload)
+    return f"{message}.{_b64encode(_session_mac(message, settings))}"
+
+
+def verify_signed_session_token(token: str, settings: Settings) -> SignedSessionClaims | None:
+    """Return the embedded claims when the MAC is valid; expiry is checked by the caller."""
+    if not is_signed_session_token(token) or not token.isascii():
+        return None
+    message, sep, encoded_mac = token.rpartition(".")
+    if not sep or message == SIGNED_SESSION_TOKEN_PREFIX.rstrip("."):
+        return None
+    try:
+        mac = _b64decode(encoded_mac)
+        payload = _b64decode(message[len(SIGNED_SESSION_TOKEN_PREFIX) :])
+    except (binascii.Error, ValueError):
+        return None
+    if not hmac.compare_digest(mac, _session_mac(message, settings)):
+        return None
+    if len(payload) != _SIGNED_SESSION_PAYLOAD.size:
+        return None
+    session_bytes, user_bytes, expires_ts = _SIGNED_SESSION_PAYLOAD.unpack(payload)
+    return SignedSessionClaims(
+        session_id=uuid.UUID(bytes=session_bytes),
+        user_id=uuid.UUID(bytes=user_bytes),
+        expires_at=dt.datetime.fromtimestamp(expires_ts, tz=dt.UTC),
+    )
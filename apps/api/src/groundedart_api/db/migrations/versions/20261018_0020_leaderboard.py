@@ -0,0 +1,52 @@
+"""leaderboard indexes + rolling rank windows
+
+Revision ID: 20261018_0020
+Revises: 20261018_0019
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0020"
+down_revision = "20261018_0019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_curator_rank_cache_leaderboard",
+        "curator_rank_cache",
+        ["rank_version", sa.text("points_total DESC"), "user_id"],
+    )
+    op.create_index("ix_rank_events_node_created", "rank_events", ["node_id", "created_at"])
+
+    op.create_table(
+        "curator_rank_window",
+        sa.Column("rank_version", sa.String(length=32), nullable=False),
+        sa.Column("window_days", sa.Integer(), nullable=False),
+        sa.Column("user_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("points_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("verified_captures_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("rank_version", "window_days", "user_id"),
+    )
+    op.create_index(
+        "ix_curator_rank_window_leaderboard",
+        "curator_rank_window",
+        ["rank_version", "window_days", sa.text("points_total DESC"), "user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_curator_rank_window_leaderboard", table_name="curator_rank_window")
+    op.drop_table("curator_rank_window")
+    op.drop_index("ix_rank_events_node_created", table_name="rank_events")
+    op.drop_index("ix_curator_rank_cache_leaderboard", table_name="curator_rank_cache")
@@ -0,0 +1,32 @@
+"""key curator_rank_cache by (user_id, rank_version)
+
+Revision ID: 20261018_0021
+Revises: 20261018_0020
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0021"
+down_revision = "20261018_0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("curator_rank_cache_pkey", "curator_rank_cache", type_="primary")
+    op.create_primary_key(
+        "curator_rank_cache_pkey",
+        "curator_rank_cache",
+        ["user_id", "rank_version"],
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM curator_rank_cache WHERE rank_version <> 'v1_points'")
+    op.drop_constraint("curator_rank_cache_pkey", "curator_rank_cache", type_="primary")
+    op.create_primary_key("curator_rank_cache_pkey", "curator_rank_cache", ["user_id"])
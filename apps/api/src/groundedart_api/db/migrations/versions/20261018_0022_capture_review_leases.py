@@ -0,0 +1,48 @@
+"""capture review leases + pending queue index
+
+Revision ID: 20261018_0022
+Revises: 20261018_0021
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0022"
+down_revision = "20261018_0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_captures_pending_queue",
+        "captures",
+        ["created_at", "id"],
+        postgresql_where=sa.text("state = 'pending_verification'"),
+    )
+    op.create_table(
+        "capture_review_leases",
+        sa.Column("capture_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("moderator_id", sa.String(length=64), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["capture_id"], ["captures.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("capture_id"),
+    )
+    op.create_index(
+        "ix_capture_review_leases_moderator",
+        "capture_review_leases",
+        ["moderator_id", "expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_capture_review_leases_moderator", table_name="capture_review_leases")
+    op.drop_table("capture_review_leases")
+    op.drop_index("ix_captures_pending_queue", table_name="captures")
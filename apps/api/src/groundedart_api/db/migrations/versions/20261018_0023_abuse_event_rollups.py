@@ -0,0 +1,39 @@
+"""abuse event rollups
+
+Revision ID: 20261018_0023
+Revises: 20261018_0022
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0023"
+down_revision = "20261018_0022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "abuse_event_rollups",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("user_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("node_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("events", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_abuse_event_rollups_bucket", "abuse_event_rollups", ["bucket_start"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_abuse_event_rollups_bucket", table_name="abuse_event_rollups")
+    op.drop_table("abuse_event_rollups")
@@ -0,0 +1,86 @@
+"""capture report counters
+
+Revision ID: 20261018_0024
+Revises: 20261018_0023
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# revision identifiers, used by Alembic.
+revision = "20261018_0024"
+down_revision = "20261018_0023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "capture_report_counters",
+        sa.Column("capture_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("open_reports", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_reports", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "open_reason_counts",
+            JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("first_reported_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_reported_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("auto_hidden_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["capture_id"], ["captures.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("capture_id"),
+    )
+    op.create_index(
+        "ix_capture_report_counters_open",
+        "capture_report_counters",
+        ["open_reports", "last_reported_at"],
+        postgresql_where=sa.text("open_reports > 0"),
+    )
+    # Backfill from existing reports.
+    op.execute(
+        """
+        INSERT INTO capture_report_counters (
+            capture_id, open_reports, total_reports, open_reason_counts,
+            first_reported_at, last_reported_at
+        )
+        SELECT
+            totals.capture_id,
+            totals.open_reports,
+            totals.total_reports,
+            COALESCE(reasons.open_reason_counts, '{}'::jsonb),
+            totals.first_reported_at,
+            totals.last_reported_at
+        FROM (
+            SELECT
+                capture_id,
+                count(*) FILTER (WHERE resolved_at IS NULL) AS open_reports,
+                count(*) AS total_reports,
+                min(created_at) AS first_reported_at,
+                max(created_at) AS last_reported_at
+            FROM content_reports
+            GROUP BY capture_id
+        ) AS totals
+        LEFT JOIN (
+            SELECT capture_id, jsonb_object_agg(reason, reports) AS open_reason_counts
+            FROM (
+                SELECT capture_id, reason, count(*) AS reports
+                FROM content_reports
+                WHERE resolved_at IS NULL
+                GROUP BY capture_id, reason
+            ) AS open_by_reason
+            GROUP BY capture_id
+        ) AS reasons ON reasons.capture_id = totals.capture_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_capture_report_counters_open", table_name="capture_report_counters")
+    op.drop_table("capture_report_counters")
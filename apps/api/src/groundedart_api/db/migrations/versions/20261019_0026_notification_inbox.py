@@ -0,0 +1,63 @@
+"""notification inbox counters
+
+Revision ID: 20261019_0026
+Revises: 20261018_0025
+Create Date: 2026-10-19
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0026"
+down_revision = "20261018_0025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_notification_counters",
+        sa.Column("user_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("unread_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # Cursor paging orders by (created_at, id); the old index only covered created_at.
+    op.drop_index("ix_user_notifications_user_created", table_name="user_notifications")
+    op.create_index(
+        "ix_user_notifications_user_created",
+        "user_notifications",
+        ["user_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_user_notifications_user_unread",
+        "user_notifications",
+        ["user_id", "created_at", "id"],
+        postgresql_where=sa.text("read_at IS NULL"),
+    )
+    # Backfill from existing notifications.
+    op.execute(
+        """
+        INSERT INTO user_notification_counters (user_id, unread_count, updated_at)
+        SELECT user_id, count(*) FILTER (WHERE read_at IS NULL), now()
+        FROM user_notifications
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_notifications_user_unread", table_name="user_notifications")
+    op.drop_index("ix_user_notifications_user_created", table_name="user_notifications")
+    op.create_index(
+        "ix_user_notifications_user_created",
+        "user_notifications",
+        ["user_id", "created_at"],
+    )
+    op.drop_table("user_notification_counters")
@@ -0,0 +1,48 @@
+"""content-addressed media blobs
+
+Revision ID: 20261019_0027
+Revises: 20261019_0026
+Create Date: 2026-10-19
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0027"
+down_revision = "20261019_0026"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_blobs",
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("path", sa.Text(), nullable=False),
+        sa.Column("mime", sa.String(length=100), nullable=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("sha256"),
+    )
+    op.create_index(
+        "ix_media_blobs_unreferenced",
+        "media_blobs",
+        ["updated_at"],
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+    # Existing capture_{id}.ext files stay where they are; only new uploads are hashed.
+    op.add_column("captures", sa.Column("image_sha256", sa.String(length=64), nullable=True))
+    op.create_index("ix_captures_image_sha256", "captures", ["image_sha256"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_captures_image_sha256", table_name="captures")
+    op.drop_column("captures", "image_sha256")
+    op.drop_index("ix_media_blobs_unreferenced", table_name="media_blobs")
+    op.drop_table("media_blobs")
@@ -0,0 +1,30 @@
+"""image variants on captures and nodes
+
+Revision ID: 20261019_0028
+Revises: 20261019_0027
+Create Date: 2026-10-19
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0028"
+down_revision = "20261019_0027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NULL until the variant pipeline (or scripts/backfill_media_variants.py) renders them.
+    op.add_column("captures", sa.Column("image_variants", JSONB(), nullable=True))
+    op.add_column("nodes", sa.Column("image_variants", JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("nodes", "image_variants")
+    op.drop_column("captures", "image_variants")
@@ -0,0 +1,45 @@
+"""resumable capture upload sessions
+
+Revision ID: 20261019_0029
+Revises: 20261019_0028
+Create Date: 2026-10-19
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0029"
+down_revision = "20261019_0028"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "capture_upload_sessions",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("capture_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("content_type", sa.String(length=100), nullable=False),
+        sa.Column("length", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["capture_id"], ["captures.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_capture_upload_sessions_capture", "capture_upload_sessions", ["capture_id"]
+    )
+    op.create_index(
+        "ix_capture_upload_sessions_expires_at", "capture_upload_sessions", ["expires_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_capture_upload_sessions_expires_at", table_name="capture_upload_sessions")
+    op.drop_index("ix_capture_upload_sessions_capture", table_name="capture_upload_sessions")
+    op.drop_table("capture_upload_sessions")
@@ -0,0 +1,35 @@
+"""perceptual hashes on media blobs
+
+Revision ID: 20261019_0030
+Revises: 20261019_0029
+Create Date: 2026-10-19
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0030"
+down_revision = "20261019_0029"
+branch_labels = None
+depends_on = None
+
+_BANDS = ("phash_b0", "phash_b1", "phash_b2", "phash_b3")
+
+
+def upgrade() -> None:
+    # NULL until the media pipeline (or scripts/backfill_media_variants.py) hashes the blob.
+    op.add_column("media_blobs", sa.Column("phash", sa.BigInteger(), nullable=True))
+    for band in _BANDS:
+        op.add_column("media_blobs", sa.Column(band, sa.Integer(), nullable=True))
+        op.create_index(f"ix_media_blobs_{band}", "media_blobs", [band])
+
+
+def downgrade() -> None:
+    for band in reversed(_BANDS):
+        op.drop_index(f"ix_media_blobs_{band}", table_name="media_blobs")
+        op.drop_column("media_blobs", band)
+    op.drop_column("media_blobs", "phash")
@@ -0,0 +1,33 @@
+"""EXIF metadata cross-check on captures
+
+Revision ID: 20261019_0031
+Revises: 20261019_0030
+Create Date: 2026-10-19
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0031"
+down_revision = "20261019_0030"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NULL for captures created before this revision; the check falls back to created_at.
+    op.add_column(
+        "captures",
+        sa.Column("checkin_issued_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column("captures", sa.Column("image_metadata_check", JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("captures", "image_metadata_check")
+    op.drop_column("captures", "checkin_issued_at")
@@ -5,6 +5,7 @@ import uuid
 
 from geoalchemy2 import Geometry
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     CheckConstraint,
     Date,
@@ -15,6 +16,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -122,7 +124,7 @@ class CuratorRankCache(Base):
         ForeignKey("users.id"),
         primary_key=True,
     )
-    rank_version: Mapped[str] = mapped_column(String(32), nullable=False, default="v1_points")
+    rank_version: Mapped[str] = mapped_column(String(32), primary_key=True, default="v1_points")
 
     points_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     verified_captures_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -133,6 +135,82 @@ class CuratorRankCache(Base):
     updated_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
 
 
+Index(
+    "ix_curator_rank_cache_leaderboard",
+    CuratorRankCache.rank_version,
+    CuratorRankCache.points_total.desc(),
+    CuratorRankCache.user_id,
+)
+
+
+class CuratorRankWindow(Base):
+    __tablename__ = "curator_rank_window"
+
+    rank_version: Mapped[str] = mapped_column(String(32), primary_key=True)
+    window_days: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id"),
+        primary_key=True,
+    )
+    points_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    verified_captures_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    computed_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+
+
+Index(
+    "ix_curator_rank_window_leaderboard",
+    CuratorRankWindow.rank_version,
+    CuratorRankWindow.window_days,
+    CuratorRankWindow.points_total.desc(),
+    CuratorRankWindow.user_id,
+)
+
+
+class RankRefreshOutbox(Base):
+    __tablename__ = "rank_refresh_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+    )
+    rank_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    day: Mapped[dt.date] = mapped_column(Date, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+
+
+class EventOutbox(Base):
+    """Outbound events written with the change they describe, delivered by the dispatcher."""
+
+    __tablename__ = "event_outbox"
+    __table_args__ = (
+        CheckConstraint("status IN ('pending', 'dead')", name="ck_event_outbox_status"),
+        Index(
+            "ix_event_outbox_due",
+            "next_attempt_at",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict[str, object]] = mapped_column(JSONB, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+
+
 class Artist(Base):
     __tablename__ = "artists"
     __table_args__ = (
@@ -169,6 +247,7 @@ class Node(Base):
     image_attribution: Mapped[str | None] = mapped_column(String(300), nullable=True)
     image_source_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     image_license: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    image_variants: Mapped[list[dict[str, object]] | None] = mapped_column(JSONB, nullable=True)
     default_artist_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("artists.id"), nullable=True
     )
@@ -310,6 +389,13 @@ class Capture(Base):
             "rights_basis IS NULL OR rights_basis IN ('i_took_photo', 'permission_granted', 'public_domain')",
             name="ck_captures_rights_basis",
         ),
+        Index(
+            "ix_captures_pending_queue",
+            "created_at",
+            "id",
+            postgresql_where=text("state = 'pending_verification'"),
+        ),
+        Index("ix_captures_image_sha256", "image_sha256"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -340,9 +426,96 @@ class Capture(Base):
     rights_attested_at: Mapped[dt.datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # When the check-in token this capture consumed was issued.
+    checkin_issued_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     image_path: Mapped[str | None] = mapped_column(Text, nullable=True)
     image_mime: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    image_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    image_variants: Mapped[list[dict[str, object]] | None] = mapped_column(JSONB, nullable=True)
+    # EXIF GPS/time of the current image checked against the check-in; see
+    # domain/capture_metadata.py. NULL when the image was never inspected.
+    image_metadata_check: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+
+
+class MediaBlob(Base):
+    """A content-addressed media file and how many captures point at it.
+
+    `phash` is the image's 64-bit perceptual hash (signed, as BIGINT); `phash_b0..3` are
+    its four 16-bit bands, indexed for multi-index Hamming searches
+    (domain/near_duplicates.py).
+    """
+
+    __tablename__ = "media_blobs"
+    __table_args__ = (
+        Index(
+            "ix_media_blobs_unreferenced",
+            "updated_at",
+            postgresql_where=text("ref_count = 0"),
+        ),
+        Index("ix_media_blobs_phash_b0", "phash_b0"),
+        Index("ix_media_blobs_phash_b1", "phash_b1"),
+        Index("ix_media_blobs_phash_b2", "phash_b2"),
+        Index("ix_media_blobs_phash_b3", "phash_b3"),
+    )
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    path: Mapped[str] = mapped_column(Text, nullable=False)
+    mime: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    phash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    phash_b0: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    phash_b1: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    phash_b2: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    phash_b3: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+
+
+class CaptureUploadSession(Base):
+    """A resumable (tus-style) image upload for a capture; bytes are staged on disk."""
+
+    __tablename__ = "capture_upload_sessions"
+    __table_args__ = (
+        Index("ix_capture_upload_sessions_capture", "capture_id"),
+        Index("ix_capture_upload_sessions_expires_at", "expires_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    capture_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("captures.id", ondelete="CASCADE"), nullable=False
+    )
+    content_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    length: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    expires_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class CaptureReviewLease(Base):
+    """A moderator's time-limited claim on a pending capture (one live lease per capture)."""
+
+    __tablename__ = "capture_review_leases"
+    __table_args__ = (
+        Index("ix_capture_review_leases_moderator", "moderator_id", "expires_at"),
+    )
+
+    capture_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("captures.id", ondelete="CASCADE"), primary_key=True
+    )
+    moderator_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    claimed_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    expires_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
 class ContentReport(Base):
@@ -372,10 +545,49 @@ class ContentReport(Base):
     resolution: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
 
+class CaptureReportCounter(Base):
+    """Report counts per capture, maintained as reports are filed and resolved."""
+
+    __tablename__ = "capture_report_counters"
+    __table_args__ = (
+        Index(
+            "ix_capture_report_counters_open",
+            "open_reports",
+            "last_reported_at",
+            postgresql_where=text("open_reports > 0"),
+        ),
+    )
+
+    capture_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("captures.id", ondelete="CASCADE"), primary_key=True
+    )
+    open_reports: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_reports: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    open_reason_counts: Mapped[dict[str, int]] = mapped_column(
+        JSONB, nullable=False, default=dict
+    )
+    first_reported_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    last_reported_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    auto_hidden_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
 class UserNotification(Base):
     __tablename__ = "user_notifications"
     __table_args__ = (
-        Index("ix_user_notifications_user_created", "user_id", "created_at"),
+        Index("ix_user_notifications_user_created", "user_id", "created_at", "id"),
+        Index(
+            "ix_user_notifications_user_unread",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("read_at IS NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -392,6 +604,20 @@ class UserNotification(Base):
     read_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
+class UserNotificationCounter(Base):
+    """Unread notifications per user, maintained as notifications are created and read."""
+
+    __tablename__ = "user_notification_counters"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    unread_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+
+
 class CaptureEvent(Base):
     __tablename__ = "capture_events"
     __table_args__ = (Index("ix_capture_events_capture_created", "capture_id", "created_at"),)
@@ -422,6 +648,7 @@ class CuratorRankEvent(Base):
             name="uq_rank_events_deterministic_id",
         ),
         Index("ix_rank_events_user_created", "user_id", "created_at"),
+        Index("ix_rank_events_node_created", "node_id", "created_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -466,3 +693,20 @@ class AbuseEvent(Base):
         DateTime(timezone=True), default=utcnow, nullable=False
     )
     details: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+
+
+class AbuseEventRollup(Base):
+    """5-minute abuse event counts per (event_type, user, node), rebuilt on a rolling window."""
+
+    __tablename__ = "abuse_event_rollups"
+    __table_args__ = (Index("ix_abuse_event_rollups_bucket", "bucket_start"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    bucket_start: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    user_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    node_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    events: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
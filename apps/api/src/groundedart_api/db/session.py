@@ -25,3 +25,10 @@ async def get_db_session(
 
 
 DbSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """Plain asyncpg DSN for dedicated (non-pooled) connections such as LISTEN."""
+    if database_url.startswith("postgresql+asyncpg://"):
+        return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+    return database_url
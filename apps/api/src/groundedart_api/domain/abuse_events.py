@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 import uuid
+from collections import deque
 from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from groundedart_api.db.models import AbuseEvent
+from groundedart_api.db.models import AbuseEvent, utcnow
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.observability import metrics
+from groundedart_api.settings import get_settings
+
+logger = logging.getLogger(__name__)
 
 
 async def record_abuse_event(
@@ -16,13 +26,123 @@ async def record_abuse_event(
     capture_id: uuid.UUID | None = None,
     details: dict[str, Any] | None = None,
 ) -> None:
-    db.add(
-        AbuseEvent(
-            event_type=event_type,
-            user_id=user_id,
-            node_id=node_id,
-            capture_id=capture_id,
-            details=details,
-        )
-    )
+    """Record an abuse event, via the buffered writer when it is running.
+
+    Without a running writer (tests, scripts) the event is inserted and committed on `db`.
+    """
+    row = {
+        "id": uuid.uuid4(),
+        "event_type": event_type,
+        "user_id": user_id,
+        "node_id": node_id,
+        "capture_id": capture_id,
+        "details": details,
+        "created_at": utcnow(),
+    }
+    writer = get_abuse_event_writer()
+    if writer.running:
+        writer.enqueue(row)
+        return
+    db.add(AbuseEvent(**row))
     await db.commit()
+
+
+class AbuseEventWriter:
+    """In-process buffer that batches abuse events into multi-row inserts.
+
+    Rejection paths enqueue without touching the request's session; a background task
+    flushes whenever `flush_rows` events are waiting or every `flush_seconds`. Memory is
+    bounded by `max_buffered`: events beyond it are dropped and counted, as are batches
+    the database rejects. `stop()` flushes whatever is still buffered.
+    """
+
+    def __init__(
+        self,
+        *,
+        database_url: str,
+        max_buffered: int,
+        flush_rows: int,
+        flush_seconds: float,
+    ) -> None:
+        self._database_url = database_url
+        self.max_buffered = max_buffered
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    def enqueue(self, row: dict[str, Any]) -> bool:
+        if len(self._buffer) >= self.max_buffered:
+            metrics.abuse_events_dropped_total.labels(reason="buffer_full").inc()
+            return False
+        self._buffer.append(row)
+        metrics.abuse_event_buffer_depth.set(len(self._buffer))
+        if len(self._buffer) >= self.flush_rows:
+            self._wake.set()
+        return True
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="abuse-event-writer")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # Let the loop finish its current batch and drain, rather than cancelling mid-insert.
+        self._stopping = True
+        self._wake.set()
+        await self._task
+        self._task = None
+
+    async def flush(self) -> int:
+        written = 0
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.flush_rows, len(self._buffer)))]
+            metrics.abuse_event_buffer_depth.set(len(self._buffer))
+            try:
+                sessionmaker = create_sessionmaker(self._database_url)
+                async with sessionmaker() as db:
+                    await db.execute(insert(AbuseEvent).values(batch))
+                    await db.commit()
+            except Exception:  # noqa: BLE001
+                logger.exception("abuse_event_flush_failed", extra={"rows": len(batch)})
+                metrics.abuse_events_dropped_total.labels(reason="write_failed").inc(len(batch))
+                continue
+            written += len(batch)
+            metrics.abuse_events_written_total.inc(len(batch))
+        return written
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_seconds)
+            self._wake.clear()
+            await self.flush()
+        await self.flush()
+
+
+_abuse_event_writer: AbuseEventWriter | None = None
+
+
+def get_abuse_event_writer() -> AbuseEventWriter:
+    global _abuse_event_writer
+    if _abuse_event_writer is None:
+        settings = get_settings()
+        _abuse_event_writer = AbuseEventWriter(
+            database_url=settings.database_url,
+            max_buffered=settings.abuse_events_buffer_max_events,
+            flush_rows=settings.abuse_events_flush_rows,
+            flush_seconds=settings.abuse_events_flush_seconds,
+        )
+    return _abuse_event_writer
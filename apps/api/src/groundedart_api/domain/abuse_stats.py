@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import datetime as dt
+import re
+import uuid
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import DateTime, Integer, Interval, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import AbuseEvent, AbuseEventRollup, utcnow
+from groundedart_api.domain.errors import AppError
+
+AbuseStatsGroupKey = Literal["event_type", "user_id", "node_id"]
+AbuseStatsSource = Literal["raw", "rollup"]
+
+ABUSE_STATS_GROUP_KEYS: tuple[AbuseStatsGroupKey, ...] = ("event_type", "user_id", "node_id")
+ABUSE_STATS_DEFAULT_RANGE = dt.timedelta(hours=24)
+ABUSE_STATS_MAX_BUCKETS = 2000
+# Granularity of `abuse_event_rollups`; rollup-served buckets must be multiples of it.
+ABUSE_ROLLUP_STRIDE = dt.timedelta(minutes=5)
+# Shared `date_bin` origin so raw and rollup buckets line up (midnight UTC for day buckets).
+BUCKET_ORIGIN = dt.datetime(2000, 1, 1, tzinfo=dt.UTC)
+
+_BUCKET_PATTERN = re.compile(r"^([1-9][0-9]*)([mhd])$")
+_BUCKET_UNITS = {
+    "m": dt.timedelta(minutes=1),
+    "h": dt.timedelta(hours=1),
+    "d": dt.timedelta(days=1),
+}
+
+
+@dataclass(frozen=True)
+class AbuseStatsPoint:
+    bucket_start: dt.datetime
+    events: int
+
+
+@dataclass(frozen=True)
+class AbuseStatsGroup:
+    event_type: str | None
+    user_id: uuid.UUID | None
+    node_id: uuid.UUID | None
+    total: int
+    points: list[AbuseStatsPoint]
+
+
+@dataclass(frozen=True)
+class AbuseStats:
+    start: dt.datetime
+    end: dt.datetime
+    bucket: str
+    group_by: tuple[AbuseStatsGroupKey, ...]
+    source: AbuseStatsSource
+    groups: list[AbuseStatsGroup]
+
+
+def _invalid(message: str, **details: object) -> AppError:
+    return AppError(
+        code="invalid_abuse_stats_query",
+        message=message,
+        status_code=400,
+        details=details or None,
+    )
+
+
+def parse_bucket(value: str) -> dt.timedelta:
+    match = _BUCKET_PATTERN.match(value.strip())
+    if match is None:
+        raise _invalid("bucket must look like 1m, 5m, 1h or 1d", bucket=value)
+    return int(match.group(1)) * _BUCKET_UNITS[match.group(2)]
+
+
+def parse_group_by(value: str | None) -> tuple[AbuseStatsGroupKey, ...]:
+    if not value:
+        return ()
+    keys: list[AbuseStatsGroupKey] = []
+    for raw in value.split(","):
+        key = raw.strip()
+        if key not in ABUSE_STATS_GROUP_KEYS:
+            raise _invalid(
+                "Unknown group_by key", group_by=key, allowed=list(ABUSE_STATS_GROUP_KEYS)
+            )
+        if key not in keys:
+            keys.append(key)  # type: ignore[arg-type]
+    return tuple(keys)
+
+
+def bin_timestamp(value: dt.datetime, stride: dt.timedelta) -> dt.datetime:
+    """Python mirror of `date_bin(stride, value, BUCKET_ORIGIN)`."""
+    return BUCKET_ORIGIN + ((value - BUCKET_ORIGIN) // stride) * stride
+
+
+def _as_utc(value: dt.datetime) -> dt.datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.UTC)
+    return value.astimezone(dt.UTC)
+
+
+def _date_bin(stride: dt.timedelta, column):
+    return func.date_bin(
+        literal(stride, Interval),
+        column,
+        literal(BUCKET_ORIGIN, DateTime(timezone=True)),
+    )
+
+
+async def compute_abuse_event_stats(
+    *,
+    db: AsyncSession,
+    bucket: str,
+    group_by: tuple[AbuseStatsGroupKey, ...],
+    start: dt.datetime,
+    end: dt.datetime,
+    top_n: int,
+    source: AbuseStatsSource = "raw",
+) -> AbuseStats:
+    """Event counts per `date_bin` bucket for the `top_n` busiest groups in [start, end).
+
+    Groups are ranked by their total over the range in SQL, so only the top groups'
+    buckets are returned. Buckets without events are omitted. The raw source scans
+    `abuse_events` by `created_at`; the rollup source re-bins the 5-minute
+    `abuse_event_rollups` rows instead, which rounds both `start` and `end` down to
+    that grid; the result reports the rounded range.
+    """
+    stride = parse_bucket(bucket)
+    start, end = _as_utc(start), _as_utc(end)
+    if start >= end:
+        raise _invalid(
+            "from must be before to", **{"from": start.isoformat(), "to": end.isoformat()}
+        )
+    bucket_count = (bin_timestamp(end, stride) - bin_timestamp(start, stride)) // stride + 1
+    if bucket_count > ABUSE_STATS_MAX_BUCKETS:
+        raise _invalid(
+            "Range is too long for this bucket; use a coarser bucket",
+            bucket=bucket,
+            max_buckets=ABUSE_STATS_MAX_BUCKETS,
+        )
+
+    if source == "rollup":
+        if stride % ABUSE_ROLLUP_STRIDE:
+            raise _invalid("Rollup-served buckets must be multiples of 5m", bucket=bucket)
+        # A rollup row covers a whole slot, so a partial slot at either end is left out.
+        start = bin_timestamp(start, ABUSE_ROLLUP_STRIDE)
+        end = bin_timestamp(end, ABUSE_ROLLUP_STRIDE)
+        binned = select(
+            _date_bin(stride, AbuseEventRollup.bucket_start).label("bucket"),
+            *(getattr(AbuseEventRollup, key).label(key) for key in group_by),
+            AbuseEventRollup.events.label("events"),
+        ).where(
+            AbuseEventRollup.bucket_start >= start,
+            AbuseEventRollup.bucket_start < end,
+        )
+    else:
+        binned = select(
+            _date_bin(stride, AbuseEvent.created_at).label("bucket"),
+            *(getattr(AbuseEvent, key).label(key) for key in group_by),
+            literal(1, Integer).label("events"),
+        ).where(AbuseEvent.created_at >= start, AbuseEvent.created_at < end)
+    binned_sq = binned.subquery("binned")
+
+    group_cols = [binned_sq.c[key] for key in group_by]
+    counts = (
+        select(
+            binned_sq.c.bucket,
+            *group_cols,
+            func.sum(binned_sq.c.events).label("events"),
+        )
+        .group_by(binned_sq.c.bucket, *group_cols)
+        .subquery("counts")
+    )
+    count_group_cols = [counts.c[key] for key in group_by]
+    totals = select(
+        counts,
+        func.sum(counts.c.events).over(partition_by=count_group_cols or None).label("total"),
+    ).subquery("totals")
+    total_group_cols = [totals.c[key] for key in group_by]
+    ranked = select(
+        totals,
+        func.dense_rank()
+        .over(order_by=[totals.c.total.desc(), *total_group_cols])
+        .label("group_rank"),
+    ).subquery("ranked")
+    rows = (
+        await db.execute(
+            select(ranked)
+            .where(ranked.c.group_rank <= top_n)
+            .order_by(ranked.c.group_rank, ranked.c.bucket)
+        )
+    ).all()
+
+    groups: list[AbuseStatsGroup] = []
+    current_rank: int | None = None
+    for row in rows:
+        if row.group_rank != current_rank:
+            current_rank = row.group_rank
+            mapping = row._mapping
+            groups.append(
+                AbuseStatsGroup(
+                    event_type=mapping.get("event_type"),
+                    user_id=mapping.get("user_id"),
+                    node_id=mapping.get("node_id"),
+                    total=int(row.total),
+                    points=[],
+                )
+            )
+        groups[-1].points.append(AbuseStatsPoint(bucket_start=row.bucket, events=int(row.events)))
+
+    return AbuseStats(
+        start=start,
+        end=end,
+        bucket=bucket,
+        group_by=group_by,
+        source=source,
+        groups=groups,
+    )
+
+
+async def refresh_abuse_event_rollups(
+    *,
+    db: AsyncSession,
+    now: dt.datetime,
+    lookback: dt.timedelta,
+) -> int:
+    """Rebuild the rolling tail of `abuse_event_rollups` from raw events.
+
+    Every 5-minute bucket from `now - lookback` onwards is deleted and recomputed in the
+    caller's transaction, so late-arriving events and the still-open bucket are picked up
+    on the next run. Older buckets are left as they are. Returns the rows written.
+    """
+    start = bin_timestamp(now - lookback, ABUSE_ROLLUP_STRIDE)
+    await db.execute(delete(AbuseEventRollup).where(AbuseEventRollup.bucket_start >= start))
+
+    binned = (
+        select(
+            _date_bin(ABUSE_ROLLUP_STRIDE, AbuseEvent.created_at).label("bucket_start"),
+            AbuseEvent.event_type,
+            AbuseEvent.user_id,
+            AbuseEvent.node_id,
+        )
+        .where(AbuseEvent.created_at >= start)
+        .subquery("binned")
+    )
+    grouped = select(
+        binned.c.bucket_start,
+        binned.c.event_type,
+        binned.c.user_id,
+        binned.c.node_id,
+        func.count().label("events"),
+        literal(utcnow(), DateTime(timezone=True)).label("computed_at"),
+    ).group_by(binned.c.bucket_start, binned.c.event_type, binned.c.user_id, binned.c.node_id)
+    result = await db.execute(
+        insert(AbuseEventRollup).from_select(
+            ["bucket_start", "event_type", "user_id", "node_id", "events", "computed_at"],
+            grouped,
+        )
+    )
+    return int(result.rowcount or 0)
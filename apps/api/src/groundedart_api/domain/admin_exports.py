@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import io
+import json
+import logging
+import uuid
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import Select, Table, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from groundedart_api.db.models import AbuseEvent, CaptureEvent, ContentReport, CuratorRankEvent
+from groundedart_api.domain.errors import AppError
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_TABLES: dict[str, Table] = {
+    "abuse_events": AbuseEvent.__table__,
+    "content_reports": ContentReport.__table__,
+    "capture_events": CaptureEvent.__table__,
+    "rank_events": CuratorRankEvent.__table__,
+}
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+# Rows fetched per server-side cursor round trip; also the unit each output chunk covers.
+EXPORT_YIELD_PER = 1000
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExportFilters:
+    created_after: dt.datetime | None = None
+    created_before: dt.datetime | None = None
+    user_id: uuid.UUID | None = None
+    node_id: uuid.UUID | None = None
+    capture_id: uuid.UUID | None = None
+    event_type: str | None = None
+
+
+def get_export_table(name: str) -> Table:
+    table = EXPORT_TABLES.get(name)
+    if table is None:
+        raise AppError(
+            code="export_table_not_found",
+            message="Unknown export table",
+            status_code=404,
+            details={"table": name, "allowed": sorted(EXPORT_TABLES)},
+        )
+    return table
+
+
+def build_export_query(table: Table, filters: ExportFilters) -> Select[Any]:
+    """Select every column of `table`, filtered and ordered by (created_at, id)."""
+    query = select(table)
+    if filters.created_after is not None:
+        query = query.where(table.c.created_at >= filters.created_after)
+    if filters.created_before is not None:
+        query = query.where(table.c.created_at <= filters.created_before)
+    for column_name in ("user_id", "node_id", "capture_id", "event_type"):
+        value = getattr(filters, column_name)
+        if value is None:
+            continue
+        if column_name not in table.c:
+            raise AppError(
+                code="invalid_export_filter",
+                message=f"{table.name} cannot be filtered by {column_name}",
+                status_code=400,
+                details={"table": table.name, "filter": column_name},
+            )
+        query = query.where(table.c[column_name] == value)
+    return query.order_by(table.c.created_at.asc(), table.c.id.asc())
+
+
+def _json_default(value: object) -> object:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    raise TypeError(f"Unsupported export value: {type(value).__name__}")
+
+
+def _csv_value(value: object) -> object:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default, separators=(",", ":"))
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    return value
+
+
+def _encode_rows(
+    rows: list[dict[str, Any]],
+    *,
+    fmt: ExportFormat,
+    columns: list[str],
+) -> bytes:
+    if fmt == "ndjson":
+        return "".join(
+            json.dumps(row, default=_json_default, separators=(",", ":")) + "\n" for row in rows
+        ).encode("utf-8")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_csv_value(row[column]) for column in columns])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_export(
+    *,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    table: Table,
+    query: Select[Any],
+    fmt: ExportFormat,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """Yield the rows of `query` (from `build_export_query`) chunk by chunk.
+
+    Rows come from a server-side cursor and only one `EXPORT_YIELD_PER` partition is held
+    in memory at a time, so memory stays flat however many rows match. The generator
+    opens its own session because it runs after the request handler has returned.
+    """
+    query = query.execution_options(yield_per=EXPORT_YIELD_PER)
+    columns = [column.name for column in table.columns]
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+
+    def _emit(chunk: bytes) -> bytes:
+        return compressor.compress(chunk) if compressor is not None else chunk
+
+    rows_written = 0
+    if fmt == "csv":
+        header = io.StringIO()
+        csv.writer(header).writerow(columns)
+        yield _emit(header.getvalue().encode("utf-8"))
+
+    async with sessionmaker() as db:
+        result = await db.stream(query)
+        async for partition in result.mappings().partitions():
+            rows = [dict(row) for row in partition]
+            rows_written += len(rows)
+            chunk = _emit(_encode_rows(rows, fmt=fmt, columns=columns))
+            if chunk:
+                yield chunk
+
+    if compressor is not None:
+        yield compressor.flush()
+    logger.info(
+        "admin_export_completed",
+        extra={"table": table.name, "format": fmt, "gzip": gzip, "rows": rows_written},
+    )
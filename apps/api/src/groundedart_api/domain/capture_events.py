@@ -1,15 +1,46 @@
 from __future__ import annotations
 
+import datetime as dt
 import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from groundedart_api.db.models import Capture, CaptureEvent
+from groundedart_api.db.models import Capture, CaptureEvent, utcnow
 from groundedart_api.domain.capture_state import CaptureState
 from groundedart_api.domain.capture_transitions import apply_capture_state_transition
 from groundedart_api.observability.ops import observe_transition
 
 
+def build_capture_transition_event(
+    *,
+    capture: Capture,
+    target_state: CaptureState,
+    reason_code: str | None,
+    actor_type: str,
+    actor_user_id: uuid.UUID | None,
+    details: dict[str, object] | None = None,
+    now: dt.datetime | None = None,
+) -> CaptureEvent:
+    """Validate and apply a transition to `capture`; returns its audit event, not yet added."""
+    current_state = CaptureState(capture.state)
+    validated_reason = apply_capture_state_transition(current_state, target_state, reason_code)
+    event = CaptureEvent(
+        id=uuid.uuid4(),
+        capture_id=capture.id,
+        event_type="state_transition",
+        from_state=current_state.value,
+        to_state=target_state.value,
+        reason_code=validated_reason,
+        actor_type=actor_type,
+        actor_user_id=actor_user_id,
+        details=details,
+        created_at=now or utcnow(),
+    )
+    capture.state = target_state.value
+    capture.state_reason = validated_reason
+    return event
+
+
 def apply_capture_transition_with_audit(
     *,
     db: AsyncSession,
@@ -19,29 +50,23 @@ def apply_capture_transition_with_audit(
     actor_type: str,
     actor_user_id: uuid.UUID | None,
     details: dict[str, object] | None = None,
-) -> None:
-    current_state = CaptureState(capture.state)
+) -> CaptureEvent:
     with observe_transition(
-        from_state=current_state.value,
+        from_state=capture.state,
         to_state=target_state.value,
         actor_type=actor_type,
         attributes={"capture.id": str(capture.id)},
     ):
-        validated_reason = apply_capture_state_transition(current_state, target_state, reason_code)
-        db.add(
-            CaptureEvent(
-                capture_id=capture.id,
-                event_type="state_transition",
-                from_state=current_state.value,
-                to_state=target_state.value,
-                reason_code=validated_reason,
-                actor_type=actor_type,
-                actor_user_id=actor_user_id,
-                details=details,
-            )
+        event = build_capture_transition_event(
+            capture=capture,
+            target_state=target_state,
+            reason_code=reason_code,
+            actor_type=actor_type,
+            actor_user_id=actor_user_id,
+            details=details,
         )
-        capture.state = target_state.value
-        capture.state_reason = validated_reason
+        db.add(event)
+        return event
 
 
 def record_capture_created_event(
@@ -67,6 +92,28 @@ def record_capture_created_event(
     )
 
 
+def build_capture_published_event(
+    *,
+    capture: Capture,
+    actor_type: str,
+    actor_user_id: uuid.UUID | None,
+    details: dict[str, object] | None = None,
+    now: dt.datetime | None = None,
+) -> CaptureEvent:
+    return CaptureEvent(
+        id=uuid.uuid4(),
+        capture_id=capture.id,
+        event_type="capture_published",
+        from_state=capture.state,
+        to_state=capture.state,
+        reason_code=None,
+        actor_type=actor_type,
+        actor_user_id=actor_user_id,
+        details=details,
+        created_at=now or utcnow(),
+    )
+
+
 def record_capture_published_event(
     *,
     db: AsyncSession,
@@ -76,12 +123,8 @@ def record_capture_published_event(
     details: dict[str, object] | None = None,
 ) -> None:
     db.add(
-        CaptureEvent(
-            capture_id=capture.id,
-            event_type="capture_published",
-            from_state=capture.state,
-            to_state=capture.state,
-            reason_code=None,
+        build_capture_published_event(
+            capture=capture,
             actor_type=actor_type,
             actor_user_id=actor_user_id,
             details=details,
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import datetime as dt
+
+from geoalchemy2 import Geography
+from sqlalchemy import cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import Capture, Node
+from groundedart_api.observability import metrics
+from groundedart_api.settings import Settings
+from groundedart_api.storage.exif import ExifMetadata
+
+# Camera-local times without an offset may be anywhere from UTC-12 to UTC+14.
+_LOCAL_TIME_SLACK = dt.timedelta(hours=14)
+
+
+def check_capture_time(
+    metadata: ExifMetadata,
+    *,
+    issued_at: dt.datetime,
+    uploaded_at: dt.datetime,
+    tolerance: dt.timedelta,
+) -> tuple[str, dt.datetime | None, str | None]:
+    """(outcome, captured_at, source) for the photo's time against the check-in window.
+
+    The GPS fix time is UTC and preferred; DateTimeOriginal is used with its offset
+    when the camera wrote one. A bare local time only proves the day, so its window
+    is widened by the largest UTC offset.
+    """
+    if metadata.gps_time is not None:
+        captured_at, source, slack = metadata.gps_time, "gps", dt.timedelta()
+    elif metadata.captured_at is not None and metadata.captured_at.tzinfo is not None:
+        captured_at, source, slack = metadata.captured_at, "exif_offset", dt.timedelta()
+    elif metadata.captured_at is not None:
+        captured_at = metadata.captured_at.replace(tzinfo=dt.UTC)
+        source, slack = "exif_local", _LOCAL_TIME_SLACK
+    else:
+        return "missing", None, None
+    earliest = issued_at - tolerance - slack
+    latest = uploaded_at + tolerance + slack
+    outcome = "consistent" if earliest <= captured_at <= latest else "inconsistent"
+    return outcome, captured_at, source
+
+
+async def check_capture_metadata(
+    db: AsyncSession,
+    *,
+    capture: Capture,
+    metadata: ExifMetadata | None,
+    settings: Settings,
+    now: dt.datetime,
+) -> dict[str, object]:
+    """Cross-check an upload's EXIF against the check-in that allowed the capture.
+
+    GPS is compared with the node geofence (radius plus `capture_exif_gps_tolerance_m`,
+    since phone EXIF positions are coarser than live fixes); capture time with the span
+    from check-in token issue to upload. Each check is `consistent`, `inconsistent`
+    or `missing` (no such EXIF: many apps strip it, so absence is not evidence).
+    The result is stored as `captures.image_metadata_check` for verification to use.
+    """
+    result: dict[str, object] = {
+        "exif": metadata is not None,
+        "gps_check": "missing",
+        "gps": None,
+        "time_check": "missing",
+        "captured_at": None,
+        "time_source": None,
+    }
+    if metadata is not None and metadata.latitude is not None and metadata.longitude is not None:
+        point = func.ST_SetSRID(func.ST_MakePoint(metadata.longitude, metadata.latitude), 4326)
+        row = (
+            await db.execute(
+                select(
+                    func.ST_Distance(cast(Node.location, Geography), cast(point, Geography)),
+                    Node.radius_m,
+                ).where(Node.id == capture.node_id)
+            )
+        ).one()
+        distance_m, radius_m = float(row[0]), row[1]
+        result["gps"] = {
+            "lat": metadata.latitude,
+            "lng": metadata.longitude,
+            "distance_m": round(distance_m, 1),
+        }
+        within = distance_m <= radius_m + settings.capture_exif_gps_tolerance_m
+        result["gps_check"] = "consistent" if within else "inconsistent"
+    if metadata is not None:
+        time_check, captured_at, source = check_capture_time(
+            metadata,
+            issued_at=capture.checkin_issued_at or capture.created_at,
+            uploaded_at=now,
+            tolerance=dt.timedelta(seconds=settings.capture_exif_time_tolerance_seconds),
+        )
+        result["time_check"] = time_check
+        result["captured_at"] = captured_at.isoformat() if captured_at is not None else None
+        result["time_source"] = source
+    for field in ("gps", "time"):
+        metrics.capture_metadata_checks_total.labels(
+            field=field, outcome=result[f"{field}_check"]
+        ).inc()
+    return result
@@ -2,25 +2,154 @@ from __future__ import annotations
 
 import datetime as dt
 import uuid
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from groundedart_api.db.models import Capture
+from groundedart_api.db.models import (
+    Capture,
+    CaptureEvent,
+    CuratorRankEvent,
+    UserNotification,
+    utcnow,
+)
 from groundedart_api.domain.attribution_rights import missing_public_requirements
 from groundedart_api.domain.capture_events import (
-    apply_capture_transition_with_audit,
-    record_capture_published_event,
+    build_capture_published_event,
+    build_capture_transition_event,
 )
 from groundedart_api.domain.capture_state import CaptureState
 from groundedart_api.domain.errors import AppError
-from groundedart_api.domain.rank_events import CAPTURE_VERIFIED_EVENT_TYPE, append_rank_event
+from groundedart_api.domain.moderation_queue import clear_capture_leases
+from groundedart_api.domain.rank_events import (
+    CAPTURE_VERIFIED_EVENT_TYPE,
+    DEFAULT_RANK_VERSION,
+    append_rank_event,
+    compute_rank_event_deterministic_id,
+)
 from groundedart_api.domain.rank_materialization import (
+    RankRefreshKey,
     get_capture_verified_event_day,
+    get_capture_verified_event_keys,
     refresh_rank_for_user_day,
+    refresh_rank_for_user_days,
+)
+from groundedart_api.domain.rank_outbox import enqueue_rank_refresh, enqueue_rank_refresh_keys
+from groundedart_api.domain.notifications import (
+    increment_unread_counts,
+    record_capture_verified_notification,
+)
+from groundedart_api.domain.user_events import (
+    UserEvent,
+    capture_state_user_event,
+    notification_user_event,
+    publish_user_events,
 )
-from groundedart_api.domain.notifications import record_capture_verified_notification
-from groundedart_api.domain.verification_events import VerificationEventEmitter
-from groundedart_api.observability.ops import observe_operation
+from groundedart_api.domain.verification_events import (
+    CaptureStateChange,
+    VerificationEventEmitter,
+)
+from groundedart_api.observability.ops import observe_operation, observe_transition
+
+
+@dataclass(frozen=True)
+class CaptureTransitionItem:
+    capture_id: uuid.UUID
+    target_state: CaptureState
+    reason_code: str | None = None
+    details: dict[str, object] | None = None
+
+
+@dataclass(frozen=True)
+class _TransitionEffects:
+    """Rows and events one moderation transition produces before anything is written."""
+
+    change: CaptureStateChange
+    capture_events: list[CaptureEvent]
+    notification: UserNotification | None
+    user_events: list[UserEvent]
+
+
+def _apply_moderation_transition(
+    *,
+    capture: Capture,
+    target_state: CaptureState,
+    reason_code: str | None,
+    details: dict[str, object] | None,
+    actor_type: str,
+    actor_user_id: uuid.UUID | None,
+    now: dt.datetime,
+) -> _TransitionEffects:
+    """Validate and apply one transition to `capture` in memory, including auto-publish.
+
+    Shared by `transition_capture_state` and `batch_transition_capture_states`, which
+    differ only in how the returned rows reach the database.
+    """
+    from_state = capture.state
+    with observe_transition(
+        from_state=from_state,
+        to_state=target_state.value,
+        actor_type=actor_type,
+        attributes={"capture.id": str(capture.id)},
+    ):
+        transition_event = build_capture_transition_event(
+            capture=capture,
+            target_state=target_state,
+            reason_code=reason_code,
+            actor_type=actor_type,
+            actor_user_id=actor_user_id,
+            details=details,
+            now=now,
+        )
+    capture_events = [transition_event]
+    user_events: list[UserEvent] = []
+    if actor_type != "user":
+        user_events.append(
+            capture_state_user_event(user_id=capture.user_id, event=transition_event)
+        )
+    notification: UserNotification | None = None
+    if target_state == CaptureState.verified:
+        missing_fields = missing_public_requirements(capture)
+        published = False
+        if capture.publish_requested and not missing_fields and capture.visibility != "public":
+            previous_visibility = capture.visibility
+            capture.visibility = "public"
+            capture_events.append(
+                build_capture_published_event(
+                    capture=capture,
+                    actor_type=actor_type,
+                    actor_user_id=actor_user_id,
+                    details={
+                        "previous_visibility": previous_visibility,
+                        "auto_publish": True,
+                    },
+                    now=now,
+                )
+            )
+            published = True
+        notification = record_capture_verified_notification(
+            capture=capture,
+            missing_fields=missing_fields,
+            published=published,
+        )
+        notification.created_at = now
+        user_events.append(notification_user_event(notification))
+    return _TransitionEffects(
+        change=CaptureStateChange(
+            capture_id=capture.id,
+            from_state=from_state,
+            to_state=capture.state,
+            reason_code=capture.state_reason,
+        ),
+        capture_events=capture_events,
+        notification=notification,
+        user_events=user_events,
+    )
 
 
 async def transition_capture_state(
@@ -33,6 +162,7 @@ async def transition_capture_state(
     actor_user_id: uuid.UUID | None,
     verification_events: VerificationEventEmitter,
     details: dict[str, object] | None = None,
+    rank_refresh_mode: Literal["inline", "outbox"] = "inline",
 ) -> Capture:
     async with observe_operation(
         "verification_transition",
@@ -46,42 +176,25 @@ async def transition_capture_state(
         if capture is None:
             raise AppError(code="capture_not_found", message="Capture not found", status_code=404)
 
-        from_state = capture.state
-        apply_capture_transition_with_audit(
-            db=db,
+        effects = _apply_moderation_transition(
             capture=capture,
             target_state=target_state,
             reason_code=reason_code,
+            details=details,
             actor_type=actor_type,
             actor_user_id=actor_user_id,
-            details=details,
+            now=utcnow(),
         )
-
+        db.add_all(effects.capture_events)
         days_to_refresh: set[dt.date] = set()
-        if target_state == CaptureState.verified:
-            missing_fields = missing_public_requirements(capture)
-            published = False
-            if capture.publish_requested and not missing_fields and capture.visibility != "public":
-                previous_visibility = capture.visibility
-                capture.visibility = "public"
-                record_capture_published_event(
-                    db=db,
-                    capture=capture,
-                    actor_type=actor_type,
-                    actor_user_id=actor_user_id,
-                    details={
-                        "previous_visibility": previous_visibility,
-                        "auto_publish": True,
-                    },
-                )
-                published = True
-            db.add(
-                record_capture_verified_notification(
-                    capture=capture,
-                    missing_fields=missing_fields,
-                    published=published,
-                )
+        if effects.notification is not None:
+            db.add(effects.notification)
+            await increment_unread_counts(
+                db=db,
+                user_ids=Counter([capture.user_id]),
+                now=effects.notification.created_at,
             )
+        if target_state == CaptureState.verified:
             event = await append_rank_event(
                 db=db,
                 user_id=capture.user_id,
@@ -91,20 +204,181 @@ async def transition_capture_state(
                 node_id=capture.node_id,
             )
             days_to_refresh.add(event.created_at.astimezone(dt.UTC).date())
-        elif from_state == CaptureState.verified.value:
+        elif effects.change.from_state == CaptureState.verified.value:
             day = await get_capture_verified_event_day(db=db, capture_id=capture.id)
             if day is not None:
                 days_to_refresh.add(day)
 
-        for day in sorted(days_to_refresh):
-            await refresh_rank_for_user_day(db=db, user_id=capture.user_id, day=day)
-
-        await db.commit()
-        await db.refresh(capture)
+        if rank_refresh_mode == "outbox":
+            await enqueue_rank_refresh(db=db, user_id=capture.user_id, days=days_to_refresh)
+        else:
+            for day in sorted(days_to_refresh):
+                await refresh_rank_for_user_day(db=db, user_id=capture.user_id, day=day)
+        await clear_capture_leases(db=db, capture_ids=[capture.id])
         await verification_events.capture_state_changed(
             capture_id=capture.id,
-            from_state=from_state,
-            to_state=capture.state,
-            reason_code=capture.state_reason,
+            from_state=effects.change.from_state,
+            to_state=effects.change.to_state,
+            reason_code=effects.change.reason_code,
         )
+        await publish_user_events(db=db, events=effects.user_events)
+
+        await db.commit()
+        await db.refresh(capture)
         return capture
+
+
+def _batch_failure(item: CaptureTransitionItem, code: str, message: str) -> dict[str, str]:
+    return {"capture_id": str(item.capture_id), "code": code, "message": message}
+
+
+def _column_values(row: CaptureEvent | UserNotification) -> dict[str, object]:
+    return {column.key: getattr(row, column.key) for column in row.__table__.columns}
+
+
+async def batch_transition_capture_states(
+    *,
+    db: AsyncSession,
+    items: Sequence[CaptureTransitionItem],
+    actor_type: str,
+    actor_user_id: uuid.UUID | None,
+    verification_events: VerificationEventEmitter,
+    rank_refresh_mode: Literal["inline", "outbox"] = "inline",
+) -> list[Capture]:
+    """Apply many transitions in one transaction with a fixed number of statements.
+
+    Each item goes through the same `_apply_moderation_transition` as a single
+    transition, against captures locked up front. If any item fails, nothing is applied
+    and `capture_batch_transition_invalid` lists the failures. Otherwise capture events,
+    notifications and rank events are bulk-inserted, rank rows are refreshed once per
+    (user, day), and verification and stream events are queued together before commit.
+    """
+    async with observe_operation(
+        "verification_batch_transition",
+        attributes={"capture.batch_size": len(items), "capture.actor_type": actor_type},
+    ):
+        capture_ids = [item.capture_id for item in items]
+        captures = {
+            capture.id: capture
+            for capture in (
+                await db.scalars(
+                    select(Capture)
+                    .where(Capture.id.in_(capture_ids))
+                    .order_by(Capture.id)
+                    .with_for_update()
+                )
+            ).all()
+        }
+
+        now = utcnow()
+        failures: list[dict[str, str]] = []
+        applied: list[tuple[Capture, _TransitionEffects]] = []
+        seen: set[uuid.UUID] = set()
+        for item in items:
+            if item.capture_id in seen:
+                failures.append(
+                    _batch_failure(item, "duplicate_capture_id", "Capture appears twice in batch")
+                )
+                continue
+            seen.add(item.capture_id)
+            capture = captures.get(item.capture_id)
+            if capture is None:
+                failures.append(_batch_failure(item, "capture_not_found", "Capture not found"))
+                continue
+            try:
+                effects = _apply_moderation_transition(
+                    capture=capture,
+                    target_state=item.target_state,
+                    reason_code=item.reason_code,
+                    details=item.details,
+                    actor_type=actor_type,
+                    actor_user_id=actor_user_id,
+                    now=now,
+                )
+            except AppError as exc:
+                failures.append(_batch_failure(item, exc.code, exc.message))
+                continue
+            applied.append((capture, effects))
+
+        if failures:
+            # Drop the in-memory state changes of the items that did validate.
+            await db.rollback()
+            raise AppError(
+                code="capture_batch_transition_invalid",
+                message="One or more transitions in the batch are invalid",
+                status_code=400,
+                details={"failures": failures},
+            )
+
+        capture_event_rows = [
+            _column_values(event) for _, effects in applied for event in effects.capture_events
+        ]
+        notifications = [
+            effects.notification for _, effects in applied if effects.notification is not None
+        ]
+        rank_event_rows: list[dict[str, object]] = []
+        rank_capture_ids: set[uuid.UUID] = set()
+        for capture, effects in applied:
+            if effects.change.to_state == CaptureState.verified.value:
+                rank_event_rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "deterministic_id": compute_rank_event_deterministic_id(
+                            event_type=CAPTURE_VERIFIED_EVENT_TYPE,
+                            rank_version=DEFAULT_RANK_VERSION,
+                            user_id=capture.user_id,
+                            source_kind="capture",
+                            source_id=capture.id,
+                        ),
+                        "user_id": capture.user_id,
+                        "event_type": CAPTURE_VERIFIED_EVENT_TYPE,
+                        "delta": 1,
+                        "rank_version": DEFAULT_RANK_VERSION,
+                        "capture_id": capture.id,
+                        "node_id": capture.node_id,
+                        "details": None,
+                        "created_at": now,
+                    }
+                )
+                rank_capture_ids.add(capture.id)
+            elif effects.change.from_state == CaptureState.verified.value:
+                rank_capture_ids.add(capture.id)
+
+        if capture_event_rows:
+            await db.execute(insert(CaptureEvent).values(capture_event_rows))
+        if notifications:
+            await db.execute(
+                insert(UserNotification).values(
+                    [_column_values(notification) for notification in notifications]
+                )
+            )
+            await increment_unread_counts(
+                db=db,
+                user_ids=Counter(notification.user_id for notification in notifications),
+                now=now,
+            )
+        if rank_event_rows:
+            await db.execute(
+                insert(CuratorRankEvent)
+                .values(rank_event_rows)
+                .on_conflict_do_nothing(constraint="uq_rank_events_deterministic_id")
+            )
+
+        # A replayed verification keeps its original event, so days always come from
+        # the stored rank events rather than `now`.
+        verified_keys = await get_capture_verified_event_keys(db=db, capture_ids=rank_capture_ids)
+        refresh_keys: set[RankRefreshKey] = set(verified_keys.values())
+        if rank_refresh_mode == "outbox":
+            await enqueue_rank_refresh_keys(db=db, keys=refresh_keys)
+        else:
+            await refresh_rank_for_user_days(db=db, keys=refresh_keys)
+        await clear_capture_leases(db=db, capture_ids=[capture.id for capture, _ in applied])
+        await verification_events.capture_states_changed(
+            [effects.change for _, effects in applied]
+        )
+        await publish_user_events(
+            db=db, events=[event for _, effects in applied for event in effects.user_events]
+        )
+
+        await db.commit()
+        return [capture for capture, _ in applied]
@@ -10,4 +10,5 @@ class CaptureStateReasonCode(StrEnum):
     manual_review_reject = "manual_review_reject"
     manual_review_hide = "manual_review_hide"
     report_hide = "report_hide"
+    report_threshold_hide = "report_threshold_hide"
     rights_takedown = "rights_takedown"
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import Integer, String, case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import Capture, CaptureReportCounter, ContentReport
+from groundedart_api.domain.capture_moderation import transition_capture_state
+from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.capture_state_reason_code import CaptureStateReasonCode
+from groundedart_api.domain.verification_events import VerificationEventEmitter
+
+_counters = CaptureReportCounter.__table__
+
+
+@dataclass(frozen=True)
+class ReportGroup:
+    counter: CaptureReportCounter
+    capture: Capture
+
+
+def _reason_count(reason: str):
+    return func.coalesce(
+        _counters.c.open_reason_counts[literal(reason, String)].astext.cast(Integer), 0
+    )
+
+
+async def increment_report_counters(
+    *,
+    db: AsyncSession,
+    capture_id: uuid.UUID,
+    reason: str,
+    now: dt.datetime,
+) -> CaptureReportCounter:
+    """Count a newly filed report against its capture.
+
+    The upsert row-locks the capture's counter until the caller commits, so concurrent
+    reports on one capture see each other's increments (the auto-hide check relies on it).
+    """
+    stmt = insert(CaptureReportCounter).values(
+        capture_id=capture_id,
+        open_reports=1,
+        total_reports=1,
+        open_reason_counts={reason: 1},
+        first_reported_at=now,
+        last_reported_at=now,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CaptureReportCounter.capture_id],
+        set_={
+            "open_reports": _counters.c.open_reports + 1,
+            "total_reports": _counters.c.total_reports + 1,
+            "open_reason_counts": _counters.c.open_reason_counts.op("||", return_type=JSONB)(
+                func.jsonb_build_object(literal(reason, String), _reason_count(reason) + 1)
+            ),
+            "last_reported_at": stmt.excluded.last_reported_at,
+        },
+    ).returning(CaptureReportCounter)
+    return (
+        await db.scalars(stmt, execution_options={"populate_existing": True})
+    ).one()
+
+
+async def decrement_report_counters(
+    *,
+    db: AsyncSession,
+    capture_id: uuid.UUID,
+    reason: str,
+) -> None:
+    """Take one resolved report off its capture's open counts."""
+    await db.execute(
+        update(CaptureReportCounter)
+        .where(CaptureReportCounter.capture_id == capture_id)
+        .values(
+            open_reports=func.greatest(_counters.c.open_reports - 1, 0),
+            open_reason_counts=case(
+                (
+                    _reason_count(reason) <= 1,
+                    _counters.c.open_reason_counts.op("-", return_type=JSONB)(
+                        literal(reason, String)
+                    ),
+                ),
+                else_=_counters.c.open_reason_counts.op("||", return_type=JSONB)(
+                    func.jsonb_build_object(literal(reason, String), _reason_count(reason) - 1)
+                ),
+            ),
+        )
+    )
+
+
+async def auto_hide_reported_capture(
+    *,
+    db: AsyncSession,
+    capture: Capture,
+    counter: CaptureReportCounter,
+    threshold: int,
+    verification_events: VerificationEventEmitter,
+    rank_refresh_mode: Literal["inline", "outbox"],
+    now: dt.datetime,
+) -> bool:
+    """Hide `capture` the first time its open reports reach `threshold` (0 disables).
+
+    Runs in the transaction that incremented `counter`; `auto_hidden_at` is stamped before
+    the transition commits, so the hide happens at most once per capture. The capture row
+    is re-read under a lock so a concurrent admin hide is seen before transitioning.
+    """
+    if threshold <= 0 or counter.open_reports < threshold or counter.auto_hidden_at is not None:
+        return False
+    await db.refresh(capture, with_for_update=True)
+    if capture.state == CaptureState.hidden.value:
+        return False
+    counter.auto_hidden_at = now
+    await transition_capture_state(
+        db=db,
+        capture_id=capture.id,
+        target_state=CaptureState.hidden,
+        reason_code=CaptureStateReasonCode.report_threshold_hide.value,
+        actor_type="system",
+        actor_user_id=None,
+        verification_events=verification_events,
+        details={
+            "open_reports": counter.open_reports,
+            "threshold": threshold,
+            "open_reason_counts": dict(counter.open_reason_counts),
+        },
+        rank_refresh_mode=rank_refresh_mode,
+    )
+    return True
+
+
+async def resolve_capture_reports(
+    *,
+    db: AsyncSession,
+    capture_id: uuid.UUID,
+    resolution: str,
+    now: dt.datetime,
+) -> int:
+    """Resolve every open report on `capture_id` in one statement; returns how many."""
+    result = await db.execute(
+        update(ContentReport)
+        .where(ContentReport.capture_id == capture_id, ContentReport.resolved_at.is_(None))
+        .values(resolved_at=now, resolution=resolution)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        update(CaptureReportCounter)
+        .where(CaptureReportCounter.capture_id == capture_id)
+        .values(open_reports=0, open_reason_counts={})
+    )
+    return int(result.rowcount or 0)
+
+
+async def list_report_groups(
+    *,
+    db: AsyncSession,
+    include_resolved: bool,
+    limit: int,
+) -> list[ReportGroup]:
+    """Reported captures, most open reports first, from the counters alone."""
+    query = select(CaptureReportCounter, Capture).join(
+        Capture, Capture.id == CaptureReportCounter.capture_id
+    )
+    if not include_resolved:
+        query = query.where(CaptureReportCounter.open_reports > 0)
+    rows = (
+        await db.execute(
+            query.order_by(
+                CaptureReportCounter.open_reports.desc(),
+                CaptureReportCounter.last_reported_at.desc(),
+            ).limit(limit)
+        )
+    ).all()
+    return [ReportGroup(counter=counter, capture=capture) for counter, capture in rows]
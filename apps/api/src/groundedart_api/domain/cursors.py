@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime as dt
+import json
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from groundedart_api.domain.errors import AppError
+
+T = TypeVar("T")
+
+
+def encode_cursor(fields: dict[str, object]) -> str:
+    """Opaque keyset cursor: compact JSON, unpadded URL-safe base64."""
+    payload = json.dumps(fields, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(
+    value: str,
+    parse: Callable[[dict[str, Any]], T],
+    *,
+    message: str = "Invalid pagination cursor",
+) -> T:
+    """Decode `value` and build the cursor with `parse`; any failure is `invalid_cursor`.
+
+    `parse` may raise ValueError, KeyError or TypeError for missing or malformed fields.
+    """
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(data, dict):
+            raise TypeError("cursor payload must be an object")
+        return parse(data)
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise AppError(code="invalid_cursor", message=message, status_code=400) from exc
+
+
+def cursor_timestamp(value: object) -> dt.datetime:
+    created_at = dt.datetime.fromisoformat(str(value))
+    if created_at.tzinfo is None:
+        raise ValueError("cursor timestamp must be timezone-aware")
+    return created_at
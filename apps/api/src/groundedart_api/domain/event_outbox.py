@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime as dt
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from groundedart_api.db.models import EventOutbox, utcnow
+from groundedart_api.observability import metrics
+from groundedart_api.observability.ops import observe_operation
+
+logger = logging.getLogger(__name__)
+
+# Deliveries in flight at once within one dispatcher batch.
+_DELIVERY_CONCURRENCY = 8
+_LAST_ERROR_MAX_CHARS = 2000
+
+EventDelivery = Callable[[dict[str, object]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class OutboxEvent:
+    event_type: str
+    payload: dict[str, object]
+
+
+@dataclass(frozen=True)
+class OutboxBatchResult:
+    claimed: int
+    delivered: int
+    retried: int
+    dead: int
+    duration_seconds: float
+
+
+async def enqueue_outbox_events(*, db: AsyncSession, events: Sequence[OutboxEvent]) -> None:
+    """Write events to `event_outbox` in the caller's transaction."""
+    if not events:
+        return
+    now = utcnow()
+    await db.execute(
+        insert(EventOutbox).values(
+            [
+                {
+                    "event_type": event.event_type,
+                    "payload": event.payload,
+                    "status": "pending",
+                    "attempts": 0,
+                    "next_attempt_at": now,
+                    "created_at": now,
+                }
+                for event in events
+            ]
+        )
+    )
+
+
+def retry_delay(
+    attempts: int,
+    *,
+    base_seconds: float,
+    max_seconds: float,
+    jitter: float = 0.2,
+) -> dt.timedelta:
+    """Exponential backoff after `attempts` failures (base, 2*base, 4*base, ... up to max)."""
+    delay = min(max_seconds, base_seconds * (2 ** max(attempts - 1, 0)))
+    if jitter:
+        delay *= 1 + random.uniform(-jitter, jitter)
+    return dt.timedelta(seconds=delay)
+
+
+async def claim_outbox_batch(
+    *,
+    db: AsyncSession,
+    limit: int,
+    lease_seconds: int,
+    now: dt.datetime,
+) -> list[EventOutbox]:
+    """Lease up to `limit` due events by pushing `next_attempt_at` past the delivery window.
+
+    The claim commits before any delivery, so no transaction is held open across webhook
+    calls; if the dispatcher dies mid-batch the lease lapses and the events are retried.
+    """
+    due = (
+        select(EventOutbox.id)
+        .where(EventOutbox.status == "pending", EventOutbox.next_attempt_at <= now)
+        .order_by(EventOutbox.next_attempt_at.asc(), EventOutbox.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = (
+        await db.scalars(
+            update(EventOutbox)
+            .where(EventOutbox.id.in_(due))
+            .values(
+                attempts=EventOutbox.attempts + 1,
+                next_attempt_at=now + dt.timedelta(seconds=lease_seconds),
+            )
+            .returning(EventOutbox),
+            execution_options={"populate_existing": True},
+        )
+    ).all()
+    await db.commit()
+    return sorted(rows, key=lambda row: row.id)
+
+
+async def dispatch_outbox_batch(
+    *,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    deliver: EventDelivery,
+    batch_size: int,
+    lease_seconds: int,
+    max_attempts: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+) -> OutboxBatchResult:
+    """Claim a batch, deliver it, then delete delivered rows and reschedule the rest.
+
+    Delivery is at least once: every payload carries `event_id` so receivers can dedupe.
+    A row that has failed `max_attempts` times is kept with status `dead`.
+    """
+    start = time.perf_counter()
+    async with observe_operation("event_outbox_batch", attributes={"batch.size": batch_size}):
+        async with sessionmaker() as db:
+            claimed = await claim_outbox_batch(
+                db=db, limit=batch_size, lease_seconds=lease_seconds, now=utcnow()
+            )
+        if not claimed:
+            return OutboxBatchResult(0, 0, 0, 0, time.perf_counter() - start)
+
+        semaphore = asyncio.Semaphore(_DELIVERY_CONCURRENCY)
+
+        async def _deliver(event: EventOutbox) -> str | None:
+            payload = {
+                **event.payload,
+                "event_id": event.id,
+                "sent_at": utcnow().isoformat(),
+            }
+            async with semaphore:
+                delivery_start = time.perf_counter()
+                try:
+                    await deliver(payload)
+                except Exception as exc:  # noqa: BLE001
+                    return f"{type(exc).__name__}: {exc}"[:_LAST_ERROR_MAX_CHARS]
+                finally:
+                    metrics.event_outbox_delivery_seconds.observe(
+                        time.perf_counter() - delivery_start
+                    )
+            return None
+
+        errors = await asyncio.gather(*(_deliver(event) for event in claimed))
+
+        delivered_ids: list[int] = []
+        retried = dead = 0
+        now = utcnow()
+        async with sessionmaker() as db:
+            for event, error in zip(claimed, errors, strict=True):
+                if error is None:
+                    delivered_ids.append(event.id)
+                    metrics.event_outbox_deliveries_total.labels(
+                        event_type=event.event_type, outcome="delivered"
+                    ).inc()
+                    continue
+                exhausted = event.attempts >= max_attempts
+                values: dict[str, object] = {"last_error": error}
+                if exhausted:
+                    values["status"] = "dead"
+                    dead += 1
+                else:
+                    values["next_attempt_at"] = now + retry_delay(
+                        event.attempts,
+                        base_seconds=backoff_base_seconds,
+                        max_seconds=backoff_max_seconds,
+                    )
+                    retried += 1
+                await db.execute(
+                    update(EventOutbox).where(EventOutbox.id == event.id).values(**values)
+                )
+                outcome = "dead" if exhausted else "retried"
+                metrics.event_outbox_deliveries_total.labels(
+                    event_type=event.event_type, outcome=outcome
+                ).inc()
+                log = logger.error if exhausted else logger.warning
+                log(
+                    "event_outbox_delivery_failed",
+                    extra={
+                        "event_id": event.id,
+                        "event_type": event.event_type,
+                        "attempts": event.attempts,
+                        "outcome": outcome,
+                        "error": error,
+                    },
+                )
+            if delivered_ids:
+                await db.execute(delete(EventOutbox).where(EventOutbox.id.in_(delivered_ids)))
+            await db.commit()
+
+    return OutboxBatchResult(
+        claimed=len(claimed),
+        delivered=len(delivered_ids),
+        retried=retried,
+        dead=dead,
+        duration_seconds=time.perf_counter() - start,
+    )
+
+
+async def requeue_dead_events(*, db: AsyncSession, now: dt.datetime) -> int:
+    """Move dead-lettered events back to pending with a fresh attempt budget."""
+    result = await db.execute(
+        update(EventOutbox)
+        .where(EventOutbox.status == "dead")
+        .values(status="pending", attempts=0, next_attempt_at=now)
+    )
+    return int(result.rowcount or 0)
+
+
+class EventOutboxDispatcher:
+    """Background task that drains `event_outbox` while the API is running.
+
+    Batches are dispatched back to back while full ones keep coming, then the loop idles
+    for `poll_seconds`. Several API workers (or scripts/dispatch_event_outbox.py) can run
+    dispatchers side by side; claims use SKIP LOCKED and leases.
+    """
+
+    def __init__(
+        self,
+        *,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        deliver: EventDelivery,
+        batch_size: int,
+        poll_seconds: float,
+        lease_seconds: int,
+        max_attempts: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self._deliver = deliver
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping.is_set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="event-outbox-dispatcher")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # Finish the batch in flight; unfinished leases would otherwise delay redelivery.
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def dispatch_once(self) -> OutboxBatchResult:
+        return await dispatch_outbox_batch(
+            sessionmaker=self._sessionmaker,
+            deliver=self._deliver,
+            batch_size=self.batch_size,
+            lease_seconds=self.lease_seconds,
+            max_attempts=self.max_attempts,
+            backoff_base_seconds=self.backoff_base_seconds,
+            backoff_max_seconds=self.backoff_max_seconds,
+        )
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                result = await self.dispatch_once()
+            except Exception:  # noqa: BLE001
+                logger.exception("event_outbox_dispatch_failed")
+                result = None
+            if result is not None and result.claimed >= self.batch_size:
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
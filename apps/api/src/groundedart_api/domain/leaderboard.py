@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import datetime as dt
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import Date, Integer, and_, cast, delete, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import (
+    Capture,
+    CuratorRankCache,
+    CuratorRankDaily,
+    CuratorRankEvent,
+    CuratorRankWindow,
+    Node,
+    utcnow,
+)
+from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.cursors import decode_cursor, encode_cursor
+from groundedart_api.domain.rank_constants import PER_DAY_POINTS_CAP
+from groundedart_api.domain.rank_events import CAPTURE_VERIFIED_EVENT_TYPE
+
+LeaderboardScope = Literal["global", "node", "area"]
+LeaderboardPeriod = Literal["all", "30d"]
+
+LEADERBOARD_PERIOD_DAYS: dict[str, int] = {"30d": 30}
+
+
+@dataclass(frozen=True)
+class LeaderboardCursor:
+    points: int
+    user_id: uuid.UUID
+    position: int
+
+
+@dataclass(frozen=True)
+class LeaderboardRow:
+    position: int
+    user_id: uuid.UUID
+    points: int
+
+
+@dataclass(frozen=True)
+class LeaderboardPage:
+    rows: list[LeaderboardRow]
+    next_cursor: str | None
+
+
+def encode_leaderboard_cursor(cursor: LeaderboardCursor) -> str:
+    return encode_cursor({"p": cursor.points, "u": str(cursor.user_id), "n": cursor.position})
+
+
+def decode_leaderboard_cursor(value: str) -> LeaderboardCursor:
+    return decode_cursor(
+        value,
+        lambda data: LeaderboardCursor(
+            points=int(data["p"]),
+            user_id=uuid.UUID(str(data["u"])),
+            position=int(data["n"]),
+        ),
+    )
+
+
+def _period_start_day(period: LeaderboardPeriod, today: dt.date) -> dt.date | None:
+    window_days = LEADERBOARD_PERIOD_DAYS.get(period)
+    if window_days is None:
+        return None
+    return today - dt.timedelta(days=window_days - 1)
+
+
+async def _fetch_page(
+    db: AsyncSession,
+    *,
+    user_col: Any,
+    points_col: Any,
+    query: Any,
+    cursor: LeaderboardCursor | None,
+    limit: int,
+) -> LeaderboardPage:
+    if cursor is not None:
+        query = query.where(
+            or_(
+                points_col < cursor.points,
+                and_(points_col == cursor.points, user_col > cursor.user_id),
+            )
+        )
+    query = query.order_by(points_col.desc(), user_col.asc()).limit(limit + 1)
+    rows = (await db.execute(query)).all()
+
+    start = cursor.position if cursor is not None else 0
+    page = [
+        LeaderboardRow(position=start + index + 1, user_id=row[0], points=int(row[1]))
+        for index, row in enumerate(rows[:limit])
+    ]
+    next_cursor = None
+    if len(rows) > limit and page:
+        last = page[-1]
+        next_cursor = encode_leaderboard_cursor(
+            LeaderboardCursor(points=last.points, user_id=last.user_id, position=last.position)
+        )
+    return LeaderboardPage(rows=page, next_cursor=next_cursor)
+
+
+async def global_leaderboard(
+    *,
+    db: AsyncSession,
+    rank_version: str,
+    period: LeaderboardPeriod,
+    cursor: LeaderboardCursor | None,
+    limit: int,
+) -> LeaderboardPage:
+    """All-time reads the rank cache; windowed periods read the precomputed window rows."""
+    window_days = LEADERBOARD_PERIOD_DAYS.get(period)
+    if window_days is None:
+        query = select(CuratorRankCache.user_id, CuratorRankCache.points_total).where(
+            CuratorRankCache.rank_version == rank_version,
+            CuratorRankCache.points_total > 0,
+        )
+        user_col, points_col = CuratorRankCache.user_id, CuratorRankCache.points_total
+    else:
+        query = select(CuratorRankWindow.user_id, CuratorRankWindow.points_total).where(
+            CuratorRankWindow.rank_version == rank_version,
+            CuratorRankWindow.window_days == window_days,
+        )
+        user_col, points_col = CuratorRankWindow.user_id, CuratorRankWindow.points_total
+    return await _fetch_page(
+        db,
+        user_col=user_col,
+        points_col=points_col,
+        query=query,
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+async def scoped_leaderboard(
+    *,
+    db: AsyncSession,
+    rank_version: str,
+    period: LeaderboardPeriod,
+    node_id: uuid.UUID | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    today: dt.date,
+    cursor: LeaderboardCursor | None,
+    limit: int,
+) -> LeaderboardPage:
+    """Points earned at one node or inside a bbox, with the same per-day caps as global rank.
+
+    Per user and UTC day, distinct nodes count once each up to PER_DAY_POINTS_CAP.
+    """
+    day_expr = cast(func.timezone("UTC", CuratorRankEvent.created_at), Date)
+    filters = [
+        CuratorRankEvent.rank_version == rank_version,
+        CuratorRankEvent.event_type == CAPTURE_VERIFIED_EVENT_TYPE,
+        Capture.state == CaptureState.verified.value,
+    ]
+    if node_id is not None:
+        filters.append(CuratorRankEvent.node_id == node_id)
+    if bbox is not None:
+        envelope = func.ST_MakeEnvelope(*bbox, 4326)
+        filters.append(
+            CuratorRankEvent.node_id.in_(
+                select(Node.id).where(func.ST_Intersects(Node.location, envelope))
+            )
+        )
+    start_day = _period_start_day(period, today)
+    if start_day is not None:
+        filters.append(
+            CuratorRankEvent.created_at
+            >= dt.datetime.combine(start_day, dt.time.min, tzinfo=dt.UTC)
+        )
+
+    per_day = (
+        select(
+            CuratorRankEvent.user_id.label("user_id"),
+            func.count(func.distinct(CuratorRankEvent.node_id)).label("nodes"),
+        )
+        .select_from(CuratorRankEvent)
+        .join(Capture, CuratorRankEvent.capture_id == Capture.id)
+        .where(*filters)
+        .group_by(CuratorRankEvent.user_id, day_expr)
+        .subquery("per_day")
+    )
+    scored = (
+        select(
+            per_day.c.user_id.label("user_id"),
+            cast(func.sum(func.least(per_day.c.nodes, PER_DAY_POINTS_CAP)), Integer).label(
+                "points"
+            ),
+        )
+        .group_by(per_day.c.user_id)
+        .subquery("scored")
+    )
+    return await _fetch_page(
+        db,
+        user_col=scored.c.user_id,
+        points_col=scored.c.points,
+        query=select(scored.c.user_id, scored.c.points),
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+async def refresh_rank_window(
+    *,
+    db: AsyncSession,
+    rank_version: str,
+    window_days: int,
+    today: dt.date,
+) -> int:
+    """Replace one rolling window snapshot from curator_rank_daily in a single transaction."""
+    start_day = today - dt.timedelta(days=window_days - 1)
+    now = utcnow()
+    await db.execute(
+        delete(CuratorRankWindow).where(
+            CuratorRankWindow.rank_version == rank_version,
+            CuratorRankWindow.window_days == window_days,
+        )
+    )
+    points = func.sum(CuratorRankDaily.points_counted)
+    result = await db.execute(
+        insert(CuratorRankWindow).from_select(
+            [
+                "rank_version",
+                "window_days",
+                "user_id",
+                "points_total",
+                "verified_captures_total",
+                "computed_at",
+            ],
+            select(
+                literal(rank_version),
+                literal(window_days),
+                CuratorRankDaily.user_id,
+                cast(points, Integer),
+                cast(func.sum(CuratorRankDaily.verified_captures_total), Integer),
+                literal(now, CuratorRankWindow.computed_at.type),
+            )
+            .where(
+                CuratorRankDaily.rank_version == rank_version,
+                CuratorRankDaily.day >= start_day,
+            )
+            .group_by(CuratorRankDaily.user_id)
+            .having(points > 0),
+        )
+    )
+    return max(result.rowcount or 0, 0)
+
+
+class LeaderboardCache:
+    """Small in-process TTL cache for leaderboard pages (bounded, LRU eviction)."""
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[object, ...], tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: tuple[object, ...]) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: tuple[object, ...], value: Any, *, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+from dataclasses import dataclass
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import MediaBlob
+from groundedart_api.storage.base import StoredMedia
+
+
+@dataclass(frozen=True)
+class UnreferencedBlob:
+    sha256: str
+    path: str
+    size_bytes: int
+
+
+async def acquire_media_blob(
+    *,
+    db: AsyncSession,
+    stored: StoredMedia,
+    now: dt.datetime,
+) -> StoredMedia:
+    """Add a reference to the blob behind `stored` (creating its row).
+
+    Returns `stored` pointed at the blob's recorded path and MIME type: one row tracks
+    one file per sha256, so identical bytes uploaded under another type share the file
+    stored first. The row stays locked until the caller's transaction ends.
+    """
+    stmt = insert(MediaBlob).values(
+        sha256=stored.sha256,
+        path=stored.path,
+        mime=stored.mime,
+        size_bytes=stored.bytes_written,
+        ref_count=1,
+        created_at=now,
+        updated_at=now,
+    )
+    row = (
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[MediaBlob.sha256],
+                set_={
+                    "ref_count": MediaBlob.ref_count + 1,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ).returning(MediaBlob.path, MediaBlob.mime)
+        )
+    ).one()
+    return dataclasses.replace(stored, path=row.path, mime=row.mime)
+
+
+async def repoint_media_blob(*, db: AsyncSession, stored: StoredMedia, now: dt.datetime) -> None:
+    """Record that the blob's file now lives at `stored.path` (it was stored again)."""
+    await db.execute(
+        update(MediaBlob)
+        .where(MediaBlob.sha256 == stored.sha256)
+        .values(
+            path=stored.path,
+            mime=stored.mime,
+            size_bytes=stored.bytes_written,
+            updated_at=now,
+        )
+    )
+
+
+async def release_media_blob(*, db: AsyncSession, sha256: str, now: dt.datetime) -> None:
+    """Drop one reference; blobs at zero are removed later by `collect_unreferenced_blobs`."""
+    await db.execute(
+        update(MediaBlob)
+        .where(MediaBlob.sha256 == sha256, MediaBlob.ref_count > 0)
+        .values(ref_count=MediaBlob.ref_count - 1, updated_at=now)
+    )
+
+
+async def collect_unreferenced_blobs(
+    *,
+    db: AsyncSession,
+    unreferenced_before: dt.datetime,
+    limit: int,
+) -> list[UnreferencedBlob]:
+    """Delete up to `limit` rows unreferenced since before the cutoff and return them.
+
+    The caller removes the files *before* committing, while the rows are still locked:
+    an upload that found the blob on disk just before then blocks in
+    `acquire_media_blob` until the commit, and its re-check finds the file gone and
+    stores it again. Rows an upload has locked are skipped.
+    """
+    candidates = (
+        select(MediaBlob.sha256)
+        .where(MediaBlob.ref_count == 0, MediaBlob.updated_at < unreferenced_before)
+        .order_by(MediaBlob.updated_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = (
+        await db.execute(
+            delete(MediaBlob)
+            .where(MediaBlob.sha256.in_(candidates), MediaBlob.ref_count == 0)
+            .returning(MediaBlob.sha256, MediaBlob.path, MediaBlob.size_bytes)
+        )
+    ).all()
+    return [
+        UnreferencedBlob(sha256=row.sha256, path=row.path, size_bytes=int(row.size_bytes))
+        for row in rows
+    ]
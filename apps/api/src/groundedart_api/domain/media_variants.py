@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from groundedart_api.db.models import Capture, Node
+from groundedart_api.db.session import create_sessionmaker
+from groundedart_api.domain.near_duplicates import flag_near_duplicates, record_blob_phash
+from groundedart_api.observability import metrics
+from groundedart_api.settings import Settings, get_settings
+from groundedart_api.storage.perceptual_hash import image_phash
+from groundedart_api.storage.variants import render_variants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VariantJob:
+    """Render the variants of one stored image and record them on its rows.
+
+    Capture jobs are keyed by blob hash, so one render serves every capture sharing it;
+    they also perceptual-hash the blob. `capture_id` is the upload that triggered the job,
+    checked for near-duplicates once the hash is stored (backfills leave it unset).
+    """
+
+    kind: Literal["capture", "node"]
+    source_path: str
+    sha256: str | None = None
+    capture_id: uuid.UUID | None = None
+
+
+async def record_variants(
+    db: AsyncSession, job: VariantJob, variants: list[dict[str, Any]]
+) -> int:
+    """Store `variants` on every row still pointing at the job's source; returns rows."""
+    if job.kind == "capture":
+        stmt = update(Capture).where(
+            Capture.image_sha256 == job.sha256, Capture.image_path == job.source_path
+        )
+    else:
+        stmt = update(Node).where(Node.image_path == job.source_path)
+    result = await db.execute(stmt.values(image_variants=variants))
+    return result.rowcount or 0
+
+
+class MediaVariantPipeline:
+    """Post-upload thumbnail/WebP rendering and hashing on a process pool, off the request path.
+
+    Decoding and resizing are CPU-bound and hold the GIL, so they run in worker
+    processes; the event loop only queues jobs and writes the results. `submit()` never
+    blocks: when the pipeline is not running or its queue is full the job is dropped and
+    counted, and `scripts/backfill_media_variants.py` renders whatever was missed.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        sessionmaker: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._sessionmaker = sessionmaker
+        self._workers = settings.media_variant_workers
+        self._queue: asyncio.Queue[VariantJob] = asyncio.Queue(
+            maxsize=settings.media_variant_queue_max
+        )
+        self._executor: ProcessPoolExecutor | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def submit(self, job: VariantJob) -> bool:
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            metrics.media_variant_jobs_total.labels(kind=job.kind, outcome="dropped").inc()
+            return False
+        return True
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run(), name=f"media-variants-{index}")
+                for index in range(self._workers)
+            ]
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def process(self, job: VariantJob, *, force: bool = False) -> list[dict[str, Any]]:
+        """Render `job` in the pool and commit the variant records; returns them."""
+        settings = self._settings
+        render = functools.partial(
+            render_variants,
+            settings.media_dir,
+            job.source_path,
+            tuple(settings.media_variant_widths),
+            webp_quality=settings.media_variant_webp_quality,
+            jpeg_quality=settings.media_variant_jpeg_quality,
+            avif_quality=(
+                settings.media_variant_avif_quality if settings.media_variant_avif_enabled else None
+            ),
+            force=force,
+        )
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        try:
+            variants = await loop.run_in_executor(self._process_executor(), render)
+            phash = None
+            if job.kind == "capture" and job.sha256 is not None:
+                phash = await loop.run_in_executor(
+                    self._process_executor(), image_phash, settings.media_dir, job.source_path
+                )
+            async with self._get_sessionmaker()() as db:
+                await record_variants(db, job, variants)
+                if phash is not None:
+                    await record_blob_phash(db, sha256=job.sha256, phash=phash)
+                await db.commit()
+                if phash is not None and job.capture_id is not None:
+                    await flag_near_duplicates(
+                        db,
+                        capture_id=job.capture_id,
+                        phash=phash,
+                        max_distance=settings.near_duplicate_flag_distance,
+                    )
+        except Exception:
+            metrics.media_variant_jobs_total.labels(kind=job.kind, outcome="failed").inc()
+            raise
+        metrics.media_variant_jobs_total.labels(kind=job.kind, outcome="rendered").inc()
+        metrics.media_variant_render_seconds.observe(time.perf_counter() - started)
+        return variants
+
+    def _process_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and I/O threads is unsafe.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _get_sessionmaker(self) -> async_sessionmaker[AsyncSession]:
+        if self._sessionmaker is None:
+            self._sessionmaker = create_sessionmaker(self._settings.database_url)
+        return self._sessionmaker
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self.process(job)
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "media_variant_job_failed",
+                    extra={"kind": job.kind, "source_path": job.source_path},
+                )
+            finally:
+                self._queue.task_done()
+
+
+_pipeline: MediaVariantPipeline | None = None
+
+
+def get_media_variant_pipeline() -> MediaVariantPipeline:
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = MediaVariantPipeline(get_settings())
+    return _pipeline
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import and_, delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import Capture, CaptureReviewLease
+from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.cursors import cursor_timestamp, decode_cursor, encode_cursor
+from groundedart_api.observability import metrics
+
+
+@dataclass(frozen=True)
+class ReviewLease:
+    capture: Capture
+    moderator_id: str
+    expires_at: dt.datetime
+
+
+@dataclass(frozen=True)
+class QueueCursor:
+    created_at: dt.datetime
+    capture_id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class QueuePage:
+    captures: list[Capture]
+    next_cursor: str | None
+
+
+@dataclass(frozen=True)
+class QueueDepth:
+    unclaimed: int
+    leased: int
+
+
+def encode_queue_cursor(cursor: QueueCursor) -> str:
+    return encode_cursor({"t": cursor.created_at.isoformat(), "c": str(cursor.capture_id)})
+
+
+def decode_queue_cursor(value: str) -> QueueCursor:
+    return decode_cursor(
+        value,
+        lambda data: QueueCursor(
+            created_at=cursor_timestamp(data["t"]), capture_id=uuid.UUID(str(data["c"]))
+        ),
+    )
+
+
+def _unleased_pending(now: dt.datetime):
+    """Pending captures with no live lease, oldest first (served by ix_captures_pending_queue)."""
+    return (
+        select(Capture)
+        .outerjoin(CaptureReviewLease, CaptureReviewLease.capture_id == Capture.id)
+        .where(
+            Capture.state == CaptureState.pending_verification.value,
+            or_(
+                CaptureReviewLease.capture_id.is_(None),
+                CaptureReviewLease.expires_at <= now,
+            ),
+        )
+        .order_by(Capture.created_at.asc(), Capture.id.asc())
+    )
+
+
+async def claim_pending_captures(
+    *,
+    db: AsyncSession,
+    moderator_id: str,
+    limit: int,
+    lease_seconds: int,
+    now: dt.datetime,
+) -> list[ReviewLease]:
+    """Lease up to `limit` of the oldest unclaimed pending captures to `moderator_id`.
+
+    Candidate captures are locked with SKIP LOCKED, so concurrent claims take disjoint
+    rows instead of queueing behind each other. The lease upsert only overwrites an
+    expired lease, which covers a claim that raced another claim's commit.
+    """
+    captures = (
+        await db.scalars(
+            _unleased_pending(now).limit(limit).with_for_update(of=Capture, skip_locked=True)
+        )
+    ).all()
+    if not captures:
+        return []
+
+    expires_at = now + dt.timedelta(seconds=lease_seconds)
+    stmt = insert(CaptureReviewLease).values(
+        [
+            {
+                "capture_id": capture.id,
+                "moderator_id": moderator_id,
+                "claimed_at": now,
+                "expires_at": expires_at,
+            }
+            for capture in captures
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CaptureReviewLease.capture_id],
+        set_={
+            "moderator_id": stmt.excluded.moderator_id,
+            "claimed_at": stmt.excluded.claimed_at,
+            "expires_at": stmt.excluded.expires_at,
+        },
+        where=CaptureReviewLease.expires_at <= now,
+    ).returning(CaptureReviewLease.capture_id)
+    leased_ids = set((await db.scalars(stmt)).all())
+    metrics.moderation_leases_total.labels(action="claimed").inc(len(leased_ids))
+    return [
+        ReviewLease(capture=capture, moderator_id=moderator_id, expires_at=expires_at)
+        for capture in captures
+        if capture.id in leased_ids
+    ]
+
+
+async def renew_capture_leases(
+    *,
+    db: AsyncSession,
+    moderator_id: str,
+    capture_ids: Iterable[uuid.UUID],
+    lease_seconds: int,
+    now: dt.datetime,
+) -> list[ReviewLease]:
+    """Extend `moderator_id`'s live leases; expired or foreign leases are left untouched."""
+    ids = set(capture_ids)
+    if not ids:
+        return []
+    expires_at = now + dt.timedelta(seconds=lease_seconds)
+    renewed_ids = set(
+        (
+            await db.scalars(
+                update(CaptureReviewLease)
+                .where(
+                    CaptureReviewLease.capture_id.in_(ids),
+                    CaptureReviewLease.moderator_id == moderator_id,
+                    CaptureReviewLease.expires_at > now,
+                )
+                .values(expires_at=expires_at)
+                .returning(CaptureReviewLease.capture_id)
+            )
+        ).all()
+    )
+    if not renewed_ids:
+        return []
+    metrics.moderation_leases_total.labels(action="renewed").inc(len(renewed_ids))
+    captures = (
+        await db.scalars(
+            select(Capture)
+            .where(Capture.id.in_(renewed_ids))
+            .order_by(Capture.created_at.asc(), Capture.id.asc())
+        )
+    ).all()
+    return [
+        ReviewLease(capture=capture, moderator_id=moderator_id, expires_at=expires_at)
+        for capture in captures
+    ]
+
+
+async def release_capture_leases(
+    *,
+    db: AsyncSession,
+    moderator_id: str,
+    capture_ids: Iterable[uuid.UUID],
+) -> list[uuid.UUID]:
+    """Hand `moderator_id`'s leases back to the queue; returns the released capture ids."""
+    ids = set(capture_ids)
+    if not ids:
+        return []
+    released = (
+        await db.scalars(
+            delete(CaptureReviewLease)
+            .where(
+                CaptureReviewLease.capture_id.in_(ids),
+                CaptureReviewLease.moderator_id == moderator_id,
+            )
+            .returning(CaptureReviewLease.capture_id)
+        )
+    ).all()
+    metrics.moderation_leases_total.labels(action="released").inc(len(released))
+    return list(released)
+
+
+async def clear_capture_leases(*, db: AsyncSession, capture_ids: Iterable[uuid.UUID]) -> None:
+    """Drop leases on captures that have left the queue (e.g. after a transition)."""
+    ids = set(capture_ids)
+    if ids:
+        await db.execute(delete(CaptureReviewLease).where(CaptureReviewLease.capture_id.in_(ids)))
+
+
+async def list_queue_page(
+    *,
+    db: AsyncSession,
+    now: dt.datetime,
+    cursor: QueueCursor | None,
+    limit: int,
+) -> QueuePage:
+    """Keyset page over unclaimed pending captures in claim order."""
+    query = _unleased_pending(now)
+    if cursor is not None:
+        query = query.where(
+            tuple_(Capture.created_at, Capture.id) > tuple_(cursor.created_at, cursor.capture_id)
+        )
+    captures = list((await db.scalars(query.limit(limit + 1))).all())
+    next_cursor = None
+    if len(captures) > limit:
+        captures = captures[:limit]
+        last = captures[-1]
+        next_cursor = encode_queue_cursor(
+            QueueCursor(created_at=last.created_at, capture_id=last.id)
+        )
+    return QueuePage(captures=captures, next_cursor=next_cursor)
+
+
+async def measure_queue_depth(*, db: AsyncSession, now: dt.datetime) -> QueueDepth:
+    """Count pending captures by lease status and publish them as the queue-depth gauge."""
+    live_lease = and_(
+        CaptureReviewLease.capture_id.is_not(None),
+        CaptureReviewLease.expires_at > now,
+    )
+    row = (
+        await db.execute(
+            select(
+                func.count().filter(~live_lease).label("unclaimed"),
+                func.count().filter(live_lease).label("leased"),
+            )
+            .select_from(Capture)
+            .outerjoin(CaptureReviewLease, CaptureReviewLease.capture_id == Capture.id)
+            .where(Capture.state == CaptureState.pending_verification.value)
+        )
+    ).one()
+    depth = QueueDepth(unclaimed=int(row.unclaimed or 0), leased=int(row.leased or 0))
+    metrics.moderation_queue_depth.labels(status="unclaimed").set(depth.unclaimed)
+    metrics.moderation_queue_depth.labels(status="leased").set(depth.leased)
+    return depth
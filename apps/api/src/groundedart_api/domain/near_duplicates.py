@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import itertools
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import cast, func, or_, select, update
+from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import Capture, MediaBlob
+from groundedart_api.domain.abuse_events import record_abuse_event
+from groundedart_api.storage.perceptual_hash import PHASH_BITS, from_signed64, to_signed64
+
+PHASH_BANDS = 4
+BAND_BITS = PHASH_BITS // PHASH_BANDS
+_BAND_MASK = (1 << BAND_BITS) - 1
+_BAND_COLUMNS = (MediaBlob.phash_b0, MediaBlob.phash_b1, MediaBlob.phash_b2, MediaBlob.phash_b3)
+# Abuse event details list at most this many matches.
+_FLAG_MATCHES_MAX = 10
+
+
+@dataclass(frozen=True)
+class SimilarCapture:
+    capture: Capture
+    distance: int
+
+
+def phash_bands(phash: int) -> list[int]:
+    """The four 16-bit bands of an unsigned 64-bit hash, most significant first."""
+    return [
+        (phash >> (BAND_BITS * (PHASH_BANDS - 1 - index))) & _BAND_MASK
+        for index in range(PHASH_BANDS)
+    ]
+
+
+def band_neighbors(band: int, radius: int) -> list[int]:
+    """Every band value within Hamming distance `radius` of `band`."""
+    neighbors = [band]
+    for flips in range(1, radius + 1):
+        for positions in itertools.combinations(range(BAND_BITS), flips):
+            value = band
+            for position in positions:
+                value ^= 1 << position
+            neighbors.append(value)
+    return neighbors
+
+
+async def record_blob_phash(db: AsyncSession, *, sha256: str, phash: int) -> None:
+    bands = phash_bands(phash)
+    await db.execute(
+        update(MediaBlob)
+        .where(MediaBlob.sha256 == sha256)
+        .values(
+            phash=to_signed64(phash),
+            phash_b0=bands[0],
+            phash_b1=bands[1],
+            phash_b2=bands[2],
+            phash_b3=bands[3],
+        )
+    )
+
+
+async def find_similar_captures(
+    db: AsyncSession,
+    *,
+    capture_id: uuid.UUID,
+    phash: int,
+    max_distance: int,
+    limit: int,
+) -> list[SimilarCapture]:
+    """Other captures whose image is within `max_distance` bits of `phash`, nearest first.
+
+    Multi-index hashing: if two 64-bit hashes differ in at most `max_distance` bits, some
+    16-bit band differs in at most `max_distance // 4` (pigeonhole). So the candidates
+    are the blobs matching one band exactly or within that small radius (one indexed
+    `IN` probe per band) and only they get the full popcount check. Candidates per
+    probe shrink as 2^-16 of the table, which keeps lookups to index reads at millions
+    of blobs; a radius of up to 7 probes 17 values per band, 8-11 probe 137.
+    Byte-identical captures share the blob and come back at distance 0.
+    """
+    band_radius = max_distance // PHASH_BANDS
+    signed = to_signed64(phash)
+    distance = func.bit_count(cast(MediaBlob.phash.op("#")(signed), BIT(64))).label("distance")
+    candidates = (
+        select(MediaBlob.sha256, distance)
+        .where(
+            or_(
+                *(
+                    column.in_(band_neighbors(band, band_radius))
+                    for column, band in zip(_BAND_COLUMNS, phash_bands(phash), strict=True)
+                )
+            ),
+            MediaBlob.ref_count > 0,
+        )
+        .subquery()
+    )
+    rows = (
+        await db.execute(
+            select(Capture, candidates.c.distance)
+            .join(candidates, Capture.image_sha256 == candidates.c.sha256)
+            .where(candidates.c.distance <= max_distance, Capture.id != capture_id)
+            .order_by(candidates.c.distance, Capture.created_at, Capture.id)
+            .limit(limit)
+        )
+    ).all()
+    return [SimilarCapture(capture=capture, distance=int(dist)) for capture, dist in rows]
+
+
+async def get_capture_phash(db: AsyncSession, capture: Capture) -> int | None:
+    if capture.image_sha256 is None:
+        return None
+    value = await db.scalar(
+        select(MediaBlob.phash).where(MediaBlob.sha256 == capture.image_sha256)
+    )
+    return None if value is None else from_signed64(value)
+
+
+async def flag_near_duplicates(
+    db: AsyncSession,
+    *,
+    capture_id: uuid.UUID,
+    phash: int,
+    max_distance: int,
+) -> int:
+    """Record a `capture_near_duplicate` abuse event when the image resurfaces elsewhere.
+
+    Only matches from another user or another node count: one user re-shooting the same
+    artwork at the same node is expected. Returns the number of such matches.
+    """
+    capture = await db.get(Capture, capture_id)
+    if capture is None:
+        return 0
+    matches = [
+        match
+        for match in await find_similar_captures(
+            db,
+            capture_id=capture.id,
+            phash=phash,
+            max_distance=max_distance,
+            limit=_FLAG_MATCHES_MAX * 5,
+        )
+        if match.capture.user_id != capture.user_id or match.capture.node_id != capture.node_id
+    ]
+    if not matches:
+        return 0
+    await record_abuse_event(
+        db=db,
+        event_type="capture_near_duplicate",
+        user_id=capture.user_id,
+        node_id=capture.node_id,
+        capture_id=capture.id,
+        details={
+            "max_distance": max_distance,
+            "other_users": len({match.capture.user_id for match in matches} - {capture.user_id}),
+            "other_nodes": len({match.capture.node_id for match in matches} - {capture.node_id}),
+            "matches": [
+                {
+                    "capture_id": str(match.capture.id),
+                    "user_id": str(match.capture.user_id),
+                    "node_id": str(match.capture.node_id),
+                    "distance": match.distance,
+                }
+                for match in matches[:_FLAG_MATCHES_MAX]
+            ],
+        },
+    )
+    return len(matches)
+
@@ -1,6 +1,21 @@
 from __future__ import annotations
 
-from groundedart_api.db.models import Capture, UserNotification
+import datetime as dt
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+
+from sqlalchemy import func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import (
+    Capture,
+    UserNotification,
+    UserNotificationCounter,
+    utcnow,
+)
+from groundedart_api.domain.cursors import cursor_timestamp, decode_cursor, encode_cursor
 
 MISSING_FIELD_LABELS: dict[str, str] = {
     "attribution_artist_name": "artist name",
@@ -37,10 +52,164 @@ def record_capture_verified_notification(
         "published": published,
         "publish_requested": bool(capture.publish_requested),
     }
+    # id and created_at are set up front so the stream event can be published before flush.
     return UserNotification(
+        id=uuid.uuid4(),
         user_id=capture.user_id,
         event_type="capture_verified",
         title=title,
         body=body,
         details=details,
+        created_at=utcnow(),
+    )
+
+
+@dataclass(frozen=True)
+class NotificationCursor:
+    created_at: dt.datetime
+    notification_id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class NotificationPage:
+    notifications: list[UserNotification]
+    next_cursor: str | None
+    latest_cursor: str | None
+
+
+@dataclass(frozen=True)
+class MarkReadResult:
+    marked_read: int
+    unread_count: int
+
+
+def encode_notification_cursor(cursor: NotificationCursor) -> str:
+    """Same fields as /v1/me/stream event ids, so a notification event id is a cursor."""
+    return encode_cursor({"t": cursor.created_at.isoformat(), "i": str(cursor.notification_id)})
+
+
+def decode_notification_cursor(value: str) -> NotificationCursor:
+    return decode_cursor(
+        value,
+        lambda data: NotificationCursor(
+            created_at=cursor_timestamp(data["t"]), notification_id=uuid.UUID(str(data["i"]))
+        ),
+    )
+
+
+def _cursor_for(notification: UserNotification) -> str:
+    return encode_notification_cursor(
+        NotificationCursor(created_at=notification.created_at, notification_id=notification.id)
+    )
+
+
+def _position(cursor: NotificationCursor):
+    return tuple_(literal(cursor.created_at), literal(cursor.notification_id))
+
+
+_order_key = tuple_(UserNotification.created_at, UserNotification.id)
+
+
+async def increment_unread_counts(
+    *,
+    db: AsyncSession,
+    user_ids: Counter[uuid.UUID],
+    now: dt.datetime,
+) -> None:
+    """Count newly created notifications (per user) in the caller's transaction."""
+    if not user_ids:
+        return
+    stmt = insert(UserNotificationCounter).values(
+        [
+            {"user_id": user_id, "unread_count": count, "updated_at": now}
+            for user_id, count in sorted(user_ids.items())
+        ]
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserNotificationCounter.user_id],
+            set_={
+                "unread_count": UserNotificationCounter.unread_count
+                + stmt.excluded.unread_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def get_unread_count(*, db: AsyncSession, user_id: uuid.UUID) -> int:
+    count = await db.scalar(
+        select(UserNotificationCounter.unread_count).where(
+            UserNotificationCounter.user_id == user_id
+        )
+    )
+    return int(count or 0)
+
+
+async def list_notification_page(
+    *,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    cursor: NotificationCursor | None,
+    limit: int,
+    unread_only: bool,
+) -> NotificationPage:
+    """Newest first, keyset-paged on (created_at, id)."""
+    query = select(UserNotification).where(UserNotification.user_id == user_id)
+    if unread_only:
+        query = query.where(UserNotification.read_at.is_(None))
+    if cursor is not None:
+        query = query.where(_order_key < _position(cursor))
+    rows = (
+        await db.scalars(
+            query.order_by(UserNotification.created_at.desc(), UserNotification.id.desc()).limit(
+                limit + 1
+            )
+        )
+    ).all()
+    notifications = list(rows[:limit])
+    return NotificationPage(
+        notifications=notifications,
+        next_cursor=_cursor_for(notifications[-1]) if len(rows) > limit else None,
+        latest_cursor=_cursor_for(notifications[0]) if notifications else None,
+    )
+
+
+async def mark_notifications_read(
+    *,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    now: dt.datetime,
+    ids: list[uuid.UUID] | None = None,
+    up_to: NotificationCursor | None = None,
+) -> MarkReadResult:
+    """Mark the given notifications, or every one at or before `up_to`, as read.
+
+    A single UPDATE flips the unread rows; the counter is decremented by its rowcount, so
+    a notification marked by two concurrent requests is only subtracted once.
+    """
+    stmt = update(UserNotification).where(
+        UserNotification.user_id == user_id, UserNotification.read_at.is_(None)
+    )
+    if ids is not None:
+        stmt = stmt.where(UserNotification.id.in_(ids))
+    if up_to is not None:
+        stmt = stmt.where(_order_key <= _position(up_to))
+    result = await db.execute(
+        stmt.values(read_at=now).execution_options(synchronize_session=False)
+    )
+    marked_read = int(result.rowcount or 0)
+    if not marked_read:
+        return MarkReadResult(
+            marked_read=0, unread_count=await get_unread_count(db=db, user_id=user_id)
+        )
+    unread_count = await db.scalar(
+        update(UserNotificationCounter)
+        .where(UserNotificationCounter.user_id == user_id)
+        .values(
+            unread_count=func.greatest(UserNotificationCounter.unread_count - marked_read, 0),
+            updated_at=now,
+        )
+        .returning(UserNotificationCounter.unread_count)
     )
+    return MarkReadResult(marked_read=marked_read, unread_count=int(unread_count or 0))
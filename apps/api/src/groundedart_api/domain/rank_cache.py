@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import asyncpg
+from sqlalchemy import String, bindparam, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.session import asyncpg_dsn
+from groundedart_api.observability import metrics
+from groundedart_api.settings import get_settings
+
+RANK_CHANGED_CHANNEL = "rank_changed"
+_ALL_USERS = "*"
+# Above this many users a single version-wide invalidation is cheaper than per-user payloads.
+_MAX_USER_NOTIFICATIONS = 200
+
+logger = logging.getLogger(__name__)
+
+RankCacheKey = tuple[uuid.UUID, str]
+
+
+@dataclass(frozen=True)
+class RankCacheEntry:
+    points_total: int
+    verified_captures_total: int
+    verified_captures_counted: int
+    per_node_per_day_removed: int
+    per_day_removed: int
+
+
+async def notify_rank_changed(
+    *,
+    db: AsyncSession,
+    rank_version: str,
+    user_ids: Iterable[uuid.UUID] | None = None,
+) -> None:
+    """Queue `NOTIFY rank_changed` in the caller's transaction (delivered on commit).
+
+    `user_ids=None` invalidates every user on `rank_version`.
+    """
+    unique_ids = None if user_ids is None else sorted(set(user_ids))
+    if unique_ids is not None and not unique_ids:
+        return
+    if unique_ids is None or len(unique_ids) > _MAX_USER_NOTIFICATIONS:
+        await db.execute(
+            select(func.pg_notify(RANK_CHANGED_CHANNEL, f"{rank_version}:{_ALL_USERS}"))
+        )
+        return
+    values = [f"{rank_version}:{user_id}" for user_id in unique_ids]
+    payloads = func.unnest(bindparam("payloads", values, ARRAY(String))).table_valued("payload")
+    await db.execute(
+        select(func.pg_notify(literal(RANK_CHANGED_CHANNEL), payloads.c.payload)).select_from(
+            payloads
+        )
+    )
+
+
+class RankCache:
+    """Per-worker cache of curator rank totals keyed by (user_id, rank_version).
+
+    Entries are only served while the `rank_changed` listener is connected, so a worker
+    that cannot hear invalidations falls back to reading `curator_rank_cache`. The TTL
+    bounds staleness if a notification is ever missed. A generation counter stops a read
+    that raced an invalidation from repopulating the cache with the old value.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[RankCacheKey, tuple[float, RankCacheEntry]] = OrderedDict()
+        self._generation = 0
+        self._listening = False
+
+    @property
+    def active(self) -> bool:
+        return self._listening and self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def set_listening(self, listening: bool) -> None:
+        # Anything cached before (re)connecting may have missed notifications.
+        self.clear()
+        self._listening = listening
+        metrics.rank_cache_listener_connected.set(1 if listening else 0)
+
+    def get(self, key: RankCacheKey) -> RankCacheEntry | None:
+        if not self.active:
+            return None
+        cached = self._entries.get(key)
+        if cached is None:
+            metrics.rank_cache_lookups_total.labels(outcome="miss").inc()
+            return None
+        loaded_at, entry = cached
+        age = time.monotonic() - loaded_at
+        if age >= self.ttl_seconds:
+            self._entries.pop(key, None)
+            metrics.rank_cache_lookups_total.labels(outcome="expired").inc()
+            return None
+        self._entries.move_to_end(key)
+        metrics.rank_cache_lookups_total.labels(outcome="hit").inc()
+        metrics.rank_cache_entry_age_seconds.observe(age)
+        return entry
+
+    def put(self, key: RankCacheKey, entry: RankCacheEntry, *, generation: int) -> None:
+        if not self.active or generation != self._generation:
+            return
+        self._entries[key] = (time.monotonic(), entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID, rank_version: str) -> None:
+        self._generation += 1
+        self._entries.pop((user_id, rank_version), None)
+        metrics.rank_cache_invalidations_total.labels(scope="user").inc()
+
+    def invalidate_version(self, rank_version: str) -> None:
+        self._generation += 1
+        for key in [key for key in self._entries if key[1] == rank_version]:
+            del self._entries[key]
+        metrics.rank_cache_invalidations_total.labels(scope="version").inc()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def handle_notification(self, payload: str) -> None:
+        rank_version, _, target = payload.rpartition(":")
+        if not rank_version:
+            logger.warning("rank_changed_payload_invalid", extra={"payload": payload})
+            self.clear()
+            return
+        if target == _ALL_USERS:
+            self.invalidate_version(rank_version)
+            return
+        try:
+            user_id = uuid.UUID(target)
+        except ValueError:
+            logger.warning("rank_changed_payload_invalid", extra={"payload": payload})
+            self.clear()
+            return
+        self.invalidate(user_id, rank_version)
+
+
+class RankChangeListener:
+    """Background task holding a dedicated LISTEN connection for `rank_changed`."""
+
+    def __init__(
+        self,
+        cache: RankCache,
+        *,
+        database_url: str,
+        reconnect_seconds: float = 5.0,
+    ) -> None:
+        self._cache = cache
+        self._dsn = asyncpg_dsn(database_url)
+        self._reconnect_seconds = reconnect_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="rank-change-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def _on_notification(self, _conn: object, _pid: int, _channel: str, payload: str) -> None:
+        self._cache.handle_notification(payload)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("rank_change_listener_failed")
+            await asyncio.sleep(self._reconnect_seconds)
+
+    async def _listen_once(self) -> None:
+        conn = await asyncpg.connect(self._dsn)
+        lost = asyncio.Event()
+        conn.add_termination_listener(lambda _conn: lost.set())
+        try:
+            await conn.add_listener(RANK_CHANGED_CHANNEL, self._on_notification)
+            self._cache.set_listening(True)
+            await lost.wait()
+            logger.warning("rank_change_listener_disconnected")
+        finally:
+            self._cache.set_listening(False)
+            if not conn.is_closed():
+                conn.terminate()
+
+
+_rank_cache: RankCache | None = None
+
+
+def get_rank_cache() -> RankCache:
+    global _rank_cache
+    if _rank_cache is None:
+        settings = get_settings()
+        _rank_cache = RankCache(
+            ttl_seconds=settings.rank_cache_ttl_seconds,
+            max_entries=settings.rank_cache_max_entries,
+        )
+    return _rank_cache
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import Date, DateTime, Integer, case, cast, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import CuratorRankDaily
+from groundedart_api.domain.errors import AppError
+
+RankHistoryBucket = Literal["day", "week", "month"]
+
+# Auto-bucketing picks the finest bucket that keeps a series at or below this many points.
+RANK_HISTORY_TARGET_POINTS = 60
+# Explicit buckets are honoured up to this many points; longer ranges must use a coarser bucket.
+RANK_HISTORY_MAX_POINTS = 400
+RANK_HISTORY_DEFAULT_DAYS = 365
+
+_BUCKET_ORDER: tuple[RankHistoryBucket, ...] = ("day", "week", "month")
+
+
+@dataclass(frozen=True)
+class RankHistoryPoint:
+    bucket_start: dt.date
+    points: int
+    points_cumulative: int
+    verified_captures: int
+    per_node_per_day_removed: int
+    per_day_removed: int
+
+
+@dataclass(frozen=True)
+class RankHistory:
+    start: dt.date
+    end: dt.date
+    bucket: RankHistoryBucket
+    points: list[RankHistoryPoint]
+
+
+def bucket_start(day: dt.date, bucket: RankHistoryBucket) -> dt.date:
+    """Python mirror of `date_trunc(bucket, day)` (weeks start on Monday)."""
+    if bucket == "week":
+        return day - dt.timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(start: dt.date, bucket: RankHistoryBucket) -> dt.date:
+    if bucket == "week":
+        return start + dt.timedelta(days=7)
+    if bucket == "month":
+        return (start.replace(day=28) + dt.timedelta(days=4)).replace(day=1)
+    return start + dt.timedelta(days=1)
+
+
+def _bucket_starts(start: dt.date, end: dt.date, bucket: RankHistoryBucket) -> list[dt.date]:
+    starts: list[dt.date] = []
+    current = bucket_start(start, bucket)
+    while current <= end:
+        starts.append(current)
+        try:
+            current = _next_bucket(current, bucket)
+        except OverflowError:
+            # The last bucket before date.max.
+            break
+    return starts
+
+
+def count_buckets(start: dt.date, end: dt.date, bucket: RankHistoryBucket) -> int:
+    if bucket == "day":
+        return (end - start).days + 1
+    if bucket == "week":
+        return (bucket_start(end, "week") - bucket_start(start, "week")).days // 7 + 1
+    return (end.year - start.year) * 12 + end.month - start.month + 1
+
+
+def choose_bucket(start: dt.date, end: dt.date) -> RankHistoryBucket:
+    for bucket in _BUCKET_ORDER:
+        if count_buckets(start, end, bucket) <= RANK_HISTORY_TARGET_POINTS:
+            return bucket
+    return "month"
+
+
+async def compute_rank_history(
+    *,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    rank_version: str,
+    start: dt.date,
+    end: dt.date,
+    bucket: RankHistoryBucket | None = None,
+) -> RankHistory:
+    """Bucketed points series with running totals, downsampled in SQL.
+
+    Daily rows are grouped per bucket and `sum(...) OVER (ORDER BY bucket)` yields the
+    running total. Days before the first bucket collapse into one leading row so the
+    running total includes earlier history without returning those rows.
+    """
+    if start > end:
+        raise AppError(
+            code="invalid_rank_history_range",
+            message="from must be on or before to",
+            status_code=400,
+            details={"from": start.isoformat(), "to": end.isoformat()},
+        )
+    if bucket is None:
+        bucket = choose_bucket(start, end)
+    if count_buckets(start, end, bucket) > RANK_HISTORY_MAX_POINTS:
+        raise AppError(
+            code="invalid_rank_history_range",
+            message=(
+                "Range is too long; narrow from/to"
+                if bucket == _BUCKET_ORDER[-1]
+                else "Range is too long for this bucket; use a coarser bucket"
+            ),
+            status_code=400,
+            details={"bucket": bucket, "max_points": RANK_HISTORY_MAX_POINTS},
+        )
+
+    first_bucket = bucket_start(start, bucket)
+    # Nothing precedes date.min, so the leading row is never used there.
+    prior_bucket = dt.date.fromordinal(max(first_bucket.toordinal() - 1, 1))
+    bucketed = (
+        select(
+            case(
+                (CuratorRankDaily.day < first_bucket, literal(prior_bucket, Date)),
+                else_=cast(func.date_trunc(bucket, cast(CuratorRankDaily.day, DateTime)), Date),
+            ).label("bucket"),
+            CuratorRankDaily.points_counted,
+            CuratorRankDaily.verified_captures_total,
+            CuratorRankDaily.per_node_per_day_removed,
+            CuratorRankDaily.per_day_removed,
+        )
+        .where(
+            CuratorRankDaily.user_id == user_id,
+            CuratorRankDaily.rank_version == rank_version,
+            CuratorRankDaily.day <= end,
+        )
+        .subquery("bucketed")
+    )
+    grouped = (
+        select(
+            bucketed.c.bucket,
+            func.sum(bucketed.c.points_counted).label("points"),
+            func.sum(bucketed.c.verified_captures_total).label("verified_captures"),
+            func.sum(bucketed.c.per_node_per_day_removed).label("per_node_removed"),
+            func.sum(bucketed.c.per_day_removed).label("per_day_removed"),
+        )
+        .group_by(bucketed.c.bucket)
+        .subquery("grouped")
+    )
+    query = select(
+        grouped.c.bucket,
+        cast(grouped.c.points, Integer),
+        cast(func.sum(grouped.c.points).over(order_by=grouped.c.bucket), Integer).label(
+            "points_cumulative"
+        ),
+        cast(grouped.c.verified_captures, Integer),
+        cast(grouped.c.per_node_removed, Integer),
+        cast(grouped.c.per_day_removed, Integer),
+    ).order_by(grouped.c.bucket)
+    rows = (await db.execute(query)).all()
+
+    by_bucket: dict[dt.date, RankHistoryPoint] = {}
+    running_total = 0
+    for row in rows:
+        if row[0] < first_bucket:
+            running_total = int(row[2])
+            continue
+        by_bucket[row[0]] = RankHistoryPoint(
+            bucket_start=row[0],
+            points=int(row[1]),
+            points_cumulative=int(row[2]),
+            verified_captures=int(row[3]),
+            per_node_per_day_removed=int(row[4]),
+            per_day_removed=int(row[5]),
+        )
+
+    # Fill empty buckets so clients can plot the series without gaps.
+    points: list[RankHistoryPoint] = []
+    for start_day in _bucket_starts(start, end, bucket):
+        point = by_bucket.get(start_day)
+        if point is None:
+            point = RankHistoryPoint(
+                bucket_start=start_day,
+                points=0,
+                points_cumulative=running_total,
+                verified_captures=0,
+                per_node_per_day_removed=0,
+                per_day_removed=0,
+            )
+        running_total = point.points_cumulative
+        points.append(point)
+    return RankHistory(start=start, end=end, bucket=bucket, points=points)
@@ -2,13 +2,38 @@ from __future__ import annotations
 
 import datetime as dt
 import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 
-from sqlalchemy import Date, cast, delete, func, select
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Integer,
+    Text,
+    and_,
+    cast,
+    column,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from groundedart_api.db.models import Capture, CuratorRankCache, CuratorRankDaily, CuratorRankEvent, utcnow
+from groundedart_api.db.models import (
+    Capture,
+    CuratorRankCache,
+    CuratorRankDaily,
+    CuratorRankEvent,
+    User,
+    utcnow,
+)
 from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.rank_cache import notify_rank_changed
 from groundedart_api.domain.rank_constants import PER_DAY_POINTS_CAP
 from groundedart_api.domain.rank_events import CAPTURE_VERIFIED_EVENT_TYPE, DEFAULT_RANK_VERSION
 
@@ -27,12 +52,59 @@ def _event_source_key_expr():
     return func.coalesce(CuratorRankEvent.node_id, CuratorRankEvent.capture_id, CuratorRankEvent.id)
 
 
+RankRefreshKey = tuple[uuid.UUID, str, dt.date]
+
+_DAILY_STAT_COLUMNS = (
+    "verified_captures_total",
+    "verified_captures_unique",
+    "points_counted",
+    "per_node_per_day_removed",
+    "per_day_removed",
+)
+
+_CACHE_STAT_COLUMNS = (
+    "points_total",
+    "verified_captures_total",
+    "verified_captures_counted",
+    "per_node_per_day_removed",
+    "per_day_removed",
+)
+
+
+def _daily_stats(total: int, unique_sources: int) -> dict[str, int]:
+    points = min(unique_sources, PER_DAY_POINTS_CAP)
+    return {
+        "verified_captures_total": total,
+        "verified_captures_unique": unique_sources,
+        "points_counted": points,
+        "per_node_per_day_removed": max(total - unique_sources, 0),
+        "per_day_removed": max(unique_sources - points, 0),
+    }
+
+
+async def _lock_rank_rows(db: AsyncSession, pairs: Iterable[tuple[uuid.UUID, str]]) -> None:
+    """Serialize rank rebuilds per (user, rank_version) until the transaction ends.
+
+    Refreshes re-sum daily rows into the cache, so two running at once for one user
+    could each write a total that misses the other's day. Locks are taken in key order
+    so overlapping batches cannot deadlock; re-taking one in the same transaction is a
+    no-op.
+    """
+    lock_keys = sorted({f"rank:{user_id}:{rank_version}" for user_id, rank_version in pairs})
+    if not lock_keys:
+        return
+    keys = values(column("key", Text), name="rank_lock_keys").data([(key,) for key in lock_keys])
+    ordered = select(keys.c.key).order_by(keys.c.key).subquery()
+    await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(ordered.c.key))))
+
+
 async def materialize_rank_for_user(
     *,
     db: AsyncSession,
     user_id: uuid.UUID,
     rank_version: str = DEFAULT_RANK_VERSION,
 ) -> CuratorRankCache:
+    await _lock_rank_rows(db, [(user_id, rank_version)])
     await db.execute(
         delete(CuratorRankDaily).where(
             CuratorRankDaily.user_id == user_id,
@@ -111,9 +183,8 @@ async def materialize_rank_for_user(
             updated_at=now,
         )
         .on_conflict_do_update(
-            index_elements=[CuratorRankCache.user_id],
+            index_elements=[CuratorRankCache.user_id, CuratorRankCache.rank_version],
             set_={
-                "rank_version": rank_version,
                 "points_total": totals["points_total"],
                 "verified_captures_total": totals["verified_captures_total"],
                 "verified_captures_counted": totals["verified_captures_counted"],
@@ -125,7 +196,8 @@ async def materialize_rank_for_user(
         .returning(CuratorRankCache.user_id)
     )
     await db.execute(cache_stmt)
-    cache = await db.get(CuratorRankCache, user_id)
+    await notify_rank_changed(db=db, rank_version=rank_version, user_ids=[user_id])
+    cache = await db.get(CuratorRankCache, (user_id, rank_version))
     if cache is None:
         raise RuntimeError("Failed to materialize curator rank cache.")
     return cache
@@ -185,8 +257,9 @@ async def refresh_rank_for_user_day(
     day: dt.date,
     rank_version: str = DEFAULT_RANK_VERSION,
 ) -> CuratorRankCache:
-    existing_cache = await db.get(CuratorRankCache, user_id)
-    if existing_cache is None or existing_cache.rank_version != rank_version:
+    await _lock_rank_rows(db, [(user_id, rank_version)])
+    existing_cache = await db.get(CuratorRankCache, (user_id, rank_version))
+    if existing_cache is None:
         return await materialize_rank_for_user(db=db, user_id=user_id, rank_version=rank_version)
 
     existing_daily = await db.get(
@@ -280,9 +353,8 @@ async def refresh_rank_for_user_day(
             updated_at=now,
         )
         .on_conflict_do_update(
-            index_elements=[CuratorRankCache.user_id],
+            index_elements=[CuratorRankCache.user_id, CuratorRankCache.rank_version],
             set_={
-                "rank_version": rank_version,
                 "points_total": points_total,
                 "verified_captures_total": verified_total,
                 "verified_captures_counted": counted_total,
@@ -293,7 +365,8 @@ async def refresh_rank_for_user_day(
         )
     )
     await db.execute(cache_update)
-    cache = await db.get(CuratorRankCache, user_id)
+    await notify_rank_changed(db=db, rank_version=rank_version, user_ids=[user_id])
+    cache = await db.get(CuratorRankCache, (user_id, rank_version))
     if cache is None:
         raise RuntimeError("Failed to update curator rank cache.")
     return cache
@@ -319,3 +392,432 @@ async def get_capture_verified_event_day(
     if created_at is None:
         return None
     return _utc_date(created_at)
+
+
+async def get_capture_verified_event_keys(
+    *,
+    db: AsyncSession,
+    capture_ids: Iterable[uuid.UUID],
+    rank_version: str = DEFAULT_RANK_VERSION,
+) -> dict[uuid.UUID, RankRefreshKey]:
+    """Batch form of `get_capture_verified_event_day`: capture_id -> (user, version, day)."""
+    ids = set(capture_ids)
+    if not ids:
+        return {}
+    rows = await db.execute(
+        select(
+            CuratorRankEvent.capture_id,
+            CuratorRankEvent.user_id,
+            func.min(CuratorRankEvent.created_at).label("created_at"),
+        )
+        .where(
+            CuratorRankEvent.capture_id.in_(ids),
+            CuratorRankEvent.rank_version == rank_version,
+            CuratorRankEvent.event_type == CAPTURE_VERIFIED_EVENT_TYPE,
+        )
+        .group_by(CuratorRankEvent.capture_id, CuratorRankEvent.user_id)
+    )
+    return {
+        row.capture_id: (row.user_id, rank_version, _utc_date(row.created_at))
+        for row in rows
+    }
+
+
+async def refresh_rank_for_user_days(
+    *,
+    db: AsyncSession,
+    keys: set[RankRefreshKey],
+) -> int:
+    """Recompute many (user, rank_version, day) rows with a fixed number of statements.
+
+    Daily rows are recomputed from `rank_events` in one grouped query and upserted in one
+    statement; caches for the affected users are then re-summed from their daily rows.
+    Users with no cache row for that rank_version fall back to a full
+    `materialize_rank_for_user`, mirroring `refresh_rank_for_user_day`.
+    """
+    if not keys:
+        return 0
+
+    pairs = {(user_id, rank_version) for user_id, rank_version, _ in keys}
+    await _lock_rank_rows(db, pairs)
+    cached_pairs = {
+        (row.user_id, row.rank_version)
+        for row in (
+            await db.execute(
+                select(CuratorRankCache.user_id, CuratorRankCache.rank_version).where(
+                    tuple_(CuratorRankCache.user_id, CuratorRankCache.rank_version).in_(
+                        sorted(pairs)
+                    )
+                )
+            )
+        ).all()
+    }
+    full_rebuilds = pairs - cached_pairs
+    for user_id, rank_version in sorted(full_rebuilds):
+        await materialize_rank_for_user(db=db, user_id=user_id, rank_version=rank_version)
+
+    incremental_keys = sorted(key for key in keys if (key[0], key[1]) not in full_rebuilds)
+    if not incremental_keys:
+        return len(keys)
+    incremental_pairs = {(user_id, rank_version) for user_id, rank_version, _ in incremental_keys}
+    incremental_users = {user_id for user_id, _ in incremental_pairs}
+
+    day_expr = _event_utc_day_expr()
+    source_key_expr = _event_source_key_expr()
+    rows = (
+        await db.execute(
+            select(
+                CuratorRankEvent.user_id,
+                CuratorRankEvent.rank_version,
+                day_expr.label("day"),
+                func.count().label("total"),
+                func.count(func.distinct(source_key_expr)).label("unique_sources"),
+            )
+            .select_from(CuratorRankEvent)
+            .join(Capture, CuratorRankEvent.capture_id == Capture.id)
+            .where(
+                CuratorRankEvent.user_id.in_(incremental_users),
+                CuratorRankEvent.event_type == CAPTURE_VERIFIED_EVENT_TYPE,
+                Capture.state == CaptureState.verified.value,
+                tuple_(CuratorRankEvent.user_id, CuratorRankEvent.rank_version, day_expr).in_(
+                    incremental_keys
+                ),
+            )
+            .group_by(CuratorRankEvent.user_id, CuratorRankEvent.rank_version, day_expr)
+        )
+    ).all()
+
+    now = utcnow()
+    daily_values: list[dict[str, object]] = []
+    for row in rows:
+        daily_values.append(
+            {
+                "user_id": row.user_id,
+                "rank_version": row.rank_version,
+                "day": row.day,
+                **_daily_stats(int(row.total or 0), int(row.unique_sources or 0)),
+                "updated_at": now,
+            }
+        )
+    if daily_values:
+        daily_stmt = insert(CuratorRankDaily).values(daily_values)
+        daily_stmt = daily_stmt.on_conflict_do_update(
+            constraint="uq_curator_rank_daily_user_version_day",
+            set_={
+                **{column: daily_stmt.excluded[column] for column in _DAILY_STAT_COLUMNS},
+                "updated_at": daily_stmt.excluded.updated_at,
+            },
+        )
+        await db.execute(daily_stmt)
+
+    present = {(row.user_id, row.rank_version, row.day) for row in rows}
+    emptied = [key for key in incremental_keys if key not in present]
+    if emptied:
+        await db.execute(
+            delete(CuratorRankDaily).where(
+                tuple_(
+                    CuratorRankDaily.user_id,
+                    CuratorRankDaily.rank_version,
+                    CuratorRankDaily.day,
+                ).in_(emptied)
+            )
+        )
+
+    sums = (
+        await db.execute(
+            select(
+                CuratorRankDaily.user_id,
+                CuratorRankDaily.rank_version,
+                func.coalesce(func.sum(CuratorRankDaily.points_counted), 0).label("points"),
+                func.coalesce(func.sum(CuratorRankDaily.verified_captures_total), 0).label("total"),
+                func.coalesce(func.sum(CuratorRankDaily.per_node_per_day_removed), 0).label(
+                    "node_removed"
+                ),
+                func.coalesce(func.sum(CuratorRankDaily.per_day_removed), 0).label("day_removed"),
+            )
+            .where(
+                tuple_(CuratorRankDaily.user_id, CuratorRankDaily.rank_version).in_(
+                    sorted(incremental_pairs)
+                )
+            )
+            .group_by(CuratorRankDaily.user_id, CuratorRankDaily.rank_version)
+        )
+    ).all()
+    totals_by_pair = {(row.user_id, row.rank_version): row for row in sums}
+    cache_values: list[dict[str, object]] = []
+    for user_id, rank_version in sorted(incremental_pairs):
+        row = totals_by_pair.get((user_id, rank_version))
+        points = int(row.points) if row else 0
+        cache_values.append(
+            {
+                "user_id": user_id,
+                "rank_version": rank_version,
+                "points_total": points,
+                "verified_captures_total": int(row.total) if row else 0,
+                "verified_captures_counted": points,
+                "per_node_per_day_removed": int(row.node_removed) if row else 0,
+                "per_day_removed": int(row.day_removed) if row else 0,
+                "updated_at": now,
+            }
+        )
+    cache_stmt = insert(CuratorRankCache).values(cache_values)
+    cache_stmt = cache_stmt.on_conflict_do_update(
+        index_elements=[CuratorRankCache.user_id, CuratorRankCache.rank_version],
+        set_={
+            **{column: cache_stmt.excluded[column] for column in _CACHE_STAT_COLUMNS},
+            "updated_at": cache_stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(cache_stmt)
+    for rank_version in sorted({rank_version for _, rank_version in incremental_pairs}):
+        await notify_rank_changed(
+            db=db,
+            rank_version=rank_version,
+            user_ids=[user_id for user_id, version in incremental_pairs if version == rank_version],
+        )
+    return len(keys)
+
+
+@dataclass(frozen=True)
+class RankRangeResult:
+    users: int
+    daily_rows: int
+    daily_added: int = 0
+    daily_removed: int = 0
+    daily_changed: int = 0
+    users_changed: int = 0
+
+
+def _user_range_clauses(column, start: uuid.UUID | None, end: uuid.UUID | None) -> list:
+    clauses = []
+    if start is not None:
+        clauses.append(column >= start)
+    if end is not None:
+        clauses.append(column < end)
+    return clauses
+
+
+def _fresh_daily_subquery(
+    *,
+    rank_version: str,
+    user_id_start: uuid.UUID | None,
+    user_id_end: uuid.UUID | None,
+):
+    day_expr = _event_utc_day_expr()
+    source_key_expr = _event_source_key_expr()
+    return (
+        select(
+            CuratorRankEvent.user_id.label("user_id"),
+            day_expr.label("day"),
+            func.count().label("total"),
+            func.count(func.distinct(source_key_expr)).label("unique_sources"),
+        )
+        .select_from(CuratorRankEvent)
+        .join(Capture, CuratorRankEvent.capture_id == Capture.id)
+        .where(
+            CuratorRankEvent.rank_version == rank_version,
+            CuratorRankEvent.event_type == CAPTURE_VERIFIED_EVENT_TYPE,
+            Capture.state == CaptureState.verified.value,
+            *_user_range_clauses(CuratorRankEvent.user_id, user_id_start, user_id_end),
+        )
+        .group_by(CuratorRankEvent.user_id, day_expr)
+        .subquery("fresh")
+    )
+
+
+async def rematerialize_rank_range(
+    *,
+    db: AsyncSession,
+    rank_version: str = DEFAULT_RANK_VERSION,
+    user_id_start: uuid.UUID | None = None,
+    user_id_end: uuid.UUID | None = None,
+    dry_run: bool = False,
+) -> RankRangeResult:
+    """Rebuild daily rows and caches for every user in [start, end) with set-based SQL.
+
+    One GROUP BY over `rank_events` feeds an INSERT ... SELECT into `curator_rank_daily`,
+    and caches are re-summed from those rows in a single upsert. With `dry_run`, nothing
+    is written and the result describes how the stored rows differ from a rebuild.
+    A rebuild takes the per-user rank locks for the whole range first, so single-user
+    refreshes wait for it instead of racing the DELETE and INSERT. The caller owns the
+    transaction.
+    """
+    fresh = _fresh_daily_subquery(
+        rank_version=rank_version,
+        user_id_start=user_id_start,
+        user_id_end=user_id_end,
+    )
+    points = func.least(fresh.c.unique_sources, PER_DAY_POINTS_CAP)
+    if dry_run:
+        return await _diff_rank_range(
+            db=db,
+            fresh=fresh,
+            points=points,
+            rank_version=rank_version,
+            user_id_start=user_id_start,
+            user_id_end=user_id_end,
+        )
+
+    user_ids = await db.scalars(
+        select(User.id).where(*_user_range_clauses(User.id, user_id_start, user_id_end))
+    )
+    await _lock_rank_rows(db, [(user_id, rank_version) for user_id in user_ids])
+    await db.execute(
+        delete(CuratorRankDaily).where(
+            CuratorRankDaily.rank_version == rank_version,
+            *_user_range_clauses(CuratorRankDaily.user_id, user_id_start, user_id_end),
+        )
+    )
+    now = utcnow()
+    daily_result = await db.execute(
+        insert(CuratorRankDaily).from_select(
+            [
+                "user_id",
+                "rank_version",
+                "day",
+                *_DAILY_STAT_COLUMNS,
+                "updated_at",
+            ],
+            select(
+                fresh.c.user_id,
+                literal(rank_version),
+                fresh.c.day,
+                fresh.c.total,
+                fresh.c.unique_sources,
+                points,
+                func.greatest(fresh.c.total - fresh.c.unique_sources, 0),
+                func.greatest(fresh.c.unique_sources - points, 0),
+                literal(now, DateTime(timezone=True)),
+            ),
+        )
+    )
+
+    def _sum(column):
+        return cast(func.coalesce(func.sum(column), 0), Integer)
+
+    totals = (
+        select(
+            User.id,
+            literal(rank_version),
+            _sum(CuratorRankDaily.points_counted),
+            _sum(CuratorRankDaily.verified_captures_total),
+            _sum(CuratorRankDaily.points_counted),
+            _sum(CuratorRankDaily.per_node_per_day_removed),
+            _sum(CuratorRankDaily.per_day_removed),
+            literal(now, DateTime(timezone=True)),
+        )
+        .select_from(User)
+        .outerjoin(
+            CuratorRankDaily,
+            and_(
+                CuratorRankDaily.user_id == User.id,
+                CuratorRankDaily.rank_version == rank_version,
+            ),
+        )
+        .where(*_user_range_clauses(User.id, user_id_start, user_id_end))
+        .group_by(User.id)
+    )
+    cache_stmt = insert(CuratorRankCache).from_select(
+        ["user_id", "rank_version", *_CACHE_STAT_COLUMNS, "updated_at"],
+        totals,
+    )
+    cache_stmt = cache_stmt.on_conflict_do_update(
+        index_elements=[CuratorRankCache.user_id, CuratorRankCache.rank_version],
+        set_={
+            **{column: cache_stmt.excluded[column] for column in _CACHE_STAT_COLUMNS},
+            "updated_at": cache_stmt.excluded.updated_at,
+        },
+    )
+    cache_result = await db.execute(cache_stmt)
+    await notify_rank_changed(db=db, rank_version=rank_version)
+    return RankRangeResult(
+        users=max(cache_result.rowcount or 0, 0),
+        daily_rows=max(daily_result.rowcount or 0, 0),
+    )
+
+
+async def _diff_rank_range(
+    *,
+    db: AsyncSession,
+    fresh,
+    points,
+    rank_version: str,
+    user_id_start: uuid.UUID | None,
+    user_id_end: uuid.UUID | None,
+) -> RankRangeResult:
+    existing = (
+        select(
+            CuratorRankDaily.user_id,
+            CuratorRankDaily.day,
+            CuratorRankDaily.verified_captures_total,
+            CuratorRankDaily.verified_captures_unique,
+            CuratorRankDaily.points_counted,
+        )
+        .where(
+            CuratorRankDaily.rank_version == rank_version,
+            *_user_range_clauses(CuratorRankDaily.user_id, user_id_start, user_id_end),
+        )
+        .subquery("existing")
+    )
+    joined = fresh.join(
+        existing,
+        and_(fresh.c.user_id == existing.c.user_id, fresh.c.day == existing.c.day),
+        full=True,
+    )
+    daily = (
+        await db.execute(
+            select(
+                func.count(fresh.c.user_id).label("daily_rows"),
+                func.count().filter(existing.c.user_id.is_(None)).label("added"),
+                func.count().filter(fresh.c.user_id.is_(None)).label("removed"),
+                func.count()
+                .filter(
+                    fresh.c.user_id.is_not(None),
+                    existing.c.user_id.is_not(None),
+                    or_(
+                        fresh.c.total != existing.c.verified_captures_total,
+                        fresh.c.unique_sources != existing.c.verified_captures_unique,
+                        points != existing.c.points_counted,
+                    ),
+                )
+                .label("changed"),
+            ).select_from(joined)
+        )
+    ).one()
+
+    fresh_points = (
+        select(fresh.c.user_id, func.sum(points).label("points"))
+        .group_by(fresh.c.user_id)
+        .subquery("fresh_points")
+    )
+    users = (
+        await db.execute(
+            select(
+                func.count().label("users"),
+                func.count()
+                .filter(
+                    func.coalesce(fresh_points.c.points, 0)
+                    != func.coalesce(CuratorRankCache.points_total, -1)
+                )
+                .label("changed"),
+            )
+            .select_from(User)
+            .outerjoin(fresh_points, fresh_points.c.user_id == User.id)
+            .outerjoin(
+                CuratorRankCache,
+                and_(
+                    CuratorRankCache.user_id == User.id,
+                    CuratorRankCache.rank_version == rank_version,
+                ),
+            )
+            .where(*_user_range_clauses(User.id, user_id_start, user_id_end))
+        )
+    ).one()
+    return RankRangeResult(
+        users=int(users.users or 0),
+        daily_rows=int(daily.daily_rows or 0),
+        daily_added=int(daily.added or 0),
+        daily_removed=int(daily.removed or 0),
+        daily_changed=int(daily.changed or 0),
+        users_changed=int(users.changed or 0),
+    )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import datetime as dt
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import RankRefreshOutbox, utcnow
+from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
+from groundedart_api.domain.rank_materialization import (
+    RankRefreshKey,
+    refresh_rank_for_user_days,
+)
+from groundedart_api.observability import metrics
+from groundedart_api.observability.ops import observe_operation
+
+
+@dataclass(frozen=True)
+class RankOutboxBatchResult:
+    claimed: int
+    refreshed_days: int
+    users: int
+    duration_seconds: float
+
+
+async def enqueue_rank_refresh(
+    *,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    days: Iterable[dt.date],
+    rank_version: str = DEFAULT_RANK_VERSION,
+) -> None:
+    """Record that rank rows for (user, day) are stale; written in the caller's transaction."""
+    await enqueue_rank_refresh_keys(
+        db=db,
+        keys={(user_id, rank_version, day) for day in days},
+    )
+
+
+async def enqueue_rank_refresh_keys(*, db: AsyncSession, keys: set[RankRefreshKey]) -> None:
+    if not keys:
+        return
+    now = utcnow()
+    await db.execute(
+        insert(RankRefreshOutbox).values(
+            [
+                {
+                    "user_id": user_id,
+                    "rank_version": rank_version,
+                    "day": day,
+                    "created_at": now,
+                }
+                for user_id, rank_version, day in sorted(keys)
+            ]
+        )
+    )
+
+
+async def claim_rank_refresh_batch(*, db: AsyncSession, limit: int) -> list[RankRefreshKey]:
+    """Delete and return up to `limit` outbox rows; SKIP LOCKED lets workers run in parallel."""
+    claimable = (
+        select(RankRefreshOutbox.id)
+        .order_by(RankRefreshOutbox.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = (
+        await db.execute(
+            delete(RankRefreshOutbox)
+            .where(RankRefreshOutbox.id.in_(claimable))
+            .returning(
+                RankRefreshOutbox.user_id,
+                RankRefreshOutbox.rank_version,
+                RankRefreshOutbox.day,
+            )
+        )
+    ).all()
+    return [(row.user_id, row.rank_version, row.day) for row in rows]
+
+
+async def process_rank_refresh_batch(
+    *,
+    db: AsyncSession,
+    batch_size: int,
+) -> RankOutboxBatchResult:
+    start = time.perf_counter()
+    async with observe_operation("rank_outbox_batch", attributes={"batch.size": batch_size}):
+        claimed = await claim_rank_refresh_batch(db=db, limit=batch_size)
+        keys = set(claimed)
+        await refresh_rank_for_user_days(db=db, keys=keys)
+        await db.commit()
+
+    metrics.rank_outbox_entries_total.labels(stage="claimed").inc(len(claimed))
+    metrics.rank_outbox_entries_total.labels(stage="refreshed_day").inc(len(keys))
+    return RankOutboxBatchResult(
+        claimed=len(claimed),
+        refreshed_days=len(keys),
+        users=len({user_id for user_id, _, _ in keys}),
+        duration_seconds=time.perf_counter() - start,
+    )
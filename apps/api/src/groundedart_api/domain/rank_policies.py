@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from groundedart_api.domain.rank_constants import PER_DAY_POINTS_CAP
+from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
+
+
+@dataclass(frozen=True)
+class RankPolicy:
+    """Scoring rules for one rank_version, applied per user per UTC day.
+
+    Each source (node, else capture) counts at most `per_node_per_day_cap` times a day,
+    and the day's points are capped at `per_day_points_cap`.
+    """
+
+    version: str
+    per_day_points_cap: int = PER_DAY_POINTS_CAP
+    per_node_per_day_cap: int = 1
+    description: str = ""
+
+    def score_day(self, source_counts: Iterable[int]) -> dict[str, int]:
+        """Daily stats (curator_rank_daily columns) from per-source event counts."""
+        counts = list(source_counts)
+        total = sum(counts)
+        eligible = sum(min(count, self.per_node_per_day_cap) for count in counts)
+        points = min(eligible, self.per_day_points_cap)
+        return {
+            "verified_captures_total": total,
+            "verified_captures_unique": len(counts),
+            "points_counted": points,
+            "per_node_per_day_removed": total - eligible,
+            "per_day_removed": eligible - points,
+        }
+
+
+_RANK_POLICIES: dict[str, RankPolicy] = {}
+
+
+def register_rank_policy(policy: RankPolicy) -> RankPolicy:
+    existing = _RANK_POLICIES.get(policy.version)
+    if existing is not None and existing != policy:
+        raise ValueError(f"Rank policy {policy.version!r} is already registered with other rules.")
+    if policy.per_day_points_cap < 0 or policy.per_node_per_day_cap < 1:
+        raise ValueError(f"Rank policy {policy.version!r} has invalid caps.")
+    _RANK_POLICIES[policy.version] = policy
+    return policy
+
+
+def get_rank_policy(version: str) -> RankPolicy:
+    try:
+        return _RANK_POLICIES[version]
+    except KeyError:
+        raise KeyError(f"Unknown rank policy {version!r}.") from None
+
+
+def registered_rank_policies() -> list[RankPolicy]:
+    return list(_RANK_POLICIES.values())
+
+
+register_rank_policy(
+    RankPolicy(
+        version=DEFAULT_RANK_VERSION,
+        description="1 point per distinct node per UTC day, at most 3 points per day.",
+    )
+)
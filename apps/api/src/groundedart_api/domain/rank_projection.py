@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from groundedart_api.db.models import CuratorRankCache
 from groundedart_api.domain.gating import RANK_TIERS
+from groundedart_api.domain.rank_cache import RankCacheEntry, get_rank_cache
 from groundedart_api.domain.rank_events import DEFAULT_RANK_VERSION
 from groundedart_api.domain.rank_materialization import compute_rank_totals_from_events
 
@@ -59,34 +60,57 @@ def _next_unlock_for_rank(rank: int) -> NextUnlock | None:
     return None
 
 
-async def compute_rank_projection(
+async def _load_rank_entry(
     *,
     db: AsyncSession,
     user_id: uuid.UUID,
-    rank_version: str = DEFAULT_RANK_VERSION,
-) -> RankProjection:
-    cache = await db.get(CuratorRankCache, user_id)
-    if cache is not None and cache.rank_version == rank_version:
-        breakdown = RankBreakdown(
+    rank_version: str,
+) -> RankCacheEntry:
+    rank_cache = get_rank_cache()
+    key = (user_id, rank_version)
+    entry = rank_cache.get(key)
+    if entry is not None:
+        return entry
+
+    generation = rank_cache.generation
+    cache = await db.get(CuratorRankCache, (user_id, rank_version))
+    if cache is not None:
+        entry = RankCacheEntry(
             points_total=cache.points_total,
             verified_captures_total=cache.verified_captures_total,
             verified_captures_counted=cache.verified_captures_counted,
-            caps_applied=RankBreakdownCaps(
-                per_node_per_day=cache.per_node_per_day_removed,
-                per_day_total=cache.per_day_removed,
-            ),
+            per_node_per_day_removed=cache.per_node_per_day_removed,
+            per_day_removed=cache.per_day_removed,
         )
     else:
         totals = await compute_rank_totals_from_events(db=db, user_id=user_id, rank_version=rank_version)
-        breakdown = RankBreakdown(
+        entry = RankCacheEntry(
             points_total=totals["points_total"],
             verified_captures_total=totals["verified_captures_total"],
             verified_captures_counted=totals["verified_captures_counted"],
-            caps_applied=RankBreakdownCaps(
-                per_node_per_day=totals["per_node_per_day_removed"],
-                per_day_total=totals["per_day_removed"],
-            ),
+            per_node_per_day_removed=totals["per_node_per_day_removed"],
+            per_day_removed=totals["per_day_removed"],
         )
+    rank_cache.put(key, entry, generation=generation)
+    return entry
+
+
+async def compute_rank_projection(
+    *,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    rank_version: str = DEFAULT_RANK_VERSION,
+) -> RankProjection:
+    entry = await _load_rank_entry(db=db, user_id=user_id, rank_version=rank_version)
+    breakdown = RankBreakdown(
+        points_total=entry.points_total,
+        verified_captures_total=entry.verified_captures_total,
+        verified_captures_counted=entry.verified_captures_counted,
+        caps_applied=RankBreakdownCaps(
+            per_node_per_day=entry.per_node_per_day_removed,
+            per_day_total=entry.per_day_removed,
+        ),
+    )
     return RankProjection(
         rank=breakdown.points_total,
         rank_version=rank_version,
@@ -101,8 +125,5 @@ async def get_rank_for_user(
     user_id: uuid.UUID,
     rank_version: str = DEFAULT_RANK_VERSION,
 ) -> int:
-    cache = await db.get(CuratorRankCache, user_id)
-    if cache is not None and cache.rank_version == rank_version:
-        return cache.points_total
-    totals = await compute_rank_totals_from_events(db=db, user_id=user_id, rank_version=rank_version)
-    return totals["points_total"]
+    entry = await _load_rank_entry(db=db, user_id=user_id, rank_version=rank_version)
+    return entry.points_total
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from groundedart_api.db.models import (
+    Capture,
+    CuratorRankCache,
+    CuratorRankDaily,
+    CuratorRankEvent,
+    utcnow,
+)
+from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.rank_cache import notify_rank_changed
+from groundedart_api.domain.rank_events import CAPTURE_VERIFIED_EVENT_TYPE, DEFAULT_RANK_VERSION
+from groundedart_api.domain.rank_materialization import (
+    _event_source_key_expr,
+    _event_utc_day_expr,
+)
+from groundedart_api.domain.rank_policies import RankPolicy, get_rank_policy
+from groundedart_api.observability.ops import observe_operation
+
+
+@dataclass(frozen=True)
+class RankMover:
+    user_id: uuid.UUID
+    baseline_points: int
+    candidate_points: int
+
+
+@dataclass(frozen=True)
+class PolicyDivergence:
+    version: str
+    users_scored: int
+    users_changed: int
+    users_gained: int
+    users_lost: int
+    points_total: int
+    points_delta: int
+    top_movers: list[RankMover]
+
+
+@dataclass(frozen=True)
+class ShadowRankReport:
+    source_version: str
+    baseline_version: str
+    source_rows: int
+    users_scanned: int
+    daily_rows_written: int
+    policies: list[PolicyDivergence]
+
+
+@dataclass
+class _PolicyTally:
+    users_scored: int = 0
+    users_changed: int = 0
+    users_gained: int = 0
+    users_lost: int = 0
+    points_total: int = 0
+    points_delta: int = 0
+    movers: list[tuple[int, str, RankMover]] = field(default_factory=list)
+
+
+class _RowBuffer:
+    def __init__(self, db: AsyncSession, model: type, *, flush_rows: int) -> None:
+        self._db = db
+        self._model = model
+        self._flush_rows = flush_rows
+        self._rows: list[dict[str, object]] = []
+        self.written = 0
+
+    async def add(self, row: dict[str, object]) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self._flush_rows:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._rows:
+            return
+        await self._db.execute(insert(self._model).values(self._rows))
+        self.written += len(self._rows)
+        self._rows = []
+
+
+async def run_shadow_rank_pass(
+    *,
+    db: AsyncSession,
+    policies: Sequence[RankPolicy],
+    source_version: str = DEFAULT_RANK_VERSION,
+    write: bool = True,
+    flush_rows: int = 1000,
+    top_movers: int = 10,
+) -> ShadowRankReport:
+    """Score every candidate policy in one ordered scan of `rank_events`.
+
+    Events of `source_version` are streamed once, grouped to per-(user, day, source)
+    counts, and each policy scores every day as it goes by. With `write`, each
+    candidate version's `curator_rank_daily` and `curator_rank_cache` rows are rebuilt
+    in the caller's transaction. Divergence is measured against the policy registered
+    for `source_version`, scored in the same pass. Users without events get no rows.
+    """
+    baseline = get_rank_policy(source_version)
+    candidates = [policy for policy in policies if policy.version != source_version]
+    versions = [policy.version for policy in candidates]
+    if not candidates:
+        raise ValueError("At least one candidate policy other than the source version is required.")
+    if len(set(versions)) != len(versions):
+        raise ValueError("Candidate policy versions must be unique.")
+
+    async with observe_operation(
+        "rank_shadow_pass",
+        attributes={"rank.source_version": source_version, "rank.policies": len(candidates)},
+    ):
+        if write:
+            await db.execute(
+                delete(CuratorRankDaily).where(CuratorRankDaily.rank_version.in_(versions))
+            )
+            await db.execute(
+                delete(CuratorRankCache).where(CuratorRankCache.rank_version.in_(versions))
+            )
+
+        day_expr = _event_utc_day_expr()
+        source_key_expr = _event_source_key_expr()
+        query = (
+            select(
+                CuratorRankEvent.user_id,
+                day_expr.label("day"),
+                func.count().label("events"),
+            )
+            .select_from(CuratorRankEvent)
+            .join(Capture, CuratorRankEvent.capture_id == Capture.id)
+            .where(
+                CuratorRankEvent.rank_version == source_version,
+                CuratorRankEvent.event_type == CAPTURE_VERIFIED_EVENT_TYPE,
+                Capture.state == CaptureState.verified.value,
+            )
+            .group_by(CuratorRankEvent.user_id, day_expr, source_key_expr)
+            .order_by(CuratorRankEvent.user_id, day_expr)
+            .execution_options(yield_per=flush_rows)
+        )
+
+        now = utcnow()
+        daily_buffer = _RowBuffer(db, CuratorRankDaily, flush_rows=flush_rows)
+        cache_buffer = _RowBuffer(db, CuratorRankCache, flush_rows=flush_rows)
+        tallies = {policy.version: _PolicyTally() for policy in candidates}
+        source_rows = 0
+        users_scanned = 0
+
+        current_user: uuid.UUID | None = None
+        current_day: dt.date | None = None
+        day_counts: list[int] = []
+        baseline_points = 0
+        user_totals: dict[str, dict[str, int]] = {}
+
+        def _start_user() -> None:
+            nonlocal baseline_points, user_totals
+            baseline_points = 0
+            user_totals = {
+                policy.version: {
+                    "points_total": 0,
+                    "verified_captures_total": 0,
+                    "verified_captures_counted": 0,
+                    "per_node_per_day_removed": 0,
+                    "per_day_removed": 0,
+                }
+                for policy in candidates
+            }
+
+        async def _close_day() -> None:
+            nonlocal baseline_points
+            if current_user is None or not day_counts:
+                return
+            baseline_points += baseline.score_day(day_counts)["points_counted"]
+            for policy in candidates:
+                stats = policy.score_day(day_counts)
+                totals = user_totals[policy.version]
+                totals["points_total"] += stats["points_counted"]
+                totals["verified_captures_total"] += stats["verified_captures_total"]
+                totals["verified_captures_counted"] += stats["points_counted"]
+                totals["per_node_per_day_removed"] += stats["per_node_per_day_removed"]
+                totals["per_day_removed"] += stats["per_day_removed"]
+                if write:
+                    await daily_buffer.add(
+                        {
+                            "user_id": current_user,
+                            "rank_version": policy.version,
+                            "day": current_day,
+                            **stats,
+                            "updated_at": now,
+                        }
+                    )
+
+        async def _close_user() -> None:
+            if current_user is None:
+                return
+            for policy in candidates:
+                totals = user_totals[policy.version]
+                tally = tallies[policy.version]
+                candidate_points = totals["points_total"]
+                delta = candidate_points - baseline_points
+                tally.users_scored += 1
+                tally.points_total += candidate_points
+                tally.points_delta += delta
+                if delta:
+                    tally.users_changed += 1
+                    if delta > 0:
+                        tally.users_gained += 1
+                    else:
+                        tally.users_lost += 1
+                    mover = RankMover(current_user, baseline_points, candidate_points)
+                    entry = (abs(delta), str(current_user), mover)
+                    if len(tally.movers) < top_movers:
+                        heapq.heappush(tally.movers, entry)
+                    elif top_movers > 0:
+                        heapq.heappushpop(tally.movers, entry)
+                if write:
+                    await cache_buffer.add(
+                        {
+                            "user_id": current_user,
+                            "rank_version": policy.version,
+                            **totals,
+                            "updated_at": now,
+                        }
+                    )
+
+        result = await db.stream(query)
+        async for row in result:
+            source_rows += 1
+            if row.user_id != current_user:
+                await _close_day()
+                await _close_user()
+                current_user, current_day, day_counts = row.user_id, row.day, []
+                users_scanned += 1
+                _start_user()
+            elif row.day != current_day:
+                await _close_day()
+                current_day, day_counts = row.day, []
+            day_counts.append(int(row.events))
+        await _close_day()
+        await _close_user()
+
+        if write:
+            await daily_buffer.flush()
+            await cache_buffer.flush()
+            for version in versions:
+                await notify_rank_changed(db=db, rank_version=version)
+
+    return ShadowRankReport(
+        source_version=source_version,
+        baseline_version=baseline.version,
+        source_rows=source_rows,
+        users_scanned=users_scanned,
+        daily_rows_written=daily_buffer.written,
+        policies=[
+            PolicyDivergence(
+                version=version,
+                users_scored=tally.users_scored,
+                users_changed=tally.users_changed,
+                users_gained=tally.users_gained,
+                users_lost=tally.users_lost,
+                points_total=tally.points_total,
+                points_delta=tally.points_delta,
+                top_movers=[mover for _, _, mover in sorted(tally.movers, reverse=True)],
+            )
+            for version, tally in tallies.items()
+        ],
+    )
@@ -61,9 +61,9 @@ class TipReceiptProvider(Protocol):
 def get_tip_receipt_provider(
     settings: Settings = Depends(get_settings),
 ) -> TipReceiptProvider:
-    from groundedart_api.domain.tip_receipts_solana import SolanaTipReceiptProvider
+    from groundedart_api.resources import get_app_resources
 
-    return SolanaTipReceiptProvider(str(settings.solana_rpc_url))
+    return get_app_resources(settings).tip_receipt_provider
 
 
 TipReceiptProviderDep = Annotated[
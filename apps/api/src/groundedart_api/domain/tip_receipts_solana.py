@@ -15,6 +15,7 @@ from groundedart_api.domain.tip_receipts import (
     TipReceiptVerificationFailure,
     TipReceiptVerificationSuccess,
 )
+from groundedart_api.resources import get_app_resources
 from groundedart_api.settings import Settings, get_settings
 
 _MEMO_PROGRAM_ID = "MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr"
@@ -38,8 +39,8 @@ async def fetch_solana_transaction(
             params,
         ],
     }
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(rpc_url, json=payload)
+    client = get_app_resources().solana_rpc_client
+    response = await client.post(rpc_url, json=payload)
     response.raise_for_status()
     return response.json()
 
@@ -221,4 +222,4 @@ class SolanaTipReceiptProvider:
 def get_solana_tip_receipt_provider(
     settings: Settings = Depends(get_settings),
 ) -> TipReceiptProvider:
-    return SolanaTipReceiptProvider(settings.solana_rpc_url)
+    return get_app_resources(settings).tip_receipt_provider
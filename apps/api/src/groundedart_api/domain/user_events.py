@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime as dt
+import json
+import logging
+import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from typing import Literal
+
+import asyncpg
+from sqlalchemy import String, bindparam, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from groundedart_api.db.models import Capture, CaptureEvent, UserNotification, utcnow
+from groundedart_api.db.session import asyncpg_dsn
+from groundedart_api.domain.cursors import cursor_timestamp, decode_cursor, encode_cursor
+from groundedart_api.observability import metrics
+from groundedart_api.settings import get_settings
+
+USER_EVENTS_CHANNEL = "user_events"
+# Postgres caps NOTIFY payloads at 8000 bytes; larger events go out without `data` and
+# subscribers reload them from the database.
+_MAX_NOTIFY_PAYLOAD_BYTES = 7500
+# Event ids remembered per stream so a replay overlapping live delivery is not sent twice.
+_RECENT_EVENT_IDS = 1024
+_RETRY_MILLISECONDS = 3000
+
+logger = logging.getLogger(__name__)
+
+UserEventKind = Literal["notification", "capture_state"]
+
+
+@dataclass(frozen=True)
+class UserEventCursor:
+    created_at: dt.datetime
+    event_id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class UserEvent:
+    user_id: uuid.UUID
+    kind: UserEventKind
+    event_id: uuid.UUID
+    created_at: dt.datetime
+    # None when the event was too large to travel in the NOTIFY payload.
+    data: dict[str, object] | None
+
+    @property
+    def cursor(self) -> UserEventCursor:
+        return UserEventCursor(created_at=self.created_at, event_id=self.event_id)
+
+
+def encode_user_event_cursor(cursor: UserEventCursor) -> str:
+    return encode_cursor({"t": cursor.created_at.isoformat(), "i": str(cursor.event_id)})
+
+
+def decode_user_event_cursor(value: str) -> UserEventCursor:
+    return decode_cursor(
+        value,
+        lambda data: UserEventCursor(
+            created_at=cursor_timestamp(data["t"]), event_id=uuid.UUID(str(data["i"]))
+        ),
+        message="Invalid Last-Event-ID",
+    )
+
+
+def notification_user_event(notification: UserNotification) -> UserEvent:
+    """Stream event for a notification; `id` and `created_at` must already be set."""
+    return UserEvent(
+        user_id=notification.user_id,
+        kind="notification",
+        event_id=notification.id,
+        created_at=notification.created_at,
+        data={
+            "id": str(notification.id),
+            "event_type": notification.event_type,
+            "title": notification.title,
+            "body": notification.body,
+            "details": notification.details,
+            "created_at": notification.created_at.isoformat(),
+        },
+    )
+
+
+def capture_state_user_event(*, user_id: uuid.UUID, event: CaptureEvent) -> UserEvent:
+    """Stream event for a `state_transition` capture event owned by `user_id`."""
+    return UserEvent(
+        user_id=user_id,
+        kind="capture_state",
+        event_id=event.id,
+        created_at=event.created_at,
+        data={
+            "id": str(event.id),
+            "capture_id": str(event.capture_id),
+            "from_state": event.from_state,
+            "to_state": event.to_state,
+            "reason_code": event.reason_code,
+            "created_at": event.created_at.isoformat(),
+        },
+    )
+
+
+def _notify_payload(event: UserEvent) -> str:
+    message: dict[str, object] = {
+        "u": str(event.user_id),
+        "k": event.kind,
+        "i": str(event.event_id),
+        "t": event.created_at.isoformat(),
+    }
+    if event.data is not None:
+        with_data = json.dumps({**message, "d": event.data}, separators=(",", ":"))
+        if len(with_data.encode("utf-8")) <= _MAX_NOTIFY_PAYLOAD_BYTES:
+            return with_data
+    return json.dumps(message, separators=(",", ":"))
+
+
+def parse_user_event_payload(payload: str) -> UserEvent | None:
+    try:
+        message = json.loads(payload)
+        data = message.get("d")
+        return UserEvent(
+            user_id=uuid.UUID(message["u"]),
+            kind=message["k"],
+            event_id=uuid.UUID(message["i"]),
+            created_at=dt.datetime.fromisoformat(message["t"]),
+            data=data if isinstance(data, dict) else None,
+        )
+    except (ValueError, KeyError, TypeError, AttributeError):
+        logger.warning("user_event_payload_invalid", extra={"payload": payload[:200]})
+        return None
+
+
+async def publish_user_events(*, db: AsyncSession, events: Iterable[UserEvent]) -> None:
+    """Queue `NOTIFY user_events` in the caller's transaction (delivered on commit).
+
+    Every worker's listener receives the payloads, including this one's, so local
+    subscribers are reached the same way as remote ones.
+    """
+    values = [_notify_payload(event) for event in events]
+    if not values:
+        return
+    payloads = func.unnest(bindparam("payloads", values, ARRAY(String))).table_valued("payload")
+    await db.execute(
+        select(func.pg_notify(literal(USER_EVENTS_CHANNEL), payloads.c.payload)).select_from(
+            payloads
+        )
+    )
+
+
+async def replay_user_events(
+    *,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    after: UserEventCursor,
+    limit: int,
+) -> list[UserEvent]:
+    """Events for `user_id` strictly after `after`, oldest first.
+
+    Capture events are limited to state transitions made by someone other than the
+    owner, matching what `transition_capture_state` publishes live.
+    """
+    notifications = (
+        await db.scalars(
+            select(UserNotification)
+            .where(
+                UserNotification.user_id == user_id,
+                tuple_(UserNotification.created_at, UserNotification.id)
+                > tuple_(literal(after.created_at), literal(after.event_id)),
+            )
+            .order_by(UserNotification.created_at.asc(), UserNotification.id.asc())
+            .limit(limit)
+        )
+    ).all()
+    capture_events = (
+        await db.scalars(
+            select(CaptureEvent)
+            .join(Capture, Capture.id == CaptureEvent.capture_id)
+            .where(
+                Capture.user_id == user_id,
+                CaptureEvent.event_type == "state_transition",
+                CaptureEvent.actor_type != "user",
+                tuple_(CaptureEvent.created_at, CaptureEvent.id)
+                > tuple_(literal(after.created_at), literal(after.event_id)),
+            )
+            .order_by(CaptureEvent.created_at.asc(), CaptureEvent.id.asc())
+            .limit(limit)
+        )
+    ).all()
+    events = [notification_user_event(notification) for notification in notifications]
+    events.extend(
+        capture_state_user_event(user_id=user_id, event=event) for event in capture_events
+    )
+    events.sort(key=lambda event: (event.created_at, event.event_id))
+    return events[:limit]
+
+
+@dataclass(eq=False)
+class UserEventSubscription:
+    user_id: uuid.UUID
+    queue: asyncio.Queue[UserEvent]
+    # Set when the queue filled up; the stream then catches up from the database.
+    overflowed: bool = False
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def put(self, event: UserEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+        self.wakeup.set()
+
+
+class UserEventBroker:
+    """Per-worker fan-out of `user_events` notifications to open streams.
+
+    While the LISTEN connection is down (`listening` is False) streams poll the
+    database instead, so nothing is missed across reconnects.
+    """
+
+    def __init__(self, *, queue_max: int) -> None:
+        self.queue_max = queue_max
+        self._subscriptions: dict[uuid.UUID, set[UserEventSubscription]] = {}
+        self._listening = False
+
+    @property
+    def listening(self) -> bool:
+        return self._listening
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def set_listening(self, listening: bool) -> None:
+        self._listening = listening
+        metrics.user_events_listener_connected.set(1 if listening else 0)
+        # Wake every stream so it notices the switch between push and polling.
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.wakeup.set()
+
+    def subscribe(self, user_id: uuid.UUID) -> UserEventSubscription:
+        subscription = UserEventSubscription(
+            user_id=user_id, queue=asyncio.Queue(maxsize=self.queue_max)
+        )
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: UserEventSubscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    def publish(self, event: UserEvent) -> None:
+        for subscription in self._subscriptions.get(event.user_id, ()):
+            subscription.put(event)
+
+    def handle_notification(self, payload: str) -> None:
+        event = parse_user_event_payload(payload)
+        if event is not None:
+            self.publish(event)
+
+
+class UserEventListener:
+    """Background task holding a dedicated LISTEN connection for `user_events`."""
+
+    def __init__(
+        self,
+        broker: UserEventBroker,
+        *,
+        database_url: str,
+        reconnect_seconds: float = 5.0,
+    ) -> None:
+        self._broker = broker
+        self._dsn = asyncpg_dsn(database_url)
+        self._reconnect_seconds = reconnect_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="user-event-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def _on_notification(self, _conn: object, _pid: int, _channel: str, payload: str) -> None:
+        self._broker.handle_notification(payload)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("user_event_listener_failed")
+            await asyncio.sleep(self._reconnect_seconds)
+
+    async def _listen_once(self) -> None:
+        conn = await asyncpg.connect(self._dsn)
+        lost = asyncio.Event()
+        conn.add_termination_listener(lambda _conn: lost.set())
+        try:
+            await conn.add_listener(USER_EVENTS_CHANNEL, self._on_notification)
+            self._broker.set_listening(True)
+            await lost.wait()
+            logger.warning("user_event_listener_disconnected")
+        finally:
+            self._broker.set_listening(False)
+            if not conn.is_closed():
+                conn.terminate()
+
+
+def format_sse_event(event: UserEvent) -> bytes:
+    data = json.dumps(event.data, separators=(",", ":"))
+    cursor = encode_user_event_cursor(event.cursor)
+    return f"id: {cursor}\nevent: {event.kind}\ndata: {data}\n\n".encode()
+
+
+async def stream_user_events(
+    *,
+    broker: UserEventBroker,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    user_id: uuid.UUID,
+    after: UserEventCursor | None,
+    heartbeat_seconds: float,
+    poll_seconds: float,
+    replay_limit: int,
+) -> AsyncIterator[bytes]:
+    """Server-Sent Events for `user_id`: a replay after `after`, then live events.
+
+    The subscription is taken before the replay query so nothing published in between
+    is lost; events seen in both are sent once. The database is only touched for the
+    replay, on queue overflow, for events too large for NOTIFY, and for polling while
+    the worker's LISTEN connection is down; no connection is held between those.
+    """
+    subscription = broker.subscribe(user_id)
+    metrics.user_event_streams.inc()
+    cursor = after or UserEventCursor(created_at=utcnow(), event_id=uuid.UUID(int=0))
+    recent: deque[uuid.UUID] = deque(maxlen=_RECENT_EVENT_IDS)
+    seen: set[uuid.UUID] = set()
+
+    def _accept(event: UserEvent) -> bool:
+        nonlocal cursor
+        if event.event_id in seen:
+            return False
+        if len(recent) == recent.maxlen:
+            seen.discard(recent[0])
+        recent.append(event.event_id)
+        seen.add(event.event_id)
+        if (event.created_at, event.event_id) > (cursor.created_at, cursor.event_id):
+            cursor = event.cursor
+        return True
+
+    async def _catch_up() -> list[bytes]:
+        frames: list[bytes] = []
+        async with sessionmaker() as db:
+            while True:
+                events = await replay_user_events(
+                    db=db, user_id=user_id, after=cursor, limit=replay_limit
+                )
+                for event in events:
+                    if _accept(event):
+                        frames.append(format_sse_event(event))
+                        metrics.user_events_sent_total.labels(
+                            kind=event.kind, source="replay"
+                        ).inc()
+                if len(events) < replay_limit:
+                    return frames
+
+    try:
+        yield f"retry: {_RETRY_MILLISECONDS}\n\n".encode()
+        if after is not None:
+            for frame in await _catch_up():
+                yield frame
+        last_sent = last_poll = time.monotonic()
+        while True:
+            needs_catch_up = False
+            while not subscription.queue.empty():
+                event = subscription.queue.get_nowait()
+                if event.data is None:
+                    needs_catch_up = True
+                    continue
+                if _accept(event):
+                    metrics.user_events_sent_total.labels(kind=event.kind, source="live").inc()
+                    last_sent = time.monotonic()
+                    yield format_sse_event(event)
+            if subscription.overflowed:
+                subscription.overflowed = False
+                needs_catch_up = True
+            now = time.monotonic()
+            if not broker.listening and now - last_poll >= poll_seconds:
+                needs_catch_up = True
+            if needs_catch_up:
+                last_poll = now
+                for frame in await _catch_up():
+                    last_sent = time.monotonic()
+                    yield frame
+                continue
+            if now - last_sent >= heartbeat_seconds:
+                last_sent = now
+                yield b": keep-alive\n\n"
+            timeout = heartbeat_seconds - (now - last_sent)
+            if not broker.listening:
+                timeout = min(timeout, poll_seconds - (now - last_poll))
+            subscription.wakeup.clear()
+            if subscription.queue.empty() and not subscription.overflowed:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(subscription.wakeup.wait(), timeout=max(timeout, 0))
+    finally:
+        broker.unsubscribe(subscription)
+        metrics.user_event_streams.dec()
+
+
+_user_event_broker: UserEventBroker | None = None
+
+
+def get_user_event_broker() -> UserEventBroker:
+    global _user_event_broker
+    if _user_event_broker is None:
+        _user_event_broker = UserEventBroker(queue_max=get_settings().user_events_queue_max)
+    return _user_event_broker
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
-import datetime as dt
 import logging
 import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Annotated, Protocol
 
 from fastapi import Depends
-import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from groundedart_api.db.session import DbSessionDep, create_sessionmaker
+from groundedart_api.domain.event_outbox import (
+    EventOutboxDispatcher,
+    OutboxEvent,
+    enqueue_outbox_events,
+)
+from groundedart_api.resources import get_app_resources
 from groundedart_api.settings import Settings, get_settings
 
 
+@dataclass(frozen=True)
+class CaptureStateChange:
+    capture_id: uuid.UUID
+    from_state: str
+    to_state: str
+    reason_code: str | None
+
+
 class VerificationEventEmitter(Protocol):
+    """Capture verification boundary events.
+
+    Called inside the transaction that makes the change, before it commits, so the
+    webhook outbox row is written atomically with it.
+    """
+
     async def capture_uploaded(
         self,
         capture_id: uuid.UUID,
@@ -29,6 +51,9 @@ class VerificationEventEmitter(Protocol):
     ) -> None:
         ...
 
+    async def capture_states_changed(self, changes: Sequence[CaptureStateChange]) -> None:
+        ...
+
 
 class NoopVerificationEventEmitter:
     async def capture_uploaded(
@@ -48,6 +73,9 @@ class NoopVerificationEventEmitter:
     ) -> None:
         return None
 
+    async def capture_states_changed(self, changes: Sequence[CaptureStateChange]) -> None:
+        return None
+
 
 class LoggingVerificationEventEmitter:
     def __init__(self) -> None:
@@ -87,15 +115,51 @@ class LoggingVerificationEventEmitter:
             },
         )
 
+    async def capture_states_changed(self, changes: Sequence[CaptureStateChange]) -> None:
+        for change in changes:
+            await self.capture_state_changed(
+                capture_id=change.capture_id,
+                from_state=change.from_state,
+                to_state=change.to_state,
+                reason_code=change.reason_code,
+            )
 
-class WebhookVerificationEventEmitter:
-    def __init__(self, settings: Settings) -> None:
-        if settings.verification_events_webhook_url is None:
-            raise ValueError("verification_events_webhook_url is required for webhook mode")
-        self._url = str(settings.verification_events_webhook_url)
-        self._token = settings.verification_events_webhook_token
-        self._timeout = float(settings.verification_events_webhook_timeout_seconds)
-        self._logger = logging.getLogger("groundedart_api.verification_events")
+
+def capture_uploaded_payload(
+    *,
+    capture_id: uuid.UUID,
+    node_id: uuid.UUID,
+    user_id: uuid.UUID,
+) -> dict[str, object]:
+    return {
+        "schema_version": 1,
+        "event_type": "capture_uploaded",
+        "capture_id": str(capture_id),
+        "node_id": str(node_id),
+        "user_id": str(user_id),
+    }
+
+
+def capture_state_changed_payload(change: CaptureStateChange) -> dict[str, object]:
+    return {
+        "schema_version": 1,
+        "event_type": "capture_state_changed",
+        "capture_id": str(change.capture_id),
+        "from_state": change.from_state,
+        "to_state": change.to_state,
+        "reason_code": change.reason_code,
+    }
+
+
+class OutboxVerificationEventEmitter:
+    """Webhook-mode emitter: stages events in `event_outbox` on the request's session.
+
+    Rows commit (or roll back) with the state change; the outbox dispatcher delivers them,
+    so request latency does not depend on the webhook.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
 
     async def capture_uploaded(
         self,
@@ -103,15 +167,16 @@ class WebhookVerificationEventEmitter:
         node_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> None:
-        await self._emit(
-            {
-                "schema_version": 1,
-                "event_type": "capture_uploaded",
-                "sent_at": dt.datetime.now(dt.UTC).isoformat(),
-                "capture_id": str(capture_id),
-                "node_id": str(node_id),
-                "user_id": str(user_id),
-            }
+        await enqueue_outbox_events(
+            db=self._db,
+            events=[
+                OutboxEvent(
+                    event_type="capture_uploaded",
+                    payload=capture_uploaded_payload(
+                        capture_id=capture_id, node_id=node_id, user_id=user_id
+                    ),
+                )
+            ],
         )
 
     async def capture_state_changed(
@@ -121,34 +186,47 @@ class WebhookVerificationEventEmitter:
         to_state: str,
         reason_code: str | None,
     ) -> None:
-        await self._emit(
-            {
-                "schema_version": 1,
-                "event_type": "capture_state_changed",
-                "sent_at": dt.datetime.now(dt.UTC).isoformat(),
-                "capture_id": str(capture_id),
-                "from_state": from_state,
-                "to_state": to_state,
-                "reason_code": reason_code,
-            }
+        await self.capture_states_changed(
+            [
+                CaptureStateChange(
+                    capture_id=capture_id,
+                    from_state=from_state,
+                    to_state=to_state,
+                    reason_code=reason_code,
+                )
+            ]
+        )
+
+    async def capture_states_changed(self, changes: Sequence[CaptureStateChange]) -> None:
+        await enqueue_outbox_events(
+            db=self._db,
+            events=[
+                OutboxEvent(
+                    event_type="capture_state_changed",
+                    payload=capture_state_changed_payload(change),
+                )
+                for change in changes
+            ],
         )
 
-    async def _emit(self, payload: dict[str, object]) -> None:
+
+class VerificationEventWebhook:
+    """Posts outbox payloads to the configured webhook; raises on any failure."""
+
+    def __init__(self, settings: Settings) -> None:
+        if settings.verification_events_webhook_url is None:
+            raise ValueError("verification_events_webhook_url is required for webhook mode")
+        self._settings = settings
+        self._url = str(settings.verification_events_webhook_url)
+        self._token = settings.verification_events_webhook_token
+
+    async def __call__(self, payload: dict[str, object]) -> None:
         headers: dict[str, str] = {"Content-Type": "application/json"}
         if self._token:
             headers["X-GroundedArt-Webhook-Token"] = self._token
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(self._url, json=payload, headers=headers)
-                response.raise_for_status()
-        except httpx.HTTPError:
-            self._logger.exception(
-                "verification_event_webhook_failed",
-                extra={
-                    "webhook_url": self._url,
-                    **payload,
-                },
-            )
+        client = get_app_resources(self._settings).webhook_client
+        response = await client.post(self._url, json=payload, headers=headers)
+        response.raise_for_status()
 
 
 _noop_emitter = NoopVerificationEventEmitter()
@@ -156,16 +234,43 @@ _log_emitter = LoggingVerificationEventEmitter()
 
 
 def get_verification_event_emitter(
+    db: DbSessionDep,
     settings: Settings = Depends(get_settings),
 ) -> VerificationEventEmitter:
     mode = settings.verification_events_mode
     if mode == "noop":
         return _noop_emitter
     if mode == "webhook":
-        return WebhookVerificationEventEmitter(settings)
+        return OutboxVerificationEventEmitter(db)
     return _log_emitter
 
 
 VerificationEventEmitterDep = Annotated[
     VerificationEventEmitter, Depends(get_verification_event_emitter)
 ]
+
+_dispatcher: EventOutboxDispatcher | None = None
+
+
+def get_verification_event_dispatcher() -> EventOutboxDispatcher:
+    """Process-wide dispatcher delivering `event_outbox` rows to the webhook."""
+    global _dispatcher
+    if _dispatcher is None:
+        settings = get_settings()
+        _dispatcher = EventOutboxDispatcher(
+            sessionmaker=create_sessionmaker(settings.database_url),
+            deliver=VerificationEventWebhook(settings),
+            batch_size=settings.verification_events_outbox_batch_size,
+            poll_seconds=settings.verification_events_outbox_poll_seconds,
+            lease_seconds=settings.verification_events_outbox_lease_seconds,
+            max_attempts=settings.verification_events_outbox_max_attempts,
+            backoff_base_seconds=settings.verification_events_outbox_backoff_base_seconds,
+            backoff_max_seconds=settings.verification_events_outbox_backoff_max_seconds,
+        )
+    return _dispatcher
+
+
+async def shutdown_verification_event_dispatcher() -> None:
+    """Stop the dispatcher, letting it finish the batch in flight."""
+    if _dispatcher is not None:
+        await _dispatcher.stop()
@@ -1,30 +1,83 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from groundedart_api.api.errors import install_error_handlers
 from groundedart_api.api.routers.admin import router as admin_router
 from groundedart_api.api.routers.captures import router as captures_router
 from groundedart_api.api.routers.health import router as health_router
+from groundedart_api.api.routers.leaderboard import router as leaderboard_router
 from groundedart_api.api.routers.me import router as me_router
 from groundedart_api.api.routers.nodes import router as nodes_router
 from groundedart_api.api.routers.sessions import router as sessions_router
 from groundedart_api.api.routers.tips import router as tips_router
+from groundedart_api.domain.abuse_events import get_abuse_event_writer
+from groundedart_api.domain.leaderboard import LeaderboardCache
+from groundedart_api.domain.media_variants import get_media_variant_pipeline
+from groundedart_api.domain.rank_cache import RankChangeListener, get_rank_cache
+from groundedart_api.domain.user_events import UserEventListener, get_user_event_broker
+from groundedart_api.domain.verification_events import (
+    get_verification_event_dispatcher,
+    shutdown_verification_event_dispatcher,
+)
 from groundedart_api.observability.logging import access_log, configure_logging
 from groundedart_api.observability.metrics import render_metrics
 from groundedart_api.observability.middleware import RequestContextMiddleware
 from groundedart_api.observability.tracing import configure_tracing
+from groundedart_api.resources import close_app_resources, get_app_resources
 from groundedart_api.settings import get_settings
+from groundedart_api.storage.serving import MediaFiles
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    resources = app.state.resources = get_app_resources(settings)
+    listener = None
+    if settings.rank_cache_enabled:
+        listener = RankChangeListener(get_rank_cache(), database_url=settings.database_url)
+        listener.start()
+    abuse_writer = get_abuse_event_writer() if settings.abuse_events_buffered else None
+    if abuse_writer is not None:
+        abuse_writer.start()
+    user_event_listener = None
+    if settings.user_events_listener_enabled:
+        user_event_listener = UserEventListener(
+            get_user_event_broker(), database_url=settings.database_url
+        )
+        user_event_listener.start()
+    variant_pipeline = get_media_variant_pipeline() if settings.media_variants_enabled else None
+    if variant_pipeline is not None:
+        variant_pipeline.start()
+    event_dispatcher_enabled = settings.verification_events_mode == "webhook"
+    if event_dispatcher_enabled:
+        get_verification_event_dispatcher().start()
+    try:
+        yield
+    finally:
+        if event_dispatcher_enabled:
+            await shutdown_verification_event_dispatcher()
+        if variant_pipeline is not None:
+            await variant_pipeline.stop()
+        if abuse_writer is not None:
+            await abuse_writer.stop()
+        if user_event_listener is not None:
+            await user_event_listener.stop()
+        if listener is not None:
+            await listener.stop()
+        await close_app_resources(resources)
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging()
-    app = FastAPI(title="Grounded Art API", version="0.1.0")
+    app = FastAPI(title="Grounded Art API", version="0.1.0", lifespan=lifespan)
+    app.state.leaderboard_cache = LeaderboardCache()
 
     app.add_middleware(RequestContextMiddleware, access_log=access_log)
 
@@ -36,6 +89,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Resumable uploads report progress in headers.
+        expose_headers=["Location", "Upload-Offset", "Upload-Length", "Upload-Expires"],
     )
 
     app.include_router(health_router)
@@ -44,13 +99,19 @@ def create_app() -> FastAPI:
     app.include_router(nodes_router)
     app.include_router(captures_router)
     app.include_router(tips_router)
+    app.include_router(leaderboard_router)
     app.include_router(admin_router)
 
     app.add_api_route("/metrics", render_metrics, methods=["GET"], include_in_schema=False)
 
     Path(settings.media_dir).mkdir(parents=True, exist_ok=True)
     if settings.media_serve_static:
-        app.mount("/media", StaticFiles(directory=settings.media_dir), name="media")
+        app.add_api_route(
+            "/media/{path:path}",
+            MediaFiles(settings).serve,
+            methods=["GET", "HEAD"],
+            include_in_schema=False,
+        )
     install_error_handlers(app)
     configure_tracing(app)
     return app
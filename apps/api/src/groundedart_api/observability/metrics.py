@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 from starlette.responses import Response
 
 operation_total = Counter(
@@ -38,6 +38,106 @@ upload_bytes_total = Counter(
     "Total uploaded bytes.",
     labelnames=("mime", "outcome"),
 )
+media_blob_uploads_total = Counter(
+    "ga_media_blob_uploads_total",
+    "Stored capture uploads by whether the content was new or already had a blob.",
+    labelnames=("outcome",),
+)
+media_variant_jobs_total = Counter(
+    "ga_media_variant_jobs_total",
+    "Image variant render jobs by outcome (rendered, failed, dropped).",
+    labelnames=("kind", "outcome"),
+)
+media_variant_render_seconds = Histogram(
+    "ga_media_variant_render_seconds",
+    "Time to render and record the variants of one image.",
+)
+media_responses_total = Counter(
+    "ga_media_responses_total",
+    "Media requests served by the API (full, partial, not_modified, offloaded, ...).",
+    labelnames=("outcome",),
+)
+
+rank_outbox_entries_total = Counter(
+    "ga_rank_outbox_entries_total",
+    "Rank refresh outbox entries processed by the rank worker.",
+    labelnames=("stage",),
+)
+
+rank_cache_lookups_total = Counter(
+    "ga_rank_cache_lookups_total",
+    "In-process rank cache lookups while the rank_changed listener is connected.",
+    labelnames=("outcome",),
+)
+rank_cache_invalidations_total = Counter(
+    "ga_rank_cache_invalidations_total",
+    "In-process rank cache invalidations received via NOTIFY rank_changed.",
+    labelnames=("scope",),
+)
+rank_cache_entry_age_seconds = Histogram(
+    "ga_rank_cache_entry_age_seconds",
+    "Age of rank cache entries when served (upper bound on staleness).",
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0),
+)
+rank_cache_listener_connected = Gauge(
+    "ga_rank_cache_listener_connected",
+    "Whether this worker's rank_changed LISTEN connection is up (cache bypassed when 0).",
+)
+
+moderation_queue_depth = Gauge(
+    "ga_moderation_queue_depth",
+    "Pending captures awaiting review, by lease status (as of the last claim or queue read).",
+    labelnames=("status",),
+)
+moderation_leases_total = Counter(
+    "ga_moderation_leases_total",
+    "Moderation queue leases claimed, renewed and released.",
+    labelnames=("action",),
+)
+
+abuse_events_written_total = Counter(
+    "ga_abuse_events_written_total",
+    "Abuse events written to the database by the buffered abuse event writer.",
+)
+abuse_events_dropped_total = Counter(
+    "ga_abuse_events_dropped_total",
+    "Abuse events dropped by the buffered writer (buffer full or failed batch insert).",
+    labelnames=("reason",),
+)
+abuse_event_buffer_depth = Gauge(
+    "ga_abuse_event_buffer_depth",
+    "Abuse events waiting in this worker's buffer.",
+)
+
+capture_metadata_checks_total = Counter(
+    "ga_capture_metadata_checks_total",
+    "EXIF cross-checks of capture uploads against the check-in, by field and outcome.",
+    ["field", "outcome"],
+)
+
+event_outbox_deliveries_total = Counter(
+    "ga_event_outbox_deliveries_total",
+    "Event outbox delivery attempts by outcome (delivered, retried, dead).",
+    labelnames=("event_type", "outcome"),
+)
+event_outbox_delivery_seconds = Histogram(
+    "ga_event_outbox_delivery_seconds",
+    "Latency of a single event outbox webhook delivery.",
+)
+
+user_event_streams = Gauge(
+    "ga_user_event_streams",
+    "Open /v1/me/stream connections on this worker.",
+)
+user_events_sent_total = Counter(
+    "ga_user_events_sent_total",
+    "Events written to /v1/me/stream connections.",
+    ["kind", "source"],
+)
+user_events_listener_connected = Gauge(
+    "ga_user_events_listener_connected",
+    "Whether this worker's user_events LISTEN connection is up (streams poll when 0).",
+)
 
 
 def render_metrics() -> Response:
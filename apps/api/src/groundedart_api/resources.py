@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from typing import TYPE_CHECKING
+
+import httpx
+
+from groundedart_api.settings import Settings, get_settings
+from groundedart_api.storage.base import MediaStorage
+from groundedart_api.storage.local import LocalMediaStorage
+from groundedart_api.storage.s3 import S3MediaStorage
+from groundedart_api.storage.staging import UploadStaging
+
+if TYPE_CHECKING:
+    from groundedart_api.domain.tip_receipts import TipReceiptProvider
+
+logger = logging.getLogger(__name__)
+
+SOLANA_RPC_TIMEOUT_SECONDS = 10.0
+
+
+class AppResources:
+    """Long-lived clients and services shared by every request in the process.
+
+    HTTP clients are keep-alive pools (HTTP/2 when `h2` is installed) created on first
+    use; the lifespan in `main.py` opens the registry at startup and closes the pools at
+    shutdown. A registry is tied to one `Settings` instance, so tests that swap settings
+    get a fresh one and the replaced registry is closed. `aclose` is idempotent.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self.media_storage: MediaStorage
+        if settings.media_storage_backend == "s3":
+            self.media_storage = S3MediaStorage(
+                settings, client=self._http_client(timeout=settings.s3_timeout_seconds)
+            )
+        else:
+            self.media_storage = LocalMediaStorage(settings)
+        self.upload_staging = UploadStaging(settings)
+        self._solana_rpc_client: httpx.AsyncClient | None = None
+        self._webhook_client: httpx.AsyncClient | None = None
+        self._tip_receipt_provider: TipReceiptProvider | None = None
+
+    @property
+    def solana_rpc_client(self) -> httpx.AsyncClient:
+        if self._solana_rpc_client is None:
+            self._solana_rpc_client = self._http_client(timeout=SOLANA_RPC_TIMEOUT_SECONDS)
+        return self._solana_rpc_client
+
+    @property
+    def webhook_client(self) -> httpx.AsyncClient:
+        if self._webhook_client is None:
+            self._webhook_client = self._http_client(
+                timeout=float(self.settings.verification_events_webhook_timeout_seconds)
+            )
+        return self._webhook_client
+
+    @property
+    def tip_receipt_provider(self) -> TipReceiptProvider:
+        if self._tip_receipt_provider is None:
+            from groundedart_api.domain.tip_receipts_solana import SolanaTipReceiptProvider
+
+            self._tip_receipt_provider = SolanaTipReceiptProvider(
+                str(self.settings.solana_rpc_url)
+            )
+        return self._tip_receipt_provider
+
+    def _http_client(self, *, timeout: float) -> httpx.AsyncClient:
+        settings = self.settings
+        return httpx.AsyncClient(
+            timeout=timeout,
+            http2=settings.http_client_http2 and _http2_available(),
+            limits=httpx.Limits(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive_connections,
+                keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        for client in (self._solana_rpc_client, self._webhook_client):
+            if client is not None:
+                await client.aclose()
+        self._solana_rpc_client = None
+        self._webhook_client = None
+        await self.media_storage.aclose()
+
+
+_http2_checked: bool | None = None
+
+
+def _http2_available() -> bool:
+    global _http2_checked
+    if _http2_checked is None:
+        _http2_checked = importlib.util.find_spec("h2") is not None
+        if not _http2_checked:
+            logger.warning("http2_unavailable", extra={"hint": "pip install 'httpx[http2]'"})
+    return _http2_checked
+
+
+_resources: AppResources | None = None
+# Registries replaced by one for new settings; closed in the background or at shutdown.
+_retired: list[AppResources] = []
+_retiring: set[asyncio.Task[None]] = set()
+
+
+def get_app_resources(settings: Settings | None = None) -> AppResources:
+    global _resources
+    settings = settings or get_settings()
+    if _resources is None or _resources.settings is not settings:
+        previous, _resources = _resources, AppResources(settings)
+        if previous is not None:
+            _retire(previous)
+    return _resources
+
+
+def _retire(resources: AppResources) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _retired.append(resources)
+        return
+    task = loop.create_task(resources.aclose())
+    _retiring.add(task)
+    task.add_done_callback(_retiring.discard)
+
+
+async def close_app_resources(resources: AppResources | None = None) -> None:
+    """Close `resources` (default: the current registry) and any replaced registries.
+
+    The lifespan passes the registry it stored on `app.state`, so shutdown closes that
+    instance even if the global was swapped meanwhile.
+    """
+    global _resources
+    resources = resources or _resources
+    if resources is _resources:
+        _resources = None
+    retired = [*_retired, *([resources] if resources is not None else [])]
+    _retired.clear()
+    if _retiring:
+        await asyncio.gather(*_retiring, return_exceptions=True)
+    for registry in retired:
+        await registry.aclose()
@@ -56,6 +56,17 @@ class Settings(BaseSettings):
         default=None,
         description="Optional Domain attribute for the session cookie.",
     )
+    session_token_format: Literal["opaque", "signed"] = Field(
+        default="opaque",
+        description=(
+            "Format for newly issued session cookies. Signed tokens embed user_id/expiry under a "
+            "MAC keyed by TOKEN_HASH_SECRET; both formats are always accepted."
+        ),
+    )
+    session_revocation_refresh_seconds: int = Field(
+        default=30,
+        description="How often each worker reloads revoked signed-session ids, in seconds.",
+    )
     admin_api_token: str = "dev-admin-token-change-me"
 
     checkin_challenge_ttl_seconds: int = Field(
@@ -67,6 +78,22 @@ class Settings(BaseSettings):
     max_location_accuracy_m: int = Field(
         default=50, description="Maximum allowed reported location accuracy, in meters."
     )
+    capture_exif_gps_tolerance_m: float = Field(
+        default=150.0,
+        ge=0,
+        description=(
+            "Slack beyond the node radius for an upload's EXIF GPS position to count as "
+            "consistent with the check-in, in meters."
+        ),
+    )
+    capture_exif_time_tolerance_seconds: int = Field(
+        default=15 * 60,
+        ge=0,
+        description=(
+            "Slack around [check-in token issued, upload] for an upload's EXIF capture time "
+            "to count as consistent, in seconds."
+        ),
+    )
     checkin_challenge_rate_window_seconds: int = Field(
         default=5 * 60,
         description="Rolling window for check-in challenge rate limits, in seconds.",
@@ -95,6 +122,10 @@ class Settings(BaseSettings):
         default=5,
         description="Maximum reports per user per rate window.",
     )
+    report_auto_hide_threshold: int = Field(
+        default=10,
+        description="Open reports that automatically hide a capture (0 disables).",
+    )
     tip_intent_ttl_seconds: int = Field(
         default=60 * 60,
         description="Time-to-live for tip intents, in seconds.",
@@ -111,6 +142,115 @@ class Settings(BaseSettings):
         default="https://api.devnet.solana.com",
         description="Solana JSON-RPC endpoint for tip receipt verification.",
     )
+    http_client_http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for outbound API clients when the h2 package is installed.",
+    )
+    http_client_max_connections: int = Field(
+        default=20,
+        description="Maximum open connections per outbound HTTP client pool.",
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=10,
+        description="Idle keep-alive connections kept per outbound HTTP client pool.",
+    )
+    http_client_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="How long an idle pooled connection is kept open, in seconds.",
+    )
+
+    rank_refresh_mode: Literal["inline", "outbox"] = Field(
+        default="inline",
+        description=(
+            "How moderation transitions refresh curator rank: inline in the request, or via "
+            "the rank_refresh_outbox consumed by scripts/process_rank_outbox.py."
+        ),
+    )
+    rank_outbox_batch_size: int = Field(
+        default=500,
+        description="Maximum rank refresh outbox rows claimed per worker batch.",
+    )
+    rank_outbox_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Idle sleep between rank outbox polls in loop mode, in seconds.",
+    )
+
+    rank_cache_enabled: bool = Field(
+        default=True,
+        description=(
+            "Cache rank totals per worker, invalidated via Postgres NOTIFY rank_changed. "
+            "Entries are only served while the worker's LISTEN connection is up."
+        ),
+    )
+    rank_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="Fallback TTL for cached rank totals if a notification is missed, in seconds.",
+    )
+    rank_cache_max_entries: int = Field(
+        default=50_000,
+        description="Maximum cached (user_id, rank_version) entries per worker.",
+    )
+
+    leaderboard_cache_ttl_seconds: float = Field(
+        default=15.0,
+        description="In-process TTL for cached leaderboard pages, in seconds (0 disables).",
+    )
+    leaderboard_window_refresh_seconds: int = Field(
+        default=5 * 60,
+        description=(
+            "Interval between rolling leaderboard window refreshes in loop mode, "
+            "in seconds."
+        ),
+    )
+
+    moderation_lease_seconds: int = Field(
+        default=5 * 60,
+        description=(
+            "How long a claimed capture stays leased to a moderator before it returns "
+            "to the queue."
+        ),
+    )
+    moderation_claim_max: int = Field(
+        default=50,
+        description="Maximum captures a moderator may claim per request.",
+    )
+
+    abuse_events_buffered: bool = Field(
+        default=True,
+        description=(
+            "Batch abuse events through an in-process writer instead of inserting per request. "
+            "Events still buffered when a worker crashes are lost."
+        ),
+    )
+    abuse_events_buffer_max_events: int = Field(
+        default=10_000,
+        description=(
+            "Maximum abuse events buffered per worker; further events are dropped "
+            "and counted."
+        ),
+    )
+    abuse_events_flush_rows: int = Field(
+        default=500,
+        description=(
+            "Flush buffered abuse events once this many are waiting "
+            "(and per insert batch)."
+        ),
+    )
+    abuse_events_flush_seconds: float = Field(
+        default=1.0,
+        description="Flush buffered abuse events at least this often, in seconds.",
+    )
+    abuse_rollup_refresh_seconds: int = Field(
+        default=60,
+        description="Interval between abuse_event_rollups refreshes in loop mode, in seconds.",
+    )
+    abuse_rollup_lookback_minutes: int = Field(
+        default=60,
+        description=(
+            "How far back each rollup refresh recomputes 5-minute abuse buckets, "
+            "in minutes."
+        ),
+    )
 
     verification_events_mode: Literal["noop", "log", "webhook"] = Field(
         default="log",
@@ -128,6 +268,57 @@ class Settings(BaseSettings):
         default=5.0,
         description="Timeout for webhook emission, in seconds.",
     )
+    verification_events_outbox_batch_size: int = Field(
+        default=100,
+        description="Maximum event_outbox rows claimed per dispatcher batch.",
+    )
+    verification_events_outbox_poll_seconds: float = Field(
+        default=1.0,
+        description="Idle interval between event_outbox polls, in seconds.",
+    )
+    verification_events_outbox_lease_seconds: int = Field(
+        default=60,
+        description=(
+            "How long a claimed event_outbox row is hidden from other dispatchers, "
+            "in seconds."
+        ),
+    )
+    verification_events_outbox_max_attempts: int = Field(
+        default=12,
+        description="Delivery attempts before an event_outbox row is dead-lettered.",
+    )
+    verification_events_outbox_backoff_base_seconds: float = Field(
+        default=2.0,
+        description="First retry delay for a failed delivery; doubles on each attempt, in seconds.",
+    )
+    verification_events_outbox_backoff_max_seconds: float = Field(
+        default=15 * 60,
+        description="Upper bound on the retry delay for a failed delivery, in seconds.",
+    )
+
+    user_events_listener_enabled: bool = Field(
+        default=True,
+        description=(
+            "Hold a LISTEN user_events connection per worker to push /v1/me/stream events. "
+            "When disabled or disconnected, open streams poll the database instead."
+        ),
+    )
+    user_events_heartbeat_seconds: float = Field(
+        default=15.0,
+        description="Idle interval after which /v1/me/stream sends a keep-alive comment.",
+    )
+    user_events_poll_seconds: float = Field(
+        default=5.0,
+        description="Database poll interval for open streams while LISTEN is unavailable.",
+    )
+    user_events_queue_max: int = Field(
+        default=100,
+        description="Events buffered per open stream before it falls back to a replay.",
+    )
+    user_events_replay_limit: int = Field(
+        default=100,
+        description="Rows fetched per replay query when resuming from Last-Event-ID.",
+    )
 
     media_dir: str = "./.local_media"
     media_serve_static: bool = Field(
@@ -146,6 +337,118 @@ class Settings(BaseSettings):
         default=1_500_000,
         description="Maximum allowed upload size for capture images, in bytes.",
     )
+    media_durability: Literal["fsync", "batched", "none"] = Field(
+        default="fsync",
+        description=(
+            "Crash durability for stored media: fsync each file and directory entry, "
+            "fsync files but batch directory syncs across uploads, or none (dev only)."
+        ),
+    )
+    media_io_threads: int = Field(
+        default=4,
+        description="Worker threads for blocking media file I/O (writes, fsync, renames).",
+    )
+    media_dir_fsync_window_ms: float = Field(
+        default=5.0,
+        description="How long batched durability waits to coalesce directory fsyncs, in ms.",
+    )
+    media_blob_gc_grace_seconds: int = Field(
+        default=60 * 60,
+        description="How long a media blob must stay unreferenced before GC deletes it.",
+    )
+    upload_staging_dir: str = Field(
+        default="./.local_upload_staging",
+        description="Where partial resumable uploads are kept; must not be under MEDIA_DIR.",
+    )
+    upload_session_ttl_seconds: int = Field(
+        default=24 * 60 * 60,
+        description="How long a resumable upload session (and its staged bytes) stays valid.",
+    )
+    media_storage_backend: Literal["local", "s3"] = Field(
+        default="local",
+        description=(
+            "Where capture media lives: MEDIA_DIR on local disk, or an S3-compatible "
+            "bucket."
+        ),
+    )
+    s3_endpoint_url: str = Field(
+        default="http://localhost:9000",
+        description="S3-compatible endpoint (e.g. https://s3.us-east-1.amazonaws.com or MinIO).",
+    )
+    s3_region: str = Field(default="us-east-1", description="Region used for SigV4 signing.")
+    s3_bucket: str = Field(default="groundedart-media", description="Bucket holding media.")
+    s3_access_key_id: str = Field(default="", description="S3 access key id.")
+    s3_secret_access_key: str = Field(default="", description="S3 secret access key.")
+    s3_force_path_style: bool = Field(
+        default=True,
+        description="Address objects as endpoint/bucket/key (MinIO) instead of bucket.host/key.",
+    )
+    s3_presign_expires_seconds: int = Field(
+        default=15 * 60,
+        description="Lifetime of presigned direct-upload URLs.",
+    )
+    s3_timeout_seconds: float = Field(
+        default=30.0,
+        description="Timeout for API-side S3 requests, in seconds.",
+    )
+    media_variants_enabled: bool = Field(
+        default=True,
+        description="Render thumbnail/WebP variants of uploaded images in a background pool.",
+    )
+    media_variant_workers: int = Field(
+        default=2,
+        description="Worker processes for media variant rendering.",
+    )
+    media_variant_queue_max: int = Field(
+        default=1000,
+        description="Variant jobs queued per API worker; beyond this they wait for the backfill.",
+    )
+    media_variant_widths: list[int] = Field(
+        default=[160, 320, 640, 1280],
+        description="Width buckets (px) for image variants; sources are never upscaled.",
+    )
+    media_variant_webp_quality: int = Field(
+        default=80,
+        ge=1,
+        le=100,
+        description="Encoder quality for WebP variants.",
+    )
+    media_variant_jpeg_quality: int = Field(
+        default=82,
+        ge=1,
+        le=100,
+        description="Encoder quality for the JPEG thumbnail.",
+    )
+    media_variant_avif_enabled: bool = Field(
+        default=False,
+        description="Also render an AVIF per width bucket (slower to encode; needs Pillow AVIF).",
+    )
+    media_variant_avif_quality: int = Field(
+        default=55,
+        ge=1,
+        le=100,
+        description="Encoder quality for AVIF variants.",
+    )
+    near_duplicate_flag_distance: int = Field(
+        default=8,
+        ge=0,
+        le=16,
+        description=(
+            "Perceptual-hash Hamming distance (of 64 bits) within which a new capture image "
+            "matching another user's or node's capture is recorded as an abuse event."
+        ),
+    )
+    media_cache_max_age_seconds: int = Field(
+        default=5 * 60,
+        description="Cache lifetime for served media whose path is not content-addressed.",
+    )
+    media_accel_redirect_prefix: str | None = Field(
+        default=None,
+        description=(
+            "Internal location (e.g. /_media/) that an nginx front end maps to MEDIA_DIR; when "
+            "set, /media answers with X-Accel-Redirect and nginx sends the file itself."
+        ),
+    )
 
     @field_validator("api_cors_origins", mode="before")
     @classmethod
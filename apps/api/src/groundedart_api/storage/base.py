@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import datetime as dt
+import re
+import uuid
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from fastapi import UploadFile
+
+from groundedart_api.domain.errors import AppError
+
+BLOB_DIR = "blobs"
+_SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(frozen=True)
+class StoredMedia:
+    path: str
+    mime: str | None
+    bytes_written: int
+    sha256: str
+    # True when an identical blob was already stored and the upload was discarded.
+    deduplicated: bool = False
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    size_bytes: int
+    mime: str | None
+
+
+@dataclass(frozen=True)
+class PresignedUpload:
+    """Where and how the client uploads the bytes itself.
+
+    `upload_required` is False when the content is already stored; the client goes
+    straight to the completion call.
+    """
+
+    path: str
+    upload_required: bool
+    method: str = "PUT"
+    url: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    expires_at: dt.datetime | None = None
+
+
+class MediaStorage(Protocol):
+    """Content-addressed capture media; see `LocalMediaStorage` and `S3MediaStorage`."""
+
+    async def save_capture_image(
+        self, capture_id: uuid.UUID, upload: UploadFile
+    ) -> StoredMedia: ...
+
+    async def presign_capture_upload(
+        self,
+        capture_id: uuid.UUID,
+        *,
+        sha256: str,
+        size_bytes: int,
+        content_type: str,
+        now: dt.datetime,
+    ) -> PresignedUpload: ...
+
+    async def stat_blob(self, relative_path: str) -> StoredBlob | None: ...
+
+    async def delete_blob(self, relative_path: str) -> None: ...
+
+    async def aclose(self) -> None: ...
+
+
+def blob_relative_path(sha256: str, ext: str) -> str:
+    """Content-addressed location: blobs/ab/cd/abcd...<ext>."""
+    return f"{BLOB_DIR}/{sha256[:2]}/{sha256[2:4]}/{sha256}{ext}"
+
+
+def check_upload_content_type(content_type: str | None, allowed: set[str]) -> str:
+    """Normalized MIME type of an upload; raises `invalid_media_type` if not allowed."""
+    normalized = normalize_content_type(content_type)
+    if not normalized or normalized not in allowed:
+        raise AppError(
+            code="invalid_media_type",
+            message="Unsupported upload content type.",
+            status_code=415,
+            details={"allowed": sorted(allowed)},
+        )
+    return normalized
+
+
+def check_upload_size(size_bytes: int, max_bytes: int) -> None:
+    if size_bytes > max_bytes:
+        raise AppError(
+            code="file_too_large",
+            message="Uploaded file exceeds size limit.",
+            status_code=413,
+            details={"max_bytes": max_bytes},
+        )
+
+
+def check_sha256(sha256: str) -> str:
+    normalized = sha256.strip().lower()
+    if not _SHA256_HEX.match(normalized):
+        raise AppError(
+            code="invalid_upload_checksum",
+            message="sha256 must be 64 hex characters.",
+            status_code=400,
+        )
+    return normalized
+
+
+def safe_extension(content_type: str | None) -> str:
+    if content_type == "image/jpeg":
+        return ".jpg"
+    if content_type == "image/png":
+        return ".png"
+    if content_type == "image/webp":
+        return ".webp"
+    return ""
+
+
+def normalize_content_type(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+    return content_type.split(";", 1)[0].strip().lower()
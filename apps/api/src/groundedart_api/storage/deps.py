@@ -4,12 +4,21 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from groundedart_api.resources import get_app_resources
 from groundedart_api.settings import Settings, get_settings
-from groundedart_api.storage.local import LocalMediaStorage
+from groundedart_api.storage.base import MediaStorage
+from groundedart_api.storage.staging import UploadStaging
 
 
-def get_media_storage(settings: Settings = Depends(get_settings)) -> LocalMediaStorage:
-    return LocalMediaStorage(settings)
+def get_media_storage(settings: Settings = Depends(get_settings)) -> MediaStorage:
+    return get_app_resources(settings).media_storage
 
 
-MediaStorageDep = Annotated[LocalMediaStorage, Depends(get_media_storage)]
+MediaStorageDep = Annotated[MediaStorage, Depends(get_media_storage)]
+
+
+def get_upload_staging(settings: Settings = Depends(get_settings)) -> UploadStaging:
+    return get_app_resources(settings).upload_staging
+
+
+UploadStagingDep = Annotated[UploadStaging, Depends(get_upload_staging)]
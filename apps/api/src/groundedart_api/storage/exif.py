@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO
+
+# A JPEG APP1 segment carries at most 64 KiB; WebP allows more, but real EXIF is far smaller.
+_MAX_EXIF_BYTES = 256 * 1024
+# Markers walked before giving up; EXIF sits in the first few segments of real files.
+_MAX_JPEG_SEGMENTS = 64
+_MAX_WEBP_CHUNKS = 64
+_MAX_IFD_ENTRIES = 512
+
+_JPEG_SOS = 0xDA
+_JPEG_EOI = 0xD9
+_JPEG_APP1 = 0xE1
+_JPEG_STANDALONE = {0x01, *range(0xD0, 0xD8)}
+_EXIF_HEADER = b"Exif\x00\x00"
+_WEBP_VP8X_EXIF_FLAG = 0x08
+
+_TAG_EXIF_IFD = 0x8769
+_TAG_GPS_IFD = 0x8825
+_TAG_DATETIME_ORIGINAL = 0x9003
+_TAG_OFFSET_TIME_ORIGINAL = 0x9011
+_TAG_GPS_LATITUDE_REF = 0x0001
+_TAG_GPS_LATITUDE = 0x0002
+_TAG_GPS_LONGITUDE_REF = 0x0003
+_TAG_GPS_LONGITUDE = 0x0004
+_TAG_GPS_TIMESTAMP = 0x0007
+_TAG_GPS_DATESTAMP = 0x001D
+
+_TYPE_ASCII = 2
+_TYPE_SHORT = 3
+_TYPE_LONG = 4
+_TYPE_RATIONAL = 5
+_TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 7: 1, 9: 4, 10: 8}
+
+
+@dataclass(frozen=True)
+class ExifMetadata:
+    """What an image's EXIF says about where and when it was taken.
+
+    `captured_at` is DateTimeOriginal: timezone-aware when the camera wrote
+    OffsetTimeOriginal, naive (camera local time) otherwise. `gps_time` is the GPS
+    fix time, always UTC.
+    """
+
+    latitude: float | None = None
+    longitude: float | None = None
+    captured_at: dt.datetime | None = None
+    gps_time: dt.datetime | None = None
+
+
+def read_exif_metadata(file: BinaryIO) -> ExifMetadata | None:
+    """GPS position and capture time from the EXIF block of a JPEG or WebP file.
+
+    Reads container headers only and seeks past everything else (pixel data, ICC
+    profiles, thumbnails), so the cost is a few small reads whatever the image size.
+    Returns None for other formats, images without EXIF and malformed EXIF; never
+    raises for bad input. The file position is left wherever parsing stopped.
+    """
+    try:
+        head = file.read(12)
+        if head[:2] == b"\xff\xd8":
+            file.seek(2)
+            block = _jpeg_exif_block(file)
+        elif head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            block = _webp_exif_block(file)
+        else:
+            return None
+        return _parse_tiff(block) if block is not None else None
+    except (ValueError, TypeError, IndexError, OverflowError, struct.error, OSError):
+        return None
+
+
+def _jpeg_exif_block(file: BinaryIO) -> bytes | None:
+    for _ in range(_MAX_JPEG_SEGMENTS):
+        prefix = file.read(2)
+        if len(prefix) < 2 or prefix[0] != 0xFF:
+            return None
+        marker = prefix[1]
+        while marker == 0xFF:
+            # Fill bytes may pad a marker.
+            marker = file.read(1)[0]
+        if marker in _JPEG_STANDALONE:
+            continue
+        if marker in (_JPEG_SOS, _JPEG_EOI):
+            # Entropy-coded data follows; EXIF must come before it.
+            return None
+        (length,) = struct.unpack(">H", file.read(2))
+        if length < 2:
+            return None
+        if marker == _JPEG_APP1:
+            payload = file.read(length - 2)
+            if payload.startswith(_EXIF_HEADER):
+                return payload[len(_EXIF_HEADER) :]
+            # An XMP APP1; EXIF may still follow.
+            continue
+        file.seek(length - 2, os.SEEK_CUR)
+    return None
+
+
+def _webp_exif_block(file: BinaryIO) -> bytes | None:
+    for index in range(_MAX_WEBP_CHUNKS):
+        header = file.read(8)
+        if len(header) < 8:
+            return None
+        fourcc, size = header[:4], struct.unpack("<I", header[4:])[0]
+        if index == 0 and fourcc != b"VP8X":
+            # Simple-format WebP: the image is the only chunk.
+            return None
+        if fourcc == b"VP8X":
+            flags = file.read(1)
+            if size < 1 or not flags or not flags[0] & _WEBP_VP8X_EXIF_FLAG:
+                return None
+            file.seek(size - 1 + (size & 1), os.SEEK_CUR)
+        elif fourcc == b"EXIF":
+            if size > _MAX_EXIF_BYTES:
+                return None
+            payload = file.read(size)
+            # Some writers keep the JPEG-style prefix.
+            return payload.removeprefix(_EXIF_HEADER)
+        else:
+            # Chunks are padded to even sizes; skipping image data here is a seek, not a read.
+            file.seek(size + (size & 1), os.SEEK_CUR)
+    return None
+
+
+def _parse_tiff(data: bytes) -> ExifMetadata:
+    if data[:2] == b"II":
+        order = "<"
+    elif data[:2] == b"MM":
+        order = ">"
+    else:
+        raise ValueError("not a TIFF header")
+    magic, ifd0_offset = struct.unpack(f"{order}HI", data[2:8])
+    if magic != 42:
+        raise ValueError("not a TIFF header")
+    ifd0 = _read_ifd(data, ifd0_offset, order)
+    exif = _read_ifd(data, ifd0[_TAG_EXIF_IFD][0], order) if _TAG_EXIF_IFD in ifd0 else {}
+    gps = _read_ifd(data, ifd0[_TAG_GPS_IFD][0], order) if _TAG_GPS_IFD in ifd0 else {}
+
+    latitude = _coordinate(gps.get(_TAG_GPS_LATITUDE), gps.get(_TAG_GPS_LATITUDE_REF), "S", 90)
+    longitude = _coordinate(
+        gps.get(_TAG_GPS_LONGITUDE), gps.get(_TAG_GPS_LONGITUDE_REF), "W", 180
+    )
+    if latitude is None or longitude is None:
+        latitude = longitude = None
+    return ExifMetadata(
+        latitude=latitude,
+        longitude=longitude,
+        captured_at=_captured_at(
+            exif.get(_TAG_DATETIME_ORIGINAL), exif.get(_TAG_OFFSET_TIME_ORIGINAL)
+        ),
+        gps_time=_gps_time(gps.get(_TAG_GPS_DATESTAMP), gps.get(_TAG_GPS_TIMESTAMP)),
+    )
+
+
+def _read_ifd(data: bytes, offset: int, order: str) -> dict[int, tuple]:
+    """Tag -> values for the IFD at `offset`; only the value types EXIF dates and GPS use."""
+    (count,) = struct.unpack_from(f"{order}H", data, offset)
+    if count > _MAX_IFD_ENTRIES:
+        raise ValueError("implausible IFD")
+    entries: dict[int, tuple] = {}
+    for index in range(count):
+        entry = offset + 2 + index * 12
+        tag, value_type, value_count = struct.unpack_from(f"{order}HHI", data, entry)
+        size = _TYPE_SIZES.get(value_type, 0) * value_count
+        if size == 0:
+            continue
+        if size <= 4:
+            value_offset = entry + 8
+        else:
+            (value_offset,) = struct.unpack_from(f"{order}I", data, entry + 8)
+        if value_offset + size > len(data):
+            continue
+        if value_type == _TYPE_ASCII:
+            raw = data[value_offset : value_offset + size]
+            entries[tag] = (raw.split(b"\x00", 1)[0].decode("ascii", "replace").strip(),)
+        elif value_type == _TYPE_RATIONAL:
+            values = struct.unpack_from(f"{order}{2 * value_count}I", data, value_offset)
+            entries[tag] = tuple(
+                numerator / denominator if denominator else None
+                for numerator, denominator in zip(values[::2], values[1::2], strict=True)
+            )
+        elif value_type in (_TYPE_SHORT, _TYPE_LONG):
+            code = "H" if value_type == _TYPE_SHORT else "I"
+            entries[tag] = struct.unpack_from(f"{order}{value_count}{code}", data, value_offset)
+    return entries
+
+
+def _coordinate(
+    value: tuple | None, ref: tuple | None, negative_ref: str, limit: float
+) -> float | None:
+    if value is None or len(value) != 3 or None in value:
+        return None
+    degrees = value[0] + value[1] / 60 + value[2] / 3600
+    if ref is not None and str(ref[0]).upper() == negative_ref:
+        degrees = -degrees
+    return degrees if -limit <= degrees <= limit else None
+
+
+def _captured_at(value: tuple | None, offset: tuple | None) -> dt.datetime | None:
+    if value is None:
+        return None
+    try:
+        captured_at = dt.datetime.strptime(value[0], "%Y:%m:%d %H:%M:%S")
+    except ValueError:
+        return None
+    if offset is not None:
+        try:
+            aware = captured_at.replace(tzinfo=dt.datetime.strptime(offset[0], "%z").tzinfo)
+            # Comparing aware times goes through UTC, which year 1 or 9999 can overflow.
+            aware.astimezone(dt.UTC)
+        except (ValueError, OverflowError):
+            pass
+        else:
+            captured_at = aware
+    return captured_at
+
+
+def _gps_time(date: tuple | None, time: tuple | None) -> dt.datetime | None:
+    if date is None or time is None or len(time) != 3 or None in time:
+        return None
+    try:
+        day = dt.datetime.strptime(date[0], "%Y:%m:%d")
+    except ValueError:
+        return None
+    hours, minutes, seconds = time
+    if not (0 <= hours < 24 and 0 <= minutes < 60 and 0 <= seconds < 61):
+        return None
+    try:
+        return day.replace(tzinfo=dt.UTC) + dt.timedelta(
+            hours=hours, minutes=minutes, seconds=seconds
+        )
+    except OverflowError:
+        # A crafted 9999:12:31 23:59:60 runs past datetime.max.
+        return None
@@ -1,68 +1,146 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import datetime as dt
+import functools
+import hashlib
 import os
+import shutil
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO, Literal
 
 from fastapi import UploadFile
 
 from groundedart_api.domain.errors import AppError
 from groundedart_api.settings import Settings
+from groundedart_api.storage.base import (
+    BLOB_DIR,
+    PresignedUpload,
+    StoredBlob,
+    StoredMedia,
+    blob_relative_path,
+    check_upload_content_type,
+    check_upload_size,
+    safe_extension,
+)
+from groundedart_api.storage.variants import VARIANT_DIR
 
+MediaDurability = Literal["fsync", "batched", "none"]
 
-@dataclass(frozen=True)
-class StoredMedia:
-    path: str
-    mime: str | None
-    bytes_written: int
+# Chunks read from the upload while earlier ones are still being written (memory bound:
+# _WRITE_QUEUE_CHUNKS * chunk size per upload in flight).
+_WRITE_QUEUE_CHUNKS = 4
+_CHUNK_SIZE = 256 * 1024
+
+
+class _DirectorySyncer:
+    """Group commit for directory fsyncs after renames.
+
+    Callers that arrive within `window_seconds` of each other share one batch, which
+    fsyncs every directory they touched once all of them have renamed their files.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, window_seconds: float) -> None:
+        self._executor = executor
+        self._window_seconds = window_seconds
+        self._batch: asyncio.Task[None] | None = None
+        self._paths: set[Path] = set()
+
+    async def sync(self, paths: list[Path]) -> None:
+        self._paths.update(paths)
+        if self._batch is None:
+            self._batch = asyncio.create_task(self._run_batch())
+        await asyncio.shield(self._batch)
+
+    async def _run_batch(self) -> None:
+        await asyncio.sleep(self._window_seconds)
+        # Renames from here on join the next batch.
+        paths, self._paths, self._batch = self._paths, set(), None
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self._executor, _fsync_directory, path) for path in paths)
+        )
 
 
 class LocalMediaStorage:
+    """Content-addressed capture images on the local filesystem.
+
+    Uploads are hashed (SHA-256) while they stream to a temp file and stored once per
+    content under `blob_relative_path`; an upload whose blob already exists is dropped
+    before it is fsynced, so duplicates cost no durable writes. Reference counts live in
+    `media_blobs` (see domain/media_blobs.py), not here.
+
+    All blocking file work (open, write, fsync, rename) runs on a bounded thread pool, so
+    a large upload never stalls the event loop. Chunks stream from the request through a
+    small queue into the writer. `media_durability` controls what survives a crash:
+    `fsync` syncs each file and its directory entry, `batched` syncs each file and
+    coalesces directory syncs across concurrent uploads, `none` leaves it to the OS.
+    """
+
     def __init__(self, settings: Settings) -> None:
         self._root = Path(settings.media_dir).resolve()
         self._root.mkdir(parents=True, exist_ok=True)
         self._allowed_mime_types = {mime.lower() for mime in settings.upload_allowed_mime_types}
         self._max_upload_bytes = settings.upload_max_bytes
-        self._chunk_size = 1024 * 1024
+        self._chunk_size = _CHUNK_SIZE
+        self._durability: MediaDurability = settings.media_durability
+        self._io_threads = settings.media_io_threads
+        self._dir_fsync_window_seconds = settings.media_dir_fsync_window_ms / 1000.0
+        self._executor: ThreadPoolExecutor | None = None
+        self._dir_syncer: _DirectorySyncer | None = None
 
-    async def save_capture_image(self, capture_id: uuid.UUID, upload: UploadFile) -> StoredMedia:
-        content_type = _normalize_content_type(upload.content_type)
-        if not content_type or content_type not in self._allowed_mime_types:
-            raise AppError(
-                code="invalid_media_type",
-                message="Unsupported upload content type.",
-                status_code=415,
-                details={"allowed": sorted(self._allowed_mime_types)},
+    @property
+    def durability(self) -> MediaDurability:
+        return self._durability
+
+    def _io_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._io_threads, thread_name_prefix="media-io"
             )
+            self._dir_syncer = _DirectorySyncer(self._executor, self._dir_fsync_window_seconds)
+        return self._executor
 
-        ext = _safe_extension(content_type)
-        filename = f"capture_{capture_id}{ext}"
-        out_path = self._root / filename
-        temp_name = f".{filename}.uploading-{uuid.uuid4().hex}"
-        temp_path = self._root / temp_name
+    async def aclose(self) -> None:
+        executor, self._executor, self._dir_syncer = self._executor, None, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
 
-        bytes_written = 0
-        success = False
+    async def save_capture_image(self, capture_id: uuid.UUID, upload: UploadFile) -> StoredMedia:
+        content_type = check_upload_content_type(upload.content_type, self._allowed_mime_types)
+        ext = safe_extension(content_type)
+        temp_path = self._root / f".upload-{capture_id}-{uuid.uuid4().hex}{ext}"
+
+        executor = self._io_executor()
+        loop = asyncio.get_running_loop()
+        handle: BinaryIO | None = None
+        stored = False
         try:
-            with temp_path.open("wb") as f:
-                while True:
-                    chunk = await upload.read(self._chunk_size)
-                    if not chunk:
-                        break
-                    bytes_written += len(chunk)
-                    if bytes_written > self._max_upload_bytes:
-                        raise AppError(
-                            code="file_too_large",
-                            message="Uploaded file exceeds size limit.",
-                            status_code=413,
-                            details={"max_bytes": self._max_upload_bytes},
-                        )
-                    f.write(chunk)
-                f.flush()
-                os.fsync(f.fileno())
-            temp_path.replace(out_path)
-            success = True
+            handle = await loop.run_in_executor(executor, temp_path.open, "wb")
+            bytes_written, sha256 = await self._write_upload(upload, handle)
+            relative_path = blob_relative_path(sha256, ext)
+            blob_path = self._root / relative_path
+            if await loop.run_in_executor(executor, blob_path.exists):
+                return StoredMedia(
+                    path=relative_path,
+                    mime=content_type,
+                    bytes_written=bytes_written,
+                    sha256=sha256,
+                    deduplicated=True,
+                )
+            if self._durability != "none":
+                await loop.run_in_executor(executor, _flush_and_fsync, handle)
+            await loop.run_in_executor(executor, handle.close)
+            handle = None
+            changed_dirs = await loop.run_in_executor(
+                executor, _make_blob_dirs, self._root, blob_path.parent
+            )
+            await loop.run_in_executor(executor, temp_path.replace, blob_path)
+            stored = True
+            await self._sync_directories(changed_dirs)
         except AppError:
             raise
         except Exception as exc:  # noqa: BLE001
@@ -72,24 +150,141 @@ class LocalMediaStorage:
                 status_code=400,
             ) from exc
         finally:
-            if not success and temp_path.exists():
-                temp_path.unlink(missing_ok=True)
+            if handle is not None:
+                with contextlib.suppress(OSError):
+                    await loop.run_in_executor(executor, handle.close)
+            if not stored:
+                await loop.run_in_executor(executor, _unlink_quietly, temp_path)
 
         # Return a relative path suitable for URL building.
-        return StoredMedia(path=filename, mime=content_type, bytes_written=bytes_written)
+        return StoredMedia(
+            path=relative_path, mime=content_type, bytes_written=bytes_written, sha256=sha256
+        )
+
+    async def presign_capture_upload(
+        self,
+        capture_id: uuid.UUID,
+        *,
+        sha256: str,
+        size_bytes: int,
+        content_type: str,
+        now: dt.datetime,
+    ) -> PresignedUpload:
+        raise AppError(
+            code="presigned_upload_unavailable",
+            message="Direct uploads need the s3 media storage backend.",
+            status_code=409,
+        )
+
+    async def stat_blob(self, relative_path: str) -> StoredBlob | None:
+        path = self._blob_path(relative_path)
+        try:
+            stat = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor(), path.stat
+            )
+        except FileNotFoundError:
+            return None
+        return StoredBlob(size_bytes=stat.st_size, mime=None)
+
+    async def delete_blob(self, relative_path: str) -> None:
+        """Remove an unreferenced blob and its variants (garbage collection).
+
+        Missing files are ignored.
+        """
+        path = self._blob_path(relative_path)
+        loop = asyncio.get_running_loop()
+        executor = self._io_executor()
+        await loop.run_in_executor(executor, _unlink_quietly, path)
+        variants = self._root / VARIANT_DIR / path.relative_to(self._root).with_suffix("")
+        await loop.run_in_executor(executor, functools.partial(shutil.rmtree, variants, True))
+
+    def _blob_path(self, relative_path: str) -> Path:
+        path = (self._root / relative_path).resolve()
+        if not path.is_relative_to(self._root / BLOB_DIR):
+            raise ValueError(f"not a blob path: {relative_path}")
+        return path
+
+    async def _write_upload(self, upload: UploadFile, handle: BinaryIO) -> tuple[int, str]:
+        """Stream `upload` into `handle`, hashing as it goes; returns (size, sha256 hex).
+
+        Reading and writing overlap through a queue; nothing is fsynced here.
+        """
+        executor = self._io_executor()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_WRITE_QUEUE_CHUNKS)
+        hasher = hashlib.sha256()
+
+        async def _drain() -> None:
+            error: BaseException | None = None
+            # Keep consuming after a failed write so the producer never blocks on put().
+            while (chunk := await queue.get()) is not None:
+                if error is None:
+                    try:
+                        await loop.run_in_executor(
+                            executor, _hash_and_write, hasher, handle, chunk
+                        )
+                    except OSError as exc:
+                        error = exc
+            if error is not None:
+                raise error
+
+        writer = asyncio.create_task(_drain())
+        bytes_written = 0
+        try:
+            while True:
+                chunk = await upload.read(self._chunk_size)
+                if not chunk:
+                    break
+                bytes_written += len(chunk)
+                check_upload_size(bytes_written, self._max_upload_bytes)
+                await queue.put(chunk)
+        finally:
+            # The writer always drains to the sentinel, so this put cannot block for good.
+            await queue.put(None)
+            await writer
+        return bytes_written, hasher.hexdigest()
+
+    async def _sync_directories(self, paths: list[Path]) -> None:
+        if self._durability == "fsync":
+            loop = asyncio.get_running_loop()
+            executor = self._io_executor()
+            for path in paths:
+                await loop.run_in_executor(executor, _fsync_directory, path)
+        elif self._durability == "batched" and self._dir_syncer is not None:
+            await self._dir_syncer.sync(paths)
+
+
+def _hash_and_write(hasher: hashlib._Hash, handle: BinaryIO, chunk: bytes) -> None:
+    hasher.update(chunk)
+    handle.write(chunk)
+
+
+def _flush_and_fsync(handle: BinaryIO) -> None:
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+def _make_blob_dirs(root: Path, directory: Path) -> list[Path]:
+    """Create `directory` (and parents); returns the directories whose entries changed."""
+    changed = [directory]
+    missing: list[Path] = []
+    current = directory
+    while current != root and not current.exists():
+        missing.append(current)
+        current = current.parent
+    for path in reversed(missing):
+        path.mkdir(exist_ok=True)
+        changed.append(path.parent)
+    return changed
 
 
-def _safe_extension(content_type: str | None) -> str:
-    if content_type == "image/jpeg":
-        return ".jpg"
-    if content_type == "image/png":
-        return ".png"
-    if content_type == "image/webp":
-        return ".webp"
-    return ""
+def _fsync_directory(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
-def _normalize_content_type(content_type: str | None) -> str | None:
-    if not content_type:
-        return None
-    return content_type.split(";", 1)[0].strip().lower()
+def _unlink_quietly(path: Path) -> None:
+    path.unlink(missing_ok=True)
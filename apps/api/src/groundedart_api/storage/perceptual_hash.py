@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+from PIL import Image, ImageOps
+
+PHASH_SIZE = 32
+PHASH_LOW_FREQUENCIES = 8
+PHASH_BITS = PHASH_LOW_FREQUENCIES * PHASH_LOW_FREQUENCIES
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    # Orthonormal DCT-II basis: dct(x) == M @ x, so the 2-D DCT is M @ X @ M.T.
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] *= 1 / np.sqrt(2)
+    return matrix * np.sqrt(2 / size)
+
+
+_DCT = _dct_matrix(PHASH_SIZE)
+
+
+def phash(image: Image.Image) -> int:
+    """64-bit DCT perceptual hash of `image`.
+
+    The image is reduced to 32x32 greyscale, and each of the 8x8 lowest DCT frequencies
+    becomes one bit: set when above the median. Recompression, resizing, small colour
+    changes and light crops move only a few bits, so near-duplicates are hashes within a
+    small Hamming distance.
+    """
+    grey = image.convert("L").resize((PHASH_SIZE, PHASH_SIZE), Image.Resampling.LANCZOS)
+    pixels = np.asarray(grey, dtype=np.float64)
+    low = (_DCT @ pixels @ _DCT.T)[:PHASH_LOW_FREQUENCIES, :PHASH_LOW_FREQUENCIES].ravel()
+    # The DC term is overall brightness, not structure; keep it out of the median.
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def image_phash(media_root: str, source_path: str) -> int:
+    """`phash` of a stored image; runs in a media pipeline worker process.
+
+    JPEGs are decoded at a reduced DCT scale since only a 32x32 thumbnail is needed.
+    """
+    root = os.path.realpath(media_root)
+    source = os.path.realpath(os.path.join(root, source_path.lstrip("/")))
+    if os.path.commonpath([root, source]) != root:
+        raise ValueError(f"source outside media root: {source_path}")
+    with Image.open(source) as image:
+        image.draft("L", (PHASH_SIZE * 2, PHASH_SIZE * 2))
+        return phash(ImageOps.exif_transpose(image))
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def to_signed64(value: int) -> int:
+    """Unsigned 64-bit hash as the signed value a Postgres BIGINT can hold."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def from_signed64(value: int) -> int:
+    """Stored BIGINT back to the unsigned 64-bit hash; inverse of `to_signed64`."""
+    return value & ((1 << 64) - 1)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import dataclasses
+import datetime as dt
+import hashlib
+import uuid
+from urllib.parse import quote, urlsplit
+
+import httpx
+from fastapi import UploadFile
+
+from groundedart_api.domain.errors import AppError
+from groundedart_api.settings import Settings
+from groundedart_api.storage.base import (
+    BLOB_DIR,
+    PresignedUpload,
+    StoredBlob,
+    StoredMedia,
+    blob_relative_path,
+    check_sha256,
+    check_upload_content_type,
+    check_upload_size,
+    safe_extension,
+)
+from groundedart_api.storage.s3_signing import (
+    EMPTY_PAYLOAD_SHA256,
+    S3Credentials,
+    presign_url,
+    sign_request_headers,
+)
+from groundedart_api.time import utcnow
+
+_CHUNK_SIZE = 256 * 1024
+
+
+class S3MediaStorage:
+    """Content-addressed capture images in an S3-compatible bucket (S3, MinIO, R2, ...).
+
+    Keys match `LocalMediaStorage` paths, so `image_path`, refcounts and GC work the same.
+    Clients normally upload straight to the bucket with a presigned PUT: the URL signs
+    Content-Type, Content-Length and x-amz-checksum-sha256, so the store rejects any
+    bytes other than the ones the API approved and the API only handles metadata.
+    Multipart uploads through the API still work: they are buffered (bounded by
+    `upload_max_bytes`), hashed, and PUT with the hash as the signed payload checksum.
+    """
+
+    def __init__(self, settings: Settings, *, client: httpx.AsyncClient | None = None) -> None:
+        self._endpoint = settings.s3_endpoint_url.rstrip("/")
+        self._bucket = settings.s3_bucket
+        self._path_style = settings.s3_force_path_style
+        self._credentials = S3Credentials(
+            access_key_id=settings.s3_access_key_id,
+            secret_access_key=settings.s3_secret_access_key,
+            region=settings.s3_region,
+        )
+        self._presign_expires_seconds = settings.s3_presign_expires_seconds
+        self._allowed_mime_types = {mime.lower() for mime in settings.upload_allowed_mime_types}
+        self._max_upload_bytes = settings.upload_max_bytes
+        self._timeout_seconds = settings.s3_timeout_seconds
+        self._client = client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def save_capture_image(self, capture_id: uuid.UUID, upload: UploadFile) -> StoredMedia:
+        content_type = check_upload_content_type(upload.content_type, self._allowed_mime_types)
+        body = bytearray()
+        try:
+            while chunk := await upload.read(_CHUNK_SIZE):
+                body.extend(chunk)
+                check_upload_size(len(body), self._max_upload_bytes)
+        except AppError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise AppError(
+                code="upload_incomplete",
+                message="Upload interrupted before completion.",
+                status_code=400,
+            ) from exc
+
+        sha256 = await asyncio.to_thread(_sha256_hex, body)
+        relative_path = blob_relative_path(sha256, safe_extension(content_type))
+        stored = StoredMedia(
+            path=relative_path, mime=content_type, bytes_written=len(body), sha256=sha256
+        )
+        if await self.stat_blob(relative_path) is not None:
+            return dataclasses.replace(stored, deduplicated=True)
+        response = await self._request(
+            "PUT",
+            relative_path,
+            headers={
+                "content-type": content_type,
+                "content-length": str(len(body)),
+                "x-amz-checksum-sha256": _checksum_header(sha256),
+            },
+            content=bytes(body),
+            payload_sha256=sha256,
+        )
+        _raise_for_status(response)
+        return stored
+
+    async def presign_capture_upload(
+        self,
+        capture_id: uuid.UUID,
+        *,
+        sha256: str,
+        size_bytes: int,
+        content_type: str,
+        now: dt.datetime,
+    ) -> PresignedUpload:
+        content_type = check_upload_content_type(content_type, self._allowed_mime_types)
+        check_upload_size(size_bytes, self._max_upload_bytes)
+        sha256 = check_sha256(sha256)
+        relative_path = blob_relative_path(sha256, safe_extension(content_type))
+        if await self.stat_blob(relative_path) is not None:
+            return PresignedUpload(path=relative_path, upload_required=False)
+
+        headers = {
+            "content-type": content_type,
+            "content-length": str(size_bytes),
+            "x-amz-checksum-sha256": _checksum_header(sha256),
+        }
+        url = presign_url(
+            self._credentials,
+            method="PUT",
+            url=self._object_url(relative_path),
+            expires_seconds=self._presign_expires_seconds,
+            now=now,
+            headers=headers,
+        )
+        return PresignedUpload(
+            path=relative_path,
+            upload_required=True,
+            url=url,
+            headers=headers,
+            expires_at=now + dt.timedelta(seconds=self._presign_expires_seconds),
+        )
+
+    async def stat_blob(self, relative_path: str) -> StoredBlob | None:
+        response = await self._request("HEAD", _check_blob_key(relative_path))
+        if response.status_code == 404:
+            return None
+        _raise_for_status(response)
+        return StoredBlob(
+            size_bytes=int(response.headers.get("content-length", "0")),
+            mime=response.headers.get("content-type"),
+        )
+
+    async def delete_blob(self, relative_path: str) -> None:
+        """Remove an unreferenced blob (garbage collection); missing objects are ignored."""
+        response = await self._request("DELETE", _check_blob_key(relative_path))
+        if response.status_code != 404:
+            _raise_for_status(response)
+
+    def _object_url(self, key: str) -> str:
+        quoted = quote(key, safe="/-_.~")
+        if self._path_style:
+            return f"{self._endpoint}/{self._bucket}/{quoted}"
+        parts = urlsplit(self._endpoint)
+        return f"{parts.scheme}://{self._bucket}.{parts.netloc}/{quoted}"
+
+    async def _request(
+        self,
+        method: str,
+        key: str,
+        *,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        payload_sha256: str = EMPTY_PAYLOAD_SHA256,
+    ) -> httpx.Response:
+        url = self._object_url(key)
+        signed = sign_request_headers(
+            self._credentials,
+            method=method,
+            url=url,
+            headers=headers or {},
+            payload_sha256=payload_sha256,
+            now=utcnow(),
+        )
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._timeout_seconds)
+        try:
+            return await self._client.request(method, url, headers=signed, content=content)
+        except httpx.HTTPError as exc:
+            raise _storage_unavailable() from exc
+
+
+def _check_blob_key(relative_path: str) -> str:
+    key = relative_path.lstrip("/")
+    if not key.startswith(f"{BLOB_DIR}/") or ".." in key.split("/"):
+        raise ValueError(f"not a blob path: {relative_path}")
+    return key
+
+
+def _sha256_hex(data: bytes | bytearray) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _checksum_header(sha256: str) -> str:
+    return base64.b64encode(bytes.fromhex(sha256)).decode("ascii")
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.is_error:
+        raise _storage_unavailable(status=response.status_code)
+
+
+def _storage_unavailable(*, status: int | None = None) -> AppError:
+    return AppError(
+        code="media_storage_unavailable",
+        message="Media storage request failed.",
+        status_code=503,
+        details={"upstream_status": status} if status is not None else None,
+    )
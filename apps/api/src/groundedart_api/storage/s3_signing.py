@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import hmac
+from dataclasses import dataclass
+from urllib.parse import parse_qsl, quote, urlsplit
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+EMPTY_PAYLOAD_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+@dataclass(frozen=True)
+class S3Credentials:
+    access_key_id: str
+    secret_access_key: str
+    region: str
+    service: str = "s3"
+
+
+def sign_request_headers(
+    credentials: S3Credentials,
+    *,
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    payload_sha256: str,
+    now: dt.datetime,
+) -> dict[str, str]:
+    """AWS Signature V4 (Authorization header); returns `headers` plus the auth headers.
+
+    `url` must already be URI-encoded; its path is signed as-is.
+    """
+    amz_date = _amz_date(now)
+    signed = {
+        **{name.lower(): value for name, value in headers.items()},
+        "host": _host(url),
+        "x-amz-date": amz_date,
+        "x-amz-content-sha256": payload_sha256,
+    }
+    scope = _scope(credentials, now)
+    signed_names, canonical = _canonical_request(
+        method, url, signed, payload_sha256, extra_query=None
+    )
+    signature = _signature(credentials, now, scope, amz_date, canonical)
+    authorization = (
+        f"{ALGORITHM} Credential={credentials.access_key_id}/{scope}, "
+        f"SignedHeaders={signed_names}, Signature={signature}"
+    )
+    return {**signed, "authorization": authorization}
+
+
+def presign_url(
+    credentials: S3Credentials,
+    *,
+    method: str,
+    url: str,
+    expires_seconds: int,
+    now: dt.datetime,
+    headers: dict[str, str] | None = None,
+) -> str:
+    """AWS Signature V4 query-string presigned URL.
+
+    Every header in `headers` is signed, so the client must send exactly those values
+    (e.g. Content-Type, Content-Length, x-amz-checksum-sha256) or the store rejects the
+    request.
+    """
+    amz_date = _amz_date(now)
+    scope = _scope(credentials, now)
+    signed = {
+        **{name.lower(): value for name, value in (headers or {}).items()},
+        "host": _host(url),
+    }
+    query = {
+        "X-Amz-Algorithm": ALGORITHM,
+        "X-Amz-Credential": f"{credentials.access_key_id}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires_seconds),
+        "X-Amz-SignedHeaders": ";".join(sorted(signed)),
+    }
+    _names, canonical = _canonical_request(
+        method, url, signed, UNSIGNED_PAYLOAD, extra_query=query
+    )
+    signature = _signature(credentials, now, scope, amz_date, canonical)
+    separator = "&" if urlsplit(url).query else "?"
+    return f"{url}{separator}{_canonical_query(query)}&X-Amz-Signature={signature}"
+
+
+def _canonical_request(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    payload_sha256: str,
+    *,
+    extra_query: dict[str, str] | None,
+) -> tuple[str, str]:
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update(extra_query or {})
+    names = sorted(headers)
+    canonical_headers = "".join(f"{name}:{' '.join(headers[name].split())}\n" for name in names)
+    signed_names = ";".join(names)
+    canonical = "\n".join(
+        (
+            method.upper(),
+            parts.path or "/",
+            _canonical_query(query),
+            canonical_headers,
+            signed_names,
+            payload_sha256,
+        )
+    )
+    return signed_names, canonical
+
+
+def _canonical_query(query: dict[str, str]) -> str:
+    return "&".join(
+        f"{quote(key, safe='-_.~')}={quote(value, safe='-_.~')}"
+        for key, value in sorted(query.items())
+    )
+
+
+def _signature(
+    credentials: S3Credentials, now: dt.datetime, scope: str, amz_date: str, canonical: str
+) -> str:
+    string_to_sign = "\n".join(
+        (ALGORITHM, amz_date, scope, hashlib.sha256(canonical.encode()).hexdigest())
+    )
+    key = f"AWS4{credentials.secret_access_key}".encode()
+    for part in (_date_stamp(now), credentials.region, credentials.service, "aws4_request"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+
+def _scope(credentials: S3Credentials, now: dt.datetime) -> str:
+    return f"{_date_stamp(now)}/{credentials.region}/{credentials.service}/aws4_request"
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc
+
+
+def _amz_date(now: dt.datetime) -> str:
+    return now.astimezone(dt.UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _date_stamp(now: dt.datetime) -> str:
+    return now.astimezone(dt.UTC).strftime("%Y%m%d")
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import asyncio
+import mimetypes
+import os
+import posixpath
+import stat
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from groundedart_api.observability import metrics
+from groundedart_api.settings import Settings
+from groundedart_api.storage.base import BLOB_DIR
+from groundedart_api.storage.variants import VARIANT_DIR
+
+IMMUTABLE_MAX_AGE_SECONDS = 365 * 24 * 60 * 60
+# Paths whose bytes never change: blobs are named by their SHA-256 and variants live under
+# the blob path they were rendered from.
+_IMMUTABLE_PREFIXES = (f"{BLOB_DIR}/", f"{VARIANT_DIR}/{BLOB_DIR}/")
+# Variant siblings of one width bucket, best first; see storage/variants.py.
+_NEGOTIATED_TYPES = (("image/avif", ".avif"), ("image/webp", ".webp"))
+_NEGOTIABLE_SUFFIXES = {".avif", ".webp", ".jpg"}
+_MEDIA_TYPES = {".avif": "image/avif", ".webp": "image/webp", ".jpg": "image/jpeg"}
+_CHUNK_SIZE = 256 * 1024
+
+
+@dataclass(frozen=True)
+class _ResolvedFile:
+    relative_path: str
+    path: str
+    stat_result: os.stat_result
+
+
+class MediaFiles:
+    """Serves MEDIA_DIR at /media in place of `StaticFiles`.
+
+    Built so repeat image traffic stops at the browser or CDN: content-addressed paths
+    (`blobs/...` and their variants) and `?v=` URLs are `immutable` for a year, other
+    files get a short max-age, and every response carries a strong ETag (the SHA-256 for
+    blobs) so revalidations are 304s. Single byte ranges are honoured. Requests for a
+    variant are answered with its AVIF or WebP sibling when `Accept` lists that type.
+
+    File bodies go out without passing through Python where the stack allows it: behind
+    nginx (`media_accel_redirect_prefix`) via X-Accel-Redirect, otherwise through the
+    ASGI zero-copy or path-send extensions when the server offers them.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self._root = os.path.realpath(settings.media_dir)
+        self._max_age_seconds = settings.media_cache_max_age_seconds
+        self._accel_redirect_prefix = settings.media_accel_redirect_prefix
+
+    async def serve(self, path: str, request: Request) -> Response:
+        relative_path = _clean_relative_path(path)
+        candidates = _negotiated_candidates(relative_path, request.headers.get("accept"))
+        resolved = (
+            await asyncio.to_thread(self._resolve, candidates) if relative_path else None
+        )
+        if resolved is None:
+            metrics.media_responses_total.labels(outcome="not_found").inc()
+            return PlainTextResponse("Not Found", status_code=404)
+
+        headers = self._headers(resolved, request, negotiable=_is_negotiable(relative_path))
+        if _not_modified(request.headers, headers, resolved.stat_result):
+            metrics.media_responses_total.labels(outcome="not_modified").inc()
+            kept = ("etag", "cache-control", "vary", "last-modified")
+            return Response(
+                status_code=304, headers={name: headers[name] for name in kept if name in headers}
+            )
+        send_body = request.method != "HEAD"
+
+        if self._accel_redirect_prefix:
+            # nginx serves the internal location with sendfile and handles Range itself.
+            metrics.media_responses_total.labels(outcome="offloaded").inc()
+            prefix = self._accel_redirect_prefix.rstrip("/")
+            headers["x-accel-redirect"] = f"{prefix}/{resolved.relative_path}"
+            del headers["content-length"]
+            return Response(status_code=200, headers=headers)
+
+        size = resolved.stat_result.st_size
+        byte_range = _requested_range(request.headers, headers, size)
+        if byte_range == "unsatisfiable":
+            metrics.media_responses_total.labels(outcome="range_not_satisfiable").inc()
+            return Response(status_code=416, headers={"content-range": f"bytes */{size}"})
+        if byte_range is None:
+            metrics.media_responses_total.labels(outcome="full").inc()
+            return MediaFileResponse(
+                resolved.path, start=0, end=size, headers=headers, send_body=send_body
+            )
+        start, end = byte_range
+        headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+        headers["content-length"] = str(end - start)
+        metrics.media_responses_total.labels(outcome="partial").inc()
+        return MediaFileResponse(
+            resolved.path,
+            start=start,
+            end=end,
+            status_code=206,
+            headers=headers,
+            send_body=send_body,
+        )
+
+    def _resolve(self, candidates: list[str]) -> _ResolvedFile | None:
+        for relative_path in candidates:
+            path = os.path.realpath(os.path.join(self._root, relative_path))
+            if os.path.commonpath([self._root, path]) != self._root:
+                continue
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(stat_result.st_mode):
+                return _ResolvedFile(relative_path, path, stat_result)
+        return None
+
+    def _headers(
+        self, resolved: _ResolvedFile, request: Request, *, negotiable: bool
+    ) -> dict[str, str]:
+        stat_result = resolved.stat_result
+        if resolved.relative_path.startswith(_IMMUTABLE_PREFIXES) or "v" in request.query_params:
+            cache_control = f"public, max-age={IMMUTABLE_MAX_AGE_SECONDS}, immutable"
+        else:
+            cache_control = f"public, max-age={self._max_age_seconds}"
+        headers = {
+            "content-type": _media_type(resolved.relative_path),
+            "content-length": str(stat_result.st_size),
+            "etag": _strong_etag(resolved.relative_path, stat_result),
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": cache_control,
+            "accept-ranges": "bytes",
+        }
+        if negotiable:
+            headers["vary"] = "Accept"
+        return headers
+
+
+class MediaFileResponse(Response):
+    """`[start, end)` of a file, sent zero-copy when the ASGI server supports it."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        start: int,
+        end: int,
+        headers: dict[str, str],
+        status_code: int = 200,
+        send_body: bool = True,
+    ) -> None:
+        self.path = path
+        self.status_code = status_code
+        self.media_type = None
+        self.background = None
+        self.init_headers(headers)
+        self._start = start
+        self._end = end
+        self._send_body = send_body
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers}
+        )
+        extensions = scope.get("extensions") or {}
+        if not self._send_body or self._start == self._end:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopysend" in extensions:
+            file = await asyncio.to_thread(open, self.path, "rb")
+            try:
+                await send(
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": file,
+                        "offset": self._start,
+                        "count": self._end - self._start,
+                        "more_body": False,
+                    }
+                )
+            finally:
+                await asyncio.to_thread(file.close)
+        elif "http.response.pathsend" in extensions and self.status_code == 200:
+            await send({"type": "http.response.pathsend", "path": self.path})
+        else:
+            await self._send_chunks(send)
+
+    async def _send_chunks(self, send: Send) -> None:
+        fd = await asyncio.to_thread(os.open, self.path, os.O_RDONLY)
+        try:
+            position = self._start
+            while position < self._end:
+                size = min(_CHUNK_SIZE, self._end - position)
+                chunk = await asyncio.to_thread(os.pread, fd, size, position)
+                if not chunk:
+                    raise RuntimeError(f"{self.path} is shorter than expected")
+                position += len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": position < self._end,
+                    }
+                )
+        finally:
+            await asyncio.to_thread(os.close, fd)
+
+
+def _clean_relative_path(path: str) -> str:
+    """The request path if it is a plain relative path; "" otherwise.
+
+    Dot segments are refused outright, which also hides in-flight `.upload-*` temp files.
+    """
+    parts = path.split("/")
+    if not path or any(not part or part.startswith(".") for part in parts):
+        return ""
+    return path
+
+
+def _negotiated_candidates(relative_path: str, accept: str | None) -> list[str]:
+    """Files that may answer a request for `relative_path`, best first."""
+    if not _is_negotiable(relative_path):
+        return [relative_path]
+    stem = posixpath.splitext(relative_path)[0]
+    accepted = _accepted_types(accept)
+    candidates = [
+        f"{stem}{candidate_suffix}"
+        for media_type, candidate_suffix in _NEGOTIATED_TYPES
+        if media_type in accepted
+    ]
+    candidates.append(relative_path)
+    return list(dict.fromkeys(candidates))
+
+
+def _is_negotiable(relative_path: str) -> bool:
+    return (
+        relative_path.startswith(f"{VARIANT_DIR}/")
+        and posixpath.splitext(relative_path)[1] in _NEGOTIABLE_SUFFIXES
+    )
+
+
+def _accepted_types(accept: str | None) -> set[str]:
+    # Only types the client names explicitly: "image/*" or "*/*" does not promise AVIF.
+    accepted: set[str] = set()
+    for item in (accept or "").split(","):
+        media_type, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type and quality > 0:
+            accepted.add(media_type.lower())
+    return accepted
+
+
+def _media_type(relative_path: str) -> str:
+    suffix = posixpath.splitext(relative_path)[1].lower()
+    return (
+        _MEDIA_TYPES.get(suffix)
+        or mimetypes.guess_type(relative_path)[0]
+        or "application/octet-stream"
+    )
+
+
+def _strong_etag(relative_path: str, stat_result: os.stat_result) -> str:
+    stem = posixpath.splitext(posixpath.basename(relative_path))[0]
+    if relative_path.startswith(f"{BLOB_DIR}/") and len(stem) == 64:
+        # The file name is the SHA-256 of the bytes.
+        return f'"{stem}"'
+    # Media files are replaced by atomic renames, never rewritten in place, so size plus
+    # mtime identifies the bytes.
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _not_modified(
+    request_headers: Headers, headers: dict[str, str], stat_result: os.stat_result
+) -> bool:
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as RFC 9110 requires for If-None-Match.
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or headers["etag"] in tags
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(stat_result.st_mtime) <= since.timestamp()
+
+
+def _requested_range(
+    request_headers: Headers, headers: dict[str, str], size: int
+) -> tuple[int, int] | str | None:
+    """`(start, end)` for a satisfiable single range, "unsatisfiable", or None (send all).
+
+    Multi-range requests get the whole file, which RFC 9110 allows; image clients only
+    ever ask for one range.
+    """
+    range_header = request_headers.get("range")
+    if range_header is None:
+        return None
+    if_range = request_headers.get("if-range")
+    if if_range is not None and if_range not in (headers["etag"], headers["last-modified"]):
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = min(int(last) + 1, size) if last else size
+        else:
+            start, end = max(size - int(last), 0), size
+    except ValueError:
+        return None
+    if start >= size or start >= end:
+        return "unsatisfiable"
+    return start, end
+
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import errno
+import fcntl
+import os
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from typing import BinaryIO
+
+from groundedart_api.domain.errors import AppError
+from groundedart_api.settings import Settings
+
+_PART_SUFFIX = ".part"
+
+
+class StagedUpload:
+    """An upload session's staging file, held under an exclusive lock.
+
+    The file size is the session offset: only bytes that reached the file count, so a
+    client that disconnects mid-chunk resumes from whatever was written.
+    """
+
+    def __init__(self, path: Path, fd: int, *, fsync: bool) -> None:
+        self.path = path
+        self._fd = fd
+        self._fsync = fsync
+        self.offset = os.fstat(fd).st_size
+
+    async def append(self, chunks: AsyncIterable[bytes], *, length: int) -> int:
+        """Write `chunks` at the current offset; returns the new offset.
+
+        Raises `file_too_large` before writing a chunk that would run past `length`.
+        Bytes written before an error (or a dropped connection) are kept and synced.
+        """
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                if self.offset + len(chunk) > length:
+                    raise AppError(
+                        code="file_too_large",
+                        message="Upload chunk runs past the declared upload length.",
+                        status_code=413,
+                        details={"max_bytes": length, "offset": self.offset},
+                    )
+                await asyncio.to_thread(os.write, self._fd, chunk)
+                self.offset += len(chunk)
+        finally:
+            if self._fsync:
+                await asyncio.to_thread(os.fsync, self._fd)
+        return self.offset
+
+    def open_reader(self) -> BinaryIO:
+        return self.path.open("rb")
+
+
+class UploadStaging:
+    """Partial bytes of resumable uploads, one `<upload id>.part` file per session.
+
+    Staging lives outside `media_dir` so unfinished uploads are never served. Each PATCH
+    takes a non-blocking `flock` on the file, so two writers racing on one session (or
+    a retry overlapping a stalled request) get `upload_locked` instead of interleaving.
+    Expired files are removed by `scripts/expire_upload_sessions.py`.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self._root = Path(settings.upload_staging_dir).resolve()
+        self._fsync = settings.media_durability != "none"
+
+    def path(self, upload_id: uuid.UUID) -> Path:
+        return self._root / f"{upload_id}{_PART_SUFFIX}"
+
+    async def offset(self, upload_id: uuid.UUID) -> int:
+        try:
+            stat = await asyncio.to_thread(self.path(upload_id).stat)
+        except FileNotFoundError:
+            return 0
+        return stat.st_size
+
+    @contextlib.asynccontextmanager
+    async def locked(self, upload_id: uuid.UUID) -> AsyncIterator[StagedUpload]:
+        fd = await asyncio.to_thread(self._open_locked, self.path(upload_id))
+        try:
+            yield StagedUpload(self.path(upload_id), fd, fsync=self._fsync)
+        finally:
+            await asyncio.to_thread(os.close, fd)
+
+    async def delete(self, upload_id: uuid.UUID) -> None:
+        await asyncio.to_thread(self.path(upload_id).unlink, missing_ok=True)
+
+    def sweep(self, *, older_than_seconds: float) -> int:
+        """Delete staging files untouched for `older_than_seconds`; returns the count.
+
+        Catches files whose session row is already gone (e.g. a crash between the row
+        delete and the unlink).
+        """
+        if not self._root.is_dir():
+            return 0
+        cutoff = time.time() - older_than_seconds
+        removed = 0
+        for path in self._root.glob(f"*{_PART_SUFFIX}"):
+            with contextlib.suppress(FileNotFoundError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+        return removed
+
+    def _open_locked(self, path: Path) -> int:
+        self._root.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as exc:
+            os.close(fd)
+            if exc.errno in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EACCES):
+                raise AppError(
+                    code="upload_locked",
+                    message="Another request is writing to this upload.",
+                    status_code=409,
+                ) from exc
+            raise
+        return fd
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import uuid
+from collections.abc import Sequence
+from pathlib import PurePosixPath
+from typing import Any
+
+from PIL import Image, ImageOps
+
+VARIANT_DIR = "variants"
+# Every width bucket gets a WebP (and an AVIF when enabled); the smallest also gets a JPEG
+# thumbnail for clients without WebP support. Media serving picks between the siblings of
+# one bucket by `Accept`.
+VARIANT_FORMATS = {"webp": ".webp", "avif": ".avif", "jpeg": ".jpg"}
+
+
+def variant_relative_path(source_path: str, width: int, fmt: str) -> str:
+    """variants/<source path without extension>/<width>.<ext>.
+
+    Capture sources are content-addressed blobs, so their variants are shared by every
+    capture pointing at the same blob and never go stale.
+    """
+    stem = PurePosixPath(source_path.lstrip("/")).with_suffix("")
+    return f"{VARIANT_DIR}/{stem}/{width}{VARIANT_FORMATS[fmt]}"
+
+
+def render_variants(
+    media_root: str,
+    source_path: str,
+    widths: Sequence[int],
+    *,
+    webp_quality: int,
+    jpeg_quality: int,
+    avif_quality: int | None = None,
+    force: bool = False,
+) -> list[dict[str, Any]]:
+    """Write the size-bucketed variants of one image; runs in a worker process.
+
+    The source is decoded once (JPEGs at a reduced DCT scale when the largest bucket
+    allows it) and every bucket is resized from that decode. Buckets at or above the
+    source width are skipped, so images are never upscaled. Variants already on disk are
+    reused unless `force` is set, which makes re-runs and duplicate blobs cost only a
+    header read. `avif_quality` adds an AVIF per bucket (needs Pillow built with AVIF).
+    Returns the variant records stored on the capture or node row.
+    """
+    root = os.path.realpath(media_root)
+    source = os.path.realpath(os.path.join(root, source_path.lstrip("/")))
+    if os.path.commonpath([root, source]) != root:
+        raise ValueError(f"source outside media root: {source_path}")
+
+    with Image.open(source) as image:
+        # Header only: PIL decodes lazily.
+        transposed = _orientation_swaps_axes(image)
+        source_width, source_height = image.size
+        if transposed:
+            source_width, source_height = source_height, source_width
+        targets = sorted({width for width in widths if width < source_width}) or [source_width]
+        bucket_formats = ("webp", "avif") if avif_quality is not None else ("webp",)
+        records = [
+            _variant_record(source_path, width, fmt, source_width, source_height)
+            for width in targets
+            for fmt in (bucket_formats + ("jpeg",) if width == targets[0] else bucket_formats)
+        ]
+        if not force and all(
+            os.path.exists(os.path.join(root, record["path"])) for record in records
+        ):
+            return records
+
+        largest = targets[-1]
+        draft_size = (largest, largest * source_height // max(source_width, 1))
+        if transposed:
+            draft_size = draft_size[::-1]
+        image.draft("RGB", draft_size)
+        decoded = ImageOps.exif_transpose(image)
+        decoded = decoded.convert("RGBA" if _has_alpha(decoded) else "RGB")
+
+    for record in records:
+        size = (record["w"], record["h"])
+        resized = decoded if decoded.size == size else decoded.resize(
+            size, Image.Resampling.LANCZOS, reducing_gap=2.0
+        )
+        if record["format"] == "webp":
+            _save_atomic(root, record["path"], resized, "WEBP", quality=webp_quality, method=4)
+        elif record["format"] == "avif":
+            _save_atomic(root, record["path"], resized, "AVIF", quality=avif_quality, speed=6)
+        else:
+            _save_atomic(
+                root,
+                record["path"],
+                resized.convert("RGB"),
+                "JPEG",
+                quality=jpeg_quality,
+                optimize=True,
+                progressive=True,
+            )
+    return records
+
+
+def _variant_record(
+    source_path: str, width: int, fmt: str, source_width: int, source_height: int
+) -> dict[str, Any]:
+    height = max(1, round(source_height * width / source_width))
+    return {
+        "w": width,
+        "h": height,
+        "format": fmt,
+        "path": variant_relative_path(source_path, width, fmt),
+    }
+
+
+def _orientation_swaps_axes(image: Image.Image) -> bool:
+    # EXIF orientations 5-8 rotate by 90 degrees.
+    return image.getexif().get(0x0112, 1) in (5, 6, 7, 8)
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+
+
+def _save_atomic(
+    root: str, relative_path: str, image: Image.Image, fmt: str, **params: Any
+) -> None:
+    # Variants are derived data (the backfill can always rebuild them), so no fsync.
+    path = os.path.join(root, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        image.save(temp_path, fmt, **params)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+def build_srcset(variants: list[dict[str, Any]] | None, *, base_media_url: str) -> str | None:
+    """`srcset` attribute value over the WebP variants ("<url> 320w, <url> 640w")."""
+    if not variants:
+        return None
+    base = base_media_url.rstrip("/")
+    entries = [
+        f"{base}/{variant['path']} {variant['w']}w"
+        for variant in sorted(variants, key=lambda item: item["w"])
+        if variant.get("format") == "webp"
+    ]
+    return ", ".join(entries) or None
+
+
+def build_thumbnail_url(
+    variants: list[dict[str, Any]] | None, *, base_media_url: str
+) -> str | None:
+    """URL of the smallest JPEG variant, for list and map previews."""
+    jpegs = [variant for variant in variants or () if variant.get("format") == "jpeg"]
+    if not jpegs:
+        return None
+    smallest = min(jpegs, key=lambda item: item["w"])
+    return f"{base_media_url.rstrip('/')}/{smallest['path']}"
@@ -105,8 +105,10 @@ async def reset_db(db_sessionmaker):
     async with db_sessionmaker() as session:
         await session.execute(
             text(
-                "TRUNCATE abuse_events, capture_events, content_reports, captures, "
-                "checkin_tokens, checkin_challenges, curator_rank_cache, curator_rank_daily, "
+                "TRUNCATE abuse_events, abuse_event_rollups, capture_events, content_reports, "
+                "event_outbox, media_blobs, "
+                "captures, checkin_tokens, checkin_challenges, curator_rank_cache, "
+                "curator_rank_daily, "
                 "tip_receipts, tip_intents, nodes, artists, rank_events, devices, sessions, users "
                 "RESTART IDENTITY CASCADE"
             )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from groundedart_api.db.models import AbuseEvent, utcnow
+from groundedart_api.domain.abuse_events import AbuseEventWriter
+from groundedart_api.settings import get_settings
+
+
+def _row(event_type: str) -> dict[str, object]:
+    return {
+        "id": uuid.uuid4(),
+        "event_type": event_type,
+        "user_id": None,
+        "node_id": None,
+        "capture_id": None,
+        "details": {"source": "test"},
+        "created_at": utcnow(),
+    }
+
+
+@pytest.mark.asyncio
+async def test_abuse_event_writer_batches_drops_overflow_and_drains_on_stop(
+    db_sessionmaker,
+) -> None:
+    writer = AbuseEventWriter(
+        database_url=get_settings().database_url,
+        max_buffered=3,
+        flush_rows=2,
+        flush_seconds=60.0,
+    )
+    assert not writer.running
+    writer.start()
+    assert writer.running
+
+    accepted = [writer.enqueue(_row("outside_geofence")) for _ in range(4)]
+    # The size threshold only wakes the flusher; it has not run yet, so the 4th is dropped.
+    assert accepted == [True, True, True, False]
+
+    await writer.stop()
+    assert not writer.running
+    assert writer.buffered == 0
+
+    async with db_sessionmaker() as session:
+        count = await session.scalar(
+            select(func.count())
+            .select_from(AbuseEvent)
+            .where(AbuseEvent.event_type == "outside_geofence")
+        )
+    assert count == 3
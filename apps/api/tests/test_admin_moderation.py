@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import csv
 import datetime as dt
+import gzip
+import io
+import json
 from pathlib import Path
 import uuid
 
@@ -15,10 +19,14 @@ from groundedart_api.db.models import (
     Capture,
     CaptureEvent,
     CheckinToken,
+    CuratorRankCache,
+    CuratorRankEvent,
     Node,
     User,
+    UserNotification,
     utcnow,
 )
+from groundedart_api.domain.abuse_stats import refresh_abuse_event_rollups
 from groundedart_api.settings import get_settings
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -136,6 +144,146 @@ async def test_admin_transition_updates_capture_and_audit(db_sessionmaker, clien
         assert event.actor_type == "admin"
 
 
+@pytest.mark.asyncio
+async def test_admin_batch_transition_applies_all_items_in_one_transaction(
+    db_sessionmaker, client: AsyncClient
+) -> None:
+    verified_id = await create_pending_capture(db_sessionmaker, client)
+    rejected_id = await create_pending_capture(db_sessionmaker, client)
+    settings = get_settings()
+
+    response = await client.post(
+        "/v1/admin/captures:batchTransition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={
+            "items": [
+                {
+                    "capture_id": str(verified_id),
+                    "target_state": "verified",
+                    "reason_code": "manual_review_pass",
+                },
+                {
+                    "capture_id": str(rejected_id),
+                    "target_state": "rejected",
+                    "reason_code": "manual_review_reject",
+                },
+            ]
+        },
+    )
+    assert response.status_code == 200
+    states = {capture["id"]: capture["state"] for capture in response.json()["captures"]}
+    assert states == {str(verified_id): "verified", str(rejected_id): "rejected"}
+
+    async with db_sessionmaker() as session:
+        verified = await session.get(Capture, verified_id)
+        assert verified is not None
+        events = (
+            await session.scalars(
+                select(CaptureEvent).where(
+                    CaptureEvent.capture_id.in_([verified_id, rejected_id]),
+                    CaptureEvent.event_type == "state_transition",
+                    CaptureEvent.actor_type == "admin",
+                )
+            )
+        ).all()
+        assert {(event.capture_id, event.to_state) for event in events} == {
+            (verified_id, "verified"),
+            (rejected_id, "rejected"),
+        }
+        notifications = (
+            await session.scalars(
+                select(UserNotification).where(UserNotification.user_id == verified.user_id)
+            )
+        ).all()
+        assert [notification.event_type for notification in notifications] == [
+            "capture_verified"
+        ]
+        rank_events = (
+            await session.scalars(
+                select(CuratorRankEvent).where(CuratorRankEvent.capture_id == verified_id)
+            )
+        ).all()
+        assert len(rank_events) == 1
+        cache = await session.get(CuratorRankCache, (verified.user_id, "v1_points"))
+        assert cache is not None
+        assert cache.points_total == 1
+
+    # Re-verifying is invalid, so the whole batch is rejected and the hide is not applied.
+    response = await client.post(
+        "/v1/admin/captures:batchTransition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={
+            "items": [
+                {
+                    "capture_id": str(rejected_id),
+                    "target_state": "hidden",
+                    "reason_code": "manual_review_hide",
+                },
+                {"capture_id": str(verified_id), "target_state": "verified"},
+            ]
+        },
+    )
+    assert response.status_code == 400
+    payload = response.json()
+    assert payload["error"]["code"] == "capture_batch_transition_invalid"
+    assert payload["error"]["details"]["failures"] == [
+        {
+            "capture_id": str(verified_id),
+            "code": "invalid_capture_state_transition",
+            "message": payload["error"]["details"]["failures"][0]["message"],
+        }
+    ]
+    async with db_sessionmaker() as session:
+        rejected = await session.get(Capture, rejected_id)
+        assert rejected is not None
+        assert rejected.state == "rejected"
+
+
+@pytest.mark.asyncio
+async def test_admin_claims_disjoint_leases_from_the_queue(
+    db_sessionmaker, client: AsyncClient
+) -> None:
+    capture_ids = [await create_pending_capture(db_sessionmaker, client) for _ in range(3)]
+    settings = get_settings()
+    admin_headers = {"X-Admin-Token": settings.admin_api_token}
+
+    missing_moderator = await client.post("/v1/admin/captures/claim?n=1", headers=admin_headers)
+    assert missing_moderator.status_code == 400
+    assert missing_moderator.json()["error"]["code"] == "moderator_id_required"
+
+    alice = {**admin_headers, "X-Moderator-Id": "alice"}
+    bob = {**admin_headers, "X-Moderator-Id": "bob"}
+    first = await client.post("/v1/admin/captures/claim?n=2", headers=alice)
+    assert first.status_code == 200
+    alice_ids = [lease["capture"]["id"] for lease in first.json()["leases"]]
+    assert alice_ids == [str(capture_id) for capture_id in capture_ids[:2]]
+
+    second = await client.post("/v1/admin/captures/claim?n=5", headers=bob)
+    assert second.status_code == 200
+    payload = second.json()
+    assert [lease["capture"]["id"] for lease in payload["leases"]] == [str(capture_ids[2])]
+    assert payload["queue_depth"] == {"unclaimed": 0, "leased": 3}
+
+    foreign_renew = await client.post(
+        "/v1/admin/captures/leases:renew", headers=bob, json={"capture_ids": alice_ids}
+    )
+    assert foreign_renew.status_code == 200
+    assert foreign_renew.json()["leases"] == []
+
+    release = await client.post(
+        "/v1/admin/captures/leases:release", headers=alice, json={"capture_ids": alice_ids[:1]}
+    )
+    assert release.status_code == 200
+    assert release.json()["released"] == alice_ids[:1]
+
+    queue = await client.get("/v1/admin/captures/queue?limit=1", headers=admin_headers)
+    assert queue.status_code == 200
+    queue_payload = queue.json()
+    assert [capture["id"] for capture in queue_payload["captures"]] == alice_ids[:1]
+    assert queue_payload["next_cursor"] is None
+    assert queue_payload["queue_depth"] == {"unclaimed": 1, "leased": 2}
+
+
 @pytest.mark.asyncio
 async def test_admin_lists_abuse_events(db_sessionmaker, client: AsyncClient) -> None:
     settings = get_settings()
@@ -176,3 +324,154 @@ async def test_admin_lists_abuse_events(db_sessionmaker, client: AsyncClient) ->
     payload = response.json()
     assert payload["events"]
     assert payload["events"][0]["event_type"] == "capture_rate_limited"
+
+
+@pytest.mark.asyncio
+async def test_admin_exports_abuse_events_as_ndjson_and_gzipped_csv(
+    db_sessionmaker, client: AsyncClient
+) -> None:
+    settings = get_settings()
+    headers = {"X-Admin-Token": settings.admin_api_token}
+    user_id = uuid.uuid4()
+    other_user_id = uuid.uuid4()
+    async with db_sessionmaker() as session:
+        session.add_all([User(id=user_id), User(id=other_user_id)])
+        await session.commit()
+
+    base = utcnow() - dt.timedelta(minutes=10)
+    async with db_sessionmaker() as session:
+        for index in range(3):
+            session.add(
+                AbuseEvent(
+                    event_type="capture_rate_limited",
+                    user_id=user_id,
+                    details={"index": index},
+                    created_at=base + dt.timedelta(seconds=index),
+                )
+            )
+        session.add(AbuseEvent(event_type="checkin_too_far", user_id=other_user_id))
+        await session.commit()
+
+    response = await client.get(
+        "/v1/admin/export/abuse_events",
+        params={"user_id": str(user_id)},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["details"]["index"] for row in rows] == [0, 1, 2]
+    assert {row["user_id"] for row in rows} == {str(user_id)}
+
+    response = await client.get(
+        "/v1/admin/export/abuse_events",
+        params={"format": "csv", "gzip": "true", "event_type": "checkin_too_far"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    reader = csv.DictReader(io.StringIO(gzip.decompress(response.content).decode("utf-8")))
+    csv_rows = list(reader)
+    assert len(csv_rows) == 1
+    assert csv_rows[0]["user_id"] == str(other_user_id)
+
+    empty = await client.get(
+        "/v1/admin/export/rank_events",
+        params={"capture_id": str(uuid.uuid4())},
+        headers=headers,
+    )
+    assert empty.status_code == 200
+    assert empty.text == ""
+    unknown = await client.get("/v1/admin/export/users", headers=headers)
+    assert unknown.status_code == 404
+    assert unknown.json()["error"]["code"] == "export_table_not_found"
+    invalid = await client.get(
+        "/v1/admin/export/content_reports",
+        params={"event_type": "capture_rate_limited"},
+        headers=headers,
+    )
+    assert invalid.status_code == 400
+    assert invalid.json()["error"]["code"] == "invalid_export_filter"
+
+
+@pytest.mark.asyncio
+async def test_admin_abuse_stats_buckets_top_groups_from_raw_and_rollup(
+    db_sessionmaker, client: AsyncClient
+) -> None:
+    settings = get_settings()
+    noisy_user = uuid.uuid4()
+    quiet_user = uuid.uuid4()
+    base = dt.datetime(2026, 10, 18, 12, 0, tzinfo=dt.UTC)
+    async with db_sessionmaker() as session:
+        session.add_all([User(id=noisy_user), User(id=quiet_user)])
+        await session.flush()
+        for minute in (0, 1, 2, 6):
+            session.add(
+                AbuseEvent(
+                    event_type="capture_rate_limited",
+                    user_id=noisy_user,
+                    created_at=base + dt.timedelta(minutes=minute),
+                )
+            )
+        session.add(
+            AbuseEvent(
+                event_type="geofence_failed",
+                user_id=quiet_user,
+                created_at=base + dt.timedelta(minutes=3),
+            )
+        )
+        await session.commit()
+
+    params = {
+        "bucket": "5m",
+        "group_by": "event_type,user_id",
+        "from": base.isoformat(),
+        "to": (base + dt.timedelta(minutes=10)).isoformat(),
+        "top": 1,
+    }
+    response = await client.get(
+        "/v1/admin/abuse-events/stats",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        params=params,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["source"] == "raw"
+    assert len(payload["groups"]) == 1
+    top_group = payload["groups"][0]
+    assert top_group["event_type"] == "capture_rate_limited"
+    assert top_group["user_id"] == str(noisy_user)
+    assert top_group["total"] == 4
+    assert [bucket["events"] for bucket in top_group["buckets"]] == [3, 1]
+
+    async with db_sessionmaker() as session:
+        await refresh_abuse_event_rollups(
+            db=session, now=base + dt.timedelta(minutes=10), lookback=dt.timedelta(hours=1)
+        )
+        await session.commit()
+
+    rollup = await client.get(
+        "/v1/admin/abuse-events/stats",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        params={**params, "source": "rollup"},
+    )
+    assert rollup.status_code == 200
+    assert rollup.json()["groups"] == payload["groups"]
+
+    # Both ends snap to the 5-minute rollup grid: 12:08 excludes the 12:05 slot.
+    truncated = await client.get(
+        "/v1/admin/abuse-events/stats",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        params={**params, "to": (base + dt.timedelta(minutes=8)).isoformat(), "source": "rollup"},
+    )
+    assert truncated.status_code == 200
+    assert dt.datetime.fromisoformat(truncated.json()["to"]) == base + dt.timedelta(minutes=5)
+    assert [bucket["events"] for bucket in truncated.json()["groups"][0]["buckets"]] == [3]
+
+    invalid = await client.get(
+        "/v1/admin/abuse-events/stats",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        params={**params, "bucket": "1m", "source": "rollup"},
+    )
+    assert invalid.status_code == 400
+    assert invalid.json()["error"]["code"] == "invalid_abuse_stats_query"
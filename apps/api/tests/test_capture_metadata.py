@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import datetime as dt
+import io
+import uuid
+
+import pytest
+from geoalchemy2.elements import WKTElement
+from httpx import ASGITransport, AsyncClient
+from PIL import Image
+
+from groundedart_api.auth.tokens import generate_opaque_token, hash_opaque_token
+from groundedart_api.db.models import Capture, CheckinToken, Node, utcnow
+from groundedart_api.domain.capture_metadata import check_capture_time
+from groundedart_api.main import create_app
+from groundedart_api.settings import get_settings
+from groundedart_api.storage.exif import ExifMetadata, read_exif_metadata
+
+CEST = dt.timezone(dt.timedelta(hours=2))
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache():
+    yield
+    get_settings.cache_clear()
+
+
+def image_bytes(
+    fmt: str,
+    *,
+    gps: tuple[float, float] | None = None,
+    captured_at: str | None = None,
+    offset: str | None = None,
+    gps_time: tuple[str, tuple[float, float, float]] | None = None,
+) -> bytes:
+    exif = Image.Exif()
+    if captured_at is not None:
+        exif_ifd = exif.get_ifd(0x8769)
+        exif_ifd[0x9003] = captured_at
+        if offset is not None:
+            exif_ifd[0x9011] = offset
+    if gps is not None or gps_time is not None:
+        gps_ifd = exif.get_ifd(0x8825)
+        if gps is not None:
+            lat, lng = gps
+            gps_ifd[1] = "N" if lat >= 0 else "S"
+            gps_ifd[2] = _dms(abs(lat))
+            gps_ifd[3] = "E" if lng >= 0 else "W"
+            gps_ifd[4] = _dms(abs(lng))
+        if gps_time is not None:
+            gps_ifd[0x1D], gps_ifd[7] = gps_time
+    buffer = io.BytesIO()
+    # Pillow writes an empty EXIF segment for an empty Exif(); leave it out entirely.
+    tagged = captured_at is not None or gps is not None or gps_time is not None
+    options = {"exif": exif} if tagged else {}
+    Image.new("RGB", (1200, 900), (120, 60, 30)).save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def _dms(value: float) -> tuple[float, float, float]:
+    degrees = int(value)
+    minutes = int((value - degrees) * 60)
+    return (float(degrees), float(minutes), round((value - degrees - minutes / 60) * 3600, 2))
+
+
+@pytest.mark.parametrize("fmt", ["JPEG", "WEBP"])
+def test_reads_gps_and_capture_time_without_decoding(fmt: str) -> None:
+    payload = image_bytes(
+        fmt,
+        gps=(-33.9249, 18.4241),
+        captured_at="2026:10:19 14:05:30",
+        offset="+02:00",
+        gps_time=("2026:10:19", (12.0, 5.0, 31.0)),
+    )
+    handle = io.BytesIO(payload)
+
+    metadata = read_exif_metadata(handle)
+
+    assert metadata is not None
+    assert metadata.latitude == pytest.approx(-33.9249, abs=1e-5)
+    assert metadata.longitude == pytest.approx(18.4241, abs=1e-5)
+    assert metadata.captured_at == dt.datetime(2026, 10, 19, 14, 5, 30, tzinfo=CEST)
+    assert metadata.gps_time == dt.datetime(2026, 10, 19, 12, 5, 31, tzinfo=dt.UTC)
+    if fmt == "JPEG":
+        # EXIF leads the file: the scan stops long before the compressed pixels.
+        assert handle.tell() < 1024 < len(payload)
+
+
+def test_images_without_usable_exif_yield_none() -> None:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8)).save(buffer, "PNG")
+    with_exif = image_bytes("JPEG", captured_at="2026:10:19 14:05:30")
+
+    assert read_exif_metadata(io.BytesIO(image_bytes("JPEG"))) is None
+    assert read_exif_metadata(io.BytesIO(image_bytes("WEBP"))) is None
+    assert read_exif_metadata(io.BytesIO(buffer.getvalue())) is None
+    assert read_exif_metadata(io.BytesIO(with_exif[:40])) is None
+    assert read_exif_metadata(io.BytesIO(b"")) is None
+    overflowing = image_bytes(
+        "JPEG",
+        captured_at="0001:01:01 00:00:00",
+        offset="+14:00",
+        gps_time=("9999:12:31", (23.0, 59.0, 60.0)),
+    )
+    assert read_exif_metadata(io.BytesIO(overflowing)) == ExifMetadata(
+        captured_at=dt.datetime(1, 1, 1)
+    )
+    assert read_exif_metadata(io.BytesIO(with_exif)) == ExifMetadata(
+        captured_at=dt.datetime(2026, 10, 19, 14, 5, 30)
+    )
+
+
+def test_capture_time_is_checked_against_the_checkin_window() -> None:
+    issued_at = dt.datetime(2026, 10, 19, 12, 0, tzinfo=dt.UTC)
+    uploaded_at = issued_at + dt.timedelta(minutes=5)
+    tolerance = dt.timedelta(minutes=15)
+
+    def check(metadata: ExifMetadata) -> tuple[str, str | None]:
+        outcome, _, source = check_capture_time(
+            metadata, issued_at=issued_at, uploaded_at=uploaded_at, tolerance=tolerance
+        )
+        return outcome, source
+
+    assert check(ExifMetadata(gps_time=issued_at + dt.timedelta(minutes=2))) == (
+        "consistent",
+        "gps",
+    )
+    assert check(
+        ExifMetadata(captured_at=dt.datetime(2026, 10, 19, 14, 1, tzinfo=CEST))
+    ) == ("consistent", "exif_offset")
+    assert check(
+        ExifMetadata(captured_at=dt.datetime(2026, 10, 18, 14, 1, tzinfo=CEST))
+    ) == ("inconsistent", "exif_offset")
+    # No offset: any timezone on the same day passes, last year's photo does not.
+    assert check(ExifMetadata(captured_at=dt.datetime(2026, 10, 20, 1, 0))) == (
+        "consistent",
+        "exif_local",
+    )
+    assert check(ExifMetadata(captured_at=dt.datetime(2025, 10, 19, 12, 0))) == (
+        "inconsistent",
+        "exif_local",
+    )
+    assert check(ExifMetadata(latitude=1.0, longitude=2.0)) == ("missing", None)
+
+
+async def create_capture(db_sessionmaker, client: AsyncClient) -> uuid.UUID:
+    node_id = uuid.uuid4()
+    async with db_sessionmaker() as session:
+        session.add(
+            Node(
+                id=node_id,
+                name="Metadata Node",
+                category="mural",
+                description=None,
+                location=WKTElement("POINT(18.4241 -33.9249)", srid=4326),
+                radius_m=25,
+                min_rank=0,
+            )
+        )
+        await session.commit()
+
+    session_response = await client.post(
+        "/v1/sessions/anonymous", json={"device_id": str(uuid.uuid4())}
+    )
+    assert session_response.status_code == 200
+    user_id = uuid.UUID(session_response.json()["user_id"])
+    token = generate_opaque_token()
+    async with db_sessionmaker() as session:
+        session.add(
+            CheckinToken(
+                user_id=user_id,
+                node_id=node_id,
+                token_hash=hash_opaque_token(token, get_settings()),
+                expires_at=utcnow() + dt.timedelta(seconds=30),
+            )
+        )
+        await session.commit()
+
+    created = await client.post(
+        "/v1/captures", json={"node_id": str(node_id), "checkin_token": token}
+    )
+    assert created.status_code == 200
+    return uuid.UUID(created.json()["capture"]["id"])
+
+
+@pytest.mark.asyncio
+async def test_upload_records_exif_cross_check(db_sessionmaker, monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("MEDIA_DIR", str(tmp_path))
+    monkeypatch.setenv("UPLOAD_ALLOWED_MIME_TYPES", '["image/jpeg", "image/png"]')
+    get_settings.cache_clear()
+    now = utcnow()
+    taken = (now.strftime("%Y:%m:%d"), (float(now.hour), float(now.minute), float(now.second)))
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        matching_id = await create_capture(db_sessionmaker, client)
+        matching = await client.post(
+            f"/v1/captures/{matching_id}/image",
+            files={
+                "file": (
+                    "photo.jpg",
+                    image_bytes("JPEG", gps=(-33.9250, 18.4242), gps_time=taken),
+                    "image/jpeg",
+                )
+            },
+        )
+        elsewhere_id = await create_capture(db_sessionmaker, client)
+        elsewhere = await client.post(
+            f"/v1/captures/{elsewhere_id}/image",
+            files={
+                "file": (
+                    "photo.jpg",
+                    image_bytes(
+                        "JPEG", gps=(51.5007, -0.1246), captured_at="2019:06:01 10:00:00"
+                    ),
+                    "image/jpeg",
+                )
+            },
+        )
+        stripped_id = await create_capture(db_sessionmaker, client)
+        png = io.BytesIO()
+        Image.new("RGB", (8, 8)).save(png, "PNG")
+        stripped = await client.post(
+            f"/v1/captures/{stripped_id}/image",
+            files={"file": ("photo.png", png.getvalue(), "image/png")},
+        )
+        pending = await client.get(
+            "/v1/admin/captures/pending",
+            headers={"X-Admin-Token": get_settings().admin_api_token},
+        )
+
+    assert [matching.status_code, elsewhere.status_code, stripped.status_code] == [200] * 3
+    async with db_sessionmaker() as session:
+        checks = {
+            capture_id: (await session.get(Capture, capture_id)).image_metadata_check
+            for capture_id in (matching_id, elsewhere_id, stripped_id)
+        }
+        capture = await session.get(Capture, matching_id)
+        assert capture.checkin_issued_at is not None
+
+    assert checks[matching_id]["gps_check"] == "consistent"
+    assert checks[matching_id]["gps"]["distance_m"] < 25
+    assert (checks[matching_id]["time_check"], checks[matching_id]["time_source"]) == (
+        "consistent",
+        "gps",
+    )
+    assert checks[elsewhere_id]["gps_check"] == "inconsistent"
+    assert checks[elsewhere_id]["time_check"] == "inconsistent"
+    assert checks[stripped_id] == {
+        "exif": False,
+        "gps_check": "missing",
+        "gps": None,
+        "time_check": "missing",
+        "captured_at": None,
+        "time_source": None,
+    }
+    by_id = {item["id"]: item for item in pending.json()["captures"]}
+    assert by_id[str(elsewhere_id)]["image_metadata_check"]["gps_check"] == "inconsistent"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections import Counter
 from pathlib import Path
 import uuid
 
@@ -11,6 +12,15 @@ from sqlalchemy import select
 
 from groundedart_api.auth.tokens import generate_opaque_token, hash_opaque_token
 from groundedart_api.db.models import Capture, CheckinToken, Node, UserNotification, utcnow
+from groundedart_api.domain.notifications import increment_unread_counts
+from groundedart_api.domain.user_events import (
+    UserEvent,
+    UserEventBroker,
+    UserEventCursor,
+    _notify_payload,
+    replay_user_events,
+    stream_user_events,
+)
 from groundedart_api.settings import get_settings
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -180,3 +190,145 @@ async def test_verification_notifies_missing_requirements(db_sessionmaker, clien
         missing_fields = notification.details["missing_fields"]
         assert "rights_basis" in missing_fields
         assert "rights_attested_at" in missing_fields
+
+
+@pytest.mark.asyncio
+async def test_user_event_stream_replays_after_last_event_id(
+    db_sessionmaker, client: AsyncClient
+) -> None:
+    capture_id = await create_pending_capture(
+        db_sessionmaker,
+        client,
+        publish_requested=True,
+        include_rights=True,
+    )
+    before = UserEventCursor(created_at=utcnow(), event_id=uuid.UUID(int=0))
+    settings = get_settings()
+    response = await client.post(
+        f"/v1/admin/captures/{capture_id}/transition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={"target_state": "verified", "reason_code": "manual_review_pass"},
+    )
+    assert response.status_code == 200
+
+    async with db_sessionmaker() as session:
+        capture = await session.get(Capture, capture_id)
+        assert capture is not None
+        events = await replay_user_events(
+            db=session, user_id=capture.user_id, after=before, limit=10
+        )
+    assert [event.kind for event in events] == ["capture_state", "notification"]
+    assert events[0].data["to_state"] == "verified"
+
+    stream = stream_user_events(
+        broker=UserEventBroker(queue_max=10),
+        sessionmaker=db_sessionmaker,
+        user_id=capture.user_id,
+        after=before,
+        heartbeat_seconds=60,
+        poll_seconds=60,
+        replay_limit=1,
+    )
+    try:
+        assert (await anext(stream)).startswith(b"retry:")
+        assert b"event: capture_state" in await anext(stream)
+        assert b"event: notification" in await anext(stream)
+    finally:
+        await stream.aclose()
+
+    # Resuming from the last delivered event replays nothing.
+    async with db_sessionmaker() as session:
+        assert not await replay_user_events(
+            db=session, user_id=capture.user_id, after=events[-1].cursor, limit=10
+        )
+
+
+@pytest.mark.asyncio
+async def test_user_event_stream_pushes_live_events_once() -> None:
+    broker = UserEventBroker(queue_max=10)
+    broker.set_listening(True)
+    user_id = uuid.uuid4()
+    stream = stream_user_events(
+        broker=broker,
+        sessionmaker=None,
+        user_id=user_id,
+        after=None,
+        heartbeat_seconds=0.05,
+        poll_seconds=60,
+        replay_limit=10,
+    )
+    event = UserEvent(
+        user_id=user_id,
+        kind="notification",
+        event_id=uuid.uuid4(),
+        created_at=utcnow(),
+        data={"title": "Capture verified"},
+    )
+    try:
+        assert (await anext(stream)).startswith(b"retry:")
+        assert broker.subscriber_count == 1
+        broker.handle_notification(_notify_payload(event))
+        broker.handle_notification(_notify_payload(event))
+        frame = await anext(stream)
+        assert b"event: notification" in frame
+        assert b"Capture verified" in frame
+        assert await anext(stream) == b": keep-alive\n\n"
+    finally:
+        await stream.aclose()
+    assert broker.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_notification_inbox_pages_and_bulk_marks_read(
+    db_sessionmaker, client: AsyncClient
+) -> None:
+    user_id = await create_session(client)
+    now = utcnow()
+    async with db_sessionmaker() as session:
+        for offset in range(3):
+            session.add(
+                UserNotification(
+                    id=uuid.uuid4(),
+                    user_id=user_id,
+                    event_type="capture_verified",
+                    title=f"Notification {offset}",
+                    created_at=now + dt.timedelta(seconds=offset),
+                )
+            )
+        await increment_unread_counts(db=session, user_ids=Counter({user_id: 3}), now=now)
+        await session.commit()
+
+    first_page = (await client.get("/v1/me/notifications", params={"limit": 2})).json()
+    assert [item["title"] for item in first_page["notifications"]] == [
+        "Notification 2",
+        "Notification 1",
+    ]
+    assert first_page["unread_count"] == 3
+    second_page = (
+        await client.get(
+            "/v1/me/notifications", params={"limit": 2, "cursor": first_page["next_cursor"]}
+        )
+    ).json()
+    assert [item["title"] for item in second_page["notifications"]] == ["Notification 0"]
+    assert second_page["next_cursor"] is None
+
+    bad = await client.post("/v1/me/notifications:markRead", json={})
+    assert bad.status_code == 400
+    assert bad.json()["error"]["code"] == "invalid_mark_read_request"
+
+    oldest_id = second_page["notifications"][0]["id"]
+    marked = await client.post("/v1/me/notifications:markRead", json={"ids": [oldest_id]})
+    assert marked.status_code == 200
+    assert marked.json() == {"marked_read": 1, "unread_count": 2}
+
+    marked = await client.post(
+        "/v1/me/notifications:markRead", json={"up_to_cursor": first_page["latest_cursor"]}
+    )
+    assert marked.json() == {"marked_read": 2, "unread_count": 0}
+
+    again = await client.post(f"/v1/me/notifications/{oldest_id}/read")
+    assert again.status_code == 200
+    count = (await client.get("/v1/me/notifications/unread_count")).json()
+    assert count == {"unread_count": 0}
+    unread = (await client.get("/v1/me/notifications", params={"unread_only": True})).json()
+    assert unread["notifications"] == []
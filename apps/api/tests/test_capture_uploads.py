@@ -1,18 +1,39 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import hashlib
+import io
 from pathlib import Path
 import uuid
 
 import pytest
+from fastapi import UploadFile
 from geoalchemy2.elements import WKTElement
 from httpx import ASGITransport, AsyncClient
+from PIL import Image
+from sqlalchemy import select
+from starlette.datastructures import Headers
 
+from groundedart_api.api.routers import captures as captures_router
 from groundedart_api.auth.tokens import generate_opaque_token, hash_opaque_token
-from groundedart_api.db.models import Capture, CheckinToken, Node, utcnow
+from groundedart_api.db.models import (
+    Capture,
+    CaptureUploadSession,
+    CheckinToken,
+    MediaBlob,
+    Node,
+    utcnow,
+)
 from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.errors import AppError
+from groundedart_api.domain.media_blobs import collect_unreferenced_blobs
+from groundedart_api.domain.media_variants import MediaVariantPipeline, VariantJob
 from groundedart_api.main import create_app
 from groundedart_api.settings import get_settings
+from groundedart_api.storage.local import LocalMediaStorage
+from groundedart_api.storage.staging import UploadStaging
+from groundedart_api.storage.variants import build_srcset, build_thumbnail_url, render_variants
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
@@ -151,7 +172,7 @@ async def test_upload_rejects_too_large_file(db_sessionmaker, monkeypatch, tmp_p
 
 
 @pytest.mark.asyncio
-async def test_upload_is_idempotent_overwrite(db_sessionmaker, monkeypatch, tmp_path) -> None:
+async def test_upload_overwrite_points_at_new_blob(db_sessionmaker, monkeypatch, tmp_path) -> None:
     fixture_bytes = load_fixture_bytes("tiny.png")
     second_bytes = fixture_bytes + b"1"
     async with make_client(
@@ -175,9 +196,467 @@ async def test_upload_is_idempotent_overwrite(db_sessionmaker, monkeypatch, tmp_
 
     assert second.status_code == 200
     second_url = second.json()["image_url"]
-    assert second_url == first_url
+    assert second_url != first_url
     media_path = tmp_path / second_url.split("/media/")[1]
     assert media_path.read_bytes() == second_bytes
+    assert media_path.name == f"{hashlib.sha256(second_bytes).hexdigest()}.jpg"
+
+    async with db_sessionmaker() as session:
+        blobs = {
+            blob.sha256: blob.ref_count for blob in (await session.scalars(select(MediaBlob)))
+        }
+    assert blobs == {
+        hashlib.sha256(fixture_bytes).hexdigest(): 0,
+        hashlib.sha256(second_bytes).hexdigest(): 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_upload_identical_bytes_share_one_blob(
+    db_sessionmaker, monkeypatch, tmp_path
+) -> None:
+    fixture_bytes = load_fixture_bytes("tiny.png")
+    async with make_client(
+        monkeypatch,
+        tmp_path,
+        allowed_types=["image/jpeg"],
+        max_bytes=1_000,
+    ) as client:
+        urls = []
+        for _ in range(2):
+            capture_id = await create_capture(db_sessionmaker, client)
+            response = await client.post(
+                f"/v1/captures/{capture_id}/image",
+                files={"file": ("photo.jpg", fixture_bytes, "image/jpeg")},
+            )
+            assert response.status_code == 200
+            urls.append(response.json()["image_url"])
+
+    assert urls[0] == urls[1]
+    sha256 = hashlib.sha256(fixture_bytes).hexdigest()
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == [f"{sha256}.jpg"]
+    async with db_sessionmaker() as session:
+        blob = await session.get(MediaBlob, sha256)
+        captures = (await session.scalars(select(Capture))).all()
+    assert blob is not None
+    assert blob.ref_count == 2
+    assert blob.size_bytes == len(fixture_bytes)
+    assert {capture.image_sha256 for capture in captures} == {sha256}
+
+
+@pytest.mark.asyncio
+async def test_upload_identical_bytes_under_another_type_reuse_the_blob(
+    db_sessionmaker, monkeypatch, tmp_path
+) -> None:
+    fixture_bytes = load_fixture_bytes("tiny.png")
+    async with make_client(
+        monkeypatch,
+        tmp_path,
+        allowed_types=["image/jpeg", "image/png"],
+        max_bytes=1_000,
+    ) as client:
+        responses = []
+        for mime in ("image/jpeg", "image/png"):
+            capture_id = await create_capture(db_sessionmaker, client)
+            responses.append(
+                await client.post(
+                    f"/v1/captures/{capture_id}/image",
+                    files={"file": ("photo", fixture_bytes, mime)},
+                )
+            )
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert responses[0].json()["image_url"] == responses[1].json()["image_url"]
+    sha256 = hashlib.sha256(fixture_bytes).hexdigest()
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == [f"{sha256}.jpg"]
+    async with db_sessionmaker() as session:
+        blob = await session.get(MediaBlob, sha256)
+        captures = (await session.scalars(select(Capture))).all()
+    assert blob.ref_count == 2
+    assert {(capture.image_path, capture.image_mime) for capture in captures} == {
+        (blob.path, "image/jpeg")
+    }
+
+
+@pytest.mark.asyncio
+async def test_blob_gc_between_dedup_and_reference_stores_the_upload_again(
+    db_sessionmaker, monkeypatch, tmp_path
+) -> None:
+    fixture_bytes = load_fixture_bytes("tiny.png")
+    sha256 = hashlib.sha256(fixture_bytes).hexdigest()
+    collected: list[str] = []
+    save_capture_image = LocalMediaStorage.save_capture_image
+
+    async def save_then_collect(self, capture_id, upload):
+        stored = await save_capture_image(self, capture_id, upload)
+        if stored.deduplicated and not collected:
+            # GC runs after the upload found the blob but before it takes a reference.
+            async with db_sessionmaker() as session:
+                blobs = await collect_unreferenced_blobs(
+                    db=session, unreferenced_before=utcnow() + dt.timedelta(hours=1), limit=10
+                )
+                for blob in blobs:
+                    await self.delete_blob(blob.path)
+                await session.commit()
+            collected.extend(blob.sha256 for blob in blobs)
+        return stored
+
+    async with make_client(
+        monkeypatch,
+        tmp_path,
+        allowed_types=["image/jpeg"],
+        max_bytes=1_000,
+    ) as client:
+        capture_id = await create_capture(db_sessionmaker, client)
+        for payload in (fixture_bytes, fixture_bytes + b"1"):
+            response = await client.post(
+                f"/v1/captures/{capture_id}/image",
+                files={"file": ("photo.jpg", payload, "image/jpeg")},
+            )
+            assert response.status_code == 200
+        monkeypatch.setattr(LocalMediaStorage, "save_capture_image", save_then_collect)
+        second_id = await create_capture(db_sessionmaker, client)
+        response = await client.post(
+            f"/v1/captures/{second_id}/image",
+            files={"file": ("photo.jpg", fixture_bytes, "image/jpeg")},
+        )
+
+    assert response.status_code == 200
+    assert collected == [sha256]
+    media_path = tmp_path / response.json()["image_url"].split("/media/")[1]
+    assert media_path.read_bytes() == fixture_bytes
+    async with db_sessionmaker() as session:
+        blob = await session.get(MediaBlob, sha256)
+    assert blob.ref_count == 1
+    assert blob.path == str(media_path.relative_to(tmp_path))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("durability", ["fsync", "batched", "none"])
+async def test_storage_saves_parallel_uploads_off_loop(tmp_path, durability: str) -> None:
+    settings = get_settings().model_copy(
+        update={
+            "media_dir": str(tmp_path),
+            "media_durability": durability,
+            "upload_allowed_mime_types": ["image/jpeg"],
+            "upload_max_bytes": 2_000_000,
+        }
+    )
+    storage = LocalMediaStorage(settings)
+    payloads = {uuid.uuid4(): bytes([index]) * 700_000 for index in range(8)}
+    headers = Headers({"content-type": "image/jpeg"})
+    try:
+        stored = await asyncio.gather(
+            *(
+                storage.save_capture_image(
+                    capture_id, UploadFile(io.BytesIO(payload), headers=headers)
+                )
+                for capture_id, payload in payloads.items()
+            )
+        )
+    finally:
+        await storage.aclose()
+
+    assert [item.bytes_written for item in stored] == [700_000] * len(payloads)
+    for item, payload in zip(stored, payloads.values(), strict=True):
+        assert item.sha256 == hashlib.sha256(payload).hexdigest()
+        assert (tmp_path / item.path).read_bytes() == payload
+    assert [path.name for path in tmp_path.iterdir()] == ["blobs"]
+
+
+@pytest.mark.asyncio
+async def test_storage_deduplicates_identical_content(tmp_path) -> None:
+    settings = get_settings().model_copy(
+        update={"media_dir": str(tmp_path), "upload_allowed_mime_types": ["image/jpeg"]}
+    )
+    storage = LocalMediaStorage(settings)
+    headers = Headers({"content-type": "image/jpeg"})
+    payload = b"\xff\xd8" + bytes(range(256)) * 10
+    try:
+        first = await storage.save_capture_image(
+            uuid.uuid4(), UploadFile(io.BytesIO(payload), headers=headers)
+        )
+        second = await storage.save_capture_image(
+            uuid.uuid4(), UploadFile(io.BytesIO(payload), headers=headers)
+        )
+        with pytest.raises(ValueError):
+            await storage.delete_blob("../outside.jpg")
+        await storage.delete_blob(first.path)
+    finally:
+        await storage.aclose()
+
+    assert first.path == second.path
+    assert (first.deduplicated, second.deduplicated) == (False, True)
+    assert not (tmp_path / first.path).exists()
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_resumes_and_finalizes(
+    db_sessionmaker, monkeypatch, tmp_path
+) -> None:
+    fixture_bytes = load_fixture_bytes("tiny.png")
+    media_dir = tmp_path / "media"
+    staging_dir = tmp_path / "staging"
+    monkeypatch.setenv("UPLOAD_STAGING_DIR", str(staging_dir))
+    async with make_client(
+        monkeypatch,
+        media_dir,
+        allowed_types=["image/jpeg"],
+        max_bytes=1_000,
+    ) as client:
+        capture_id = await create_capture(db_sessionmaker, client)
+        created = await client.post(
+            f"/v1/captures/{capture_id}/uploads",
+            json={"size_bytes": len(fixture_bytes), "content_type": "image/jpeg"},
+        )
+        assert created.status_code == 201
+        upload_url = created.headers["location"]
+        assert upload_url == f"/v1/captures/{capture_id}/uploads/{created.json()['upload_id']}"
+
+        half = len(fixture_bytes) // 2
+        first = await client.patch(
+            upload_url, content=fixture_bytes[:half], headers={"Upload-Offset": "0"}
+        )
+        assert first.status_code == 204
+        assert first.headers["upload-offset"] == str(half)
+
+        progress = await client.head(upload_url)
+        assert progress.status_code == 200
+        assert progress.headers["upload-offset"] == str(half)
+        assert progress.headers["upload-length"] == str(len(fixture_bytes))
+
+        stale = await client.patch(
+            upload_url, content=fixture_bytes[half:], headers={"Upload-Offset": "0"}
+        )
+        assert stale.status_code == 409
+        assert stale.json()["error"]["details"] == {"offset": half}
+
+        final = await client.patch(
+            upload_url, content=fixture_bytes[half:], headers={"Upload-Offset": str(half)}
+        )
+        assert final.status_code == 200
+        assert final.json()["state"] == CaptureState.pending_verification.value
+
+        gone = await client.head(upload_url)
+        assert gone.status_code == 404
+
+    sha256 = hashlib.sha256(fixture_bytes).hexdigest()
+    assert final.json()["image_url"].endswith(f"/{sha256}.jpg")
+    assert (media_dir / final.json()["image_url"].split("/media/")[1]).read_bytes() == (
+        fixture_bytes
+    )
+    assert list(staging_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_retry_after_finalize_is_not_found(
+    db_sessionmaker, monkeypatch, tmp_path
+) -> None:
+    fixture_bytes = load_fixture_bytes("tiny.png")
+    staging_dir = tmp_path / "staging"
+    monkeypatch.setenv("UPLOAD_STAGING_DIR", str(staging_dir))
+    async with make_client(
+        monkeypatch,
+        tmp_path / "media",
+        allowed_types=["image/jpeg"],
+        max_bytes=1_000,
+    ) as client:
+        capture_id = await create_capture(db_sessionmaker, client)
+        created = await client.post(
+            f"/v1/captures/{capture_id}/uploads",
+            json={"size_bytes": len(fixture_bytes), "content_type": "image/jpeg"},
+        )
+        upload_url = created.headers["location"]
+        # Header bytes decode as latin-1: this arrives as "²", which isdigit() accepts.
+        non_ascii_offset = await client.patch(
+            upload_url,
+            content=fixture_bytes,
+            headers={"Upload-Offset": "²".encode("latin-1")},
+        )
+        async with db_sessionmaker() as session:
+            row = await session.get(CaptureUploadSession, uuid.UUID(created.json()["upload_id"]))
+            # What an overlapping retry read before the finalizing request committed.
+            stale = CaptureUploadSession(
+                id=row.id,
+                capture_id=row.capture_id,
+                content_type=row.content_type,
+                length=row.length,
+                created_at=row.created_at,
+                expires_at=row.expires_at,
+            )
+        final = await client.patch(
+            upload_url, content=fixture_bytes, headers={"Upload-Offset": "0"}
+        )
+
+        async def read_before_commit(*args, **kwargs) -> CaptureUploadSession:
+            return stale
+
+        monkeypatch.setattr(captures_router, "_get_upload_session", read_before_commit)
+        retry = await client.patch(
+            upload_url, content=b"", headers={"Upload-Offset": str(len(fixture_bytes))}
+        )
+
+    assert non_ascii_offset.status_code == 400
+    assert non_ascii_offset.json()["error"]["code"] == "invalid_upload_offset"
+    assert final.status_code == 200
+    assert retry.status_code == 404
+    assert retry.json()["error"]["code"] == "upload_session_not_found"
+    assert list(staging_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_checks_type_and_size_up_front(
+    db_sessionmaker, monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setenv("UPLOAD_STAGING_DIR", str(tmp_path / "staging"))
+    async with make_client(
+        monkeypatch,
+        tmp_path / "media",
+        allowed_types=["image/jpeg"],
+        max_bytes=1_000,
+    ) as client:
+        capture_id = await create_capture(db_sessionmaker, client)
+        too_large = await client.post(
+            f"/v1/captures/{capture_id}/uploads",
+            json={"size_bytes": 1_001, "content_type": "image/jpeg"},
+        )
+        wrong_type = await client.post(
+            f"/v1/captures/{capture_id}/uploads",
+            json={"size_bytes": 10, "content_type": "text/plain"},
+        )
+
+    assert too_large.status_code == 413
+    assert too_large.json()["error"]["code"] == "file_too_large"
+    assert wrong_type.status_code == 415
+    assert wrong_type.json()["error"]["code"] == "invalid_media_type"
+
+
+@pytest.mark.asyncio
+async def test_upload_staging_locks_and_bounds_appends(tmp_path) -> None:
+    settings = get_settings().model_copy(
+        update={"upload_staging_dir": str(tmp_path), "media_durability": "none"}
+    )
+    staging = UploadStaging(settings)
+    upload_id = uuid.uuid4()
+
+    async with staging.locked(upload_id) as staged:
+        assert await staged.append(_chunks(b"abc", b"de"), length=8) == 5
+        with pytest.raises(AppError) as locked:
+            async with staging.locked(upload_id):
+                pass
+        assert locked.value.code == "upload_locked"
+        with pytest.raises(AppError) as too_large:
+            await staged.append(_chunks(b"f", b"ghij"), length=8)
+        assert too_large.value.code == "file_too_large"
+
+    # Bytes before the rejected chunk are kept and count towards the offset.
+    assert await staging.offset(upload_id) == 6
+    async with staging.locked(upload_id) as staged:
+        assert staged.offset == 6
+    assert staging.sweep(older_than_seconds=3600) == 0
+    await staging.delete(upload_id)
+    assert await staging.offset(upload_id) == 0
+
+
+def _jpeg_bytes(size: tuple[int, int]) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 80, 40)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def test_render_variants_buckets_without_upscaling(tmp_path) -> None:
+    (tmp_path / "blobs").mkdir()
+    (tmp_path / "blobs" / "photo.jpg").write_bytes(_jpeg_bytes((900, 600)))
+
+    variants = render_variants(
+        str(tmp_path), "blobs/photo.jpg", (160, 640, 1280), webp_quality=80, jpeg_quality=82
+    )
+
+    assert [(item["w"], item["h"], item["format"]) for item in variants] == [
+        (160, 107, "webp"),
+        (160, 107, "jpeg"),
+        (640, 427, "webp"),
+    ]
+    for item in variants:
+        with Image.open(tmp_path / item["path"]) as image:
+            assert image.size == (item["w"], item["h"])
+    assert build_srcset(variants, base_media_url="/media/") == (
+        "/media/variants/blobs/photo/160.webp 160w, /media/variants/blobs/photo/640.webp 640w"
+    )
+    assert build_thumbnail_url(variants, base_media_url="/media") == (
+        "/media/variants/blobs/photo/160.jpg"
+    )
+    with pytest.raises(ValueError):
+        render_variants(str(tmp_path), "../photo.jpg", (160,), webp_quality=80, jpeg_quality=82)
+
+
+def test_render_variants_adds_avif_siblings(tmp_path) -> None:
+    (tmp_path / "blobs").mkdir()
+    (tmp_path / "blobs" / "photo.jpg").write_bytes(_jpeg_bytes((400, 200)))
+
+    variants = render_variants(
+        str(tmp_path),
+        "blobs/photo.jpg",
+        (160, 320),
+        webp_quality=80,
+        jpeg_quality=82,
+        avif_quality=55,
+    )
+
+    assert [(item["w"], item["format"]) for item in variants] == [
+        (160, "webp"),
+        (160, "avif"),
+        (160, "jpeg"),
+        (320, "webp"),
+        (320, "avif"),
+    ]
+    with Image.open(tmp_path / "variants/blobs/photo/320.avif") as image:
+        assert image.size == (320, 160)
+    # srcset stays WebP; AVIF is picked by Accept negotiation when serving.
+    assert "avif" not in build_srcset(variants, base_media_url="/media")
+
+
+@pytest.mark.asyncio
+async def test_variant_pipeline_exposes_srcset(db_sessionmaker, monkeypatch, tmp_path) -> None:
+    async with make_client(
+        monkeypatch,
+        tmp_path,
+        allowed_types=["image/jpeg"],
+        max_bytes=1_000_000,
+    ) as client:
+        capture_id = await create_capture(db_sessionmaker, client)
+        uploaded = await client.post(
+            f"/v1/captures/{capture_id}/image",
+            files={"file": ("photo.jpg", _jpeg_bytes((900, 600)), "image/jpeg")},
+        )
+        assert uploaded.status_code == 200
+        assert uploaded.json()["image_srcset"] is None
+
+        async with db_sessionmaker() as session:
+            capture = await session.get(Capture, capture_id)
+        pipeline = MediaVariantPipeline(get_settings(), sessionmaker=db_sessionmaker)
+        try:
+            await pipeline.process(
+                VariantJob(
+                    kind="capture", source_path=capture.image_path, sha256=capture.image_sha256
+                )
+            )
+        finally:
+            await pipeline.stop()
+
+        response = await client.get(f"/v1/captures/{capture_id}")
+
+    payload = response.json()
+    srcset = payload["image_srcset"].split(", ")
+    assert [entry.rsplit(" ", 1)[1] for entry in srcset] == ["160w", "320w", "640w"]
+    assert payload["thumbnail_url"].endswith("/160.jpg")
+    assert (tmp_path / payload["thumbnail_url"].split("/media/")[1]).is_file()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+
+import pytest
+from geoalchemy2.elements import WKTElement
+from httpx import AsyncClient
+
+from groundedart_api.db.models import Capture, CuratorRankEvent, Node, User, utcnow
+from groundedart_api.domain.leaderboard import refresh_rank_window
+from groundedart_api.domain.rank_materialization import rematerialize_rank_range
+
+
+async def _seed_ranked_users(
+    db_sessionmaker,
+    *,
+    points_by_user: list[int],
+    created_at: dt.datetime | None = None,
+) -> tuple[list[uuid.UUID], list[uuid.UUID]]:
+    """Each user earns `points` verified captures at distinct nodes on one day."""
+    created_at = created_at or utcnow()
+    node_ids = [uuid.uuid4() for _ in range(max(points_by_user))]
+    user_ids = [uuid.uuid4() for _ in points_by_user]
+    async with db_sessionmaker() as session:
+        for index, node_id in enumerate(node_ids):
+            session.add(
+                Node(
+                    id=node_id,
+                    name=f"Leaderboard Node {index}",
+                    category="mural",
+                    description=None,
+                    location=WKTElement(f"POINT(-122.{40 + index} 37.78)", srid=4326),
+                    radius_m=25,
+                    min_rank=0,
+                )
+            )
+        for user_id in user_ids:
+            session.add(User(id=user_id))
+        await session.flush()
+
+        for user_id, points in zip(user_ids, points_by_user, strict=True):
+            for node_id in node_ids[:points]:
+                capture_id = uuid.uuid4()
+                session.add(
+                    Capture(
+                        id=capture_id,
+                        user_id=user_id,
+                        node_id=node_id,
+                        state="verified",
+                        created_at=created_at,
+                    )
+                )
+                await session.flush()
+                session.add(
+                    CuratorRankEvent(
+                        deterministic_id=uuid.uuid4().hex,
+                        user_id=user_id,
+                        event_type="capture_verified",
+                        delta=1,
+                        capture_id=capture_id,
+                        node_id=node_id,
+                        created_at=created_at,
+                    )
+                )
+        await session.commit()
+
+    async with db_sessionmaker() as session:
+        await rematerialize_rank_range(db=session)
+        await session.commit()
+    return user_ids, node_ids
+
+
+@pytest.mark.asyncio
+async def test_global_leaderboard_orders_and_pages_by_keyset(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    user_ids, _ = await _seed_ranked_users(db_sessionmaker, points_by_user=[1, 3, 2])
+
+    first = await client.get("/v1/leaderboard", params={"limit": 2})
+    assert first.status_code == 200
+    payload = first.json()
+    assert payload["scope"] == "global"
+    assert payload["period"] == "all"
+    ranked = [(row["user_id"], row["points"], row["position"]) for row in payload["entries"]]
+    assert ranked == [
+        (str(user_ids[1]), 3, 1),
+        (str(user_ids[2]), 2, 2),
+    ]
+    assert payload["next_cursor"] is not None
+
+    second = await client.get(
+        "/v1/leaderboard", params={"limit": 2, "cursor": payload["next_cursor"]}
+    )
+    assert second.status_code == 200
+    second_payload = second.json()
+    assert [(entry["user_id"], entry["position"]) for entry in second_payload["entries"]] == [
+        (str(user_ids[0]), 3),
+    ]
+    assert second_payload["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_windowed_leaderboard_reads_refreshed_snapshot(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    recent_users, _ = await _seed_ranked_users(db_sessionmaker, points_by_user=[2])
+    stale_users, _ = await _seed_ranked_users(
+        db_sessionmaker,
+        points_by_user=[3],
+        created_at=utcnow() - dt.timedelta(days=60),
+    )
+
+    async with db_sessionmaker() as session:
+        refreshed = await refresh_rank_window(
+            db=session,
+            rank_version="v1_points",
+            window_days=30,
+            today=utcnow().date(),
+        )
+        await session.commit()
+    assert refreshed == 1
+
+    response = await client.get("/v1/leaderboard", params={"period": "30d"})
+    assert response.status_code == 200
+    entries = response.json()["entries"]
+    assert [entry["user_id"] for entry in entries] == [str(recent_users[0])]
+
+    all_time = await client.get("/v1/leaderboard")
+    assert [entry["user_id"] for entry in all_time.json()["entries"]] == [
+        str(stale_users[0]),
+        str(recent_users[0]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_node_scope_counts_only_that_node(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    user_ids, node_ids = await _seed_ranked_users(db_sessionmaker, points_by_user=[1, 3])
+
+    response = await client.get(
+        "/v1/leaderboard",
+        params={"scope": "node", "node_id": str(node_ids[1])},
+    )
+    assert response.status_code == 200
+    assert [(entry["user_id"], entry["points"]) for entry in response.json()["entries"]] == [
+        (str(user_ids[1]), 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_rejects_incomplete_scope_and_bad_cursor(client: AsyncClient) -> None:
+    missing_node = await client.get("/v1/leaderboard", params={"scope": "node"})
+    assert missing_node.status_code == 400
+    assert missing_node.json()["error"]["code"] == "invalid_leaderboard_scope"
+
+    missing_bbox = await client.get("/v1/leaderboard", params={"scope": "area"})
+    assert missing_bbox.status_code == 400
+    assert missing_bbox.json()["error"]["code"] == "invalid_leaderboard_scope"
+
+    bad_cursor = await client.get("/v1/leaderboard", params={"cursor": "not-a-cursor"})
+    assert bad_cursor.status_code == 400
+    assert bad_cursor.json()["error"]["code"] == "invalid_cursor"
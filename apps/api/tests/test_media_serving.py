@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from groundedart_api.main import create_app
+from groundedart_api.settings import get_settings
+from groundedart_api.storage.serving import MediaFileResponse
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache():
+    yield
+    get_settings.cache_clear()
+
+
+def make_client(monkeypatch, media_dir: Path, **env: str) -> AsyncClient:
+    monkeypatch.setenv("MEDIA_DIR", str(media_dir))
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    get_settings.cache_clear()
+    return AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://test")
+
+
+def write_media(media_dir: Path, relative_path: str, payload: bytes) -> None:
+    path = media_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+
+
+@pytest.mark.asyncio
+async def test_blob_is_immutable_with_content_etag_and_ranges(monkeypatch, tmp_path) -> None:
+    payload = bytes(range(256)) * 4
+    sha256 = hashlib.sha256(payload).hexdigest()
+    blob_path = f"blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}.jpg"
+    write_media(tmp_path, blob_path, payload)
+
+    async with make_client(monkeypatch, tmp_path) as client:
+        full = await client.get(f"/media/{blob_path}")
+        revalidated = await client.get(
+            f"/media/{blob_path}", headers={"If-None-Match": f'W/"{sha256}"'}
+        )
+        partial = await client.get(f"/media/{blob_path}", headers={"Range": "bytes=10-19"})
+        suffix = await client.get(f"/media/{blob_path}", headers={"Range": "bytes=-4"})
+        stale_range = await client.get(
+            f"/media/{blob_path}", headers={"Range": "bytes=0-9", "If-Range": '"other"'}
+        )
+        unsatisfiable = await client.get(
+            f"/media/{blob_path}", headers={"Range": f"bytes={len(payload)}-"}
+        )
+        head = await client.head(f"/media/{blob_path}")
+
+    assert full.status_code == 200
+    assert full.content == payload
+    assert full.headers["etag"] == f'"{sha256}"'
+    assert full.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert full.headers["content-type"] == "image/jpeg"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert partial.status_code == 206
+    assert partial.content == payload[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(payload)}"
+    assert suffix.content == payload[-4:]
+    assert stale_range.status_code == 200
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(payload)}"
+    assert head.status_code == 200
+    assert head.content == b""
+    assert head.headers["content-length"] == str(len(payload))
+
+
+@pytest.mark.asyncio
+async def test_variants_are_negotiated_by_accept(monkeypatch, tmp_path) -> None:
+    bucket = "variants/blobs/ab/cd/abcd/160"
+    write_media(tmp_path, f"{bucket}.jpg", b"jpeg")
+    write_media(tmp_path, f"{bucket}.webp", b"webp")
+    write_media(tmp_path, f"{bucket}.avif", b"avif")
+
+    async with make_client(monkeypatch, tmp_path) as client:
+        avif = await client.get(
+            f"/media/{bucket}.jpg", headers={"Accept": "image/avif,image/webp,*/*;q=0.8"}
+        )
+        webp = await client.get(
+            f"/media/{bucket}.jpg", headers={"Accept": "image/avif;q=0,image/webp"}
+        )
+        fallback = await client.get(f"/media/{bucket}.webp", headers={"Accept": "*/*"})
+        cached = await client.get(
+            f"/media/{bucket}.jpg",
+            headers={"Accept": "image/avif", "If-None-Match": avif.headers["etag"]},
+        )
+
+    assert (avif.content, avif.headers["content-type"]) == (b"avif", "image/avif")
+    assert (webp.content, webp.headers["content-type"]) == (b"webp", "image/webp")
+    assert fallback.content == b"webp"
+    for response in (avif, webp, fallback):
+        assert "Accept" in response.headers["vary"]
+    assert cached.status_code == 304
+    assert "Accept" in cached.headers["vary"]
+
+
+@pytest.mark.asyncio
+async def test_mutable_paths_revalidate_and_hidden_files_are_not_served(
+    monkeypatch, tmp_path
+) -> None:
+    write_media(tmp_path, "nodes/mural.jpg", b"node image")
+    write_media(tmp_path, ".upload-partial.jpg", b"in flight")
+
+    async with make_client(monkeypatch, tmp_path, MEDIA_CACHE_MAX_AGE_SECONDS="60") as client:
+        node = await client.get("/media/nodes/mural.jpg")
+        versioned = await client.get("/media/nodes/mural.jpg?v=2")
+        hidden = await client.get("/media/.upload-partial.jpg")
+        escaped = await client.get("/media/nodes/..%2F..%2Fetc%2Fpasswd")
+        missing = await client.get("/media/nodes/missing.jpg")
+
+    assert node.status_code == 200
+    assert node.headers["cache-control"] == "public, max-age=60"
+    assert node.headers["etag"].startswith('"')
+    assert "Accept" not in node.headers.get("vary", "")
+    assert versioned.headers["cache-control"].endswith("immutable")
+    assert [hidden.status_code, escaped.status_code, missing.status_code] == [404, 404, 404]
+
+
+@pytest.mark.asyncio
+async def test_accel_redirect_hands_the_body_to_the_proxy(monkeypatch, tmp_path) -> None:
+    write_media(tmp_path, "nodes/mural.jpg", b"node image")
+
+    async with make_client(
+        monkeypatch, tmp_path, MEDIA_ACCEL_REDIRECT_PREFIX="/_media/"
+    ) as client:
+        response = await client.get("/media/nodes/mural.jpg")
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["x-accel-redirect"] == "/_media/nodes/mural.jpg"
+    assert response.headers["cache-control"] == "public, max-age=300"
+
+
+@pytest.mark.asyncio
+async def test_file_response_uses_zero_copy_extensions(tmp_path) -> None:
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"0123456789")
+    sent: list[dict] = []
+
+    async def send(message) -> None:
+        if message["type"] == "http.response.zerocopysend":
+            message = {**message, "file": message["file"].name}
+        sent.append(message)
+
+    async def receive() -> dict:
+        return {"type": "http.disconnect"}
+
+    zerocopy = {"type": "http", "extensions": {"http.response.zerocopysend": {}}}
+    await MediaFileResponse(str(path), start=2, end=6, status_code=206, headers={})(
+        zerocopy, receive, send
+    )
+    pathsend = {"type": "http", "extensions": {"http.response.pathsend": {}}}
+    await MediaFileResponse(str(path), start=0, end=10, headers={})(pathsend, receive, send)
+    await MediaFileResponse(str(path), start=8, end=10, headers={})(
+        {"type": "http"}, receive, send
+    )
+
+    bodies = [message for message in sent if message["type"] != "http.response.start"]
+    assert bodies == [
+        {
+            "type": "http.response.zerocopysend",
+            "file": str(path),
+            "offset": 2,
+            "count": 4,
+            "more_body": False,
+        },
+        {"type": "http.response.pathsend", "path": str(path)},
+        {"type": "http.response.body", "body": b"89", "more_body": False},
+    ]
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import datetime as dt
+import io
+import uuid
+
+import pytest
+from geoalchemy2.elements import WKTElement
+from httpx import ASGITransport, AsyncClient
+from PIL import Image, ImageDraw, ImageEnhance
+from sqlalchemy import select
+
+from groundedart_api.auth.tokens import generate_opaque_token, hash_opaque_token
+from groundedart_api.db.models import AbuseEvent, Capture, CheckinToken, MediaBlob, Node, utcnow
+from groundedart_api.domain.media_variants import MediaVariantPipeline, VariantJob
+from groundedart_api.domain.near_duplicates import band_neighbors, phash_bands
+from groundedart_api.main import create_app
+from groundedart_api.settings import get_settings
+from groundedart_api.storage.perceptual_hash import (
+    from_signed64,
+    hamming_distance,
+    phash,
+    to_signed64,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache():
+    yield
+    get_settings.cache_clear()
+
+
+def mural(seed: int = 0, size: tuple[int, int] = (640, 480)) -> Image.Image:
+    image = Image.new("RGB", size, (30 + seed * 40, 60, 90))
+    draw = ImageDraw.Draw(image)
+    width, height = size
+    for index in range(6):
+        left = (index * 97 + seed * 131) % (width - 120)
+        top = (index * 61 + seed * 53) % (height - 120)
+        draw.ellipse(
+            (left, top, left + 80 + index * 10, top + 60 + index * 15),
+            fill=((index * 45 + seed * 90) % 256, 200 - index * 25, (index * 70) % 256),
+        )
+    draw.rectangle((width // 3, height // 2, width // 3 + 150, height // 2 + 40), fill="white")
+    return image
+
+
+def jpeg_bytes(image: Image.Image, *, quality: int = 90) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def test_phash_is_stable_under_recompression_resize_and_brightness() -> None:
+    original = mural()
+    reference = phash(original)
+    recompressed = phash(Image.open(io.BytesIO(jpeg_bytes(original, quality=35))))
+    resized = phash(original.resize((213, 160)))
+    brighter = phash(ImageEnhance.Brightness(original).enhance(1.2))
+
+    for variant in (recompressed, resized, brighter):
+        assert hamming_distance(reference, variant) <= 4
+    assert hamming_distance(reference, phash(mural(seed=3))) > 16
+
+
+def test_bands_and_neighbors_cover_the_search_radius() -> None:
+    value = 0x0123_4567_89AB_CDEF
+    assert phash_bands(value) == [0x0123, 0x4567, 0x89AB, 0xCDEF]
+    assert from_signed64(to_signed64(0xFFFF_0000_0000_0001)) == 0xFFFF_0000_0000_0001
+    assert to_signed64(0xFFFF_FFFF_FFFF_FFFF) == -1
+
+    neighbors = band_neighbors(0x0F0F, 2)
+    assert len(neighbors) == len(set(neighbors)) == 1 + 16 + 120
+    assert all(hamming_distance(0x0F0F, neighbor) <= 2 for neighbor in neighbors)
+    # Pigeonhole: a hash within 9 bits shares some band within 9 // 4 == 2 bits.
+    other = value ^ 0b111 ^ (0b111 << 20) ^ (0b111 << 40)
+    assert any(
+        mine in band_neighbors(theirs, 2)
+        for mine, theirs in zip(phash_bands(value), phash_bands(other), strict=True)
+    )
+
+
+def make_client(monkeypatch, media_dir) -> AsyncClient:
+    monkeypatch.setenv("MEDIA_DIR", str(media_dir))
+    monkeypatch.setenv("UPLOAD_ALLOWED_MIME_TYPES", '["image/jpeg"]')
+    get_settings.cache_clear()
+    return AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://test")
+
+
+async def upload_capture(db_sessionmaker, client: AsyncClient, payload: bytes) -> uuid.UUID:
+    node_id = uuid.uuid4()
+    async with db_sessionmaker() as session:
+        session.add(
+            Node(
+                id=node_id,
+                name="Near Duplicate Node",
+                category="mural",
+                description=None,
+                location=WKTElement("POINT(-122.40 37.78)", srid=4326),
+                radius_m=25,
+                min_rank=0,
+            )
+        )
+        await session.commit()
+
+    session_response = await client.post(
+        "/v1/sessions/anonymous", json={"device_id": str(uuid.uuid4())}
+    )
+    assert session_response.status_code == 200
+    user_id = uuid.UUID(session_response.json()["user_id"])
+    token = generate_opaque_token()
+    async with db_sessionmaker() as session:
+        session.add(
+            CheckinToken(
+                user_id=user_id,
+                node_id=node_id,
+                token_hash=hash_opaque_token(token, get_settings()),
+                expires_at=utcnow() + dt.timedelta(seconds=30),
+            )
+        )
+        await session.commit()
+
+    created = await client.post(
+        "/v1/captures", json={"node_id": str(node_id), "checkin_token": token}
+    )
+    assert created.status_code == 200
+    capture_id = uuid.UUID(created.json()["capture"]["id"])
+    uploaded = await client.post(
+        f"/v1/captures/{capture_id}/image",
+        files={"file": ("photo.jpg", payload, "image/jpeg")},
+    )
+    assert uploaded.status_code == 200
+    return capture_id
+
+
+async def run_pipeline(db_sessionmaker, capture_id: uuid.UUID) -> None:
+    async with db_sessionmaker() as session:
+        capture = await session.get(Capture, capture_id)
+    pipeline = MediaVariantPipeline(get_settings(), sessionmaker=db_sessionmaker)
+    try:
+        await pipeline.process(
+            VariantJob(
+                kind="capture",
+                source_path=capture.image_path,
+                sha256=capture.image_sha256,
+                capture_id=capture.id,
+            )
+        )
+    finally:
+        await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_reupload_by_another_user_is_flagged_and_listed(
+    db_sessionmaker, monkeypatch, tmp_path
+) -> None:
+    original = mural()
+    async with make_client(monkeypatch, tmp_path) as first_client:
+        first_id = await upload_capture(db_sessionmaker, first_client, jpeg_bytes(original))
+        await run_pipeline(db_sessionmaker, first_id)
+        unrelated_id = await upload_capture(
+            db_sessionmaker, first_client, jpeg_bytes(mural(seed=3))
+        )
+        await run_pipeline(db_sessionmaker, unrelated_id)
+
+    async with make_client(monkeypatch, tmp_path) as second_client:
+        resized = original.resize((480, 360))
+        second_id = await upload_capture(
+            db_sessionmaker, second_client, jpeg_bytes(resized, quality=60)
+        )
+        await run_pipeline(db_sessionmaker, second_id)
+
+        settings = get_settings()
+        response = await second_client.get(
+            f"/v1/admin/captures/{second_id}/similar",
+            headers={"X-Admin-Token": settings.admin_api_token},
+        )
+        missing = await second_client.get(
+            f"/v1/admin/captures/{uuid.uuid4()}/similar",
+            headers={"X-Admin-Token": settings.admin_api_token},
+        )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert len(payload["phash"]) == 16
+    assert [match["capture"]["id"] for match in payload["matches"]] == [str(first_id)]
+    assert payload["matches"][0]["distance"] <= settings.near_duplicate_flag_distance
+    assert missing.status_code == 404
+
+    async with db_sessionmaker() as session:
+        events = (
+            await session.scalars(
+                select(AbuseEvent).where(AbuseEvent.event_type == "capture_near_duplicate")
+            )
+        ).all()
+        hashed = (
+            await session.scalars(select(MediaBlob).where(MediaBlob.phash.is_not(None)))
+        ).all()
+    assert [event.capture_id for event in events] == [second_id]
+    assert events[0].details["matches"][0]["capture_id"] == str(first_id)
+    assert len(hashed) == 3
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from groundedart_api.domain.rank_cache import (
+    RankCache,
+    RankCacheEntry,
+    RankChangeListener,
+    notify_rank_changed,
+)
+from groundedart_api.settings import get_settings
+
+ENTRY = RankCacheEntry(
+    points_total=3,
+    verified_captures_total=4,
+    verified_captures_counted=3,
+    per_node_per_day_removed=1,
+    per_day_removed=0,
+)
+
+
+async def _wait_for(predicate, *, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.02)
+
+
+def test_rank_cache_is_bypassed_until_listening_and_ignores_raced_loads() -> None:
+    cache = RankCache(ttl_seconds=60.0, max_entries=10)
+    key = (uuid.uuid4(), "v1_points")
+
+    cache.put(key, ENTRY, generation=cache.generation)
+    assert cache.get(key) is None
+
+    cache.set_listening(True)
+    generation = cache.generation
+    cache.handle_notification(f"v1_points:{uuid.uuid4()}")
+    cache.put(key, ENTRY, generation=generation)
+    assert cache.get(key) is None
+
+    cache.put(key, ENTRY, generation=cache.generation)
+    assert cache.get(key) == ENTRY
+
+    cache.handle_notification("v1_points:*")
+    assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_rank_changed_notification_invalidates_listening_cache(db_sessionmaker) -> None:
+    cache = RankCache(ttl_seconds=60.0, max_entries=10)
+    listener = RankChangeListener(cache, database_url=get_settings().database_url)
+    listener.start()
+    try:
+        await _wait_for(lambda: cache.active)
+        user_id = uuid.uuid4()
+        cache.put((user_id, "v1_points"), ENTRY, generation=cache.generation)
+        assert cache.get((user_id, "v1_points")) == ENTRY
+
+        async with db_sessionmaker() as session:
+            await notify_rank_changed(db=session, rank_version="v1_points", user_ids=[user_id])
+            await session.rollback()
+        await asyncio.sleep(0.2)
+        assert cache.get((user_id, "v1_points")) == ENTRY
+
+        async with db_sessionmaker() as session:
+            await notify_rank_changed(db=session, rank_version="v1_points", user_ids=[user_id])
+            await session.commit()
+        await _wait_for(lambda: cache.get((user_id, "v1_points")) is None)
+    finally:
+        await listener.stop()
+    assert not cache.active
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 from pathlib import Path
 import uuid
@@ -7,10 +8,24 @@ import uuid
 import pytest
 from geoalchemy2.elements import WKTElement
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 
 from groundedart_api.auth.tokens import generate_opaque_token, hash_opaque_token
-from groundedart_api.db.models import CheckinToken, CuratorRankEvent, Node, utcnow
+from groundedart_api.db.models import (
+    CheckinToken,
+    CuratorRankCache,
+    CuratorRankDaily,
+    CuratorRankEvent,
+    Node,
+    RankRefreshOutbox,
+    utcnow,
+)
+from groundedart_api.domain.rank_materialization import (
+    refresh_rank_for_user_day,
+    refresh_rank_for_user_days,
+    rematerialize_rank_range,
+)
+from groundedart_api.domain.rank_outbox import process_rank_refresh_batch
 from groundedart_api.domain.rank_projection import compute_rank_projection
 from groundedart_api.settings import get_settings
 
@@ -110,3 +125,248 @@ async def test_verified_capture_emits_rank_event_and_updates_projection(
         assert projection.breakdown.points_total == 1
         assert projection.breakdown.verified_captures_total == 1
         assert projection.breakdown.verified_captures_counted == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_mode_defers_rank_refresh_to_worker(
+    db_sessionmaker,
+    client: AsyncClient,
+    monkeypatch,
+) -> None:
+    capture_id, _, user_id = await create_pending_capture(db_sessionmaker, client)
+    monkeypatch.setenv("RANK_REFRESH_MODE", "outbox")
+    get_settings.cache_clear()
+    settings = get_settings()
+
+    response = await client.post(
+        f"/v1/admin/captures/{capture_id}/transition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={"target_state": "verified", "reason_code": "manual_review_pass"},
+    )
+    assert response.status_code == 200
+
+    async with db_sessionmaker() as session:
+        cache = await session.get(CuratorRankCache, (user_id, "v1_points"))
+        assert cache is not None
+        assert cache.points_total == 0
+        pending = (await session.scalars(select(RankRefreshOutbox))).all()
+        assert [(row.user_id, row.day) for row in pending] == [
+            (user_id, utcnow().date()),
+        ]
+
+    async with db_sessionmaker() as session:
+        result = await process_rank_refresh_batch(db=session, batch_size=10)
+        assert result.claimed == 1
+        assert result.users == 1
+
+    async with db_sessionmaker() as session:
+        cache = await session.get(CuratorRankCache, (user_id, "v1_points"))
+        assert cache is not None
+        assert cache.points_total == 1
+        assert cache.verified_captures_total == 1
+        assert (await session.scalars(select(RankRefreshOutbox))).all() == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rank_refreshes_for_one_user_run_one_at_a_time(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    capture_id, _, user_id = await create_pending_capture(db_sessionmaker, client)
+    settings = get_settings()
+    response = await client.post(
+        f"/v1/admin/captures/{capture_id}/transition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={"target_state": "verified", "reason_code": "manual_review_pass"},
+    )
+    assert response.status_code == 200
+    keys = {(user_id, "v1_points", utcnow().date())}
+
+    async with db_sessionmaker() as first, db_sessionmaker() as second:
+        assert await refresh_rank_for_user_days(db=first, keys=keys) == 1
+        racing = asyncio.create_task(refresh_rank_for_user_days(db=second, keys=keys))
+        await asyncio.sleep(0.2)
+        # The second refresh waits for the first transaction before reading daily rows.
+        assert not racing.done()
+        await first.commit()
+        assert await asyncio.wait_for(racing, timeout=5) == 1
+        await second.commit()
+
+    async with db_sessionmaker() as session:
+        cache = await session.get(CuratorRankCache, (user_id, "v1_points"))
+        assert cache is not None
+        assert cache.points_total == 1
+
+
+@pytest.mark.asyncio
+async def test_rank_range_rebuild_blocks_concurrent_refresh_for_users_in_range(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    capture_id, _, user_id = await create_pending_capture(db_sessionmaker, client)
+    settings = get_settings()
+    response = await client.post(
+        f"/v1/admin/captures/{capture_id}/transition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={"target_state": "verified", "reason_code": "manual_review_pass"},
+    )
+    assert response.status_code == 200
+
+    async with db_sessionmaker() as first, db_sessionmaker() as second:
+        result = await rematerialize_rank_range(db=first)
+        assert result.daily_rows == 1
+        racing = asyncio.create_task(
+            refresh_rank_for_user_day(db=second, user_id=user_id, day=utcnow().date())
+        )
+        await asyncio.sleep(0.2)
+        # The refresh waits for the range rebuild instead of writing between its statements.
+        assert not racing.done()
+        await first.commit()
+        cache = await asyncio.wait_for(racing, timeout=5)
+        assert cache.points_total == 1
+        await second.commit()
+
+    async with db_sessionmaker() as session:
+        cache = await session.get(CuratorRankCache, (user_id, "v1_points"))
+        assert cache is not None
+        assert cache.points_total == 1
+
+
+@pytest.mark.asyncio
+async def test_rematerialize_rank_range_dry_run_and_rebuild(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    capture_id, _, user_id = await create_pending_capture(db_sessionmaker, client)
+    settings = get_settings()
+    response = await client.post(
+        f"/v1/admin/captures/{capture_id}/transition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={"target_state": "verified", "reason_code": "manual_review_pass"},
+    )
+    assert response.status_code == 200
+
+    async with db_sessionmaker() as session:
+        await session.execute(delete(CuratorRankDaily).where(CuratorRankDaily.user_id == user_id))
+        await session.execute(
+            update(CuratorRankCache)
+            .where(CuratorRankCache.user_id == user_id)
+            .values(points_total=0, verified_captures_total=0, verified_captures_counted=0)
+        )
+        await session.commit()
+
+    async with db_sessionmaker() as session:
+        diff = await rematerialize_rank_range(db=session, dry_run=True)
+        assert diff.users == 1
+        assert diff.users_changed == 1
+        assert diff.daily_added == 1
+        assert diff.daily_removed == 0
+        await session.rollback()
+
+    async with db_sessionmaker() as session:
+        result = await rematerialize_rank_range(db=session)
+        await session.commit()
+        assert result.users == 1
+        assert result.daily_rows == 1
+
+    async with db_sessionmaker() as session:
+        cache = await session.get(CuratorRankCache, (user_id, "v1_points"))
+        assert cache is not None
+        assert cache.points_total == 1
+        clean = await rematerialize_rank_range(db=session, dry_run=True)
+        assert clean.users_changed == 0
+        assert clean.daily_added == clean.daily_removed == clean.daily_changed == 0
+
+
+@pytest.mark.asyncio
+async def test_rank_history_buckets_and_running_totals(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    session_response = await client.post(
+        "/v1/sessions/anonymous",
+        json={"device_id": str(uuid.uuid4())},
+    )
+    assert session_response.status_code == 200
+    user_id = uuid.UUID(session_response.json()["user_id"])
+
+    daily = {
+        dt.date(2026, 1, 20): (2, 0),
+        dt.date(2026, 3, 2): (3, 1),
+        dt.date(2026, 3, 4): (1, 0),
+        dt.date(2026, 3, 17): (2, 0),
+    }
+    async with db_sessionmaker() as session:
+        for day, (points, per_day_removed) in daily.items():
+            session.add(
+                CuratorRankDaily(
+                    user_id=user_id,
+                    rank_version="v1_points",
+                    day=day,
+                    verified_captures_total=points + per_day_removed,
+                    verified_captures_unique=points + per_day_removed,
+                    points_counted=points,
+                    per_node_per_day_removed=0,
+                    per_day_removed=per_day_removed,
+                )
+            )
+        await session.commit()
+
+    response = await client.get(
+        "/v1/me/rank/history",
+        params={"from": "2026-03-01", "to": "2026-03-20", "bucket": "week"},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["bucket"] == "week"
+    assert payload["from"] == "2026-03-01"
+    assert [
+        (point["bucket_start"], point["points"], point["points_cumulative"])
+        for point in payload["points"]
+    ] == [
+        ("2026-02-23", 0, 2),
+        ("2026-03-02", 4, 6),
+        ("2026-03-09", 0, 6),
+        ("2026-03-16", 2, 8),
+    ]
+    assert payload["points"][1]["caps_applied"]["per_day_total"] == 1
+
+    auto = await client.get(
+        "/v1/me/rank/history",
+        params={"from": "2024-01-01", "to": "2026-03-20"},
+    )
+    assert auto.status_code == 200
+    assert auto.json()["bucket"] == "month"
+    assert len(auto.json()["points"]) == 27
+    assert auto.json()["points"][-1]["points_cumulative"] == 8
+
+    too_long = await client.get(
+        "/v1/me/rank/history",
+        params={"from": "2020-01-01", "to": "2026-03-20", "bucket": "day"},
+    )
+    assert too_long.status_code == 400
+    assert too_long.json()["error"]["code"] == "invalid_rank_history_range"
+
+    # Even month buckets are capped; the calendar's ends must not overflow.
+    too_long_auto = await client.get(
+        "/v1/me/rank/history", params={"from": "0001-01-01", "to": "2026-03-20"}
+    )
+    assert too_long_auto.status_code == 400
+    assert too_long_auto.json()["error"]["details"]["bucket"] == "month"
+    earliest = await client.get(
+        "/v1/me/rank/history", params={"from": "0001-01-01", "to": "0001-01-05"}
+    )
+    assert earliest.status_code == 200
+    assert earliest.json()["points"][0] == {
+        "bucket_start": "0001-01-01",
+        "points": 0,
+        "points_cumulative": 0,
+        "verified_captures": 0,
+        "caps_applied": {"per_node_per_day": 0, "per_day_total": 0},
+    }
+    assert (await client.get("/v1/me/rank/history", params={"to": "0001-01-05"})).status_code == 200
+    latest = await client.get(
+        "/v1/me/rank/history", params={"from": "9999-12-01", "to": "9999-12-31", "bucket": "week"}
+    )
+    assert latest.status_code == 200
+    assert latest.json()["points"][-1]["points_cumulative"] == 8
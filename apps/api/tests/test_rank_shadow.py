@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from geoalchemy2.elements import WKTElement
+from sqlalchemy import select
+
+from groundedart_api.db.models import (
+    Capture,
+    CuratorRankCache,
+    CuratorRankDaily,
+    CuratorRankEvent,
+    Node,
+    User,
+    utcnow,
+)
+from groundedart_api.domain.rank_policies import RankPolicy
+from groundedart_api.domain.rank_shadow import run_shadow_rank_pass
+
+
+async def _seed_events(db_sessionmaker, *, user_id: uuid.UUID, node_visits: list[int]) -> None:
+    """`node_visits[i]` verified captures at node i, all on the same UTC day."""
+    created_at = utcnow()
+    async with db_sessionmaker() as session:
+        session.add(User(id=user_id))
+        node_ids = [uuid.uuid4() for _ in node_visits]
+        for index, node_id in enumerate(node_ids):
+            session.add(
+                Node(
+                    id=node_id,
+                    name=f"Shadow Node {index}",
+                    category="mural",
+                    description=None,
+                    location=WKTElement(f"POINT(-122.{40 + index} 37.78)", srid=4326),
+                    radius_m=25,
+                    min_rank=0,
+                )
+            )
+        await session.flush()
+        for node_id, visits in zip(node_ids, node_visits, strict=True):
+            for _ in range(visits):
+                capture_id = uuid.uuid4()
+                session.add(
+                    Capture(
+                        id=capture_id,
+                        user_id=user_id,
+                        node_id=node_id,
+                        state="verified",
+                        created_at=created_at,
+                    )
+                )
+                await session.flush()
+                session.add(
+                    CuratorRankEvent(
+                        deterministic_id=uuid.uuid4().hex,
+                        user_id=user_id,
+                        event_type="capture_verified",
+                        delta=1,
+                        capture_id=capture_id,
+                        node_id=node_id,
+                        created_at=created_at,
+                    )
+                )
+        await session.commit()
+
+
+def test_rank_policy_scores_day_with_node_and_day_caps() -> None:
+    baseline = RankPolicy(version="v1_points")
+    assert baseline.score_day([2, 1, 1, 1, 1]) == {
+        "verified_captures_total": 6,
+        "verified_captures_unique": 5,
+        "points_counted": 3,
+        "per_node_per_day_removed": 1,
+        "per_day_removed": 2,
+    }
+    lenient = RankPolicy(version="v2_node2", per_day_points_cap=10, per_node_per_day_cap=2)
+    assert lenient.score_day([2, 1, 1, 1, 1])["points_counted"] == 6
+
+
+@pytest.mark.asyncio
+async def test_shadow_pass_writes_each_version_and_reports_divergence(db_sessionmaker) -> None:
+    busy_user = uuid.uuid4()
+    quiet_user = uuid.uuid4()
+    await _seed_events(db_sessionmaker, user_id=busy_user, node_visits=[2, 1, 1, 1, 1])
+    await _seed_events(db_sessionmaker, user_id=quiet_user, node_visits=[1])
+
+    policies = [
+        RankPolicy(version="v2_cap5", per_day_points_cap=5),
+        RankPolicy(version="v2_node2", per_day_points_cap=10, per_node_per_day_cap=2),
+    ]
+    async with db_sessionmaker() as session:
+        report = await run_shadow_rank_pass(db=session, policies=policies, flush_rows=2)
+        await session.commit()
+
+    assert report.users_scanned == 2
+    assert report.source_rows == 6
+    assert report.daily_rows_written == 4
+    by_version = {policy.version: policy for policy in report.policies}
+    assert by_version["v2_cap5"].users_changed == 1
+    assert by_version["v2_cap5"].points_delta == 2
+    assert by_version["v2_node2"].top_movers[0].user_id == busy_user
+    assert by_version["v2_node2"].top_movers[0].baseline_points == 3
+    assert by_version["v2_node2"].top_movers[0].candidate_points == 6
+
+    async with db_sessionmaker() as session:
+        caches = {
+            (row.user_id, row.rank_version): row.points_total
+            for row in (await session.scalars(select(CuratorRankCache))).all()
+        }
+        assert caches[(busy_user, "v2_cap5")] == 5
+        assert caches[(busy_user, "v2_node2")] == 6
+        assert caches[(quiet_user, "v2_node2")] == 1
+        assert (busy_user, "v1_points") not in caches
+        daily_versions = set(
+            (await session.scalars(select(CuratorRankDaily.rank_version))).all()
+        )
+        assert daily_versions == {"v2_cap5", "v2_node2"}
+
+    async with db_sessionmaker() as session:
+        rerun = await run_shadow_rank_pass(db=session, policies=policies[:1], write=False)
+        await session.rollback()
+    assert rerun.daily_rows_written == 0
+    assert rerun.policies[0].users_changed == 1
@@ -6,10 +6,15 @@ import uuid
 import pytest
 from geoalchemy2.elements import WKTElement
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 
-from groundedart_api.db.models import Capture, ContentReport, Node, User
+from groundedart_api.db.models import Capture, CaptureEvent, ContentReport, Node, User
 from groundedart_api.domain.capture_state import CaptureState
+from groundedart_api.domain.content_reports import (
+    auto_hide_reported_capture,
+    increment_report_counters,
+)
+from groundedart_api.domain.verification_events import NoopVerificationEventEmitter
 from groundedart_api.settings import get_settings
 
 
@@ -106,3 +111,147 @@ async def test_reports_create_list_and_resolve(db_sessionmaker, client: AsyncCli
             select(ContentReport).where(ContentReport.capture_id == capture_id)
         )
         assert report_in_db is not None
+
+
+async def file_report(client: AsyncClient, capture_id: uuid.UUID, reason: str) -> None:
+    session_response = await client.post(
+        "/v1/sessions/anonymous",
+        json={"device_id": str(uuid.uuid4())},
+    )
+    assert session_response.status_code == 200
+    response = await client.post(f"/v1/captures/{capture_id}/reports", json={"reason": reason})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_reports_aggregate_per_capture_and_auto_hide_once(
+    db_sessionmaker,
+    client: AsyncClient,
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("REPORT_AUTO_HIDE_THRESHOLD", "3")
+    get_settings.cache_clear()
+    settings = get_settings()
+    headers = {"X-Admin-Token": settings.admin_api_token}
+    _, capture_id = await create_reportable_capture(db_sessionmaker)
+
+    await file_report(client, capture_id, "spam")
+    await file_report(client, capture_id, "spam")
+
+    groups = await client.get("/v1/admin/reports/by-capture", headers=headers)
+    assert groups.status_code == 200
+    [group] = groups.json()["groups"]
+    assert group["capture_id"] == str(capture_id)
+    assert group["open_reports"] == 2
+    assert group["open_reason_counts"] == {"spam": 2}
+    assert group["capture_state"] == CaptureState.verified.value
+    assert group["auto_hidden_at"] is None
+
+    await file_report(client, capture_id, "privacy")
+
+    async with db_sessionmaker() as session:
+        capture = await session.get(Capture, capture_id)
+        assert capture is not None
+        assert capture.state == CaptureState.hidden.value
+        assert capture.state_reason == "report_threshold_hide"
+        hide_events = (
+            await session.scalars(
+                select(CaptureEvent).where(
+                    CaptureEvent.capture_id == capture_id,
+                    CaptureEvent.to_state == CaptureState.hidden.value,
+                )
+            )
+        ).all()
+        assert len(hide_events) == 1
+        assert hide_events[0].actor_type == "system"
+
+    [group] = (await client.get("/v1/admin/reports/by-capture", headers=headers)).json()["groups"]
+    assert group["open_reports"] == 3
+    assert group["open_reason_counts"] == {"spam": 2, "privacy": 1}
+    assert group["auto_hidden_at"] is not None
+
+    resolve = await client.post(
+        f"/v1/admin/captures/{capture_id}/reports:resolve",
+        headers=headers,
+        json={"resolution": "dismissed"},
+    )
+    assert resolve.status_code == 200
+    assert resolve.json()["resolved"] == 3
+
+    groups = await client.get("/v1/admin/reports/by-capture", headers=headers)
+    assert groups.json()["groups"] == []
+    all_groups = await client.get(
+        "/v1/admin/reports/by-capture",
+        params={"include_resolved": "true"},
+        headers=headers,
+    )
+    [group] = all_groups.json()["groups"]
+    assert group["open_reports"] == 0
+    assert group["total_reports"] == 3
+    assert group["open_reason_counts"] == {}
+
+    async with db_sessionmaker() as session:
+        open_reports = await session.scalar(
+            select(func.count())
+            .select_from(ContentReport)
+            .where(ContentReport.capture_id == capture_id, ContentReport.resolved_at.is_(None))
+        )
+        assert open_reports == 0
+
+    again = await client.post(
+        f"/v1/admin/captures/{capture_id}/reports:resolve",
+        headers=headers,
+        json={"resolution": "dismissed"},
+    )
+    assert again.status_code == 404
+    assert again.json()["error"]["code"] == "no_open_reports"
+
+
+@pytest.mark.asyncio
+async def test_auto_hide_sees_a_hide_committed_after_the_capture_was_loaded(
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    settings = get_settings()
+    _, capture_id = await create_reportable_capture(db_sessionmaker)
+
+    async with db_sessionmaker() as session:
+        capture = await session.get(Capture, capture_id)
+        assert capture is not None
+        assert capture.state == CaptureState.verified.value
+
+        hide = await client.post(
+            f"/v1/admin/captures/{capture_id}/transition",
+            headers={"X-Admin-Token": settings.admin_api_token},
+            json={"target_state": "hidden", "reason_code": "manual_review_hide"},
+        )
+        assert hide.status_code == 200
+
+        now = dt.datetime.now(dt.UTC)
+        counter = await increment_report_counters(
+            db=session, capture_id=capture_id, reason="spam", now=now
+        )
+        hidden = await auto_hide_reported_capture(
+            db=session,
+            capture=capture,
+            counter=counter,
+            threshold=1,
+            verification_events=NoopVerificationEventEmitter(),
+            rank_refresh_mode="inline",
+            now=now,
+        )
+        assert hidden is False
+        assert counter.auto_hidden_at is None
+        await session.commit()
+
+    async with db_sessionmaker() as session:
+        hide_events = (
+            await session.scalars(
+                select(CaptureEvent).where(
+                    CaptureEvent.capture_id == capture_id,
+                    CaptureEvent.to_state == CaptureState.hidden.value,
+                )
+            )
+        ).all()
+        assert len(hide_events) == 1
+        assert hide_events[0].reason_code == "manual_review_hide"
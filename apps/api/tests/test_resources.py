@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from groundedart_api.domain.tip_receipts import get_tip_receipt_provider
+from groundedart_api.main import create_app
+from groundedart_api.resources import close_app_resources, get_app_resources
+from groundedart_api.settings import get_settings
+from groundedart_api.storage.deps import get_media_storage
+
+
+@pytest.mark.asyncio
+async def test_resources_are_shared_per_settings_and_pools_are_reused(
+    tmp_path, monkeypatch
+) -> None:
+    settings = get_settings()
+    assert get_media_storage(settings) is get_media_storage(settings)
+    assert get_tip_receipt_provider(settings) is get_tip_receipt_provider(settings)
+
+    resources = get_app_resources(settings)
+    client = resources.solana_rpc_client
+    assert resources.solana_rpc_client is client
+    assert resources.webhook_client is not client
+
+    monkeypatch.setenv("MEDIA_DIR", str(tmp_path / "media"))
+    get_settings.cache_clear()
+    swapped = get_settings()
+    current = get_app_resources(swapped)
+    assert current is not resources
+    assert get_media_storage(swapped) is current.media_storage
+
+    # The replaced registry is closed rather than left holding its pools.
+    await close_app_resources()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_the_registry_it_opened(monkeypatch) -> None:
+    for name in (
+        "RANK_CACHE_ENABLED",
+        "ABUSE_EVENTS_BUFFERED",
+        "USER_EVENTS_LISTENER_ENABLED",
+        "MEDIA_VARIANTS_ENABLED",
+    ):
+        monkeypatch.setenv(name, "false")
+    get_settings.cache_clear()
+    app = create_app()
+
+    async with app.router.lifespan_context(app):
+        client = app.state.resources.webhook_client
+        # Settings swapped mid-run: shutdown still closes the instance on app.state.
+        get_settings.cache_clear()
+        replacement = get_app_resources(get_settings())
+        replacement_client = replacement.webhook_client
+    assert client.is_closed
+    assert not replacement_client.is_closed
+    await close_app_resources()
+    assert replacement_client.is_closed
+    get_settings.cache_clear()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from groundedart_api.auth.revocation import get_session_revocation_list
+from groundedart_api.auth.tokens import (
+    generate_signed_session_token,
+    hash_opaque_token,
+    is_signed_session_token,
+    verify_signed_session_token,
+)
+from groundedart_api.db.models import Session
+from groundedart_api.settings import get_settings
+
+
+@pytest.fixture
+def signed_sessions(monkeypatch):
+    monkeypatch.setenv("SESSION_TOKEN_FORMAT", "signed")
+    get_settings.cache_clear()
+    get_session_revocation_list().invalidate()
+    yield
+    get_settings.cache_clear()
+    get_session_revocation_list().invalidate()
+
+
+def test_signed_session_token_roundtrip_and_tamper_detection() -> None:
+    settings = get_settings()
+    session_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    expires_at = dt.datetime(2030, 1, 1, tzinfo=dt.UTC)
+
+    token = generate_signed_session_token(
+        session_id=session_id,
+        user_id=user_id,
+        expires_at=expires_at,
+        settings=settings,
+    )
+    assert is_signed_session_token(token)
+
+    claims = verify_signed_session_token(token, settings)
+    assert claims is not None
+    assert claims.session_id == session_id
+    assert claims.user_id == user_id
+    assert claims.expires_at == expires_at
+
+    message, _, mac = token.rpartition(".")
+    tampered = f"{message[:-1]}{'A' if message[-1] != 'A' else 'B'}.{mac}"
+    assert verify_signed_session_token(tampered, settings) is None
+    assert verify_signed_session_token("v1.not-a-token", settings) is None
+    assert verify_signed_session_token("opaque-token", settings) is None
+
+    other_settings = settings.model_copy(update={"token_hash_secret": "another-secret"})
+    assert verify_signed_session_token(token, other_settings) is None
+
+
+@pytest.mark.asyncio
+async def test_signed_session_authenticates_and_honours_revocation(
+    signed_sessions,
+    db_sessionmaker,
+    client: AsyncClient,
+) -> None:
+    settings = get_settings()
+    response = await client.post(
+        "/v1/sessions/anonymous",
+        json={"device_id": str(uuid.uuid4())},
+    )
+    assert response.status_code == 200
+    user_id = response.json()["user_id"]
+    token = client.cookies.get(settings.session_cookie_name)
+    assert token is not None
+    assert is_signed_session_token(token)
+
+    me = await client.get("/v1/me")
+    assert me.status_code == 200
+    assert me.json()["user_id"] == user_id
+
+    async with db_sessionmaker() as session:
+        await session.execute(
+            update(Session)
+            .where(Session.token_hash == hash_opaque_token(token, settings))
+            .values(revoked_at=dt.datetime.now(dt.UTC))
+        )
+        await session.commit()
+    get_session_revocation_list().invalidate()
+
+    revoked = await client.get("/v1/me")
+    assert revoked.status_code == 401
+    assert revoked.json()["error"]["code"] == "auth_required"
+
+
+@pytest.mark.asyncio
+async def test_opaque_sessions_keep_working_when_signed_format_enabled(
+    db_sessionmaker,
+    client: AsyncClient,
+    monkeypatch,
+) -> None:
+    response = await client.post(
+        "/v1/sessions/anonymous",
+        json={"device_id": str(uuid.uuid4())},
+    )
+    assert response.status_code == 200
+    settings = get_settings()
+    token = client.cookies.get(settings.session_cookie_name)
+    assert token is not None
+    assert not is_signed_session_token(token)
+
+    monkeypatch.setenv("SESSION_TOKEN_FORMAT", "signed")
+    get_settings.cache_clear()
+
+    me = await client.get("/v1/me")
+    assert me.status_code == 200
+    assert me.json()["user_id"] == response.json()["user_id"]
@@ -55,7 +55,7 @@ async def test_anonymous_session_creates_user_device_and_rank_cache_on_first_rea
     assert me.json()["rank"] == 0
 
     async with db_sessionmaker() as session:
-        cache = await session.get(CuratorRankCache, user_id)
+        cache = await session.get(CuratorRankCache, (user_id, "v1_points"))
         assert cache is not None
         assert cache.points_total == 0
 
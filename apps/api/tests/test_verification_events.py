@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import datetime as dt
-from pathlib import Path
 import uuid
+from pathlib import Path
 
 import pytest
 from geoalchemy2.elements import WKTElement
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select, update
 
 from groundedart_api.auth.tokens import generate_opaque_token, hash_opaque_token
-from groundedart_api.db.models import CheckinToken, Node, utcnow
+from groundedart_api.db.models import CheckinToken, EventOutbox, Node, utcnow
+from groundedart_api.domain.event_outbox import dispatch_outbox_batch, requeue_dead_events
 from groundedart_api.domain.verification_events import get_verification_event_emitter
 from groundedart_api.main import create_app
 from groundedart_api.settings import get_settings
@@ -43,6 +45,12 @@ class RecordingEmitter:
     ) -> None:
         self.state_changed.append((capture_id, from_state, to_state, reason_code))
 
+    async def capture_states_changed(self, changes) -> None:
+        for change in changes:
+            self.state_changed.append(
+                (change.capture_id, change.from_state, change.to_state, change.reason_code)
+            )
+
 
 def make_client_with_emitter(emitter: RecordingEmitter) -> AsyncClient:
     app = create_app()
@@ -175,3 +183,77 @@ async def test_admin_transition_emits_capture_state_changed_event(db_sessionmake
             "manual_review_pass",
         )
     ]
+
+
+@pytest.mark.asyncio
+async def test_webhook_mode_stages_events_in_outbox_and_dispatcher_retries_then_dead_letters(
+    db_sessionmaker,
+    client: AsyncClient,
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("VERIFICATION_EVENTS_MODE", "webhook")
+    monkeypatch.setenv("VERIFICATION_EVENTS_WEBHOOK_URL", "http://hooks.invalid/events")
+    get_settings.cache_clear()
+    settings = get_settings()
+
+    capture_id = await create_pending_capture(db_sessionmaker, client)
+    response = await client.post(
+        f"/v1/admin/captures/{capture_id}/transition",
+        headers={"X-Admin-Token": settings.admin_api_token},
+        json={"target_state": "verified", "reason_code": "manual_review_pass"},
+    )
+    assert response.status_code == 200
+
+    async with db_sessionmaker() as session:
+        rows = (await session.scalars(select(EventOutbox).order_by(EventOutbox.id))).all()
+    assert [row.event_type for row in rows] == ["capture_uploaded", "capture_state_changed"]
+    assert rows[1].payload["capture_id"] == str(capture_id)
+    assert rows[1].payload["to_state"] == "verified"
+    assert all(row.status == "pending" and row.attempts == 0 for row in rows)
+
+    async def failing(payload: dict[str, object]) -> None:
+        raise RuntimeError("webhook down")
+
+    dispatch = {
+        "sessionmaker": db_sessionmaker,
+        "batch_size": 10,
+        "lease_seconds": 60,
+        "max_attempts": 2,
+        "backoff_base_seconds": 30.0,
+        "backoff_max_seconds": 60.0,
+    }
+    first = await dispatch_outbox_batch(deliver=failing, **dispatch)
+    assert (first.claimed, first.retried, first.dead) == (2, 2, 0)
+    async with db_sessionmaker() as session:
+        rows = (await session.scalars(select(EventOutbox).order_by(EventOutbox.id))).all()
+    assert all(row.attempts == 1 and row.next_attempt_at > utcnow() for row in rows)
+    assert all(row.last_error == "RuntimeError: webhook down" for row in rows)
+
+    # Nothing is due until the backoff elapses.
+    idle = await dispatch_outbox_batch(deliver=failing, **dispatch)
+    assert idle.claimed == 0
+
+    async with db_sessionmaker() as session:
+        await session.execute(update(EventOutbox).values(next_attempt_at=utcnow()))
+        await session.commit()
+    second = await dispatch_outbox_batch(deliver=failing, **dispatch)
+    assert (second.claimed, second.dead) == (2, 2)
+
+    async with db_sessionmaker() as session:
+        assert await requeue_dead_events(db=session, now=utcnow()) == 2
+        await session.commit()
+
+    delivered: list[dict[str, object]] = []
+
+    async def recording(payload: dict[str, object]) -> None:
+        delivered.append(payload)
+
+    third = await dispatch_outbox_batch(deliver=recording, **dispatch)
+    assert (third.claimed, third.delivered) == (2, 2)
+    assert [payload["event_type"] for payload in delivered] == [
+        "capture_uploaded",
+        "capture_state_changed",
+    ]
+    assert all("event_id" in payload and "sent_at" in payload for payload in delivered)
+    async with db_sessionmaker() as session:
+        assert (await session.scalars(select(EventOutbox))).all() == []
@@ -10,3 +10,18 @@ export function resolveMediaUrl(value?: string | null): string | null {
     return trimmed;
   }
 }
+
+// Resolves each "<url> <width>w" entry of an API srcset against the API origin.
+export function resolveMediaSrcSet(value?: string | null): string | undefined {
+  if (!value) return undefined;
+  const entries = value
+    .split(",")
+    .map((entry) => {
+      const [url, descriptor] = entry.trim().split(/\s+/, 2);
+      const resolved = resolveMediaUrl(url);
+      if (!resolved) return null;
+      return descriptor ? `${resolved} ${descriptor}` : resolved;
+    })
+    .filter((entry): entry is string => entry !== null);
+  return entries.length ? entries.join(", ") : undefined;
+}
@@ -10,6 +10,8 @@ export type CapturePublic = {
   visibility: string;
   created_at: string;
   image_url: string | null;
+  image_srcset: string | null;
+  thumbnail_url: string | null;
   attribution_artist_name: string | null;
   attribution_artwork_title: string | null;
   attribution_source: string | null;
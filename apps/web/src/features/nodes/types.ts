@@ -9,6 +9,8 @@ export type NodePublic = {
   radius_m: number;
   min_rank: number;
   image_url?: string | null;
+  image_srcset?: string | null;
+  thumbnail_url?: string | null;
   image_attribution?: string | null;
   image_source_url?: string | null;
   image_license?: string | null;
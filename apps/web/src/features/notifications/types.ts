@@ -18,4 +18,7 @@ export type NotificationPublic = {
 
 export type NotificationsResponse = {
   notifications: NotificationPublic[];
+  next_cursor: string | null;
+  latest_cursor: string | null;
+  unread_count: number;
 };
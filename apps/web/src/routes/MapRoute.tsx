@@ -12,7 +12,7 @@ import { useLocation, useNavigate } from "react-router-dom";
 import { resetDeviceId } from "../auth/device";
 import { ensureAnonymousSession } from "../auth/session";
 import { isApiError } from "../api/http";
-import { resolveMediaUrl } from "../api/media";
+import { resolveMediaSrcSet, resolveMediaUrl } from "../api/media";
 import { createCheckinChallenge, checkIn } from "../features/checkin/api";
 import { clearActiveCaptureDraft } from "../features/captures/captureDraftStore";
 import {
@@ -383,6 +383,8 @@ export function MapRoute() {
   const [selectedNodeId, setSelectedNodeId] = useState<string | null>(null);
   const selectedNode = useMemo(() => nodes.find((n) => n.id === selectedNodeId) ?? null, [nodes, selectedNodeId]);
   const selectedNodeImageUrl = resolveMediaUrl(selectedNode?.image_url);
+  const selectedNodePreviewUrl = resolveMediaUrl(selectedNode?.thumbnail_url) ?? selectedNodeImageUrl;
+  const selectedNodeSrcSet = resolveMediaSrcSet(selectedNode?.image_srcset);
   const [imageExpanded, setImageExpanded] = useState(false);
   const [status, setStatus] = useState<string>("Starting…");
   const [nodesStatus, setNodesStatus] = useState<"idle" | "loading" | "ready" | "error">("idle");
@@ -396,6 +398,7 @@ export function MapRoute() {
   const [me, setMe] = useState<MeResponse | null>(null);
   const [meStatus, setMeStatus] = useState<"idle" | "loading" | "ready" | "error">("idle");
   const [notifications, setNotifications] = useState<NotificationPublic[]>([]);
+  const [notificationsUnread, setNotificationsUnread] = useState(0);
   const [notificationsStatus, setNotificationsStatus] = useState<"idle" | "loading" | "ready" | "error">("idle");
   const [notificationsError, setNotificationsError] = useState<string | null>(null);
   const [sessionReady, setSessionReady] = useState(false);
@@ -592,6 +595,7 @@ export function MapRoute() {
     listNotifications({ signal: controller.signal })
       .then((res) => {
         setNotifications(res.notifications);
+        setNotificationsUnread(res.unread_count);
         setNotificationsStatus("ready");
       })
       .catch((err) => {
@@ -1280,6 +1284,7 @@ export function MapRoute() {
     try {
       const res = await listNotifications();
       setNotifications(res.notifications);
+      setNotificationsUnread(res.unread_count);
       setNotificationsStatus("ready");
     } catch (err) {
       setNotificationsStatus("error");
@@ -1289,8 +1294,10 @@ export function MapRoute() {
 
   async function handleMarkNotificationRead(notificationId: string) {
     try {
+      const wasUnread = notifications.some((item) => item.id === notificationId && !item.read_at);
       const updated = await markNotificationRead(notificationId);
       setNotifications((prev) => prev.map((item) => (item.id === notificationId ? updated : item)));
+      if (wasUnread) setNotificationsUnread((prev) => Math.max(prev - 1, 0));
     } catch {
       // ignore
     }
@@ -1299,7 +1306,7 @@ export function MapRoute() {
   const viewMe = useMemo(() => (me && demoRank !== null ? { ...me, rank: demoRank } : me), [demoRank, me]);
   const nextUnlockLine = viewMe ? formatNextUnlockLine(viewMe) : null;
   const capsNotes = viewMe ? formatRankCapsNotes(viewMe.rank_breakdown) : [];
-  const unreadCount = isCreatorSurface ? notifications.filter((notification) => !notification.read_at).length : 0;
+  const unreadCount = isCreatorSurface ? notificationsUnread : 0;
   const handleOpenSettings = useCallback(() => setSettingsOpen(true), []);
   const handleCloseSettings = useCallback(() => setSettingsOpen(false), []);
   const directionsLeg = useMemo(() => directionsResult?.routes?.[0]?.legs?.[0] ?? null, [directionsResult]);
@@ -1752,7 +1759,13 @@ export function MapRoute() {
               onClick={() => setImageExpanded(true)}
               aria-label="View node image"
             >
-              <img src={selectedNodeImageUrl} alt={selectedNode.name} loading="lazy" />
+              <img
+                src={selectedNodePreviewUrl ?? undefined}
+                srcSet={selectedNodeSrcSet}
+                sizes="(max-width: 600px) 90vw, 320px"
+                alt={selectedNode.name}
+                loading="lazy"
+              />
               <span>Tap to enlarge</span>
             </button>
           ) : null}
@@ -1,7 +1,7 @@
 import { useEffect, useState } from "react";
 import { Link, useLocation, useParams } from "react-router-dom";
 import { isApiError } from "../api/http";
-import { resolveMediaUrl } from "../api/media";
+import { resolveMediaSrcSet, resolveMediaUrl } from "../api/media";
 import {
   createCaptureReport,
   listNodeCaptures,
@@ -35,6 +35,7 @@ export function NodeDetailRoute() {
   const [lastReportedId, setLastReportedId] = useState<string | null>(null);
   const tipsEnabled = import.meta.env.VITE_TIPS_ENABLED === "true";
   const nodeImageUrl = resolveMediaUrl(node?.image_url);
+  const nodeImageSrcSet = resolveMediaSrcSet(node?.image_srcset);
 
   const reportReasons: ReportReasonCode[] = [
     "spam",
@@ -156,7 +157,13 @@ export function NodeDetailRoute() {
                 </div>
                 {nodeImageUrl ? (
                   <div className="node-image">
-                    <img src={nodeImageUrl} alt={node.name} loading="lazy" />
+                    <img
+                      src={nodeImageUrl}
+                      srcSet={nodeImageSrcSet}
+                      sizes="(max-width: 720px) 100vw, 720px"
+                      alt={node.name}
+                      loading="lazy"
+                    />
                     {node.image_attribution ? (
                       <div className="node-image-credit">
                         Image credit:{" "}
@@ -217,12 +224,20 @@ export function NodeDetailRoute() {
                 <div className="captures-grid">
                   {captures.map((capture) => {
                     const attribution = formatAttribution(capture);
-                    const captureImageUrl = resolveMediaUrl(capture.image_url);
+                    const captureImageUrl =
+                      resolveMediaUrl(capture.thumbnail_url) ?? resolveMediaUrl(capture.image_url);
+                    const captureSrcSet = resolveMediaSrcSet(capture.image_srcset);
                     return (
                       <div key={capture.id} className="capture-card">
                         <div className="capture-thumb">
                           {captureImageUrl ? (
-                            <img src={captureImageUrl} alt="Verified capture" loading="lazy" />
+                            <img
+                              src={captureImageUrl}
+                              srcSet={captureSrcSet}
+                              sizes="(max-width: 600px) 50vw, 240px"
+                              alt="Verified capture"
+                              loading="lazy"
+                            />
                           ) : (
                             <div className="capture-thumb-fallback">Image pending</div>
                           )}